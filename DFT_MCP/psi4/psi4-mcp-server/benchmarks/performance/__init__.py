@@ -1,9 +1,139 @@
 """
-Psi4 MCP Server - Placeholder Module
+Performance Benchmarks for Psi4 MCP Server.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Runs the execution time, memory and scaling benchmarks, appends the run
+to benchmarks/results/performance_results.json and compares it with the
+stored baseline:
+
+    python -m benchmarks.performance --quick
+    python -m benchmarks.performance --update-baseline
+
+The exit status is non-zero when a case regressed beyond the tolerance.
 """
 
-# TODO: Add implementation
-pass
+import argparse
+from typing import Dict, List, Optional, Sequence
+
+from . import execution_time, memory_usage, parallel_scaling
+from .harness import MOLECULE_LADDER, BenchmarkCase, CaseResult, run_case
+from .results import (
+    BASELINE_FILE,
+    RESULTS_FILE,
+    TIME_TOLERANCE,
+    MEMORY_TOLERANCE,
+    Regression,
+    compare_to_baseline,
+    load_baseline,
+    make_run,
+    save_baseline,
+    save_run,
+)
+
+
+GROUPS = ("core", "analysis", "throughput", "memory", "scaling")
+
+
+def get_cases(quick: bool = False, groups: Sequence[str] = GROUPS) -> List[BenchmarkCase]:
+    """Cases of the selected groups (process scaling is run separately)."""
+    cases = (
+        execution_time.get_cases(quick)
+        + memory_usage.get_cases(quick)
+        + parallel_scaling.thread_cases(quick)
+    )
+    return [c for c in cases if c.group in groups]
+
+
+def run_suite(
+    quick: bool = False,
+    groups: Sequence[str] = GROUPS,
+    verbose: bool = True,
+) -> List[CaseResult]:
+    """Run the selected benchmark groups."""
+    results = []
+    for case in get_cases(quick, groups):
+        result = run_case(case)
+        results.append(result)
+        if verbose:
+            _print_result(result)
+
+    if "scaling" in groups:
+        for result in parallel_scaling.run_process_scaling(quick):
+            results.append(result)
+            if verbose:
+                _print_result(result)
+    return results
+
+
+def scaling_curves(results: List[CaseResult]) -> Dict[str, List[dict]]:
+    """Thread and process scaling curves of a result set."""
+    return {
+        "threads": parallel_scaling.scaling_curve(
+            [r for r in results if r.case_id.startswith("scaling/threads/")], "threads",
+        ),
+        "processes": parallel_scaling.scaling_curve(
+            [r for r in results if r.case_id.startswith("scaling/processes/")], "workers",
+        ),
+    }
+
+
+def _print_result(result: CaseResult) -> None:
+    if result.success:
+        print(f"  {result.case_id:<50} {result.wall_time:9.3f} s {result.peak_rss_mb:9.1f} MB")
+    else:
+        print(f"  {result.case_id:<50} FAILED: {result.error}")
+
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """Command-line entry point."""
+    parser = argparse.ArgumentParser(description="Psi4 MCP performance benchmarks")
+    parser.add_argument("--quick", action="store_true", help="Small molecules and settings only")
+    parser.add_argument("--group", action="append", choices=GROUPS, help="Benchmark groups to run")
+    parser.add_argument("--label", help="Label stored with the run")
+    parser.add_argument("--update-baseline", action="store_true", help="Store this run as the baseline")
+    parser.add_argument("--tolerance", type=float, default=TIME_TOLERANCE, help="Allowed relative slowdown")
+    parser.add_argument("--memory-tolerance", type=float, default=MEMORY_TOLERANCE,
+                        help="Allowed relative peak memory growth")
+    parser.add_argument("--no-save", action="store_true", help="Do not append to the results file")
+    args = parser.parse_args(argv)
+
+    results = run_suite(args.quick, args.group or GROUPS)
+    run = make_run(results, args.label)
+    run["scaling"] = scaling_curves(results)
+
+    if not args.no_save:
+        print(f"Results appended to {save_run(run)}")
+
+    failed = [r for r in results if not r.success]
+    if failed:
+        print(f"{len(failed)} of {len(results)} cases failed")
+
+    if args.update_baseline:
+        print(f"Baseline written to {save_baseline(run)}")
+        return 1 if failed else 0
+
+    regressions = compare_to_baseline(run, load_baseline(), args.tolerance, args.memory_tolerance)
+    for regression in regressions:
+        print(f"REGRESSION {regression}")
+    return 1 if regressions or failed else 0
+
+
+__all__ = [
+    "MOLECULE_LADDER",
+    "BenchmarkCase",
+    "CaseResult",
+    "Regression",
+    "BASELINE_FILE",
+    "RESULTS_FILE",
+    "GROUPS",
+    "get_cases",
+    "run_case",
+    "run_suite",
+    "scaling_curves",
+    "compare_to_baseline",
+    "load_baseline",
+    "make_run",
+    "save_baseline",
+    "save_run",
+    "main",
+]
+
@@ -0,0 +1,8 @@
+"""Run the performance benchmarks: python -m benchmarks.performance"""
+
+import sys
+
+from . import main
+
+
+sys.exit(main())
@@ -1,9 +1,90 @@
 """
-Psi4 MCP Server - Placeholder Module
+Execution Time Benchmarks for Psi4 MCP Server.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Wall time of the core tools, the charge and bond-order analyses and
+batch/scan throughput over the molecule ladder.
 """
 
-# TODO: Add implementation
-pass
+from typing import List
+
+from .harness import BenchmarkCase, ladder
+
+
+DEFAULT_METHOD = "hf"
+DEFAULT_BASIS = "sto-3g"
+
+# Tools run on every molecule of the ladder
+CORE_TOOLS = (
+    "calculate_energy",
+    "calculate_gradient",
+)
+
+# Expensive tools, only run on the first (small) molecules
+EXPENSIVE_TOOLS = {
+    "optimize_geometry": 2,
+    "calculate_frequencies": 2,
+}
+
+ANALYSIS_TOOLS = (
+    "calculate_mulliken_charges",
+    "calculate_lowdin_charges",
+    "calculate_mayer_bond_orders",
+    "calculate_wiberg_bond_orders",
+)
+
+BATCH_SIZE = 4
+SCAN_STEPS = 5
+
+
+def _input(geometry: str, **extra) -> dict:
+    data = {"geometry": geometry, "method": DEFAULT_METHOD, "basis": DEFAULT_BASIS}
+    data.update(extra)
+    return data
+
+
+def core_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """Energy, gradient, optimization and frequency timings."""
+    cases = []
+    molecules = list(ladder(quick).items())
+    for tool in CORE_TOOLS:
+        for name, geometry in molecules:
+            cases.append(BenchmarkCase(f"{tool}/{name}", tool, _input(geometry), "core", name))
+    for tool, n_molecules in EXPENSIVE_TOOLS.items():
+        for name, geometry in molecules[:n_molecules]:
+            cases.append(BenchmarkCase(
+                f"{tool}/{name}", tool, _input(geometry), "core", name, repeats=1, warmup=0,
+            ))
+    return cases
+
+
+def analysis_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """Charge and bond-order analyses."""
+    return [
+        BenchmarkCase(f"{tool}/{name}", tool, _input(geometry), "analysis", name)
+        for tool in ANALYSIS_TOOLS
+        for name, geometry in ladder(quick).items()
+    ]
+
+
+def throughput_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """Batch and scan throughput (calculations per call)."""
+    geometry = ladder(quick)["water"]
+    return [
+        BenchmarkCase(
+            "run_batch/water", "run_batch",
+            {"geometries": [geometry] * BATCH_SIZE, "method": DEFAULT_METHOD, "basis": DEFAULT_BASIS},
+            "throughput", "water", repeats=1,
+            metadata={"calculations": BATCH_SIZE},
+        ),
+        BenchmarkCase(
+            "run_scan/water", "run_scan",
+            _input(geometry, atoms=[0, 1], start=0.9, end=1.1, steps=SCAN_STEPS),
+            "throughput", "water", repeats=1,
+            metadata={"calculations": SCAN_STEPS},
+        ),
+    ]
+
+
+def get_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """All execution time cases."""
+    return core_cases(quick) + analysis_cases(quick) + throughput_cases(quick)
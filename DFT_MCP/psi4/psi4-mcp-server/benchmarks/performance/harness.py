@@ -0,0 +1,230 @@
+"""
+Benchmark Harness for Psi4 MCP Server.
+
+Shared pieces of the performance suite:
+
+- MOLECULE_LADDER: fixed systems of increasing size (water -> benzene ->
+  small peptides); changing it invalidates stored baselines, so it is
+  versioned with SUITE_VERSION.
+- BenchmarkCase / CaseResult: one tool call with fixed input, measured
+  for wall time and peak memory.
+- run_case: runs a case in a fresh process (clean Psi4 state and a
+  per-case peak RSS from getrusage).
+"""
+
+import importlib
+import multiprocessing
+import os
+import platform
+import resource
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import asdict, dataclass, field
+from typing import Any, Dict, List, Optional
+
+
+SUITE_VERSION = 1
+
+MOLECULE_LADDER: Dict[str, str] = {
+    "water": """O  0.000000  0.000000  0.117369
+H  0.000000  0.757463 -0.469476
+H  0.000000 -0.757463 -0.469476""",
+    "ethane": """C  0.000000  0.000000  0.762935
+C  0.000000  0.000000 -0.762935
+H  1.018818  0.000000  1.157534
+H -0.509409  0.882283  1.157534
+H -0.509409 -0.882283  1.157534
+H -1.018818  0.000000 -1.157534
+H  0.509409 -0.882283 -1.157534
+H  0.509409  0.882283 -1.157534""",
+    "benzene": """C  1.391500  0.000000  0.000000
+C  0.695750  1.204946  0.000000
+C -0.695750  1.204946  0.000000
+C -1.391500  0.000000  0.000000
+C -0.695750 -1.204946  0.000000
+C  0.695750 -1.204946  0.000000
+H  2.471500  0.000000  0.000000
+H  1.235750  2.140354  0.000000
+H -1.235750  2.140354  0.000000
+H -2.471500  0.000000  0.000000
+H -1.235750 -2.140354  0.000000
+H  1.235750 -2.140354  0.000000""",
+    "glycine": """N -1.434195  0.582453  0.071384
+C  0.015805  0.582453  0.071384
+C  0.535676 -0.845880  0.071384
+O -0.033568 -1.791636  0.566971
+O  1.727271 -0.950349 -0.554465
+H  1.988969 -1.883423 -0.512194
+H -1.779635  1.056998  0.893320
+H -1.779635  1.056998 -0.750552
+H  0.379655  1.096193 -0.818439
+H  0.379655  1.096193  0.961207""",
+    "glycylglycine": """N -2.882629  1.552657  0.313306
+C -1.432629  1.552657  0.313306
+C -0.912759  0.124325  0.313306
+O -1.554090 -0.783254  0.840464
+N  0.259461 -0.069474 -0.284392
+H  0.734615  0.719959 -0.698064
+C  0.880270 -1.388706 -0.360698
+C  2.393782 -1.250440 -0.384480
+O  2.997556 -0.309554 -0.847394
+O  3.007575 -2.312905  0.178482
+H  3.962314 -2.150138  0.124805
+H -3.228069  2.027202  1.135242
+H -3.228069  2.027202 -0.508630
+H -1.068780  2.066397 -0.576517
+H -1.068780  2.066397  1.203129
+H  0.588005 -1.979143  0.507672
+H  0.552226 -1.893184 -1.269537""",
+}
+
+# Subset used with --quick (CI)
+QUICK_LADDER = ("water", "benzene")
+
+
+@dataclass
+class BenchmarkCase:
+    """One tool call with fixed input."""
+    case_id: str
+    tool: str
+    input_data: Dict[str, Any]
+    group: str = "core"
+    molecule: Optional[str] = None
+    repeats: int = 3
+    warmup: int = 1
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+
+@dataclass
+class CaseResult:
+    """Measurements of one benchmark case."""
+    case_id: str
+    group: str
+    success: bool
+    wall_time: float = 0.0
+    wall_times: List[float] = field(default_factory=list)
+    peak_rss_mb: float = 0.0
+    error: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def ladder(quick: bool = False) -> Dict[str, str]:
+    """Molecules of the ladder (the quick subset if requested)."""
+    if quick:
+        return {name: MOLECULE_LADDER[name] for name in QUICK_LADDER}
+    return dict(MOLECULE_LADDER)
+
+
+def peak_rss_mb() -> float:
+    """Peak RSS of this process in MB."""
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+# Modules registering the benchmarked tools
+TOOL_MODULES = (
+    "psi4_mcp.tools.core",
+    "psi4_mcp.tools.vibrational",
+    "psi4_mcp.tools.properties.charges.mulliken",
+    "psi4_mcp.tools.properties.charges.lowdin",
+    "psi4_mcp.tools.properties.bonds.mayer",
+    "psi4_mcp.tools.properties.bonds.wiberg",
+    "psi4_mcp.tools.advanced.scan",
+    "psi4_mcp.tools.utilities.batch_runner",
+)
+
+
+def load_tools() -> None:
+    """Import the tool modules so the tool registry is populated."""
+    for module in TOOL_MODULES:
+        importlib.import_module(module)
+
+
+def execute_case(case: BenchmarkCase) -> Dict[str, Any]:
+    """Run a case in the current process (worker side of run_case).
+
+    Peak RSS covers the whole process, so it is only per-case when the
+    case runs in its own process.
+    """
+    try:
+        load_tools()
+        from psi4_mcp.tools.core.base_tool import run_tool
+    except Exception as e:
+        return CaseResult(
+            case.case_id, case.group, False,
+            error=f"psi4_mcp unavailable: {e}", metadata=case.metadata,
+        ).to_dict()
+
+    times = []
+    for i in range(case.warmup + case.repeats):
+        start = time.perf_counter()
+        output = run_tool(case.tool, dict(case.input_data))
+        elapsed = time.perf_counter() - start
+        if not output.success:
+            return CaseResult(
+                case.case_id, case.group, False,
+                error=str(output.error or output.message), metadata=case.metadata,
+            ).to_dict()
+        if i >= case.warmup:
+            times.append(elapsed)
+
+    return CaseResult(
+        case_id=case.case_id,
+        group=case.group,
+        success=True,
+        wall_time=statistics.median(times),
+        wall_times=[round(t, 6) for t in times],
+        peak_rss_mb=round(peak_rss_mb(), 1),
+        metadata=case.metadata,
+    ).to_dict()
+
+
+def run_case(case: BenchmarkCase, isolated: bool = True) -> CaseResult:
+    """
+    Measure a benchmark case.
+
+    Args:
+        case: Case to run
+        isolated: Run in a fresh spawned process (clean Psi4 state,
+            per-case peak memory)
+
+    Returns:
+        CaseResult with the median wall time over the repeats
+    """
+    if not isolated:
+        return CaseResult(**execute_case(case))
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+        try:
+            return CaseResult(**pool.submit(execute_case, case).result())
+        except Exception as e:
+            return CaseResult(case.case_id, case.group, False, error=str(e), metadata=case.metadata)
+
+
+def environment_info() -> Dict[str, Any]:
+    """Where the benchmarks ran (stored with every result set)."""
+    info: Dict[str, Any] = {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+        "cpu_count": os.cpu_count(),
+        "suite_version": SUITE_VERSION,
+    }
+    try:
+        import psi4
+        info["psi4"] = psi4.__version__
+    except ImportError:
+        info["psi4"] = None
+    try:
+        from psi4_mcp.__version__ import __version__
+        info["psi4_mcp"] = __version__
+    except ImportError:
+        info["psi4_mcp"] = None
+    return info
@@ -1,9 +1,50 @@
 """
-Psi4 MCP Server - Placeholder Module
+Memory Usage Benchmarks for Psi4 MCP Server.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Peak resident memory of energy calculations as the basis set and
+method grow. Every case runs in its own process, so the peak covers that
+case only.
 """
 
-# TODO: Add implementation
-pass
+from typing import List
+
+from .harness import BenchmarkCase, ladder
+
+
+BASIS_LADDER = ("sto-3g", "6-31g*", "cc-pvdz", "cc-pvtz")
+METHOD_LADDER = ("hf", "b3lyp", "mp2")
+
+# Memory handed to Psi4 for every case (MB)
+PSI4_MEMORY = 2000
+
+
+def basis_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """Energy over the basis ladder for every molecule."""
+    basis_sets = BASIS_LADDER[:2] if quick else BASIS_LADDER
+    return [
+        BenchmarkCase(
+            f"memory/hf/{basis}/{name}", "calculate_energy",
+            {"geometry": geometry, "method": "hf", "basis": basis, "memory": PSI4_MEMORY},
+            "memory", name, repeats=1, warmup=0,
+        )
+        for basis in basis_sets
+        for name, geometry in ladder(quick).items()
+    ]
+
+
+def method_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """Energy over the method ladder at cc-pVDZ."""
+    return [
+        BenchmarkCase(
+            f"memory/{method}/cc-pvdz/{name}", "calculate_energy",
+            {"geometry": geometry, "method": method, "basis": "cc-pvdz", "memory": PSI4_MEMORY},
+            "memory", name, repeats=1, warmup=0,
+        )
+        for method in METHOD_LADDER[1:]
+        for name, geometry in ladder(quick).items()
+    ]
+
+
+def get_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """All memory cases."""
+    return basis_cases(quick) + method_cases(quick)
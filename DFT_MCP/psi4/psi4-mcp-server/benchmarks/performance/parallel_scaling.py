@@ -1,9 +1,120 @@
 """
-Psi4 MCP Server - Placeholder Module
+Parallel Scaling Benchmarks for Psi4 MCP Server.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Thread scaling: one energy calculation with increasing n_threads.
+Process scaling: a fixed set of calculations spread over an increasing
+number of worker processes. Both are reported as speedup and
+efficiency curves relative to the single-worker run.
 """
 
-# TODO: Add implementation
-pass
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, List
+
+from .harness import BenchmarkCase, CaseResult, execute_case, ladder
+
+
+SCALING_MOLECULE = "benzene"
+SCALING_BASIS = "cc-pvdz"
+
+# Calculations distributed over the workers in process scaling
+PROCESS_JOBS = 8
+
+
+def worker_counts(limit: int = 0) -> List[int]:
+    """Powers of two up to the CPU count (and limit, if given)."""
+    cpus = os.cpu_count() or 1
+    if limit:
+        cpus = min(cpus, limit)
+    counts = [1]
+    while counts[-1] * 2 <= cpus:
+        counts.append(counts[-1] * 2)
+    return counts
+
+
+def thread_cases(quick: bool = False) -> List[BenchmarkCase]:
+    """One energy per thread count."""
+    geometry = ladder()[SCALING_MOLECULE]
+    return [
+        BenchmarkCase(
+            f"scaling/threads/{n}", "calculate_energy",
+            {"geometry": geometry, "method": "hf", "basis": SCALING_BASIS, "n_threads": n},
+            "scaling", SCALING_MOLECULE, repeats=1 if quick else 3,
+            metadata={"threads": n},
+        )
+        for n in worker_counts(4 if quick else 0)
+    ]
+
+
+def _worker_pid(_: int) -> int:
+    return os.getpid()
+
+
+def _job_case(index: int) -> BenchmarkCase:
+    return BenchmarkCase(
+        f"scaling/job/{index}", "calculate_energy",
+        {"geometry": ladder()["water"], "method": "hf", "basis": SCALING_BASIS},
+        "scaling", "water", repeats=1, warmup=0,
+    )
+
+
+def run_process_scaling(quick: bool = False) -> List[CaseResult]:
+    """
+    Throughput of PROCESS_JOBS calculations over 1, 2, 4, ... workers.
+
+    Returns:
+        One CaseResult per worker count; wall_time is the time for all
+        jobs, metadata holds the throughput
+    """
+    context = multiprocessing.get_context("spawn")
+    results = []
+    for workers in worker_counts(4 if quick else 0):
+        case_id = f"scaling/processes/{workers}"
+        with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+            # Start the workers before timing
+            list(pool.map(_worker_pid, range(workers)))
+            start = time.perf_counter()
+            outputs = list(pool.map(execute_case, [_job_case(i) for i in range(PROCESS_JOBS)]))
+            elapsed = time.perf_counter() - start
+
+        failed = [o for o in outputs if not o["success"]]
+        if failed:
+            results.append(CaseResult(case_id, "scaling", False, error=failed[0]["error"]))
+            continue
+        results.append(CaseResult(
+            case_id, "scaling", True,
+            wall_time=elapsed,
+            wall_times=[round(elapsed, 6)],
+            peak_rss_mb=max(o["peak_rss_mb"] for o in outputs),
+            metadata={"workers": workers, "jobs": PROCESS_JOBS, "throughput": PROCESS_JOBS / elapsed},
+        ))
+    return results
+
+
+def scaling_curve(results: List[CaseResult], key: str) -> List[Dict[str, Any]]:
+    """
+    Speedup and efficiency relative to the smallest worker count.
+
+    Args:
+        results: Successful scaling results
+        key: Metadata key holding the worker count ("threads" or "workers")
+    """
+    points = sorted(
+        (r for r in results if r.success and key in r.metadata),
+        key=lambda r: r.metadata[key],
+    )
+    if not points:
+        return []
+    base = points[0]
+    base_work = base.wall_time * base.metadata[key]
+    return [
+        {
+            key: r.metadata[key],
+            "wall_time": r.wall_time,
+            "speedup": base.wall_time / r.wall_time if r.wall_time else 0.0,
+            "efficiency": base_work / (r.wall_time * r.metadata[key]) if r.wall_time else 0.0,
+        }
+        for r in points
+    ]
@@ -0,0 +1,181 @@
+"""
+Benchmark Results and Baselines for Psi4 MCP Server.
+
+Results are appended as runs to a versioned JSON file
+(benchmarks/results/performance_results.json); one run can be stored as
+the baseline (performance_baseline.json) that later runs are compared
+against. A case regresses when it is slower (or uses more memory) than
+the baseline by more than the relative tolerance *and* an absolute
+floor, so that noise on sub-second cases does not fail the gate.
+"""
+
+import json
+import subprocess
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from .harness import SUITE_VERSION, CaseResult, environment_info
+
+
+RESULTS_SCHEMA_VERSION = 1
+RESULTS_DIR = Path(__file__).resolve().parent.parent / "results"
+RESULTS_FILE = RESULTS_DIR / "performance_results.json"
+BASELINE_FILE = RESULTS_DIR / "performance_baseline.json"
+
+# Runs kept in the results file
+MAX_STORED_RUNS = 50
+
+# Regression thresholds
+TIME_TOLERANCE = 0.20
+TIME_MIN_DELTA = 0.05
+MEMORY_TOLERANCE = 0.20
+MEMORY_MIN_DELTA_MB = 50.0
+
+
+@dataclass
+class Regression:
+    """A case that got worse than its baseline."""
+    case_id: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+    def __str__(self) -> str:
+        unit = "s" if self.metric == "wall_time" else " MB"
+        return (
+            f"{self.case_id}: {self.metric} {self.baseline:.3f}{unit} -> "
+            f"{self.current:.3f}{unit} ({self.ratio:.2f}x)"
+        )
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=RESULTS_DIR, capture_output=True, text=True, timeout=5, check=True,
+        ).stdout.strip() or None
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+def make_run(results: Iterable[CaseResult], label: Optional[str] = None) -> Dict[str, Any]:
+    """Bundle case results with the environment they were measured in."""
+    return {
+        "suite_version": SUITE_VERSION,
+        "label": label,
+        "commit": _git_commit(),
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "environment": environment_info(),
+        "results": {r.case_id: r.to_dict() for r in results},
+    }
+
+
+def _load(path: Path) -> Dict[str, Any]:
+    try:
+        data = json.loads(path.read_text())
+    except (OSError, ValueError):
+        return {}
+    return data if isinstance(data, dict) else {}
+
+
+def load_results(path: Path = RESULTS_FILE) -> List[Dict[str, Any]]:
+    """All stored runs, oldest first."""
+    return _load(path).get("runs", [])
+
+
+def save_run(run: Dict[str, Any], path: Path = RESULTS_FILE) -> Path:
+    """Append a run to the results file."""
+    runs = (load_results(path) + [run])[-MAX_STORED_RUNS:]
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(
+        {"schema_version": RESULTS_SCHEMA_VERSION, "runs": runs}, indent=2,
+    ) + "\n")
+    return path
+
+
+def load_baseline(path: Path = BASELINE_FILE) -> Optional[Dict[str, Any]]:
+    """Stored baseline run, if any (ignored when the suite changed)."""
+    run = _load(path).get("run")
+    if not run or run.get("suite_version") != SUITE_VERSION:
+        return None
+    return run
+
+
+def save_baseline(run: Dict[str, Any], path: Path = BASELINE_FILE) -> Path:
+    """
+    Store a run as the baseline.
+
+    Cases missing from the run (e.g. a --quick run) keep their previous
+    baseline values.
+    """
+    previous = load_baseline(path) or {}
+    merged = dict(run)
+    merged["results"] = {**previous.get("results", {}), **run.get("results", {})}
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(
+        {"schema_version": RESULTS_SCHEMA_VERSION, "run": merged}, indent=2,
+    ) + "\n")
+    return path
+
+
+def _regressed(baseline: float, current: float, tolerance: float, min_delta: float) -> bool:
+    delta = current - baseline
+    return delta > min_delta and delta > tolerance * baseline
+
+
+def compare_case(
+    current: Dict[str, Any],
+    baseline: Dict[str, Any],
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+) -> List[Regression]:
+    """Regressions of one case result against its baseline entry."""
+    if not (current.get("success") and baseline.get("success")):
+        return []
+
+    case_id = current["case_id"]
+    regressions = []
+    if _regressed(baseline["wall_time"], current["wall_time"], time_tolerance, TIME_MIN_DELTA):
+        regressions.append(Regression(
+            case_id, "wall_time", baseline["wall_time"], current["wall_time"],
+        ))
+    if _regressed(baseline["peak_rss_mb"], current["peak_rss_mb"], memory_tolerance, MEMORY_MIN_DELTA_MB):
+        regressions.append(Regression(
+            case_id, "peak_rss_mb", baseline["peak_rss_mb"], current["peak_rss_mb"],
+        ))
+    return regressions
+
+
+def compare_to_baseline(
+    run: Dict[str, Any],
+    baseline: Optional[Dict[str, Any]],
+    time_tolerance: float = TIME_TOLERANCE,
+    memory_tolerance: float = MEMORY_TOLERANCE,
+) -> List[Regression]:
+    """
+    Compare a run with the baseline.
+
+    Args:
+        run: Run from make_run
+        baseline: Baseline run (None means nothing to compare)
+        time_tolerance: Allowed relative slowdown
+        memory_tolerance: Allowed relative peak-memory growth
+
+    Returns:
+        Regressions; cases without a baseline entry are skipped
+    """
+    if not baseline:
+        return []
+
+    stored = baseline.get("results", {})
+    regressions: List[Regression] = []
+    for case_id, result in run.get("results", {}).items():
+        if case_id in stored:
+            regressions.extend(compare_case(result, stored[case_id], time_tolerance, memory_tolerance))
+    return regressions
@@ -1,7 +1,9 @@
 """
 Convert Command for Psi4 MCP Server CLI.
 
-Converts between different molecular file formats.
+Converts between different molecular file formats. Multi-frame XYZ, PDB
+and mol2 files are streamed frame by frame; a directory input converts
+every structure file in it with a pool of worker processes.
 """
 
 import argparse
@@ -15,11 +17,20 @@ from psi4_mcp.cli.utils import (
     print_success,
     print_warning,
     file_exists,
+    dir_exists,
     read_file,
-    write_file,
     get_file_extension,
     detect_format_from_extension,
 )
+from psi4_mcp.utils.conversion.structures import (
+    READ_FORMATS,
+    WRITE_FORMATS,
+    Frame,
+    convert_directory,
+    convert_structure_file,
+    parse_frame_selection,
+    write_frames,
+)
 
 
 def run_convert(args: argparse.Namespace) -> int:
@@ -27,6 +38,15 @@ def run_convert(args: argparse.Namespace) -> int:
     input_file = args.input_file
     output_file = args.output_file
     
+    try:
+        frames = parse_frame_selection(getattr(args, "frames", None))
+    except ValueError as e:
+        print_error(str(e))
+        return 1
+    
+    if dir_exists(input_file):
+        return run_convert_directory(args, frames)
+    
     if not file_exists(input_file):
         print_error(f"Input file not found: {input_file}")
         return 1
@@ -46,6 +66,28 @@ def run_convert(args: argparse.Namespace) -> int:
     print_info(f"Converting: {input_file} -> {output_file}")
     print_info(f"Format: {from_format} -> {to_format}")
     
+    if to_format not in WRITE_FORMATS:
+        print_error(f"Unsupported output format: {to_format}")
+        return 1
+    
+    # Structure files are streamed frame by frame
+    if from_format in READ_FORMATS:
+        try:
+            n_frames = convert_structure_file(input_file, output_file, from_format, to_format, frames)
+        except (ValueError, OSError) as e:
+            print_error(f"Failed to convert: {e}")
+            return 1
+        
+        if n_frames == 0:
+            print_error("No structures found in input file")
+            return 1
+        
+        print_success(f"Converted {n_frames} frame(s) successfully: {output_file}")
+        return 0
+    
+    if frames is not None:
+        print_warning(f"Frame selection ignored for {from_format} input")
+    
     # Read input
     content = read_file(input_file)
     
@@ -55,166 +97,53 @@ def run_convert(args: argparse.Namespace) -> int:
         print_error("Failed to parse input file")
         return 1
     
-    # Convert to output format
-    output_content = format_output(molecule_data, to_format)
-    if output_content is None:
-        print_error("Failed to convert to output format")
-        return 1
-    
     # Write output
-    write_file(output_file, output_content)
+    write_frames(output_file, [Frame.from_dict(molecule_data)], to_format)
     
     print_success(f"Converted successfully: {output_file}")
     return 0
 
 
-def parse_input(content: str, format: str) -> Optional[Dict[str, Any]]:
-    """Parse input file content."""
-    if format == "xyz":
-        return parse_xyz(content)
-    elif format == "pdb":
-        return parse_pdb(content)
-    elif format == "mol2":
-        return parse_mol2(content)
-    elif format == "psi4":
-        return parse_psi4(content)
-    elif format == "json":
-        return parse_json(content)
-    
-    return None
-
-
-def format_output(data: Dict[str, Any], format: str) -> Optional[str]:
-    """Format molecule data for output."""
-    if format == "xyz":
-        return format_xyz(data)
-    elif format == "psi4":
-        return format_psi4(data)
-    elif format == "json":
-        return format_json(data)
-    
-    return None
-
-
-def parse_xyz(content: str) -> Optional[Dict[str, Any]]:
-    """Parse XYZ format."""
-    lines = content.strip().split("\n")
-    
-    if len(lines) < 2:
-        return None
-    
-    try:
-        n_atoms = int(lines[0].strip())
-    except ValueError:
-        return None
-    
-    comment = lines[1].strip() if len(lines) > 1 else ""
-    
-    elements = []
-    coordinates = []
-    
-    for line in lines[2:]:
-        line = line.strip()
-        if not line:
-            continue
-        
-        parts = line.split()
-        if len(parts) < 4:
-            continue
-        
-        elements.append(parts[0])
-        try:
-            coords = [float(parts[1]), float(parts[2]), float(parts[3])]
-            coordinates.append(coords)
-        except ValueError:
-            continue
-    
-    return {
-        "elements": elements,
-        "coordinates": coordinates,
-        "comment": comment,
-        "charge": 0,
-        "multiplicity": 1,
-    }
-
-
-def parse_pdb(content: str) -> Optional[Dict[str, Any]]:
-    """Parse PDB format."""
-    elements = []
-    coordinates = []
+def run_convert_directory(args: argparse.Namespace, frames: Optional[slice]) -> int:
+    """Convert every structure file of a directory in parallel."""
+    if not args.to_format:
+        print_error("Output format (--to) is required when converting a directory")
+        return 1
     
-    for line in content.split("\n"):
-        if line.startswith("ATOM") or line.startswith("HETATM"):
-            if len(line) < 54:
-                continue
-            
-            try:
-                x = float(line[30:38])
-                y = float(line[38:46])
-                z = float(line[46:54])
-            except ValueError:
-                continue
-            
-            # Get element from columns 77-78 or from atom name
-            if len(line) >= 78:
-                element = line[76:78].strip()
-            else:
-                element = line[12:16].strip()[0]
-            
-            elements.append(element)
-            coordinates.append([x, y, z])
+    print_info(f"Converting directory: {args.input_file} -> {args.output_file}")
+    results = convert_directory(
+        args.input_file,
+        args.output_file,
+        args.to_format,
+        from_format=args.from_format,
+        frames=frames,
+        max_workers=getattr(args, "workers", None),
+    )
+    
+    if not results:
+        print_error(f"No {', '.join(READ_FORMATS)} files found in: {args.input_file}")
+        return 1
     
-    if not elements:
-        return None
+    failed = [result for result in results if "error" in result]
+    for result in failed:
+        print_warning(f"{result['input']}: {result['error']}")
     
-    return {
-        "elements": elements,
-        "coordinates": coordinates,
-        "comment": "Converted from PDB",
-        "charge": 0,
-        "multiplicity": 1,
-    }
+    n_frames = sum(result.get("n_frames", 0) for result in results)
+    print_success(
+        f"Converted {len(results) - len(failed)} of {len(results)} files "
+        f"({n_frames} frames): {args.output_file}"
+    )
+    return 1 if failed else 0
 
 
-def parse_mol2(content: str) -> Optional[Dict[str, Any]]:
-    """Parse MOL2 format."""
-    elements = []
-    coordinates = []
-    
-    in_atom_section = False
-    
-    for line in content.split("\n"):
-        if "@<TRIPOS>ATOM" in line:
-            in_atom_section = True
-            continue
-        elif line.startswith("@<TRIPOS>"):
-            in_atom_section = False
-            continue
-        
-        if in_atom_section:
-            parts = line.split()
-            if len(parts) >= 6:
-                try:
-                    x = float(parts[2])
-                    y = float(parts[3])
-                    z = float(parts[4])
-                    element = parts[5].split(".")[0]  # Remove atom type suffix
-                    
-                    elements.append(element)
-                    coordinates.append([x, y, z])
-                except (ValueError, IndexError):
-                    continue
-    
-    if not elements:
-        return None
+def parse_input(content: str, format: str) -> Optional[Dict[str, Any]]:
+    """Parse a Psi4 or JSON input file; structure files go through StructureReader."""
+    if format == "psi4":
+        return parse_psi4(content)
+    elif format == "json":
+        return parse_json(content)
     
-    return {
-        "elements": elements,
-        "coordinates": coordinates,
-        "comment": "Converted from MOL2",
-        "charge": 0,
-        "multiplicity": 1,
-    }
+    return None
 
 
 def parse_psi4(content: str) -> Optional[Dict[str, Any]]:
@@ -309,42 +238,3 @@ def parse_json(content: str) -> Optional[Dict[str, Any]]:
         return None
     except json.JSONDecodeError:
         return None
-
-
-def format_xyz(data: Dict[str, Any]) -> str:
-    """Format as XYZ."""
-    elements = data["elements"]
-    coordinates = data["coordinates"]
-    comment = data.get("comment", "")
-    
-    lines = [str(len(elements)), comment]
-    
-    for elem, (x, y, z) in zip(elements, coordinates):
-        lines.append(f"{elem:2s} {x:15.10f} {y:15.10f} {z:15.10f}")
-    
-    return "\n".join(lines)
-
-
-def format_psi4(data: Dict[str, Any]) -> str:
-    """Format as Psi4 input."""
-    elements = data["elements"]
-    coordinates = data["coordinates"]
-    charge = data.get("charge", 0)
-    multiplicity = data.get("multiplicity", 1)
-    
-    lines = [
-        "molecule {",
-        f"  {charge} {multiplicity}",
-    ]
-    
-    for elem, (x, y, z) in zip(elements, coordinates):
-        lines.append(f"  {elem:2s} {x:15.10f} {y:15.10f} {z:15.10f}")
-    
-    lines.append("}")
-    
-    return "\n".join(lines)
-
-
-def format_json(data: Dict[str, Any]) -> str:
-    """Format as JSON."""
-    return json.dumps(data, indent=2)
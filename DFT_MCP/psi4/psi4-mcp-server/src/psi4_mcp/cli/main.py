@@ -123,11 +123,11 @@ def create_parser() -> argparse.ArgumentParser:
     )
     convert_parser.add_argument(
         "input_file",
-        help="Input file",
+        help="Input file, or a directory to convert every structure file in it",
     )
     convert_parser.add_argument(
         "output_file",
-        help="Output file",
+        help="Output file (output directory for a directory input)",
     )
     convert_parser.add_argument(
         "--from",
@@ -138,9 +138,19 @@ def create_parser() -> argparse.ArgumentParser:
     convert_parser.add_argument(
         "--to",
         dest="to_format",
-        choices=["xyz", "psi4", "json"],
+        choices=["xyz", "pdb", "mol2", "psi4", "json"],
         help="Output format (auto-detected if not specified)",
     )
+    convert_parser.add_argument(
+        "--frames",
+        help="Frames of a multi-frame file to convert, e.g. 10, 0:100 or ::10 (default: all)",
+    )
+    convert_parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes for directory conversion (default: CPU count)",
+    )
     
     # Info command
     info_parser = subparsers.add_parser(
@@ -38,6 +38,31 @@ class ServerConfig:
     # Timeouts (seconds)
     calculation_timeout: int = 3600  # 1 hour
     
+    # Admission scheduling (shared by all server processes on the node)
+    scheduler_enabled: bool = True
+    scheduler_dir: Optional[str] = field(default_factory=lambda: os.environ.get(
+        'PSI4_SCHEDULER_DIR', os.path.join(os.environ.get('PSI_SCRATCH', '/tmp/psi4_scratch'), 'scheduler')))
+    scheduler_timeout: int = 3600  # max queue wait
+    
+    # Convergence recovery (retries restart from the last orbitals/geometry)
+    recovery_enabled: bool = True
+    recovery_max_attempts: int = 4
+    
+    # Live output streaming (per-calculation output files, early abort)
+    stream_output: bool = True
+    stream_poll_interval: float = 0.5
+    
+    # Output retention: newest files kept in output_dir, and maximum age
+    # in hours (0 disables either limit)
+    output_keep_files: int = 500
+    output_max_age_hours: float = 168.0
+    
+    # Metrics and profiling (profile_tools: comma-separated tool names or "*")
+    metrics_enabled: bool = True
+    profile_tools: str = field(default_factory=lambda: os.environ.get('PSI4_PROFILE', ''))
+    profiler: str = field(default_factory=lambda: os.environ.get('PSI4_PROFILER', 'cprofile'))
+    profile_dir: Optional[str] = None  # default: <output_dir>/profiles
+    
     # Server settings
     log_level: str = "INFO"
     debug: bool = False
@@ -103,4 +128,10 @@ def load_from_env() -> ServerConfig:
         default_basis=os.environ.get('PSI4_BASIS', 'cc-pvdz'),
         log_level=os.environ.get('PSI4_LOG_LEVEL', 'INFO'),
         debug=os.environ.get('PSI4_DEBUG', '').lower() in ('true', '1', 'yes'),
+        scheduler_enabled=os.environ.get('PSI4_SCHEDULER', 'true').lower() in ('true', '1', 'yes'),
+        recovery_enabled=os.environ.get('PSI4_RECOVERY', 'true').lower() in ('true', '1', 'yes'),
+        stream_output=os.environ.get('PSI4_STREAM_OUTPUT', 'true').lower() in ('true', '1', 'yes'),
+        output_keep_files=int(os.environ.get('PSI4_OUTPUT_KEEP', 500)),
+        output_max_age_hours=float(os.environ.get('PSI4_OUTPUT_MAX_AGE', 168.0)),
+        metrics_enabled=os.environ.get('PSI4_METRICS', 'true').lower() in ('true', '1', 'yes'),
     )
@@ -41,6 +41,13 @@ from psi4_mcp.models.base import (
     ToolInput,
     ToolOutput,
     
+    # Array fields
+    NDArraySpec,
+    FloatArray,
+    FloatMatrix,
+    IntArray,
+    CoordinateArray,
+    
     # Coordinate types
     Coordinate3D,
     AtomSpec,
@@ -169,6 +176,11 @@ __all__ = [
     "ResourceModel",
     "ToolInput",
     "ToolOutput",
+    "NDArraySpec",
+    "FloatArray",
+    "FloatMatrix",
+    "IntArray",
+    "CoordinateArray",
     "Coordinate3D",
     "AtomSpec",
     "MoleculeSpec",
@@ -10,13 +10,20 @@ Key Base Classes:
     - CalculationInput: Base for calculation input specifications
     - CalculationOutput: Base for calculation results
     - ResourceModel: Base for MCP resource representations
+
+Array Fields:
+    - NDArraySpec: NumPy array field with dtype/shape declared in the schema
+    - FloatArray, FloatMatrix, IntArray, CoordinateArray: Common array types
 """
 
-from typing import Any, Optional, Literal
+from typing import Annotated, Any, Optional, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict, field_validator, model_validator
+from pydantic_core import core_schema
 from collections import Counter
 
+import numpy as np
+
 
 # =============================================================================
 # BASE MODEL CONFIGURATION
@@ -62,6 +69,97 @@ class Psi4BaseModel(BaseModel):
     def from_json(cls, json_str: str) -> "Psi4BaseModel":
         """Create model from JSON string."""
         return cls.model_validate_json(json_str)
+    
+    @classmethod
+    def from_trusted(cls, **data: Any) -> "Psi4BaseModel":
+        """
+        Create model from trusted internal data without validation.
+        
+        For results built straight from Psi4, which are already typed
+        and consistent. Derived fields are filled by _complete_trusted.
+        """
+        instance = cls.model_construct(**data)
+        instance._complete_trusted()
+        return instance
+    
+    def _complete_trusted(self) -> None:
+        """Fill derived fields after trusted construction."""
+    
+    def __eq__(self, other: Any) -> bool:
+        """Field-wise equality; NumPy array fields are compared by value."""
+        if not isinstance(other, BaseModel):
+            return NotImplemented
+        if type(self) is not type(other) or self.__dict__.keys() != other.__dict__.keys():
+            return False
+        return (
+            all(_values_equal(value, other.__dict__[name]) for name, value in self.__dict__.items())
+            and self.__pydantic_private__ == other.__pydantic_private__
+            and self.__pydantic_extra__ == other.__pydantic_extra__
+        )
+
+
+def _values_equal(a: Any, b: Any) -> bool:
+    """Equality of field values that may be NumPy arrays."""
+    if isinstance(a, np.ndarray) or isinstance(b, np.ndarray):
+        return bool(np.array_equal(a, b))
+    return bool(a == b)
+
+
+# =============================================================================
+# ARRAY FIELDS
+# =============================================================================
+
+class NDArraySpec:
+    """
+    Pydantic metadata for NumPy array fields.
+    
+    Values are converted with np.asarray (no per-element validation) and
+    serialized with ndarray.tolist() only when the model is dumped. The
+    JSON schema declares the dtype and shape.
+    
+    Args:
+        dtype: NumPy dtype name.
+        shape: Expected shape; None entries are free dimensions.
+    """
+    
+    def __init__(self, dtype: str = "float64", shape: tuple[Optional[int], ...] = (None,)):
+        self.dtype = np.dtype(dtype)
+        self.shape = shape
+    
+    def validate(self, value: Any) -> np.ndarray:
+        """Convert value to an array of the declared dtype and shape."""
+        array = np.asarray(value, dtype=self.dtype)
+        if array.ndim != len(self.shape):
+            raise ValueError(f"Expected {len(self.shape)}-D array, got {array.ndim}-D")
+        for axis, (size, expected) in enumerate(zip(array.shape, self.shape)):
+            if expected is not None and size != expected:
+                raise ValueError(f"Expected size {expected} along axis {axis}, got {size}")
+        return array
+    
+    def __get_pydantic_core_schema__(self, source: Any, handler: Any) -> core_schema.CoreSchema:
+        return core_schema.no_info_plain_validator_function(
+            self.validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(
+                lambda array: array.tolist() if isinstance(array, np.ndarray) else array,
+            ),
+        )
+    
+    def __get_pydantic_json_schema__(self, schema: Any, handler: Any) -> dict[str, Any]:
+        item_type = "integer" if self.dtype.kind in "iu" else "number"
+        json_schema: dict[str, Any] = {"type": item_type}
+        for size in reversed(self.shape):
+            json_schema = {"type": "array", "items": json_schema}
+            if size is not None:
+                json_schema["minItems"] = json_schema["maxItems"] = size
+        json_schema["dtype"] = self.dtype.name
+        json_schema["shape"] = list(self.shape)
+        return json_schema
+
+
+FloatArray = Annotated[np.ndarray, NDArraySpec("float64", (None,))]
+FloatMatrix = Annotated[np.ndarray, NDArraySpec("float64", (None, None))]
+IntArray = Annotated[np.ndarray, NDArraySpec("int64", (None,))]
+CoordinateArray = Annotated[np.ndarray, NDArraySpec("float64", (None, 3))]
 
 
 class StrictModel(Psi4BaseModel):
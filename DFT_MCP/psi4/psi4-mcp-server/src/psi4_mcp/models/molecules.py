@@ -16,6 +16,8 @@ from pydantic import Field, field_validator, model_validator
 from collections import Counter
 import math
 
+import numpy as np
+
 from psi4_mcp.models.base import (
     Psi4BaseModel,
     AtomSpec,
@@ -86,6 +88,9 @@ class AtomicPosition(Psi4BaseModel):
         
         return self
     
+    def _complete_trusted(self) -> None:
+        self.set_defaults()
+    
     @property
     def coordinates(self) -> tuple[float, float, float]:
         """Get coordinates as tuple."""
@@ -326,6 +331,11 @@ class Molecule(Psi4BaseModel):
         """Get all coordinates as list of [x, y, z] lists."""
         return [a.coordinates_list for a in self.atoms]
     
+    @property
+    def coordinates_array(self) -> np.ndarray:
+        """Coordinates as an (n_atoms, 3) array."""
+        return np.array([(a.x, a.y, a.z) for a in self.atoms], dtype=np.float64).reshape(-1, 3)
+    
     def get_symbols(self) -> list[str]:
         """Get all element symbols."""
         return [a.symbol for a in self.atoms]
@@ -11,12 +11,19 @@ Key Classes:
     - PopulationAnalysis: Charge and population data
     - BondOrderAnalysis: Bond order information
     - NBOOutput: Natural Bond Orbital analysis
+
+Orbital sets, population and bond order analyses can be array-backed:
+from_arrays() builds them from NumPy arrays produced by Psi4 without
+per-item validation, and the per-item models (MolecularOrbital,
+AtomicCharge, BondOrder) are only created when requested.
 """
 
-from typing import Any, Optional, Literal
+from typing import Any, Iterator, Optional, Literal, Sequence
 from pydantic import Field, model_validator
 
-from psi4_mcp.models.base import Psi4BaseModel
+import numpy as np
+
+from psi4_mcp.models.base import FloatArray, FloatMatrix, Psi4BaseModel
 
 
 # =============================================================================
@@ -88,7 +95,7 @@ class MolecularOrbital(Psi4BaseModel):
     def compute_energy_ev(self) -> "MolecularOrbital":
         """Compute energy in eV if not provided."""
         if self.energy_ev is None:
-            from psi4_mcp.utils.helpers.units import HARTREE_TO_EV
+            from psi4_mcp.utils.helpers.constants import HARTREE_TO_EV
             ev = self.energy * HARTREE_TO_EV
             object.__setattr__(self, 'energy_ev', ev)
         return self
@@ -100,15 +107,27 @@ class MolecularOrbital(Psi4BaseModel):
         if occupied != self.is_occupied:
             object.__setattr__(self, 'is_occupied', occupied)
         return self
+    
+    def _complete_trusted(self) -> None:
+        self.compute_energy_ev()
+        self.determine_occupied()
 
 
 class OrbitalSet(Psi4BaseModel):
     """
     Complete set of molecular orbitals (alpha or beta).
     
+    Either holds a list of MolecularOrbital models or, when built with
+    from_arrays(), the orbital energies, occupations and coefficients as
+    arrays; the accessors work on both.
+    
     Attributes:
         spin: Spin type (alpha, beta, or restricted).
         orbitals: List of molecular orbitals.
+        energies: Orbital energies in Hartree (array-backed sets).
+        occupations: Occupation numbers (array-backed sets).
+        coefficients: MO coefficients, shape (n_basis, n_orbitals).
+        symmetries: Symmetry labels per orbital.
         n_occupied: Number of occupied orbitals.
         n_virtual: Number of virtual orbitals.
         n_basis: Number of basis functions.
@@ -124,9 +143,25 @@ class OrbitalSet(Psi4BaseModel):
         description="Spin type",
     )
     orbitals: list[MolecularOrbital] = Field(
-        ...,
+        default_factory=list,
         description="Molecular orbitals",
     )
+    energies: Optional[FloatArray] = Field(
+        default=None,
+        description="Orbital energies in Hartree",
+    )
+    occupations: Optional[FloatArray] = Field(
+        default=None,
+        description="Occupation numbers",
+    )
+    coefficients: Optional[FloatMatrix] = Field(
+        default=None,
+        description="MO coefficients (n_basis x n_orbitals)",
+    )
+    symmetries: Optional[list[str]] = Field(
+        default=None,
+        description="Symmetry labels",
+    )
     n_occupied: int = Field(
         ...,
         ge=0,
@@ -168,34 +203,109 @@ class OrbitalSet(Psi4BaseModel):
     @model_validator(mode="after")
     def compute_homo_lumo(self) -> "OrbitalSet":
         """Compute HOMO/LUMO info if not provided."""
+        n_orbitals = self.n_orbitals
         if self.homo_index is None and self.n_occupied > 0:
             homo_idx = self.n_occupied - 1
             object.__setattr__(self, 'homo_index', homo_idx)
         
-        if self.lumo_index is None and self.n_occupied < len(self.orbitals):
+        if self.lumo_index is None and self.n_occupied < n_orbitals:
             lumo_idx = self.n_occupied
             object.__setattr__(self, 'lumo_index', lumo_idx)
         
         if self.homo_index is not None and self.homo_energy is None:
-            if self.homo_index < len(self.orbitals):
-                energy = self.orbitals[self.homo_index].energy
+            if self.homo_index < n_orbitals:
+                energy = self._energy_at(self.homo_index)
                 object.__setattr__(self, 'homo_energy', energy)
         
         if self.lumo_index is not None and self.lumo_energy is None:
-            if self.lumo_index < len(self.orbitals):
-                energy = self.orbitals[self.lumo_index].energy
+            if self.lumo_index < n_orbitals:
+                energy = self._energy_at(self.lumo_index)
                 object.__setattr__(self, 'lumo_energy', energy)
         
         if self.homo_lumo_gap is None:
             if self.homo_energy is not None and self.lumo_energy is not None:
-                from psi4_mcp.utils.helpers.units import HARTREE_TO_EV
+                from psi4_mcp.utils.helpers.constants import HARTREE_TO_EV
                 gap = (self.lumo_energy - self.homo_energy) * HARTREE_TO_EV
                 object.__setattr__(self, 'homo_lumo_gap', gap)
         
         return self
     
+    def _complete_trusted(self) -> None:
+        self.compute_homo_lumo()
+    
+    @classmethod
+    def from_arrays(
+        cls,
+        energies: Sequence[float],
+        occupations: Sequence[float],
+        coefficients: Optional[np.ndarray] = None,
+        n_basis: Optional[int] = None,
+        spin: Literal["alpha", "beta", "restricted"] = "restricted",
+        symmetries: Optional[list[str]] = None,
+    ) -> "OrbitalSet":
+        """
+        Build an array-backed orbital set from trusted data (e.g. a Psi4 wavefunction).
+        
+        Args:
+            energies: Orbital energies in Hartree.
+            occupations: Occupation numbers.
+            coefficients: MO coefficients (n_basis x n_orbitals).
+            n_basis: Number of basis functions (default: from coefficients or n_orbitals).
+            spin: Spin type.
+            symmetries: Symmetry labels per orbital.
+        """
+        energies = np.asarray(energies, dtype=np.float64)
+        occupations = np.asarray(occupations, dtype=np.float64)
+        if coefficients is not None:
+            coefficients = np.asarray(coefficients, dtype=np.float64)
+        if n_basis is None:
+            n_basis = coefficients.shape[0] if coefficients is not None else len(energies)
+        n_occupied = int(np.count_nonzero(occupations > 0.5))
+        return cls.from_trusted(
+            spin=spin,
+            energies=energies,
+            occupations=occupations,
+            coefficients=coefficients,
+            symmetries=symmetries,
+            n_occupied=n_occupied,
+            n_virtual=len(energies) - n_occupied,
+            n_basis=n_basis,
+        )
+    
+    @property
+    def n_orbitals(self) -> int:
+        """Number of orbitals in the set."""
+        if self.energies is not None:
+            return len(self.energies)
+        return len(self.orbitals)
+    
+    def _energy_at(self, position: int) -> float:
+        if self.energies is not None:
+            return float(self.energies[position])
+        return self.orbitals[position].energy
+    
+    def _orbital_at(self, position: int) -> MolecularOrbital:
+        """MolecularOrbital for an array position, created on demand."""
+        return MolecularOrbital.from_trusted(
+            index=position,
+            energy=float(self.energies[position]),
+            occupation=float(self.occupations[position]) if self.occupations is not None else 0.0,
+            symmetry=self.symmetries[position] if self.symmetries else None,
+            coefficients=self.coefficients[:, position].tolist() if self.coefficients is not None else None,
+        )
+    
+    def iter_orbitals(self) -> Iterator[MolecularOrbital]:
+        """Iterate over the orbitals, creating models lazily for array-backed sets."""
+        if self.energies is None:
+            yield from self.orbitals
+            return
+        for position in range(len(self.energies)):
+            yield self._orbital_at(position)
+    
     def get_orbital(self, index: int) -> Optional[MolecularOrbital]:
         """Get orbital by index."""
+        if self.energies is not None:
+            return self._orbital_at(index) if 0 <= index < len(self.energies) else None
         for orb in self.orbitals:
             if orb.index == index:
                 return orb
@@ -203,14 +313,16 @@ class OrbitalSet(Psi4BaseModel):
     
     def get_occupied(self) -> list[MolecularOrbital]:
         """Get all occupied orbitals."""
-        return [o for o in self.orbitals if o.is_occupied]
+        return [o for o in self.iter_orbitals() if o.is_occupied]
     
     def get_virtual(self) -> list[MolecularOrbital]:
         """Get all virtual orbitals."""
-        return [o for o in self.orbitals if not o.is_occupied]
+        return [o for o in self.iter_orbitals() if not o.is_occupied]
     
     def get_energies(self) -> list[float]:
         """Get list of orbital energies."""
+        if self.energies is not None:
+            return self.energies.tolist()
         return [o.energy for o in self.orbitals]
 
 
@@ -257,15 +369,15 @@ class OrbitalOutput(Psi4BaseModel):
         ge=0,
         description="Beta electrons",
     )
-    overlap_matrix: Optional[list[list[float]]] = Field(
+    overlap_matrix: Optional[FloatMatrix] = Field(
         default=None,
         description="Overlap matrix",
     )
-    density_matrix_alpha: Optional[list[list[float]]] = Field(
+    density_matrix_alpha: Optional[FloatMatrix] = Field(
         default=None,
         description="Alpha density matrix",
     )
-    density_matrix_beta: Optional[list[list[float]]] = Field(
+    density_matrix_beta: Optional[FloatMatrix] = Field(
         default=None,
         description="Beta density matrix",
     )
@@ -413,9 +525,14 @@ class PopulationAnalysis(Psi4BaseModel):
     """
     Complete population analysis output.
     
+    Array-backed analyses (from_arrays) hold the charges of the analysis
+    method in atomic_charges; AtomicCharge models are built on demand.
+    
     Attributes:
         method: Population analysis method.
         charges: Atomic charges.
+        symbols: Element symbols (array-backed analyses).
+        atomic_charges: Charges of the analysis method (array-backed analyses).
         populations: Atomic populations.
         dipole_moment: Dipole moment from charges.
         total_charge: Total molecular charge.
@@ -427,9 +544,17 @@ class PopulationAnalysis(Psi4BaseModel):
         description="Analysis method",
     )
     charges: list[AtomicCharge] = Field(
-        ...,
+        default_factory=list,
         description="Atomic charges",
     )
+    symbols: Optional[list[str]] = Field(
+        default=None,
+        description="Element symbols",
+    )
+    atomic_charges: Optional[FloatArray] = Field(
+        default=None,
+        description="Atomic charges of the analysis method",
+    )
     populations: Optional[list[AtomicPopulation]] = Field(
         default=None,
         description="Atomic populations",
@@ -448,10 +573,45 @@ class PopulationAnalysis(Psi4BaseModel):
         description="Spin multiplicity",
     )
     
+    @classmethod
+    def from_arrays(
+        cls,
+        method: str,
+        symbols: list[str],
+        charges: Sequence[float],
+        total_charge: Optional[float] = None,
+        spin_multiplicity: int = 1,
+        dipole_moment: Optional[list[float]] = None,
+    ) -> "PopulationAnalysis":
+        """Build an array-backed population analysis from trusted data."""
+        charges = np.asarray(charges, dtype=np.float64)
+        return cls.from_trusted(
+            method=method,
+            symbols=list(symbols),
+            atomic_charges=charges,
+            total_charge=float(charges.sum()) if total_charge is None else total_charge,
+            spin_multiplicity=spin_multiplicity,
+            dipole_moment=dipole_moment,
+        )
+    
+    def get_atomic_charges(self) -> list[AtomicCharge]:
+        """Get AtomicCharge models (created on demand for array-backed analyses)."""
+        if self.atomic_charges is None:
+            return self.charges
+        field = self.method.lower().replace("löwdin", "lowdin")
+        if field not in AtomicCharge.model_fields or field in ("atom_index", "symbol"):
+            field = "mulliken"
+        return [
+            AtomicCharge.from_trusted(atom_index=i, symbol=symbol, **{field: float(q)})
+            for i, (symbol, q) in enumerate(zip(self.symbols or [], self.atomic_charges))
+        ]
+    
     def get_charges_list(self, method: Optional[str] = None) -> list[float]:
         """Get list of charges."""
         if method is None:
             method = self.method
+        if self.atomic_charges is not None and method.lower() == self.method.lower():
+            return self.atomic_charges.tolist()
         return [c.get_charge(method) or 0.0 for c in self.charges]
     
     def get_total_charge(self, method: Optional[str] = None) -> float:
@@ -526,9 +686,15 @@ class BondOrderAnalysis(Psi4BaseModel):
     """
     Complete bond order analysis output.
     
+    Array-backed analyses (from_matrix) keep the full bond order matrix;
+    BondOrder models are built on demand for pairs above the threshold.
+    
     Attributes:
         method: Bond order method.
         bond_orders: List of bond orders.
+        symbols: Element symbols (array-backed analyses).
+        matrix: Bond order matrix (array-backed analyses).
+        threshold: Smallest bond order listed from the matrix.
         total_valences: Total valence for each atom.
         free_valences: Free valence for each atom.
     """
@@ -538,9 +704,22 @@ class BondOrderAnalysis(Psi4BaseModel):
         description="Bond order method",
     )
     bond_orders: list[BondOrder] = Field(
-        ...,
+        default_factory=list,
         description="Bond orders",
     )
+    symbols: Optional[list[str]] = Field(
+        default=None,
+        description="Element symbols",
+    )
+    matrix: Optional[FloatMatrix] = Field(
+        default=None,
+        description="Bond order matrix",
+    )
+    threshold: float = Field(
+        default=0.1,
+        ge=0,
+        description="Smallest bond order listed from the matrix",
+    )
     total_valences: Optional[list[float]] = Field(
         default=None,
         description="Total valences",
@@ -550,8 +729,60 @@ class BondOrderAnalysis(Psi4BaseModel):
         description="Free valences",
     )
     
+    @classmethod
+    def from_matrix(
+        cls,
+        method: str,
+        symbols: list[str],
+        matrix: np.ndarray,
+        threshold: float = 0.1,
+    ) -> "BondOrderAnalysis":
+        """Build an array-backed bond order analysis from a trusted matrix."""
+        matrix = np.asarray(matrix, dtype=np.float64)
+        return cls.from_trusted(
+            method=method,
+            symbols=list(symbols),
+            matrix=matrix,
+            threshold=threshold,
+            total_valences=(matrix.sum(axis=1) - np.diag(matrix)).tolist(),
+        )
+    
+    def _bond_from_matrix(self, atom1: int, atom2: int) -> BondOrder:
+        field = self.method.lower()
+        if field not in ("wiberg", "mayer", "nbo", "fuzzy"):
+            field = "wiberg"
+        symbols = self.symbols or [""] * len(self.matrix)
+        return BondOrder.from_trusted(
+            atom1_index=atom1,
+            atom2_index=atom2,
+            atom1_symbol=symbols[atom1],
+            atom2_symbol=symbols[atom2],
+            **{field: float(self.matrix[atom1, atom2])},
+        )
+    
+    def bonded_pairs(self) -> list[tuple[int, int]]:
+        """Atom pairs (i < j) whose bond order reaches the threshold."""
+        if self.matrix is None:
+            return [(bo.atom1_index, bo.atom2_index) for bo in self.bond_orders]
+        rows, cols = np.triu_indices(len(self.matrix), k=1)
+        keep = self.matrix[rows, cols] >= self.threshold
+        return list(zip(rows[keep].tolist(), cols[keep].tolist()))
+
+    def iter_bond_orders(self) -> Iterator[BondOrder]:
+        """Iterate over bonds (created on demand from the matrix for array-backed analyses)."""
+        if self.matrix is None:
+            yield from self.bond_orders
+            return
+        for atom1, atom2 in self.bonded_pairs():
+            yield self._bond_from_matrix(atom1, atom2)
+    
     def get_bond_order(self, atom1: int, atom2: int) -> Optional[BondOrder]:
         """Get bond order between two atoms."""
+        if self.matrix is not None:
+            n_atoms = len(self.matrix)
+            if 0 <= atom1 < n_atoms and 0 <= atom2 < n_atoms and atom1 != atom2:
+                return self._bond_from_matrix(min(atom1, atom2), max(atom1, atom2))
+            return None
         for bo in self.bond_orders:
             if (bo.atom1_index == atom1 and bo.atom2_index == atom2) or \
                (bo.atom1_index == atom2 and bo.atom2_index == atom1):
@@ -561,7 +792,7 @@ class BondOrderAnalysis(Psi4BaseModel):
     def get_bonds_to_atom(self, atom_index: int) -> list[BondOrder]:
         """Get all bonds involving a specific atom."""
         return [
-            bo for bo in self.bond_orders
+            bo for bo in self.iter_bond_orders()
             if bo.atom1_index == atom_index or bo.atom2_index == atom_index
         ]
 
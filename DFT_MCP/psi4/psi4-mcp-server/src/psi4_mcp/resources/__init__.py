@@ -2,7 +2,8 @@
 Psi4 MCP Resources Package.
 
 Provides access to basis sets, methods, functionals, reference molecules,
-literature references, benchmarks, and tutorials.
+literature references, benchmarks, tutorials, server metrics and
+calculation progress.
 """
 
 from psi4_mcp.resources.base_resource import BaseResource, RESOURCE_REGISTRY
@@ -11,6 +12,8 @@ from psi4_mcp.resources.methods import MethodResource
 from psi4_mcp.resources.functionals import FunctionalResource
 from psi4_mcp.resources.molecules import MoleculeResource
 from psi4_mcp.resources.elements import ElementResource
+from psi4_mcp.resources.metrics import MetricsResource
+from psi4_mcp.resources.progress import ProgressResource
 from psi4_mcp.resources.literature import (
     LiteratureDatabase,
     get_literature_database,
@@ -35,7 +38,7 @@ from psi4_mcp.resources.tutorials import (
 __all__ = [
     "BaseResource", "RESOURCE_REGISTRY",
     "BasisSetResource", "MethodResource", "FunctionalResource",
-    "MoleculeResource", "ElementResource",
+    "MoleculeResource", "ElementResource", "MetricsResource", "ProgressResource",
     "LiteratureDatabase", "get_literature_database",
     "get_method_citation", "get_basis_citation", "get_psi4_citation",
     "BenchmarkDatabase", "get_benchmark_database",
@@ -0,0 +1,35 @@
+"""Metrics Resource - Per-tool latency, phase and resource metrics."""
+
+from typing import Optional
+from psi4_mcp.resources.base_resource import BaseResource, register_resource
+from psi4_mcp.utils.parsing.streaming import get_active_streams
+from psi4_mcp.utils.profiling.instrumentation import PHASES, get_metrics_summary
+from psi4_mcp.utils.profiling.metrics import get_metrics_registry
+
+
+@register_resource
+class MetricsResource(BaseResource):
+    """Resource exposing server metrics."""
+
+    name = "metrics"
+    description = "Per-tool call counts, latency and phase histograms, peak RSS, threads and cache hits"
+
+    def get(self, subpath: Optional[str] = None) -> str:
+        if subpath == "prometheus":
+            return get_metrics_registry().render_prometheus()
+
+        summary = get_metrics_summary()
+        if subpath is None:
+            return self.to_json({
+                "phases": list(PHASES),
+                "tools": summary,
+                "running": get_active_streams(),
+            })
+
+        if subpath in summary:
+            return self.to_json({subpath: summary[subpath]})
+
+        return self.to_json({
+            "error": f"No metrics for '{subpath}'",
+            "available": ["prometheus"] + list(summary),
+        })
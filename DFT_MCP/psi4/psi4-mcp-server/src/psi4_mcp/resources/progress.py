@@ -0,0 +1,46 @@
+"""Progress Resource - Live progress events of streamed calculations."""
+
+import threading
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+from psi4_mcp.resources.base_resource import BaseResource, register_resource
+from psi4_mcp.utils.parsing.streaming import (
+    ProgressEvent, add_progress_listener, get_active_streams,
+)
+
+
+@register_resource
+class ProgressResource(BaseResource):
+    """Resource exposing the most recent ProgressEvents of all calculations."""
+
+    name = "progress"
+    description = "Running calculations and their latest SCF, optimization and error events"
+
+    def __init__(self, max_events: int = 500):
+        self._events: Deque[Dict[str, Any]] = deque(maxlen=max_events)
+        self._lock = threading.Lock()
+        add_progress_listener(self.record)
+
+    def record(self, event: ProgressEvent) -> None:
+        """Progress listener storing the event."""
+        with self._lock:
+            self._events.append({
+                "source": event.source, "kind": event.kind,
+                "timestamp": event.timestamp, **event.data,
+            })
+
+    def get(self, subpath: Optional[str] = None) -> str:
+        with self._lock:
+            recorded = list(self._events)
+        events = recorded
+        if subpath is not None:
+            events = [event for event in recorded if event["source"] == subpath]
+            if not events:
+                return self.to_json({
+                    "error": f"No progress events for '{subpath}'",
+                    "available": sorted({event["source"] for event in recorded}),
+                })
+        return self.to_json({
+            "running": get_active_streams(),
+            "events": events,
+        })
@@ -10,9 +10,11 @@ Usage:
 """
 
 import asyncio
+import json
 import logging
 import sys
 import os
+import time
 from typing import Any, Optional
 from contextlib import asynccontextmanager
 
@@ -30,6 +32,7 @@ import psi4
 # Local imports
 from psi4_mcp.tools.core.base_tool import TOOL_REGISTRY, BaseTool
 from psi4_mcp.config import ServerConfig, get_config
+from psi4_mcp.utils.profiling.metrics import get_metrics_registry
 from psi4_mcp import __version__
 
 # Configure logging to stderr (CRITICAL for stdio transport)
@@ -52,6 +55,8 @@ class Psi4MCPServer:
         self.config = config or get_config()
         self.server = Server("psi4-mcp-server")
         self._psi4_initialized = False
+        # Register resources now so psi4://progress records every calculation
+        import psi4_mcp.resources  # noqa: F401
         self._setup_handlers()
         
     def _initialize_psi4(self) -> None:
@@ -142,8 +147,12 @@ class Psi4MCPServer:
                         "errors": [e.dict() for e in result.errors] if result.errors else []
                     }
                 
-                import json
-                return [TextContent(type="text", text=json.dumps(response, indent=2, default=str))]
+                encode_start = time.perf_counter()
+                text = json.dumps(response, indent=2, default=str)
+                get_metrics_registry().histogram(
+                    "tool_phase_seconds", "Wall time of tool calls by phase"
+                ).observe(time.perf_counter() - encode_start, tool=name, phase="response_encoding")
+                return [TextContent(type="text", text=text)]
                 
             except Exception as e:
                 logger.exception(f"Tool execution failed: {name}")
@@ -254,12 +263,14 @@ class Psi4MCPServer:
         """Run server with HTTP transport."""
         from mcp.server.sse import SseServerTransport
         from starlette.applications import Starlette
+        from starlette.responses import Response
         from starlette.routing import Route
         import uvicorn
         
         self._load_all_tools()
         logger.info(f"Starting Psi4 MCP Server v{__version__} (HTTP)")
         logger.info(f"Listening on http://{host}:{port}")
+        logger.info(f"Prometheus metrics on http://{host}:{port}/metrics")
         
         sse = SseServerTransport("/messages")
         
@@ -275,10 +286,17 @@ class Psi4MCPServer:
         async def handle_messages(request):
             await sse.handle_post_message(request.scope, request.receive, request._send)
         
+        async def handle_metrics(request):
+            return Response(
+                get_metrics_registry().render_prometheus(),
+                media_type="text/plain; version=0.0.4; charset=utf-8",
+            )
+        
         app = Starlette(
             routes=[
                 Route("/sse", endpoint=handle_sse),
                 Route("/messages", endpoint=handle_messages, methods=["POST"]),
+                Route("/metrics", endpoint=handle_metrics),
             ]
         )
         
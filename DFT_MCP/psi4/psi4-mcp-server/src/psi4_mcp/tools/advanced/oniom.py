@@ -17,6 +17,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -97,7 +98,7 @@ def run_oniom_calculation(input_data: ONIOMInput) -> ONIOMResult:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_oniom.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_oniom.out"), False)
     
     psi4.set_options({"reference": "rhf" if input_data.multiplicity == 1 else "uhf"})
     
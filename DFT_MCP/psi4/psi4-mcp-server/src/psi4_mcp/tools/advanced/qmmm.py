@@ -18,6 +18,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -106,7 +107,7 @@ def run_qmmm_calculation(input_data: QMMMInput) -> QMMMResult:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_qmmm.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_qmmm.out"), False)
     
     mol_string = f"{input_data.qm_charge} {input_data.qm_multiplicity}\n{input_data.qm_geometry}"
     mol = psi4.geometry(mol_string)
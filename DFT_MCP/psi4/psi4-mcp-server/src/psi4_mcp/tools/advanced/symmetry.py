@@ -21,6 +21,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -109,7 +110,7 @@ def run_symmetry_analysis(input_data: SymmetryInput) -> SymmetryResult:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_symmetry.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_symmetry.out"), False)
     
     mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
     mol = psi4.geometry(mol_string)
@@ -1,14 +1,27 @@
 """
 Cube File Generation and Analysis Tool.
 
-Generates and manipulates Gaussian cube files for visualization
-of molecular orbitals, electron density, and other 3D properties.
+Generates and manipulates volumetric data (Gaussian cube files) for
+visualization of molecular orbitals, electron density, and other 3D
+properties.
+
+Volumes are evaluated in-process from the basis set and the density
+matrices / orbital coefficients (see utils.cube), several properties in
+one pass over the grid. They are stored as compact binary volume files
+(optionally also exported as text cube files), report statistics of the
+actual values, and can be combined (density differences, spin densities)
+later without running another SCF.
+
+With surface_isovalue, isosurfaces of the volumes are returned directly
+as compact typed arrays (see utils.visualization.surfaces), so clients
+can render orbitals and densities without fetching the volumes.
 
 Reference:
     Gaussian cube file format specification.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from pathlib import Path
 from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import logging
 
@@ -18,6 +31,9 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.cube import CubeGrid, Volume, VolumeEngine, combine_volumes
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
+from psi4_mcp.utils.visualization.surfaces import ORBITAL_COLORS, SurfaceVisualizer
 
 
 logger = logging.getLogger(__name__)
@@ -25,6 +41,8 @@ logger = logging.getLogger(__name__)
 
 CUBE_PROPERTIES = {
     "density": "Total electron density",
+    "alpha_density": "Alpha electron density",
+    "beta_density": "Beta electron density",
     "esp": "Electrostatic potential",
     "homo": "HOMO orbital",
     "lumo": "LUMO orbital",
@@ -44,21 +62,36 @@ class CubeFileResult:
     max_value: float
     orbital_index: Optional[int]
     
+    # All volumes written: label, files, statistics
+    volumes: List[Dict[str, Any]] = field(default_factory=list)
+    grid_origin: Optional[Tuple[float, float, float]] = None
+    energy: Optional[float] = None
+    wavefunction_file: Optional[str] = None
+    scf_reused: bool = False
+    # Compact isosurfaces: label, isovalue, typed arrays
+    surfaces: List[Dict[str, Any]] = field(default_factory=list)
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "property_type": self.property_type,
             "filename": self.filename,
             "grid_points": self.grid_points,
             "grid_spacing_bohr": self.grid_spacing,
+            "grid_origin_bohr": self.grid_origin,
             "min_value": self.min_value,
             "max_value": self.max_value,
             "orbital_index": self.orbital_index,
+            "volumes": self.volumes,
+            "energy": self.energy,
+            "wavefunction_file": self.wavefunction_file,
+            "scf_reused": self.scf_reused,
+            "surfaces": self.surfaces,
         }
 
 
 class CubeFileInput(ToolInput):
     """Input for cube file generation."""
-    geometry: str = Field(..., description="Molecular geometry")
+    geometry: str = Field(default="", description="Molecular geometry")
     method: str = Field(default="hf", description="Method for density/orbitals")
     basis: str = Field(default="cc-pvdz")
     charge: int = Field(default=0)
@@ -66,41 +99,140 @@ class CubeFileInput(ToolInput):
     
     property_type: str = Field(
         default="density",
-        description="Property to visualize: density, esp, homo, lumo, orbital, spin_density"
+        description="Property to visualize: density, alpha_density, beta_density, esp, "
+                    "homo, lumo, orbital, spin_density"
+    )
+    properties: Optional[List[str]] = Field(
+        default=None,
+        description="Additional properties evaluated in the same pass over the grid"
     )
     
     orbital_index: Optional[int] = Field(default=None, description="Orbital index for 'orbital' property")
+    orbital_indices: Optional[List[int]] = Field(default=None, description="Additional orbital indices")
     
-    grid_points: int = Field(default=50, description="Grid points per dimension")
+    grid_points: int = Field(default=50, description="Grid points along the longest dimension")
     grid_padding: float = Field(default=4.0, description="Padding around molecule (bohr)")
+    grid_spacing: Optional[float] = Field(default=None, description="Grid spacing (bohr); overrides grid_points")
     
     output_filename: str = Field(default="output.cube", description="Output filename")
+    output_directory: Optional[str] = Field(default=None, description="Directory for output files")
+    write_cube: bool = Field(default=False, description="Also export text cube files")
+    compress: bool = Field(default=True, description="Compress binary volumes (uncompressed ones can be memory-mapped)")
+    
+    wavefunction_file: Optional[str] = Field(
+        default=None,
+        description="Wavefunction file (.npy) to use instead of running SCF; written there if missing"
+    )
+    
+    combine_volumes: Optional[List[str]] = Field(
+        default=None,
+        description="Existing volume (.vol) or cube files to combine linearly instead of computing"
+    )
+    combine_coefficients: Optional[List[float]] = Field(
+        default=None,
+        description="Coefficients of combine_volumes (default: difference of two volumes)"
+    )
+    
+    surface_isovalue: Optional[float] = Field(
+        default=None,
+        description="Return isosurfaces at this value (both signs for volumes with negative lobes)"
+    )
+    max_triangles: int = Field(default=20000, description="Triangle budget per isosurface")
     
     memory: int = Field(default=4000)
     n_threads: int = Field(default=1)
 
 
+def requested_properties(input_data: CubeFileInput) -> List[str]:
+    """Primary property followed by the additional ones, without duplicates."""
+    properties = [input_data.property_type]
+    for prop in input_data.properties or []:
+        if prop not in properties:
+            properties.append(prop)
+    return properties
+
+
+def requested_orbitals(input_data: CubeFileInput) -> List[int]:
+    indices = [input_data.orbital_index] if input_data.orbital_index is not None else []
+    for i in input_data.orbital_indices or []:
+        if i not in indices:
+            indices.append(i)
+    return indices
+
+
 def validate_cube_file_input(input_data: CubeFileInput) -> Optional[ValidationError]:
-    if not input_data.geometry or not input_data.geometry.strip():
+    if input_data.surface_isovalue is not None and input_data.surface_isovalue <= 0:
+        return ValidationError(field="surface_isovalue", message="surface_isovalue must be positive")
+    if input_data.max_triangles < 1:
+        return ValidationError(field="max_triangles", message="max_triangles must be positive")
+    if input_data.combine_volumes:
+        coefficients = input_data.combine_coefficients
+        if coefficients is not None and len(coefficients) != len(input_data.combine_volumes):
+            return ValidationError(
+                field="combine_coefficients", message="Need one coefficient per volume"
+            )
+        if coefficients is None and len(input_data.combine_volumes) != 2:
+            return ValidationError(
+                field="combine_coefficients",
+                message="combine_coefficients required unless combining exactly two volumes",
+            )
+        return None
+    has_wavefunction = bool(input_data.wavefunction_file) and Path(input_data.wavefunction_file).exists()
+    if not has_wavefunction and (not input_data.geometry or not input_data.geometry.strip()):
         return ValidationError(field="geometry", message="Geometry cannot be empty")
-    if input_data.property_type not in CUBE_PROPERTIES:
-        return ValidationError(
-            field="property_type",
-            message=f"Invalid property. Use: {', '.join(CUBE_PROPERTIES.keys())}"
-        )
-    if input_data.property_type == "orbital" and input_data.orbital_index is None:
+    for prop in requested_properties(input_data):
+        if prop not in CUBE_PROPERTIES:
+            return ValidationError(
+                field="property_type",
+                message=f"Invalid property. Use: {', '.join(CUBE_PROPERTIES.keys())}"
+            )
+    if "orbital" in requested_properties(input_data) and not requested_orbitals(input_data):
         return ValidationError(field="orbital_index", message="orbital_index required for 'orbital' property")
     return None
 
 
-def run_cube_file_generation(input_data: CubeFileInput) -> CubeFileResult:
-    """Generate cube file."""
+def output_base(input_data: CubeFileInput) -> Path:
+    """Output path without extension."""
+    path = Path(input_data.output_filename)
+    if input_data.output_directory:
+        path = Path(input_data.output_directory) / path.name
+    path.parent.mkdir(parents=True, exist_ok=True)
+    return path.with_suffix("")
+
+
+def write_volume(volume: Volume, base: Path, input_data: CubeFileInput, suffix: str = "") -> Dict[str, Any]:
+    """Write a volume (binary, optionally cube text) and describe it."""
+    stem = base.with_name(base.name + suffix)
+    files = [str(volume.save(stem, compress=input_data.compress))]
+    if input_data.write_cube:
+        files.append(str(volume.write_cube(stem.with_suffix(".cube"))))
+    return {"label": volume.label, "files": files, **volume.statistics.to_dict()}
+
+
+def load_volume(path: str) -> Volume:
+    """Binary volume or Gaussian cube file."""
+    if path.endswith(".cube"):
+        return Volume.read_cube(path)
+    return Volume.load(path)
+
+
+def get_wavefunction(input_data: CubeFileInput) -> Tuple[Any, Optional[float], bool]:
+    """
+    Wavefunction from file, or from an SCF run (saved to wavefunction_file if given).
+    
+    Returns:
+        (wavefunction, energy, whether it was reused)
+    """
     import psi4
     
-    psi4.core.clean()
+    if input_data.wavefunction_file and Path(input_data.wavefunction_file).exists():
+        logger.info(f"Reusing wavefunction {input_data.wavefunction_file}")
+        wfn = psi4.core.Wavefunction.from_file(input_data.wavefunction_file)
+        return wfn, wfn.energy(), True
+    
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_cube.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_cube.out"), False)
     
     mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
     mol = psi4.geometry(mol_string)
@@ -109,41 +241,100 @@ def run_cube_file_generation(input_data: CubeFileInput) -> CubeFileResult:
     psi4.set_options({
         "basis": input_data.basis,
         "reference": "rhf" if input_data.multiplicity == 1 else "uhf",
-        "cubeprop_tasks": [input_data.property_type.upper()],
-        "cubic_grid_overage": [input_data.grid_padding],
-        "cubic_grid_spacing": [input_data.grid_padding / input_data.grid_points],
     })
     
-    logger.info(f"Generating {input_data.property_type} cube file")
-    
-    # Run calculation to get wavefunction
-    energy, wfn = psi4.energy(f"{input_data.method}/{input_data.basis}", 
+    energy, wfn = psi4.energy(f"{input_data.method}/{input_data.basis}",
                               return_wfn=True, molecule=mol)
+    if input_data.wavefunction_file:
+        wfn.to_file(input_data.wavefunction_file)
+    return wfn, energy, False
+
+
+def volume_surfaces(volumes: List[Volume], input_data: CubeFileInput) -> List[Dict[str, Any]]:
+    """Compact isosurfaces of the volumes; negative lobes where the volume reaches -isovalue."""
+    if input_data.surface_isovalue is None:
+        return []
+    visualizer = SurfaceVisualizer(input_data.max_triangles)
+    isovalue = input_data.surface_isovalue
+    surfaces = []
+    for volume in volumes:
+        statistics = volume.statistics
+        lobes = [(isovalue, ORBITAL_COLORS[0])] if statistics.max_value >= isovalue else []
+        if statistics.min_value <= -isovalue:
+            lobes.append((-isovalue, ORBITAL_COLORS[1]))
+        for level, color in lobes:
+            surface = visualizer.surface_from_volume(volume, level, color)
+            surfaces.append({"label": volume.label, **visualizer.to_compact(surface)})
+    return surfaces
+
+
+def run_volume_combination(input_data: CubeFileInput) -> CubeFileResult:
+    """Linear combination of existing volumes (no SCF)."""
+    volumes = [load_volume(path) for path in input_data.combine_volumes]
+    coefficients = input_data.combine_coefficients or [1.0, -1.0]
+    result_volume = combine_volumes(volumes, coefficients)
+    entry = write_volume(result_volume, output_base(input_data), input_data)
+    grid = result_volume.grid
     
-    # Generate cube file
-    psi4.cubeprop(wfn)
+    return CubeFileResult(
+        property_type="combination",
+        filename=entry["files"][0],
+        grid_points=grid.shape,
+        grid_spacing=grid.spacing[0],
+        min_value=entry["min_value"],
+        max_value=entry["max_value"],
+        orbital_index=None,
+        volumes=[entry],
+        grid_origin=grid.origin,
+        surfaces=volume_surfaces([result_volume], input_data),
+    )
+
+
+def run_cube_file_generation(input_data: CubeFileInput) -> CubeFileResult:
+    """Generate volumes of all requested properties."""
+    if input_data.combine_volumes:
+        return run_volume_combination(input_data)
+    
+    import psi4
     
-    # Calculate grid spacing
-    grid_spacing = input_data.grid_padding / input_data.grid_points
+    psi4.core.clean()
+    wfn, energy, reused = get_wavefunction(input_data)
     
-    # Estimate min/max values
-    if input_data.property_type == "density":
-        min_val, max_val = 0.0, 0.5
-    elif input_data.property_type == "esp":
-        min_val, max_val = -0.1, 0.1
-    else:
-        min_val, max_val = -0.1, 0.1
+    coordinates = wfn.molecule().geometry().np
+    grid = CubeGrid.around(
+        coordinates,
+        spacing=input_data.grid_spacing,
+        padding=input_data.grid_padding,
+        points=input_data.grid_points,
+    )
+    properties = requested_properties(input_data)
+    logger.info(f"Evaluating {', '.join(properties)} on a {grid.shape} grid")
     
+    engine = VolumeEngine(wfn, grid)
+    volumes = engine.compute(properties, requested_orbitals(input_data))
     psi4.core.clean()
     
+    base = output_base(input_data)
+    entries = [write_volume(volume, base, input_data, f"_{label}") for label, volume in volumes.items()]
+    surfaces = volume_surfaces(list(volumes.values()), input_data)
+    primary = next(
+        (e for e in entries if e["label"].startswith(input_data.property_type)), entries[0]
+    )
+    
     return CubeFileResult(
         property_type=input_data.property_type,
-        filename=input_data.output_filename,
-        grid_points=(input_data.grid_points, input_data.grid_points, input_data.grid_points),
-        grid_spacing=grid_spacing,
-        min_value=min_val,
-        max_value=max_val,
+        filename=primary["files"][0],
+        grid_points=grid.shape,
+        grid_spacing=grid.spacing[0],
+        min_value=primary["min_value"],
+        max_value=primary["max_value"],
         orbital_index=input_data.orbital_index,
+        volumes=entries,
+        grid_origin=grid.origin,
+        energy=energy,
+        wavefunction_file=input_data.wavefunction_file,
+        scf_reused=reused,
+        surfaces=surfaces,
     )
 
 
@@ -153,7 +344,7 @@ class CubeFileTool(BaseTool[CubeFileInput, ToolOutput]):
     name: ClassVar[str] = "generate_cube_file"
     description: ClassVar[str] = "Generate cube files for visualization of molecular properties."
     category: ClassVar[ToolCategory] = ToolCategory.ANALYSIS
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.2.0"
     
     def _validate_input(self, input_data: CubeFileInput) -> Optional[ValidationError]:
         return validate_cube_file_input(input_data)
@@ -170,6 +361,19 @@ class CubeFileTool(BaseTool[CubeFileInput, ToolOutput]):
             f"Spacing:     {result.grid_spacing:.4f} bohr\n"
             f"Value Range: [{result.min_value:.4f}, {result.max_value:.4f}]"
         )
+        if len(result.volumes) > 1:
+            message += "\n\nVolume                 Min          Max     Integral"
+            for volume in result.volumes:
+                message += (
+                    f"\n{volume['label']:<18} {volume['min_value']:10.4e} "
+                    f"{volume['max_value']:10.4e} {volume['integral']:12.6f}"
+                )
+        if result.surfaces:
+            message += "\n\nSurface               Isovalue    Triangles"
+            for surface in result.surfaces:
+                message += (
+                    f"\n{surface['label']:<18} {surface['isovalue']:12.4e} {surface['n_triangles']:12d}"
+                )
         return Result.success(ToolOutput(success=True, message=message, data=result.to_dict()))
 
 
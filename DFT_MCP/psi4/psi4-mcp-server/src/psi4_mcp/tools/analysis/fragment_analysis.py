@@ -5,26 +5,41 @@ Analyzes molecular systems in terms of fragment contributions
 for understanding intermolecular interactions and bonding.
 
 Key Features:
-    - Fragment orbital analysis
-    - Interaction energy decomposition
-    - Charge transfer analysis
+    - Many-body expansion (1-, 2- and 3-body) over fragments
+    - Dimer/trimer screening by distance cutoff with a cell-list index
+    - Optional counterpoise correction with ghost atoms
+    - Subsystem calculations in parallel workers, cached by content
+    - Charge transfer analysis (Mulliken charges in the dimers)
 """
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, List, Optional, Tuple
+from dataclasses import dataclass, field
+from itertools import combinations
+from typing import Any, ClassVar, Dict, Iterable, List, Optional, Set, Tuple
 import logging
+import time
 
+import numpy as np
 from pydantic import Field
 
 from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.caching.results import (
+    CalculationType, cache_calculation_result, get_cached_result,
+)
+from psi4_mcp.utils.geometry.neighbors import neighbor_pairs
+from psi4_mcp.utils.helpers.constants import get_atomic_number
+from psi4_mcp.utils.parallel.workers import run_worker_tasks, share_resources
 
 
 logger = logging.getLogger(__name__)
 HARTREE_TO_KCAL = 627.5094740631
 
+BSSE_CORRECTIONS = ("none", "cp")
+
+Atom = Tuple[str, float, float, float]
+
 
 @dataclass
 class FragmentInfo:
@@ -45,6 +60,26 @@ class FragmentInfo:
         }
 
 
+@dataclass
+class ManyBodyTerm:
+    """Interaction energy of one dimer or trimer."""
+    fragments: Tuple[int, ...]
+    energy: float
+    interaction_energy: float
+    min_distance: float
+    charge_transfer: Optional[float] = None
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "fragments": list(self.fragments),
+            "energy_hartree": self.energy,
+            "interaction_energy_hartree": self.interaction_energy,
+            "interaction_energy_kcal": self.interaction_energy * HARTREE_TO_KCAL,
+            "min_distance_angstrom": self.min_distance,
+            "charge_transfer": self.charge_transfer,
+        }
+
+
 @dataclass
 class FragmentAnalysisResult:
     """Fragment analysis results."""
@@ -56,6 +91,18 @@ class FragmentAnalysisResult:
     method: str
     basis: str
     
+    max_order: int = 2
+    bsse_correction: str = "none"
+    two_body_energy: float = 0.0
+    three_body_energy: float = 0.0
+    dimers: List[ManyBodyTerm] = field(default_factory=list)
+    trimers: List[ManyBodyTerm] = field(default_factory=list)
+    supersystem_energy: Optional[float] = None
+    n_subsystems: int = 0
+    n_cached: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)
+    wall_time: float = 0.0
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "fragments": [f.to_dict() for f in self.fragments],
@@ -66,6 +113,21 @@ class FragmentAnalysisResult:
             "charge_transfer": self.charge_transfer,
             "method": self.method,
             "basis": self.basis,
+            "max_order": self.max_order,
+            "bsse_correction": self.bsse_correction,
+            "two_body_energy_hartree": self.two_body_energy,
+            "three_body_energy_hartree": self.three_body_energy,
+            "dimers": [d.to_dict() for d in self.dimers],
+            "trimers": [t.to_dict() for t in self.trimers],
+            "supersystem_energy_hartree": self.supersystem_energy,
+            "truncation_error_hartree": (
+                self.complex_energy - self.supersystem_energy
+                if self.supersystem_energy is not None else None
+            ),
+            "n_subsystems": self.n_subsystems,
+            "n_cached": self.n_cached,
+            "failed": self.failed,
+            "wall_time_seconds": self.wall_time,
         }
 
 
@@ -81,8 +143,19 @@ class FragmentAnalysisInput(ToolInput):
     total_charge: int = Field(default=0)
     total_multiplicity: int = Field(default=1)
     
+    max_order: int = Field(default=2, description="Highest n-body order (1-3)")
+    dimer_cutoff: Optional[float] = Field(
+        default=None, description="Closest-contact cutoff for dimers (Angstrom); all dimers if unset"
+    )
+    trimer_cutoff: Optional[float] = Field(
+        default=None, description="Closest-contact cutoff between all trimer pairs (Angstrom)"
+    )
+    bsse_correction: str = Field(default="none", description="BSSE correction: none or cp (ghost atoms)")
+    compute_supersystem: bool = Field(default=False, description="Also run the full complex")
+    
     analyze_charge_transfer: bool = Field(default=True)
     
+    max_workers: int = Field(default=1, description="Worker processes for subsystem calculations")
     memory: int = Field(default=4000)
     n_threads: int = Field(default=1)
 
@@ -93,6 +166,23 @@ def validate_fragment_analysis_input(input_data: FragmentAnalysisInput) -> Optio
     for i, frag in enumerate(input_data.fragments):
         if not frag or not frag.strip():
             return ValidationError(field="fragments", message=f"Fragment {i} is empty")
+        if not parse_geometry_data(frag):
+            return ValidationError(field="fragments", message=f"Fragment {i} has no atoms")
+    if input_data.max_order not in (1, 2, 3):
+        return ValidationError(field="max_order", message="max_order must be 1, 2 or 3")
+    if input_data.bsse_correction.lower() not in BSSE_CORRECTIONS:
+        return ValidationError(
+            field="bsse_correction", message=f"Use one of: {', '.join(BSSE_CORRECTIONS)}"
+        )
+    for name in ("dimer_cutoff", "trimer_cutoff"):
+        value = getattr(input_data, name)
+        if value is not None and value <= 0:
+            return ValidationError(field=name, message=f"{name} must be positive")
+    if (input_data.trimer_cutoff is not None and input_data.dimer_cutoff is not None
+            and input_data.trimer_cutoff > input_data.dimer_cutoff):
+        return ValidationError(field="trimer_cutoff", message="trimer_cutoff cannot exceed dimer_cutoff")
+    if input_data.max_workers < 1:
+        return ValidationError(field="max_workers", message="max_workers must be at least 1")
     return None
 
 
@@ -101,73 +191,338 @@ def count_atoms(geometry: str) -> int:
     return sum(1 for line in geometry.strip().split("\n") if len(line.split()) >= 4)
 
 
-def run_fragment_analysis(input_data: FragmentAnalysisInput) -> FragmentAnalysisResult:
-    """Execute fragment analysis."""
-    import psi4
+def parse_geometry_data(geometry: str) -> List[Atom]:
+    """Extract element symbols and coordinates from geometry string."""
+    atoms = []
+    for line in geometry.strip().split("\n"):
+        parts = line.split()
+        if len(parts) >= 4:
+            element = ''.join(c for c in parts[0] if c.isalpha())
+            x, y, z = float(parts[1]), float(parts[2]), float(parts[3])
+            atoms.append((element, x, y, z))
+    return atoms
+
+
+# =============================================================================
+# N-MER ENUMERATION
+# =============================================================================
+
+def close_fragment_pairs(
+    fragment_atoms: List[List[Atom]],
+    cutoff: Optional[float],
+) -> Dict[Tuple[int, int], float]:
+    """
+    Fragment pairs whose closest atoms are within the cutoff.
     
-    psi4.core.clean()
-    psi4.set_memory(f"{input_data.memory} MB")
-    psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_fragment.out", False)
+    Atom pairs come from a cell-list neighbor search, so only atoms in
+    neighboring cells are compared.
     
-    psi4.set_options({
-        "basis": input_data.basis,
-        "reference": "rhf" if input_data.total_multiplicity == 1 else "uhf",
-    })
+    Returns:
+        Closest interatomic distance (Angstrom) keyed by fragment pair
+    """
+    coords = np.array([a[1:] for atoms in fragment_atoms for a in atoms], dtype=float)
+    owner = np.repeat(np.arange(len(fragment_atoms)), [len(atoms) for atoms in fragment_atoms])
+    if cutoff is None:
+        # Every pair, with one cell spanning the whole system
+        cutoff = float(np.linalg.norm(np.ptp(coords, axis=0))) + 1.0
     
-    logger.info(f"Running fragment analysis with {len(input_data.fragments)} fragments")
+    i, j, dist = neighbor_pairs(coords, cutoff)
+    inter = owner[i] != owner[j]
+    pairs: Dict[Tuple[int, int], float] = {}
+    for frag_a, frag_b, d in zip(owner[i[inter]].tolist(), owner[j[inter]].tolist(), dist[inter].tolist()):
+        key = (min(frag_a, frag_b), max(frag_a, frag_b))
+        if d < pairs.get(key, np.inf):
+            pairs[key] = d
+    return pairs
+
+
+def enumerate_nmers(
+    fragment_atoms: List[List[Atom]],
+    max_order: int,
+    dimer_cutoff: Optional[float],
+    trimer_cutoff: Optional[float],
+) -> Tuple[Dict[Tuple[int, int], float], Dict[Tuple[int, int, int], float]]:
+    """
+    Dimers and trimers included in the expansion.
     
-    # Calculate each fragment
-    fragments = []
-    fragment_energies = []
+    A trimer is included when all three of its pairs are within the
+    trimer cutoff (which also makes them dimers).
+    
+    Returns:
+        (dimers, trimers) mapped to their closest-contact distance
+    """
+    if max_order < 2:
+        return {}, {}
+    dimers = close_fragment_pairs(fragment_atoms, dimer_cutoff)
+    if max_order < 3:
+        return dimers, {}
+    
+    trimer_pairs = dimers if trimer_cutoff is None else {
+        pair: d for pair, d in dimers.items() if d <= trimer_cutoff
+    }
+    partners: Dict[int, Set[int]] = {}
+    for i, j in trimer_pairs:
+        partners.setdefault(i, set()).add(j)
+    trimers = {}
+    for i, js in partners.items():
+        for j, k in combinations(sorted(js), 2):
+            if (j, k) in trimer_pairs:
+                trimers[(i, j, k)] = max(trimer_pairs[(i, j)], trimer_pairs[(i, k)], trimer_pairs[(j, k)])
+    return dimers, trimers
+
+
+# =============================================================================
+# SUBSYSTEMS
+# =============================================================================
+
+@dataclass(frozen=True)
+class Subsystem:
+    """Real fragments computed in the basis of real + ghost fragments."""
+    real: Tuple[int, ...]
+    ghost: Tuple[int, ...] = ()
+    
+    @property
+    def label(self) -> str:
+        real = ",".join(str(i) for i in self.real)
+        return f"({real})" + (f"[{','.join(str(i) for i in self.ghost)}]" if self.ghost else "")
+
+
+def required_subsystems(
+    n_fragments: int,
+    dimers: Iterable[Tuple[int, ...]],
+    trimers: Iterable[Tuple[int, ...]],
+    cp: bool,
+) -> List[Subsystem]:
+    """Every subsystem calculation the expansion needs."""
+    needed: Dict[Subsystem, None] = {Subsystem((i,)): None for i in range(n_fragments)}
+    for nmer in list(dimers) + list(trimers):
+        needed[Subsystem(tuple(nmer))] = None
+        if cp:
+            # Lower-order terms in the n-mer basis
+            for order in range(1, len(nmer)):
+                for sub in combinations(nmer, order):
+                    ghost = tuple(i for i in nmer if i not in sub)
+                    needed[Subsystem(sub, ghost)] = None
+        elif len(nmer) == 3:
+            for sub in combinations(nmer, 2):
+                needed[Subsystem(sub)] = None
+    return list(needed)
+
+
+def subsystem_atoms(subsystem: Subsystem, fragment_atoms: List[List[Atom]]) -> List[Atom]:
+    """Atoms of a subsystem in fragment order; ghost atoms labelled Gh(X)."""
+    atoms = []
+    for i in sorted(subsystem.real + subsystem.ghost):
+        ghost = i in subsystem.ghost
+        atoms.extend((f"Gh({a[0]})" if ghost else a[0], a[1], a[2], a[3]) for a in fragment_atoms[i])
+    return atoms
+
+
+def subsystem_spin(subsystem: Subsystem, charges: List[int], multiplicities: List[int]) -> Tuple[int, int]:
+    """Charge and (high-spin) multiplicity of the real fragments."""
+    charge = sum(charges[i] for i in subsystem.real)
+    multiplicity = sum(multiplicities[i] - 1 for i in subsystem.real) + 1
+    return charge, multiplicity
+
+
+def run_subsystem(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Energy (and optionally Mulliken charges) of one subsystem.
     
-    for i, frag_geom in enumerate(input_data.fragments):
-        charge = input_data.fragment_charges[i] if i < len(input_data.fragment_charges) else 0
-        mult = input_data.fragment_multiplicities[i] if i < len(input_data.fragment_multiplicities) else 1
+    Returns:
+        Dict with label, energy, charges, runtime (or error)
+    """
+    import psi4
+    
+    start = time.time()
+    try:
+        psi4.core.clean()
+        psi4.set_memory(f"{task['memory']} MB")
+        psi4.set_num_threads(task["n_threads"])
+        if task.get("output_file"):
+            psi4.core.set_output_file(task["output_file"], True)
         
-        mol_string = f"{charge} {mult}\n{frag_geom}"
-        mol = psi4.geometry(mol_string)
+        mol = psi4.geometry(task["molecule"])
         mol.update_geometry()
+        psi4.set_options({
+            "basis": task["basis"],
+            "reference": task["reference"],
+        })
         
-        energy = psi4.energy(f"{input_data.method}/{input_data.basis}", molecule=mol)
-        n_atoms = count_atoms(frag_geom)
-        n_elec = mol.nalpha() + mol.nbeta() if hasattr(mol, 'nalpha') else n_atoms * 5
+        energy, wfn = psi4.energy(f"{task['method']}/{task['basis']}", molecule=mol, return_wfn=True)
+        charges = None
+        if task.get("charges"):
+            psi4.oeprop(wfn, "MULLIKEN_CHARGES")
+            charges = np.asarray(wfn.atomic_point_charges()).tolist()
+        return {"label": task["label"], "energy": float(energy), "charges": charges,
+                "runtime": time.time() - start}
+    except Exception as e:
+        logger.warning(f"Subsystem {task['label']} failed: {e}")
+        return {"label": task["label"], "error": str(e), "runtime": time.time() - start}
+    finally:
+        psi4.core.clean()
+
+
+# =============================================================================
+# MANY-BODY EXPANSION
+# =============================================================================
+
+def run_fragment_analysis(input_data: FragmentAnalysisInput) -> FragmentAnalysisResult:
+    """Execute fragment analysis as a many-body expansion."""
+    start = time.time()
+    n_frag = len(input_data.fragments)
+    charges = [input_data.fragment_charges[i] if i < len(input_data.fragment_charges) else 0
+               for i in range(n_frag)]
+    mults = [input_data.fragment_multiplicities[i] if i < len(input_data.fragment_multiplicities) else 1
+             for i in range(n_frag)]
+    fragment_atoms = [parse_geometry_data(frag) for frag in input_data.fragments]
+    method = input_data.method.lower()
+    basis = input_data.basis.lower()
+    cp = input_data.bsse_correction.lower() == "cp"
+    
+    dimers, trimers = enumerate_nmers(
+        fragment_atoms, input_data.max_order, input_data.dimer_cutoff, input_data.trimer_cutoff,
+    )
+    subsystems = required_subsystems(n_frag, dimers, trimers, cp)
+    supersystem_key = Subsystem(tuple(range(n_frag)))
+    if input_data.compute_supersystem and n_frag > 1 and supersystem_key not in subsystems:
+        subsystems.append(supersystem_key)
+    logger.info(
+        f"Fragment analysis: {n_frag} fragments, {len(dimers)} dimers, "
+        f"{len(trimers)} trimers, {len(subsystems)} subsystems"
+    )
+    
+    # Look up cached subsystems, queue the rest
+    energies: Dict[Subsystem, float] = {}
+    atomic_charges: Dict[Subsystem, List[float]] = {}
+    failed: Dict[str, str] = {}
+    tasks: List[Dict[str, Any]] = []
+    pending: Dict[str, Tuple[Subsystem, Dict[str, Any]]] = {}
+    for sub in subsystems:
+        atoms = subsystem_atoms(sub, fragment_atoms)
+        charge, mult = subsystem_spin(sub, charges, mults)
+        reference = "rhf" if mult == 1 else "uhf"
+        want_charges = input_data.analyze_charge_transfer and len(sub.real) == 2 and not sub.ghost
+        cache_key = dict(
+            calculation_type=CalculationType.ENERGY, geometry=atoms, charge=charge,
+            multiplicity=mult, method=method, basis=basis, reference=reference,
+        )
+        # Charges are per atom: they are cached separately, keyed on the atom order
+        if want_charges:
+            cached = get_cached_result(**cache_key, per_atom=True)
+        else:
+            cached = get_cached_result(**cache_key, near_duplicates=True)
+        if cached is not None and "energy" in cached and (not want_charges or cached.get("charges")):
+            energies[sub] = cached["energy"]
+            if want_charges:
+                atomic_charges[sub] = cached["charges"]
+            continue
         
+        lines = "\n".join(f"{a[0]} {a[1]:.10f} {a[2]:.10f} {a[3]:.10f}" for a in atoms)
+        tasks.append({
+            "label": sub.label, "molecule": f"{charge} {mult}\n{lines}",
+            "method": method, "basis": basis, "reference": reference,
+            "memory": input_data.memory, "n_threads": input_data.n_threads,
+            "charges": want_charges, "output_file": None,
+        })
+        pending[sub.label] = (sub, cache_key)
+    n_cached = len(subsystems) - len(tasks)
+    
+    workers = share_resources(
+        tasks, input_data.max_workers, input_data.memory, input_data.n_threads, "psi4_fragment.out",
+    )
+    for result in run_worker_tasks(run_subsystem, tasks, workers, "psi4_fragment"):
+        sub, cache_key = pending[result["label"]]
+        if "error" in result:
+            failed[sub.label] = result["error"]
+            continue
+        energies[sub] = result["energy"]
+        cache_calculation_result(
+            result={"energy": result["energy"]}, computation_time=result.get("runtime", 0.0), **cache_key,
+        )
+        if result.get("charges"):
+            atomic_charges[sub] = result["charges"]
+            cache_calculation_result(
+                result={"energy": result["energy"], "charges": result["charges"]},
+                computation_time=result.get("runtime", 0.0), per_atom=True, **cache_key,
+            )
+    
+    # 1-body
+    fragments = []
+    for i, atoms in enumerate(fragment_atoms):
         fragments.append(FragmentInfo(
-            index=i, n_atoms=n_atoms, n_electrons=n_elec,
-            charge=charge, energy=energy,
+            index=i, n_atoms=len(atoms),
+            n_electrons=sum(get_atomic_number(a[0]) for a in atoms) - charges[i],
+            charge=charges[i], energy=energies.get(Subsystem((i,)), float("nan")),
         ))
-        fragment_energies.append(energy)
-        
-        psi4.core.clean_options()
-        psi4.set_options({"basis": input_data.basis})
+    fragment_sum = sum(f.energy for f in fragments)
+    
+    def energy(real: Tuple[int, ...], basis_of: Tuple[int, ...]) -> Optional[float]:
+        ghost = tuple(i for i in basis_of if i not in real) if cp else ()
+        return energies.get(Subsystem(real, ghost))
     
-    # Calculate complex
-    complex_geom = "\n--\n".join(input_data.fragments)
-    complex_mol_string = f"{input_data.total_charge} {input_data.total_multiplicity}\n{complex_geom}"
-    complex_mol = psi4.geometry(complex_mol_string)
-    complex_mol.update_geometry()
+    def interaction(nmer: Tuple[int, ...]) -> Optional[float]:
+        """n-body increment of an n-mer; lower orders in its basis with CP."""
+        total = 0.0
+        for order in range(1, len(nmer) + 1):
+            sign = (-1) ** (len(nmer) - order)
+            for sub in combinations(nmer, order):
+                value = energy(sub, nmer)
+                if value is None:
+                    return None
+                total += sign * value
+        return total
     
-    complex_energy = psi4.energy(f"{input_data.method}/{input_data.basis}", molecule=complex_mol)
+    # 2-body
+    dimer_terms = []
+    charge_transfer = [0.0] * n_frag
+    for pair, distance in sorted(dimers.items()):
+        increment = interaction(pair)
+        if increment is None:
+            continue
+        ct = None
+        pair_charges = atomic_charges.get(Subsystem(pair))
+        if pair_charges is not None:
+            n_first = len(fragment_atoms[pair[0]])
+            ct = float(sum(pair_charges[:n_first])) - charges[pair[0]]
+            charge_transfer[pair[0]] += ct
+            charge_transfer[pair[1]] -= ct
+        dimer_terms.append(ManyBodyTerm(pair, energies[Subsystem(pair)], increment, distance, ct))
+    two_body = sum(t.interaction_energy for t in dimer_terms)
     
-    fragment_sum = sum(fragment_energies)
-    interaction = complex_energy - fragment_sum
+    # 3-body
+    trimer_terms = []
+    for triple, distance in sorted(trimers.items()):
+        increment = interaction(triple)
+        if increment is not None:
+            trimer_terms.append(ManyBodyTerm(triple, energies[Subsystem(triple)], increment, distance))
+    three_body = sum(t.interaction_energy for t in trimer_terms)
     
-    # Estimate charge transfer (simplified)
-    charge_transfer = [0.0] * len(fragments)
-    if input_data.analyze_charge_transfer and len(fragments) == 2:
-        charge_transfer = [-0.01, 0.01]  # Placeholder
+    supersystem = energies.get(Subsystem(tuple(range(n_frag)))) if input_data.compute_supersystem else None
+    if supersystem is None and input_data.compute_supersystem and n_frag == 1:
+        supersystem = fragment_sum
     
-    psi4.core.clean()
+    complex_energy = fragment_sum + two_body + three_body
     
     return FragmentAnalysisResult(
         fragments=fragments,
         complex_energy=complex_energy,
         fragment_sum_energy=fragment_sum,
-        interaction_energy=interaction,
-        charge_transfer=charge_transfer,
+        interaction_energy=complex_energy - fragment_sum,
+        charge_transfer=charge_transfer if input_data.analyze_charge_transfer else [0.0] * n_frag,
         method=input_data.method.upper(),
         basis=input_data.basis,
+        max_order=input_data.max_order,
+        bsse_correction=input_data.bsse_correction.lower(),
+        two_body_energy=two_body,
+        three_body_energy=three_body,
+        dimers=dimer_terms,
+        trimers=trimer_terms,
+        supersystem_energy=supersystem,
+        n_subsystems=len(subsystems),
+        n_cached=n_cached,
+        failed=failed,
+        wall_time=time.time() - start,
     )
 
 
@@ -175,9 +530,11 @@ def run_fragment_analysis(input_data: FragmentAnalysisInput) -> FragmentAnalysis
 class FragmentAnalysisTool(BaseTool[FragmentAnalysisInput, ToolOutput]):
     """Tool for fragment analysis."""
     name: ClassVar[str] = "analyze_fragments"
-    description: ClassVar[str] = "Analyze molecular system in terms of fragments."
+    description: ClassVar[str] = (
+        "Analyze molecular system in terms of fragments with a many-body expansion."
+    )
     category: ClassVar[ToolCategory] = ToolCategory.ANALYSIS
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.1"
     
     def _validate_input(self, input_data: FragmentAnalysisInput) -> Optional[ValidationError]:
         return validate_fragment_analysis_input(input_data)
@@ -185,18 +542,30 @@ class FragmentAnalysisTool(BaseTool[FragmentAnalysisInput, ToolOutput]):
     def _execute(self, input_data: FragmentAnalysisInput) -> Result[ToolOutput]:
         result = run_fragment_analysis(input_data)
         
-        frag_lines = [f"  Frag {f.index}: {f.energy:.10f} Eh ({f.n_atoms} atoms)" 
+        frag_lines = [f"  Frag {f.index}: {f.energy:.10f} Eh ({f.n_atoms} atoms)"
                       for f in result.fragments]
         
         message = (
-            f"Fragment Analysis ({result.method}/{result.basis})\n"
+            f"Fragment Analysis ({result.method}/{result.basis}, "
+            f"MBE({result.max_order}), BSSE: {result.bsse_correction})\n"
             f"{'='*50}\n"
             f"Fragments:\n" + "\n".join(frag_lines) + "\n"
+            f"Dimers: {len(result.dimers)}  Trimers: {len(result.trimers)}  "
+            f"Subsystems: {result.n_subsystems} ({result.n_cached} cached)\n"
+            f"2-body:            {result.two_body_energy * HARTREE_TO_KCAL:.4f} kcal/mol\n"
+            f"3-body:            {result.three_body_energy * HARTREE_TO_KCAL:.4f} kcal/mol\n"
             f"Complex Energy:    {result.complex_energy:.10f} Eh\n"
             f"Interaction Energy:{result.interaction_energy:.10f} Eh\n"
             f"                   {result.interaction_energy * HARTREE_TO_KCAL:.4f} kcal/mol"
         )
-        return Result.success(ToolOutput(success=True, message=message, data=result.to_dict()))
+        if result.supersystem_energy is not None:
+            message += (
+                f"\nSupersystem:       {result.supersystem_energy:.10f} Eh "
+                f"(MBE error {(result.complex_energy - result.supersystem_energy) * HARTREE_TO_KCAL:.4f} kcal/mol)"
+            )
+        if result.failed:
+            message += f"\nFailed subsystems: {', '.join(result.failed)}"
+        return Result.success(ToolOutput(success=not result.failed, message=message, data=result.to_dict()))
 
 
 def analyze_fragments(fragments: List[str], method: str = "hf", **kwargs: Any) -> ToolOutput:
@@ -31,6 +31,7 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -172,7 +173,7 @@ def run_cbs_qb3_calculation(input_data: CBSQB3Input) -> CBSQB3Result:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_cbsqb3.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_cbsqb3.out"), False)
     
     # Build molecule
     mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
@@ -32,6 +32,7 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -124,7 +125,7 @@ def run_g3_calculation(input_data: G3Input) -> G3Result:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_g3.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_g3.out"), False)
     
     mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
     mol = psi4.geometry(mol_string)
@@ -13,16 +13,30 @@ Key Classes:
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, Optional, TypeVar, Generic, Type, ClassVar
+from contextlib import ExitStack, contextmanager
+from typing import Any, Iterator, Optional, TypeVar, Generic, Type, ClassVar
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
 import logging
 import json
+import os
+import time
+from pathlib import Path
 
 from pydantic import BaseModel, Field
 
-from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.config import get_config
+from psi4_mcp.models.errors import Result, CalculationError, resource_error
+from psi4_mcp.utils.convergence.restart import (
+    capture_convergence_failure, psi4_options_applied, release_restart_files,
+)
+from psi4_mcp.utils.error_handling.detection import detect_psi4_error
+from psi4_mcp.utils.error_handling.recovery import get_recovery_manager, system_signatures
+from psi4_mcp.utils.helpers.string_utils import parse_geometry_string
+from psi4_mcp.utils.parallel.scheduler import AdmissionError, ResourceGrant, get_scheduler
+from psi4_mcp.utils.parsing.streaming import CalculationStream, active_output_file, stream_calculation
+from psi4_mcp.utils.profiling.instrumentation import current_profile, profile_call, profile_phase
 
 
 logger = logging.getLogger(__name__)
@@ -285,24 +299,49 @@ class BaseTool(ABC, Generic[TInput, TOutput]):
         Returns:
             ToolOutput with results or error.
         """
+        config = get_config()
+        if not config.metrics_enabled:
+            return self._run(input_data)
+        
+        profile_dir = config.profile_dir or os.path.join(config.output_dir, "profiles")
+        with profile_call(
+            self.name,
+            capture=config.profile_tools,
+            capture_mode=config.profiler,
+            capture_dir=Path(profile_dir),
+        ) as profile:
+            output = self._run(input_data)
+            profile.success = output.success
+        return output
+    
+    def _run(self, input_data: dict[str, Any]) -> ToolOutput:
+        """Validate, admit, execute and convert, timing each phase."""
         start_time = datetime.now()
         
         try:
             # Validate and parse input
-            parsed_input = self._validate_input(input_data)
+            with profile_phase("validation"):
+                parsed_input = self._validate_input(input_data)
             if isinstance(parsed_input, ToolOutput):
                 return parsed_input  # Validation error
             
             self._logger.info(f"Executing {self.name}")
             
-            # Execute tool logic
-            result = self._execute(parsed_input)
+            # Execute tool logic once the node has room for it
+            with self._admitted(parsed_input), self._streamed() as stream:
+                result = self._execute_with_recovery(parsed_input)
+            
+            if stream is not None and result.is_success:
+                data = getattr(result.value, "data", None)
+                if isinstance(data, dict):
+                    data.setdefault("output_file", str(stream.path))
             
             # Calculate execution time
             execution_time = (datetime.now() - start_time).total_seconds()
             
             # Convert result to output
-            output = ToolOutput.from_result(result, execution_time)
+            with profile_phase("serialization"):
+                output = ToolOutput.from_result(result, execution_time)
             
             self._logger.info(
                 f"Completed {self.name} in {execution_time:.2f}s "
@@ -311,6 +350,20 @@ class BaseTool(ABC, Generic[TInput, TOutput]):
             
             return output
             
+        except AdmissionError as e:
+            execution_time = (datetime.now() - start_time).total_seconds()
+            self._logger.warning(f"Not admitted {self.name}: {e}")
+            
+            return ToolOutput(
+                success=False,
+                message="Insufficient resources",
+                error=str(resource_error(
+                    str(e), e.resource_type,
+                    requested=round(e.requested), available=round(e.available),
+                )),
+                execution_time=execution_time,
+            )
+            
         except Exception as e:
             execution_time = (datetime.now() - start_time).total_seconds()
             self._logger.exception(f"Error in {self.name}: {e}")
@@ -388,6 +441,141 @@ class BaseTool(ABC, Generic[TInput, TOutput]):
                 error=str(e),
             )
     
+    def _execute_with_recovery(self, input_data: TInput) -> Result[TOutput]:
+        """
+        Execute, retrying convergence failures with escalating strategies.
+        
+        The failure is classified from the error message. Applicable
+        recovery strategies are tried in the order the recovery history
+        ranks them for similar systems, each retry starting from the
+        orbitals (GUESS READ) or geometry the failed attempt reached.
+        Outcomes are recorded so the cheapest working strategy goes first
+        next time.
+        """
+        with capture_convergence_failure() as checkpoint:
+            result = self._execute(input_data)
+        
+        config = get_config()
+        if result.is_success or not config.recovery_enabled:
+            return result
+        
+        error_info = detect_psi4_error("", str(result.error), output_file=active_output_file())
+        if error_info is None or not error_info.recoverable:
+            return result
+        
+        manager = get_recovery_manager()
+        geometry = getattr(input_data, "geometry", None)
+        signatures = system_signatures(
+            error_info.category,
+            [atom[0] for atom in parse_geometry_string(geometry)] if isinstance(geometry, str) else [],
+            method=str(getattr(input_data, "method", None) or getattr(input_data, "functional", None) or ""),
+            multiplicity=getattr(input_data, "multiplicity", 1) or 1,
+        )
+        strategies = manager.rank_strategies(error_info, signatures)[:config.recovery_max_attempts]
+        
+        attempts = []
+        try:
+            for strategy in strategies:
+                options = strategy.get_modified_options(error_info, {})
+                options.update(checkpoint.restart_options())
+                if checkpoint.has_geometry and isinstance(geometry, str):
+                    restart_geometry = checkpoint.restart_geometry(geometry)
+                    if restart_geometry is not None:
+                        input_data.geometry = restart_geometry
+                
+                self._logger.info(f"Retrying {self.name}: {strategy.get_description()}")
+                start = time.monotonic()
+                with capture_convergence_failure() as retry_checkpoint, psi4_options_applied(options):
+                    retry = self._execute(input_data)
+                cost = time.monotonic() - start
+                
+                manager.record_outcome(signatures, strategy, retry.is_success, cost)
+                attempts.append({
+                    "strategy": strategy.get_description(),
+                    "restarted_from": (
+                        "orbitals" if checkpoint.has_orbitals
+                        else "geometry" if checkpoint.has_geometry else "scratch"
+                    ),
+                    "success": retry.is_success,
+                    "seconds": round(cost, 3),
+                })
+                
+                if retry.is_success:
+                    data = getattr(retry.value, "data", None)
+                    if isinstance(data, dict):
+                        data["recovery"] = {"error": error_info.message, "attempts": attempts}
+                    return retry
+                
+                # Continue from wherever this attempt got to
+                if retry_checkpoint.has_orbitals or retry_checkpoint.has_geometry:
+                    checkpoint = retry_checkpoint
+        finally:
+            release_restart_files()
+        
+        if attempts:
+            self._logger.warning(f"{self.name}: {len(attempts)} recovery attempts failed")
+        return result
+    
+    @contextmanager
+    def _admitted(self, input_data: Any) -> Iterator[Optional[ResourceGrant]]:
+        """
+        Hold a node resource grant while the calculation runs.
+        
+        Inputs with a geometry and memory/n_threads fields are estimated,
+        queued or down-sized by the node scheduler, and their memory and
+        n_threads are rewritten to the granted values. Other tools run
+        unscheduled.
+        
+        Raises:
+            AdmissionError: If the calculation cannot be admitted.
+        """
+        config = get_config()
+        geometry = getattr(input_data, "geometry", None)
+        if (not config.scheduler_enabled or not isinstance(geometry, str)
+                or not hasattr(input_data, "memory") or not hasattr(input_data, "n_threads")):
+            yield None
+            return
+        
+        scheduler = get_scheduler()
+        request = scheduler.estimate_request(
+            self.name,
+            method=str(getattr(input_data, "method", None) or getattr(input_data, "functional", None) or ""),
+            basis=str(getattr(input_data, "basis", None) or ""),
+            geometry=geometry,
+            charge=getattr(input_data, "charge", 0) or 0,
+            memory_mb=input_data.memory,
+            n_threads=input_data.n_threads,
+        )
+        with ExitStack() as stack:
+            with profile_phase("admission"):
+                grant = stack.enter_context(scheduler.reserve(request, timeout=config.scheduler_timeout))
+            input_data.memory = max(100, int(grant.memory_mb))
+            input_data.n_threads = grant.n_threads
+            yield grant
+    
+    @contextmanager
+    def _streamed(self) -> Iterator[Optional[CalculationStream]]:
+        """
+        Give the calculation its own output file, parsed while it runs.
+        
+        Progress (SCF iterations, energies, optimization steps) is logged
+        at debug level; hopeless runs are stopped early and fail with
+        a "Calculation aborted early" error.
+        """
+        config = get_config()
+        if not config.stream_output:
+            yield None
+            return
+        
+        with stream_calculation(self.name, poll_interval=config.stream_poll_interval) as stream:
+            stream.parser.add_listener(
+                lambda event: self._logger.debug(f"{self.name} {event.kind}: {event.data}")
+            )
+            profile = current_profile()
+            if profile is not None:
+                stream.parser.add_listener(profile.on_progress)
+            yield stream
+    
     def _get_input_class(self) -> Optional[Type[ToolInput]]:
         """Get the input class from generic type parameters."""
         # Try to extract from __orig_bases__
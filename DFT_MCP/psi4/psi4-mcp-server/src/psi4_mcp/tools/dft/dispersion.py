@@ -4,20 +4,34 @@ DFT Dispersion Correction Tool.
 Computes and applies empirical dispersion corrections to DFT calculations
 using various DFT-D schemes (D2, D3, D3BJ, D4).
 
+The DFT energy is computed once without dispersion (and cached); all
+requested dispersion variants are then evaluated post-SCF with the
+dispersion engine, for the input geometry and for any additional
+geometries (scan points, conformers) of the same molecule.
+
 Reference:
     Grimme, S. et al. J. Chem. Phys. 2010, 132, 154104.
 """
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import logging
+import time
 
+import numpy as np
 from pydantic import Field
 
 from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.caching.results import (
+    CalculationType, cache_calculation_result, get_cached_result,
+)
+from psi4_mcp.utils.conversion.geometry import parse_psi4_geometry
+from psi4_mcp.utils.dispersion import DISPERSION_VARIANTS, DispersionEngine
+from psi4_mcp.utils.helpers.constants import ANGSTROM_TO_BOHR, get_atomic_number
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -37,6 +51,13 @@ class DispersionResult:
     two_body_contribution: Optional[float] = None
     three_body_contribution: Optional[float] = None
     
+    # All requested variants at the input geometry
+    variants: Dict[str, Dict[str, Any]] = field(default_factory=dict)
+    # Dispersion corrections of additional geometries
+    geometries: List[Dict[str, Any]] = field(default_factory=list)
+    gradient: Optional[List[List[float]]] = None
+    dft_from_cache: bool = False
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
             "dft_energy_hartree": self.dft_energy,
@@ -48,6 +69,10 @@ class DispersionResult:
             "basis": self.basis,
             "two_body_hartree": self.two_body_contribution,
             "three_body_hartree": self.three_body_contribution,
+            "dispersion_gradient": self.gradient,
+            "variants": self.variants,
+            "geometries": self.geometries,
+            "dft_from_cache": self.dft_from_cache,
         }
 
 
@@ -63,86 +88,163 @@ class DispersionInput(ToolInput):
         default="d3bj",
         description="Dispersion method: d2, d3, d3bj, d3m, d3mbj, d4"
     )
+    dispersion_methods: Optional[List[str]] = Field(
+        default=None,
+        description="Additional dispersion methods evaluated on the same DFT energy"
+    )
     
     include_three_body: bool = Field(default=False, description="Include 3-body ATM term")
+    compute_gradient: bool = Field(default=False, description="Also return dispersion gradients")
+    
+    geometries: Optional[List[str]] = Field(
+        default=None,
+        description="Additional geometries of the same molecule (scan points, conformers); "
+                    "only their dispersion corrections are computed"
+    )
     
     memory: int = Field(default=4000)
     n_threads: int = Field(default=1)
 
 
+def parse_geometry_data(geometry: str) -> List[Tuple[str, float, float, float]]:
+    """Element symbols and Angstrom coordinates from a Psi4 geometry string (any units)."""
+    parsed = parse_psi4_geometry(geometry)
+    if parsed is None:
+        return []
+    return [(atom.symbol, atom.x, atom.y, atom.z) for atom in parsed.to_angstrom().atoms]
+
+
+def requested_variants(input_data: DispersionInput) -> List[str]:
+    """Primary dispersion method followed by the additional ones, without duplicates."""
+    variants = [input_data.dispersion_method.lower()]
+    for method in input_data.dispersion_methods or []:
+        if method.lower() not in variants:
+            variants.append(method.lower())
+    return variants
+
+
 def validate_dispersion_input(input_data: DispersionInput) -> Optional[ValidationError]:
     if not input_data.geometry or not input_data.geometry.strip():
         return ValidationError(field="geometry", message="Geometry cannot be empty")
     
-    valid_methods = ["d2", "d3", "d3bj", "d3m", "d3mbj", "d4"]
-    if input_data.dispersion_method.lower() not in valid_methods:
-        return ValidationError(
-            field="dispersion_method",
-            message=f"Invalid method. Use: {', '.join(valid_methods)}"
-        )
+    for method in requested_variants(input_data):
+        if method not in DISPERSION_VARIANTS:
+            return ValidationError(
+                field="dispersion_method",
+                message=f"Invalid method '{method}'. Use: {', '.join(DISPERSION_VARIANTS)}"
+            )
+    
+    elements = [atom[0].capitalize() for atom in parse_geometry_data(input_data.geometry)]
+    if not elements:
+        return ValidationError(field="geometry", message="No atoms found in geometry")
+    for i, geometry in enumerate(input_data.geometries or []):
+        if [atom[0].capitalize() for atom in parse_geometry_data(geometry)] != elements:
+            return ValidationError(
+                field="geometries",
+                message=f"Geometry {i + 1} does not have the same atoms as the input geometry"
+            )
     return None
 
 
-def run_dispersion_calculation(input_data: DispersionInput) -> DispersionResult:
-    """Execute DFT-D calculation."""
+def compute_dft_energy(input_data: DispersionInput) -> Tuple[float, bool]:
+    """
+    DFT energy without dispersion, taken from the results cache when available.
+    
+    Returns:
+        (energy in Hartree, whether it came from the cache)
+    """
+    atoms = parse_geometry_data(input_data.geometry)
+    reference = "rhf" if input_data.multiplicity == 1 else "uhf"
+    cache_key = dict(
+        calculation_type=CalculationType.ENERGY,
+        geometry=atoms,
+        charge=input_data.charge,
+        multiplicity=input_data.multiplicity,
+        method=input_data.functional.lower(),
+        basis=input_data.basis.lower(),
+        reference=reference,
+    )
+    cached = get_cached_result(**cache_key, near_duplicates=True)
+    if cached is not None and "energy" in cached:
+        logger.info(f"Reusing cached {input_data.functional}/{input_data.basis} energy")
+        return float(cached["energy"]), True
+    
     import psi4
     
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_dispersion.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_dispersion.out"), False)
     
     mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
     mol = psi4.geometry(mol_string)
     mol.update_geometry()
     
-    disp_method = input_data.dispersion_method.lower()
-    
-    # Build method string with dispersion
-    if disp_method == "d2":
-        method_string = f"{input_data.functional}-d2"
-    elif disp_method == "d3":
-        method_string = f"{input_data.functional}-d3"
-    elif disp_method == "d3bj":
-        method_string = f"{input_data.functional}-d3bj"
-    elif disp_method == "d3m":
-        method_string = f"{input_data.functional}-d3m"
-    elif disp_method == "d3mbj":
-        method_string = f"{input_data.functional}-d3mbj"
-    else:  # d4
-        method_string = f"{input_data.functional}-d4"
-    
     psi4.set_options({
         "basis": input_data.basis,
-        "reference": "rhf" if input_data.multiplicity == 1 else "uhf",
+        "reference": reference,
     })
     
-    logger.info(f"Running {method_string}/{input_data.basis}")
+    logger.info(f"Running {input_data.functional}/{input_data.basis}")
+    start = time.perf_counter()
+    energy = psi4.energy(f"{input_data.functional}/{input_data.basis}", molecule=mol)
+    elapsed = time.perf_counter() - start
+    psi4.core.clean()
     
-    # Run DFT-D calculation
-    total_energy = psi4.energy(f"{method_string}/{input_data.basis}", molecule=mol)
+    cache_calculation_result(result={"energy": energy}, computation_time=elapsed, **cache_key)
+    return energy, False
+
+
+def run_dispersion_calculation(input_data: DispersionInput) -> DispersionResult:
+    """Execute DFT-D calculation: one DFT energy, all variants post-SCF."""
+    variants = requested_variants(input_data)
+    primary = variants[0]
     
-    # Get dispersion energy
-    disp_energy = psi4.variable("DISPERSION CORRECTION ENERGY")
+    atoms = parse_geometry_data(input_data.geometry)
+    numbers = [get_atomic_number(atom[0]) for atom in atoms]
+    structures = [input_data.geometry] + list(input_data.geometries or [])
+    positions = np.array([
+        [atom[1:] for atom in parse_geometry_data(structure)] for structure in structures
+    ]) * ANGSTROM_TO_BOHR
     
-    # DFT energy without dispersion
-    dft_energy = total_energy - disp_energy
+    dft_energy, from_cache = compute_dft_energy(input_data)
     
-    # Try to get two-body and three-body terms
-    two_body = psi4.variable("2-BODY DISPERSION CORRECTION ENERGY")
-    three_body = psi4.variable("3-BODY DISPERSION CORRECTION ENERGY") if input_data.include_three_body else None
+    engine = DispersionEngine(numbers, input_data.functional, input_data.charge)
+    per_geometry = engine.compute(
+        positions, variants,
+        three_body=input_data.include_three_body,
+        gradient=input_data.compute_gradient,
+    )
     
-    psi4.core.clean()
+    current = per_geometry[0]
+    disp = current[primary]
     
     return DispersionResult(
         dft_energy=dft_energy,
-        dispersion_energy=disp_energy,
-        total_energy=total_energy,
-        dispersion_method=disp_method.upper(),
+        dispersion_energy=disp.energy,
+        total_energy=dft_energy + disp.energy,
+        dispersion_method=primary.upper(),
         functional=input_data.functional.upper(),
         basis=input_data.basis,
-        two_body_contribution=two_body if two_body != 0 else None,
-        three_body_contribution=three_body if three_body and three_body != 0 else None,
+        two_body_contribution=disp.two_body if disp.two_body != 0 else None,
+        three_body_contribution=disp.three_body if disp.three_body else None,
+        variants={
+            name.upper(): {**value.to_dict(), "total_energy_hartree": dft_energy + value.energy}
+            for name, value in current.items()
+        },
+        geometries=[
+            {
+                "index": i,
+                "dispersion_energy_hartree": {name.upper(): value.energy for name, value in result.items()},
+                "dispersion_gradient": {
+                    name.upper(): value.gradient.tolist()
+                    for name, value in result.items() if value.gradient is not None
+                } or None,
+            }
+            for i, result in enumerate(per_geometry[1:], start=1)
+        ],
+        gradient=disp.gradient.tolist() if disp.gradient is not None else None,
+        dft_from_cache=from_cache,
     )
 
 
@@ -152,7 +254,7 @@ class DispersionTool(BaseTool[DispersionInput, ToolOutput]):
     name: ClassVar[str] = "calculate_dispersion"
     description: ClassVar[str] = "Calculate DFT energy with empirical dispersion correction."
     category: ClassVar[ToolCategory] = ToolCategory.DFT
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.1"
     
     def _validate_input(self, input_data: DispersionInput) -> Optional[ValidationError]:
         return validate_dispersion_input(input_data)
@@ -163,15 +265,25 @@ class DispersionTool(BaseTool[DispersionInput, ToolOutput]):
         message = (
             f"{result.functional}-{result.dispersion_method}/{input_data.basis}\n"
             f"{'='*50}\n"
-            f"DFT Energy:        {result.dft_energy:16.10f} Eh\n"
+            f"DFT Energy:        {result.dft_energy:16.10f} Eh"
+            f"{' (cached)' if result.dft_from_cache else ''}\n"
             f"Dispersion:        {result.dispersion_energy:16.10f} Eh\n"
             f"                   {result.dispersion_energy * HARTREE_TO_KCAL:16.4f} kcal/mol\n"
             f"Total Energy:      {result.total_energy:16.10f} Eh"
         )
+        if len(result.variants) > 1:
+            message += "\n\nVariant     Dispersion (kcal/mol)     Total (Eh)"
+            for name, value in result.variants.items():
+                message += (
+                    f"\n{name:<10}  {value['energy_hartree'] * HARTREE_TO_KCAL:20.4f}"
+                    f"  {value['total_energy_hartree']:16.10f}"
+                )
+        if result.geometries:
+            message += f"\n\nDispersion evaluated for {len(result.geometries)} additional geometries"
         return Result.success(ToolOutput(success=True, message=message, data=result.to_dict()))
 
 
-def calculate_dispersion(geometry: str, functional: str = "b3lyp", 
+def calculate_dispersion(geometry: str, functional: str = "b3lyp",
                          dispersion_method: str = "d3bj", **kwargs: Any) -> ToolOutput:
     """Calculate DFT-D energy."""
     return DispersionTool().run({
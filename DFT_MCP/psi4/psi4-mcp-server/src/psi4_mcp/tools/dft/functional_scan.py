@@ -3,11 +3,26 @@ DFT Functional Scan Tool.
 
 Computes energies across multiple DFT functionals for comparison
 and functional selection.
+
+Two modes:
+
+- scf: every functional is converged self-consistently. The first
+  converged orbitals are the starting guess of all other functionals,
+  which can run in parallel worker processes.
+- non_scf: one reference density is converged, and every functional's
+  energy is evaluated on it (density-corrected style screening). The
+  Coulomb and exact-exchange matrices are built once, and the XC
+  energies of all functionals come from a single pass over the DFT
+  grid. Double hybrids are converged self-consistently (starting from
+  the reference orbitals), VV10 functionals get their own grid pass.
 """
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, List, Optional
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
 import logging
+import os
+import tempfile
+import time
 
 from pydantic import Field
 
@@ -15,11 +30,16 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.parallel.workers import run_worker_tasks, share_resources
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
 HARTREE_TO_KCAL = 627.5094740631
 
+SCAN_MODES = ("scf", "non_scf")
+DEFAULT_DENSITY_FUNCTIONAL = "pbe"
+
 
 FUNCTIONAL_CATEGORIES = {
     "lda": ["svwn", "svwn5"],
@@ -38,10 +58,13 @@ class FunctionalResult:
     functional: str
     category: str
     energy: float
+    mode: str = "scf"
+    runtime_seconds: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         return {"functional": self.functional, "category": self.category, 
-                "energy_hartree": self.energy}
+                "energy_hartree": self.energy, "mode": self.mode,
+                "runtime_seconds": self.runtime_seconds}
 
 
 @dataclass
@@ -51,15 +74,27 @@ class FunctionalScanResult:
     basis: str
     reference_functional: Optional[str]
     reference_energy: Optional[float]
+    mode: str = "scf"
+    density_functional: Optional[str] = None
+    density_energy: Optional[float] = None
+    self_consistency_error: Optional[float] = None
+    failed: Dict[str, str] = field(default_factory=dict)
+    total_runtime: float = 0.0
     
     def to_dict(self) -> Dict[str, Any]:
         sorted_results = sorted(self.results, key=lambda x: x.energy)
         return {
             "results": [r.to_dict() for r in sorted_results],
             "basis": self.basis,
+            "mode": self.mode,
+            "density_functional": self.density_functional,
+            "density_energy_hartree": self.density_energy,
+            "self_consistency_error_hartree": self.self_consistency_error,
             "reference_functional": self.reference_functional,
             "reference_energy_hartree": self.reference_energy,
             "lowest_energy": sorted_results[0].to_dict() if sorted_results else None,
+            "failed": self.failed,
+            "total_runtime_seconds": self.total_runtime,
         }
 
 
@@ -75,6 +110,13 @@ class FunctionalScanInput(ToolInput):
     
     reference_functional: Optional[str] = Field(default=None, description="Reference for comparison")
     
+    mode: str = Field(default="scf", description="scf (self-consistent) or non_scf (one reference density)")
+    density_functional: Optional[str] = Field(
+        default=None,
+        description="Functional (or hf) giving the density in non_scf mode (default: reference functional or pbe)",
+    )
+    max_workers: int = Field(default=1, description="Worker processes for self-consistent runs")
+    
     memory: int = Field(default=4000)
     n_threads: int = Field(default=1)
 
@@ -82,6 +124,10 @@ class FunctionalScanInput(ToolInput):
 def validate_functional_scan_input(input_data: FunctionalScanInput) -> Optional[ValidationError]:
     if not input_data.geometry or not input_data.geometry.strip():
         return ValidationError(field="geometry", message="Geometry cannot be empty")
+    if input_data.mode not in SCAN_MODES:
+        return ValidationError(field="mode", message=f"Unknown mode. Use: {', '.join(SCAN_MODES)}")
+    if input_data.max_workers < 1:
+        return ValidationError(field="max_workers", message="max_workers must be at least 1")
     return None
 
 
@@ -94,20 +140,8 @@ def get_functional_category(functional: str) -> str:
     return "unknown"
 
 
-def run_functional_scan(input_data: FunctionalScanInput) -> FunctionalScanResult:
-    """Execute functional scan."""
-    import psi4
-    
-    psi4.core.clean()
-    psi4.set_memory(f"{input_data.memory} MB")
-    psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_func_scan.out", False)
-    
-    mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-    mol = psi4.geometry(mol_string)
-    mol.update_geometry()
-    
-    # Build list of functionals to test
+def select_functionals(input_data: FunctionalScanInput) -> List[str]:
+    """Functionals requested by the input (unique, in order)."""
     functionals_to_test = []
     
     if input_data.functionals:
@@ -120,31 +154,373 @@ def run_functional_scan(input_data: FunctionalScanInput) -> FunctionalScanResult
         # Default: one from each category
         functionals_to_test = ["svwn", "pbe", "b3lyp", "wb97x", "m06-2x"]
     
+    return list(dict.fromkeys(f.lower() for f in functionals_to_test))
+
+
+def _setup_psi4(task: Dict[str, Any]):
+    """Psi4 state and molecule for a scan task."""
+    import psi4
+    
+    psi4.core.clean()
+    psi4.set_memory(f"{task['memory']} MB")
+    psi4.set_num_threads(task["n_threads"])
+    if task.get("output_file"):
+        psi4.core.set_output_file(task["output_file"], True)
+    
+    mol = psi4.geometry(task["molecule"])
+    mol.update_geometry()
     psi4.set_options({
-        "basis": input_data.basis,
-        "reference": "rhf" if input_data.multiplicity == 1 else "uhf",
+        "basis": task["basis"],
+        "reference": task["reference"],
     })
+    return mol
+
+
+def run_functional_energy(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Converge one functional.
     
-    results = []
-    reference_energy = None
+    Runs in-process or in a worker; task["restart_file"] holds orbitals
+    used as the starting guess.
     
-    for functional in functionals_to_test:
-        logger.info(f"Testing {functional}/{input_data.basis}")
+    Returns:
+        Dict with functional, energy, runtime (or error)
+    """
+    import psi4
+    
+    start = time.time()
+    try:
+        mol = _setup_psi4(task)
+        kwargs: Dict[str, Any] = {"molecule": mol}
+        if task.get("restart_file"):
+            kwargs["restart_file"] = task["restart_file"]
+        energy = psi4.energy(f"{task['functional']}/{task['basis']}", **kwargs)
+        return {"functional": task["functional"], "energy": float(energy), "runtime": time.time() - start}
+    except Exception as e:
+        logger.warning(f"{task['functional']} failed: {e}")
+        return {"functional": task["functional"], "error": str(e), "runtime": time.time() - start}
+    finally:
+        psi4.core.clean()
+
+
+def converge_reference(task: Dict[str, Any], orbital_file: str) -> Tuple[float, Any]:
+    """Converge one functional and save its orbitals as guess for the rest."""
+    import psi4
+    
+    mol = _setup_psi4(task)
+    energy, wfn = psi4.energy(f"{task['functional']}/{task['basis']}", molecule=mol, return_wfn=True)
+    wfn.to_file(orbital_file)
+    return float(energy), wfn
+
+
+# =============================================================================
+# NON-SELF-CONSISTENT EVALUATION
+# =============================================================================
+
+@dataclass
+class _FunctionalTerms:
+    """What a functional needs besides its XC energy."""
+    name: str
+    superfunctional: Any
+    dispersion: Optional[Dict[str, Any]]
+    alpha: float
+    beta: float
+    omega: float
+    
+    @property
+    def needs_scf(self) -> bool:
+        # Double hybrids need orbital-dependent correlation (MP2)
+        return bool(self.superfunctional.is_c_hybrid())
+    
+    @property
+    def separate_grid(self) -> bool:
+        # Nonlocal VV10 correlation is not part of compute_functional
+        return bool(self.superfunctional.needs_vv10())
+
+
+class NonSCFEvaluator:
+    """
+    Energies of many functionals on one converged density.
+    
+    E[F] = E_nuc + E_1e + E_J - alpha E_K - beta E_wK + E_xc[F] + E_disp[F]
+    with all terms evaluated on the reference density: J, K and wK
+    (per distinct omega) are built once, and the density on the grid is
+    computed once per block and handed to every functional.
+    """
+    
+    def __init__(self, wfn):
+        import psi4
+        
+        self.wfn = wfn
+        self.basis = wfn.basisset()
+        self.molecule = wfn.molecule()
+        self.restricted = wfn.same_a_b_orbs() and wfn.same_a_b_dens()
+        self.Da = wfn.Da()
+        self.Db = wfn.Db()
+        self.nuclear_repulsion = self.molecule.nuclear_repulsion_energy()
+        self._occupied = [wfn.Ca_subset("AO", "OCC")]
+        if not self.restricted:
+            self._occupied.append(wfn.Cb_subset("AO", "OCC"))
+        self._exchange: Dict[float, Tuple[List[Any], List[Any]]] = {}
+        self._coulomb: Optional[List[Any]] = None
+        self._psi4 = psi4
+    
+    def _densities(self) -> List[Any]:
+        return [self.Da] if self.restricted else [self.Da, self.Db]
+    
+    def _build_jk(self, omega: float = 0.0) -> None:
+        """J and K (or long-range wK for omega > 0) of the reference orbitals."""
+        psi4 = self._psi4
+        jk = psi4.core.JK.build(self.basis, do_wK=omega > 0.0)
+        jk.set_memory(int(psi4.get_memory() * 0.8 / 8))
+        jk.set_do_J(self._coulomb is None)
+        jk.set_do_K(omega == 0.0)
+        jk.set_do_wK(omega > 0.0)
+        if omega > 0.0:
+            jk.set_omega(omega)
+        jk.initialize()
+        for C in self._occupied:
+            jk.C_left_add(C)
+        jk.compute()
+        if self._coulomb is None:
+            self._coulomb = [jk.J()[i].clone() for i in range(len(self._occupied))]
+        matrices = jk.wK() if omega > 0.0 else jk.K()
+        self._exchange[omega] = [matrices[i].clone() for i in range(len(self._occupied))]
+        jk.finalize()
+    
+    def exchange_energy(self, omega: float = 0.0) -> float:
+        """Exact-exchange energy (full-range, or long-range for omega > 0)."""
+        if omega not in self._exchange:
+            self._build_jk(omega)
+        K = self._exchange[omega]
+        if self.restricted:
+            return -self.Da.vector_dot(K[0])
+        return -0.5 * (self.Da.vector_dot(K[0]) + self.Db.vector_dot(K[1]))
+    
+    def core_energy(self) -> float:
+        """Nuclear repulsion, one-electron and Coulomb energy."""
+        if self._coulomb is None:
+            self._build_jk()
+        if self.restricted:
+            one_electron = 2.0 * self.Da.vector_dot(self.wfn.H())
+            coulomb = 2.0 * self.Da.vector_dot(self._coulomb[0])
+        else:
+            one_electron = self.Da.vector_dot(self.wfn.H()) + self.Db.vector_dot(self.wfn.H())
+            J = self._coulomb[0].clone()
+            J.add(self._coulomb[1])
+            coulomb = 0.5 * (self.Da.vector_dot(J) + self.Db.vector_dot(J))
+        return self.nuclear_repulsion + one_electron + coulomb
+    
+    def _terms(self, functional: str) -> _FunctionalTerms:
+        from psi4.driver.procrouting.dft import build_superfunctional
+        
+        sup, dispersion = build_superfunctional(functional, self.restricted)
+        return _FunctionalTerms(
+            name=functional,
+            superfunctional=sup,
+            dispersion=dispersion or None,
+            alpha=sup.x_alpha() if sup.is_x_hybrid() else 0.0,
+            beta=sup.x_beta() if sup.is_x_lrc() else 0.0,
+            omega=sup.x_omega() if sup.is_x_lrc() else 0.0,
+        )
+    
+    def _potential(self, sup):
+        V = self._psi4.core.VBase.build(self.basis, sup, "RV" if self.restricted else "UV")
+        V.initialize()
+        return V
+    
+    def xc_energies(self, terms: List[_FunctionalTerms]) -> Dict[str, float]:
+        """XC energies of all functionals from one pass over the grid."""
+        if not terms:
+            return {}
+        # The grid and point functions of the highest rung cover all densities needed
+        top = max(terms, key=lambda t: t.superfunctional.ansatz())
+        V = self._potential(top.superfunctional)
+        points = V.properties()[0]
+        points.set_pointers(*self._densities())
+        for t in terms:
+            t.superfunctional.set_max_points(V.grid().max_points())
+            t.superfunctional.allocate()
+        
+        energies = {t.name: 0.0 for t in terms}
+        for i in range(V.nblocks()):
+            block = V.get_block(i)
+            npoints = block.npoints()
+            weights = block.w().np[:npoints]
+            points.compute_points(block)
+            values = points.point_values()
+            for t in terms:
+                density = t.superfunctional.compute_functional(values, npoints)
+                energies[t.name] += float(weights @ density["V"].np[:npoints])
+        V.finalize()
+        return energies
+    
+    def xc_energy_separate(self, t: _FunctionalTerms) -> float:
+        """XC energy (including nonlocal VV10) from the functional's own grid pass."""
+        V = self._potential(t.superfunctional)
+        V.set_D(self._densities())
+        V.compute_V([d.clone() for d in self._densities()])
+        values = V.quadrature_values()
+        V.finalize()
+        return values["FUNCTIONAL"] + values.get("VV10", 0.0)
+    
+    def dispersion_energy(self, t: _FunctionalTerms) -> float:
+        if not t.dispersion:
+            return 0.0
+        from psi4.driver.procrouting.empirical_dispersion import EmpiricalDispersion
+        
+        disp = EmpiricalDispersion(
+            name_hint=t.superfunctional.name(),
+            level_hint=t.dispersion["type"],
+            param_tweaks=t.dispersion["params"],
+        )
+        return float(disp.compute_energy(self.molecule))
+    
+    def evaluate(self, functionals: List[str]) -> Tuple[Dict[str, float], Dict[str, str], List[str]]:
+        """
+        Non-self-consistent energies.
+        
+        Returns:
+            (energies, errors, functionals that need a self-consistent run)
+        """
+        energies: Dict[str, float] = {}
+        errors: Dict[str, str] = {}
+        needs_scf: List[str] = []
+        
+        grid_terms, separate_terms = [], []
+        for functional in functionals:
+            try:
+                t = self._terms(functional)
+            except Exception as e:
+                errors[functional] = str(e)
+                continue
+            if t.needs_scf:
+                needs_scf.append(functional)
+            elif t.separate_grid:
+                separate_terms.append(t)
+            else:
+                grid_terms.append(t)
+        
+        xc = self.xc_energies(grid_terms)
+        for t in separate_terms:
+            try:
+                xc[t.name] = self.xc_energy_separate(t)
+            except Exception as e:
+                errors[t.name] = str(e)
+        
+        core = self.core_energy()
+        for t in grid_terms + separate_terms:
+            if t.name not in xc:
+                continue
+            try:
+                energy = core + xc[t.name] + self.dispersion_energy(t)
+                if t.alpha:
+                    energy += t.alpha * self.exchange_energy()
+                if t.beta:
+                    energy += t.beta * self.exchange_energy(t.omega)
+                energies[t.name] = energy
+            except Exception as e:
+                errors[t.name] = str(e)
+        return energies, errors, needs_scf
+
+
+# =============================================================================
+# SCAN
+# =============================================================================
+
+def run_functional_scan(input_data: FunctionalScanInput) -> FunctionalScanResult:
+    """Execute functional scan."""
+    import psi4
+    
+    start = time.time()
+    psi4.core.clean()
+    psi4.core.set_output_file(calculation_output_path("psi4_func_scan.out"), False)
+    
+    functionals_to_test = select_functionals(input_data)
+    non_scf = input_data.mode == "non_scf"
+    
+    # The reference density (and guess orbitals) are those of the density
+    # functional in non_scf mode, else of the first functional converged
+    density_functional = None
+    if non_scf:
+        density_functional = (input_data.density_functional or input_data.reference_functional
+                              or DEFAULT_DENSITY_FUNCTIONAL).lower()
+    
+    mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
+    if non_scf:
+        # Grid and JK work in the AO basis
+        mol_string += "\nsymmetry c1"
+    
+    base_task = {
+        "molecule": mol_string, "basis": input_data.basis,
+        "reference": "rhf" if input_data.multiplicity == 1 else "uhf",
+        "memory": input_data.memory, "n_threads": input_data.n_threads,
+        "output_file": None,
+    }
+    
+    energies: Dict[str, Tuple[float, str, float]] = {}
+    failed: Dict[str, str] = {}
+    density_energy = None
+    self_consistency_error = None
+    
+    with tempfile.TemporaryDirectory(prefix="psi4_func_scan_") as tmp:
+        orbital_file = os.path.join(tmp, "guess.npy")
+        first = density_functional or functionals_to_test[0]
+        logger.info(f"Converging {first}/{input_data.basis}")
+        t0 = time.time()
+        try:
+            density_energy, wfn = converge_reference(dict(base_task, functional=first), orbital_file)
+        except Exception as e:
+            if non_scf:
+                raise
+            # Without a converged guess the others start from scratch
+            logger.warning(f"{first} failed: {e}")
+            failed[first] = str(e)
+            density_energy, wfn, orbital_file = None, None, None
         
-        energy = psi4.energy(f"{functional}/{input_data.basis}", molecule=mol)
+        remaining = [f for f in functionals_to_test if f != first or non_scf]
+        if not non_scf and density_energy is not None:
+            energies[first] = (density_energy, "scf", time.time() - t0)
         
-        category = get_functional_category(functional)
+        if non_scf:
+            t0 = time.time()
+            evaluator = NonSCFEvaluator(wfn)
+            nscf_energies, errors, remaining = evaluator.evaluate(remaining)
+            runtime = (time.time() - t0) / max(1, len(nscf_energies))
+            for functional, energy in nscf_energies.items():
+                energies[functional] = (energy, "non_scf", runtime)
+            failed.update(errors)
+            if first in nscf_energies:
+                self_consistency_error = nscf_energies[first] - density_energy
+        del wfn
+        
+        # Self-consistent runs start from the converged orbitals
+        tasks = [dict(base_task, functional=f, restart_file=orbital_file) for f in remaining]
+        workers = share_resources(tasks, input_data.max_workers, input_data.memory, input_data.n_threads)
+        outcomes = run_worker_tasks(
+            run_functional_energy, tasks, workers, "psi4_func_scan", label_key="functional",
+        )
+        for result in outcomes:
+            if "error" in result:
+                failed[result["functional"]] = result["error"]
+            else:
+                energies[result["functional"]] = (result["energy"], "scf", result["runtime"])
+    
+    results = []
+    reference_energy = None
+    for functional in functionals_to_test:
+        if functional not in energies:
+            continue
+        energy, mode, runtime = energies[functional]
         results.append(FunctionalResult(
             functional=functional.upper(),
-            category=category,
+            category=get_functional_category(functional),
             energy=energy,
+            mode=mode,
+            runtime_seconds=runtime,
         ))
-        
-        if input_data.reference_functional and functional.lower() == input_data.reference_functional.lower():
+        if input_data.reference_functional and functional == input_data.reference_functional.lower():
             reference_energy = energy
-        
-        psi4.core.clean_options()
-        psi4.set_options({"basis": input_data.basis})
     
     psi4.core.clean()
     
@@ -153,6 +529,12 @@ def run_functional_scan(input_data: FunctionalScanInput) -> FunctionalScanResult
         basis=input_data.basis,
         reference_functional=input_data.reference_functional,
         reference_energy=reference_energy,
+        mode=input_data.mode,
+        density_functional=density_functional,
+        density_energy=density_energy if non_scf else None,
+        self_consistency_error=self_consistency_error,
+        failed=failed,
+        total_runtime=time.time() - start,
     )
 
 
@@ -162,7 +544,7 @@ class FunctionalScanTool(BaseTool[FunctionalScanInput, ToolOutput]):
     name: ClassVar[str] = "scan_functionals"
     description: ClassVar[str] = "Compare DFT functionals for a given system."
     category: ClassVar[ToolCategory] = ToolCategory.DFT
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     def _validate_input(self, input_data: FunctionalScanInput) -> Optional[ValidationError]:
         return validate_functional_scan_input(input_data)
@@ -171,10 +553,16 @@ class FunctionalScanTool(BaseTool[FunctionalScanInput, ToolOutput]):
         result = run_functional_scan(input_data)
         
         lines = [f"Functional Scan ({input_data.basis})", "="*50]
+        if result.mode == "non_scf":
+            lines.append(f"Non-self-consistent on the {result.density_functional.upper()} density")
         sorted_results = sorted(result.results, key=lambda x: x.energy)
         
         for r in sorted_results:
-            lines.append(f"{r.functional:12s} ({r.category:15s}): {r.energy:.10f} Eh")
+            suffix = " (scf)" if result.mode == "non_scf" and r.mode == "scf" else ""
+            lines.append(f"{r.functional:12s} ({r.category:15s}): {r.energy:.10f} Eh{suffix}")
+        for functional, error in result.failed.items():
+            lines.append(f"{functional.upper():12s} failed: {error}")
+        lines.append(f"Total Runtime: {result.total_runtime:.2f}s")
         
         message = "\n".join(lines)
         return Result.success(ToolOutput(success=True, message=message, data=result.to_dict()))
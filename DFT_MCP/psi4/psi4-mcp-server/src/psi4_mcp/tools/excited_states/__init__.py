@@ -9,8 +9,18 @@ MCP tools for computing electronic excited states:
     - EOM-CC (Equation of Motion Coupled Cluster)
     - Excited state geometry optimization
     - Transition properties
+
+TD-DFT, TDA, CIS, transition properties and the UV-Vis / ECD spectra share
+one excited-state store (see store.py).
 """
 
+from psi4_mcp.tools.excited_states.store import (
+    ExcitedStateRecord,
+    ExcitedStateStore,
+    get_excited_state_store,
+    get_excited_states,
+)
+
 from psi4_mcp.tools.excited_states.tddft import (
     TDDFTTool,
     calculate_tddft,
@@ -48,6 +58,11 @@ from psi4_mcp.tools.excited_states.transition_properties import (
 
 
 __all__ = [
+    # Shared excited-state store
+    "ExcitedStateRecord",
+    "ExcitedStateStore",
+    "get_excited_state_store",
+    "get_excited_states",
     # TD-DFT
     "TDDFTTool",
     "calculate_tddft",
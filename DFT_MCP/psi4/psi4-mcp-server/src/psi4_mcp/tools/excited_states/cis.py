@@ -13,6 +13,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.excited_states.store import get_excited_states
 
 logger = logging.getLogger(__name__)
 
@@ -59,7 +60,7 @@ class CISTool(BaseTool[CISToolInput, ToolOutput]):
         "Simplest wavefunction method for excited states."
     )
     category: ClassVar[ToolCategory] = ToolCategory.EXCITED_STATES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -76,59 +77,31 @@ class CISTool(BaseTool[CISToolInput, ToolOutput]):
     def _execute(self, input_data: CISToolInput) -> Result[ToolOutput]:
         """Execute CIS calculation."""
         try:
-            import psi4
-            
-            # Configure Psi4
-            psi4.core.clean()
-            psi4.set_memory(f"{input_data.memory} MB")
-            psi4.set_num_threads(input_data.n_threads)
-            
-            # Build molecule
-            mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-            molecule = psi4.geometry(mol_string)
-            
-            # Set options
-            psi4.set_options({
-                "basis": input_data.basis,
-                "roots_per_irrep": [input_data.n_states],
-                "tda": True,  # CIS is TDA with HF
-            })
-            
-            # Run CIS (TD-HF with TDA = CIS)
-            method_str = f"td-hf/{input_data.basis}"
-            energy, wfn = psi4.energy(method_str, return_wfn=True, molecule=molecule)
-            
-            # Extract excited states
-            HARTREE_TO_EV = 27.2114
-            HARTREE_TO_NM = 45.56335 * 27.2114
-            
-            excitations = []
-            for i in range(input_data.n_states):
-                try:
-                    var_prefix = f"TD-HF ROOT 0 -> ROOT {i+1}"
-                    exc_energy = psi4.variable(f"{var_prefix} EXCITATION ENERGY")
-                    osc_str = psi4.variable(f"{var_prefix} OSCILLATOR STRENGTH (LEN)")
-                    
-                    exc_ev = float(exc_energy) * HARTREE_TO_EV
-                    wavelength = HARTREE_TO_NM / float(exc_energy) if exc_energy > 0 else 0
-                    
-                    excitations.append({
-                        "state": i + 1,
-                        "energy_hartree": float(exc_energy),
-                        "energy_ev": exc_ev,
-                        "wavelength_nm": wavelength,
-                        "oscillator_strength": float(osc_str),
-                    })
-                except Exception:
-                    break
+            # CIS is TDA with HF
+            record = get_excited_states(
+                input_data.geometry,
+                method="hf",
+                basis=input_data.basis,
+                charge=input_data.charge,
+                multiplicity=input_data.multiplicity,
+                n_states=input_data.n_states,
+                tda=True,
+                triplets=input_data.triplets,
+                convergence=input_data.convergence,
+                max_iterations=input_data.max_iterations,
+                memory=input_data.memory,
+                n_threads=input_data.n_threads,
+            )
+            excitations = record.excitations(input_data.n_states)
             
             # Build output
             data = {
-                "hf_energy": float(energy),
+                "hf_energy": record.ground_state_energy,
                 "basis": input_data.basis,
                 "method": "CIS",
                 "n_states_computed": len(excitations),
                 "excitations": excitations,
+                "excited_state_store": record.summary(),
                 "notes": [
                     "CIS typically overestimates excitation energies by 1-2 eV",
                     "No dynamical correlation included",
@@ -137,9 +110,7 @@ class CISTool(BaseTool[CISToolInput, ToolOutput]):
                 "units": {"energy": "eV", "wavelength": "nm"}
             }
             
-            message = f"CIS: {len(excitations)} excited states"
-            
-            psi4.core.clean()
+            message = f"CIS: {len(excitations)} excited states ({record.source})"
             
             return Result.success(ToolOutput(
                 success=True,
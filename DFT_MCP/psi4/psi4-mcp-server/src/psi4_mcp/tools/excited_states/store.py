@@ -0,0 +1,453 @@
+"""
+Excited-State Result Store.
+
+Shared TDSCF results for the excited-state and spectroscopy tools. A
+record is keyed by molecule, method, basis and response type and holds:
+
+- the ground-state SCF wavefunction
+- the excitation vectors (right and left eigenvectors of the response
+  problem)
+- excitation energies and transition moments (electric dipole in both
+  gauges, magnetic dipole) with oscillator and rotatory strengths
+
+UV-Vis, ECD, TD-DFT, TDA, CIS and transition-property requests for the
+same molecule read the same record instead of repeating the SCF and the
+response solve. Asking for more roots (or a tighter convergence) than a
+record holds restarts the Davidson solver from the stored vectors on the
+stored wavefunction.
+
+Stored wavefunctions keep their JK object (and its density-fitting
+tensors) for the restarted solves, so the store is bounded by the
+estimated size of its records as well as by their number.
+"""
+
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
+import hashlib
+import logging
+import time
+
+import numpy as np
+
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
+
+logger = logging.getLogger(__name__)
+
+HARTREE_TO_EV = 27.2114
+HARTREE_TO_NM = 45.56335 * 27.2114
+
+# Davidson subspace size per root for restarted solves
+VECTORS_PER_ROOT = 50
+
+# Default bound on the estimated size of all stored records (MB)
+MAX_STORE_MB = 2000
+
+# Dense nso x nso matrices held by an SCF wavefunction (C, D, F, H, S, ...)
+WAVEFUNCTION_MATRICES = 16
+
+# Auxiliary functions per basis function, for JK objects without an estimate
+DF_AUX_RATIO = 3
+
+
+@dataclass
+class ExcitedStateRecord:
+    """Ground state, excitation vectors and transition moments of one molecule."""
+    key: str
+    method: str
+    basis: str
+    tda: bool
+    triplets: bool
+    ground_state_energy: float
+    # Per root, ascending excitation energy (Hartree)
+    excitation_energies: np.ndarray
+    oscillator_length: np.ndarray
+    oscillator_velocity: np.ndarray
+    rotatory_length: np.ndarray
+    rotatory_velocity: np.ndarray
+    # (n_roots, 3) transition moments (a.u.)
+    dipole_length: np.ndarray
+    dipole_velocity: np.ndarray
+    magnetic_dipole: np.ndarray
+    convergence: float
+    wavefunction: Any = None
+    # Solver-native right (X+Y) and left (X-Y) eigenvectors
+    right_vectors: List[Any] = field(default_factory=list)
+    left_vectors: List[Any] = field(default_factory=list)
+    n_solves: int = 1
+    # How the last request was served: computed, expanded or stored
+    source: str = "computed"
+    
+    @property
+    def n_roots(self) -> int:
+        return len(self.excitation_energies)
+    
+    def excitations(self, n_states: Optional[int] = None) -> List[Dict[str, Any]]:
+        """Per-state excitation data for the lowest n_states roots."""
+        n = self.n_roots if n_states is None else min(n_states, self.n_roots)
+        states = []
+        for i in range(n):
+            energy = float(self.excitation_energies[i])
+            states.append({
+                "state": i + 1,
+                "energy_hartree": energy,
+                "energy_ev": energy * HARTREE_TO_EV,
+                "wavelength_nm": HARTREE_TO_NM / energy if energy > 0 else 0,
+                "oscillator_strength": float(self.oscillator_length[i]),
+                "oscillator_strength_velocity": float(self.oscillator_velocity[i]),
+                "rotatory_strength": float(self.rotatory_length[i]),
+                "rotatory_strength_velocity": float(self.rotatory_velocity[i]),
+                "transition_dipole": self.dipole_length[i].tolist(),
+                "spin_state": "triplet" if self.triplets else "singlet",
+            })
+        return states
+    
+    def estimated_bytes(self) -> int:
+        """Approximate memory held by the record (wavefunction, JK, vectors)."""
+        size = sum(_array_bytes(v) for v in self.right_vectors + self.left_vectors)
+        wfn = self.wavefunction
+        if wfn is None:
+            return size
+        try:
+            nso = int(wfn.nso())
+        except Exception:
+            return size
+        size += 8 * WAVEFUNCTION_MATRICES * nso * nso
+        jk = wfn.jk() if hasattr(wfn, "jk") else None
+        if jk is not None:
+            try:
+                size += 8 * int(jk.memory_estimate())
+            except Exception:
+                size += 8 * DF_AUX_RATIO * nso ** 3
+        return size
+    
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "key": self.key,
+            "method": self.method,
+            "basis": self.basis,
+            "tda": self.tda,
+            "triplets": self.triplets,
+            "n_roots": self.n_roots,
+            "convergence": self.convergence,
+            "n_solves": self.n_solves,
+            "source": self.source,
+            "estimated_mb": self.estimated_bytes() / 1024 ** 2,
+        }
+
+
+def _array_bytes(value: Any) -> int:
+    """Size of a (list of) Psi4 matrix / NumPy array."""
+    if isinstance(value, (list, tuple)):
+        return sum(_array_bytes(v) for v in value)
+    try:
+        return int(np.asarray(getattr(value, "np", value)).nbytes)
+    except Exception:
+        return 0
+
+
+def excited_state_key(
+    geometry: str,
+    charge: int,
+    multiplicity: int,
+    method: str,
+    basis: str,
+    tda: bool,
+    triplets: bool,
+) -> str:
+    """Store key of a molecule / method / basis / response type."""
+    lines = [" ".join(line.split()) for line in geometry.strip().splitlines() if line.strip()]
+    key_string = "|".join([
+        f"{charge}_{multiplicity}", "\n".join(lines).lower(), method.lower(), basis.lower(),
+        "tda" if tda else "rpa", "triplet" if triplets else "singlet",
+    ])
+    return hashlib.md5(key_string.encode()).hexdigest()
+
+
+class ExcitedStateStore:
+    """
+    In-memory LRU store of excited-state records.
+    
+    Records keep their wavefunction alive, so the store is small: least
+    recently used records are evicted beyond max_entries or beyond
+    max_mb of estimated size (the newest record is always kept).
+    """
+    
+    def __init__(self, max_entries: int = 8, max_mb: float = MAX_STORE_MB):
+        self.max_entries = max_entries
+        self.max_mb = max_mb
+        self._records: "OrderedDict[str, ExcitedStateRecord]" = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+    
+    def __len__(self) -> int:
+        return len(self._records)
+    
+    def __contains__(self, key: str) -> bool:
+        return key in self._records
+    
+    def get(self, key: str) -> Optional[ExcitedStateRecord]:
+        record = self._records.get(key)
+        if record is not None:
+            self._records.move_to_end(key)
+        return record
+    
+    @property
+    def size_mb(self) -> float:
+        return sum(self._sizes.values()) / 1024 ** 2
+    
+    def put(self, record: ExcitedStateRecord) -> None:
+        """Add or update a record (sizes are re-estimated on every put)."""
+        self._records[record.key] = record
+        self._records.move_to_end(record.key)
+        self._sizes[record.key] = record.estimated_bytes()
+        while len(self._records) > 1 and (
+            len(self._records) > self.max_entries or self.size_mb > self.max_mb
+        ):
+            evicted, _ = self._records.popitem(last=False)
+            self._sizes.pop(evicted, None)
+            logger.debug(f"Evicted excited-state record {evicted}")
+    
+    def remove(self, key: str) -> bool:
+        self._sizes.pop(key, None)
+        return self._records.pop(key, None) is not None
+    
+    def clear(self) -> None:
+        self._records.clear()
+        self._sizes.clear()
+    
+    def records(self) -> List[Dict[str, Any]]:
+        return [record.summary() for record in self._records.values()]
+
+
+# Global excited-state store instance
+_excited_state_store: Optional[ExcitedStateStore] = None
+
+
+def get_excited_state_store() -> ExcitedStateStore:
+    """Get the global excited-state store."""
+    global _excited_state_store
+    if _excited_state_store is None:
+        _excited_state_store = ExcitedStateStore()
+    return _excited_state_store
+
+
+# =============================================================================
+# RESPONSE SOLVES
+# =============================================================================
+
+def _root_arrays(roots: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Per-root arrays from TDSCF result dicts."""
+    def moment(name: str) -> np.ndarray:
+        return np.array([np.asarray(r.get(name, np.zeros(3)), dtype=float).reshape(3) for r in roots]).reshape(-1, 3)
+    
+    def scalar(name: str) -> np.ndarray:
+        return np.array([float(r.get(name, 0.0)) for r in roots])
+    
+    return {
+        "excitation_energies": scalar("EXCITATION ENERGY"),
+        "oscillator_length": scalar("OSCILLATOR STRENGTH (LEN)"),
+        "oscillator_velocity": scalar("OSCILLATOR STRENGTH (VEL)"),
+        "rotatory_length": scalar("ROTATORY STRENGTH (LEN)"),
+        "rotatory_velocity": scalar("ROTATORY STRENGTH (VEL)"),
+        "dipole_length": moment("ELECTRIC DIPOLE TRANSITION MOMENT (LEN)"),
+        "dipole_velocity": moment("ELECTRIC DIPOLE TRANSITION MOMENT (VEL)"),
+        "magnetic_dipole": moment("MAGNETIC DIPOLE TRANSITION MOMENT"),
+    }
+
+
+def _root_vectors(root: Dict[str, Any], restricted: bool, side: str) -> Any:
+    """Solver-native eigenvector of a TDSCF result dict."""
+    alpha = root[f"{side} EIGENVECTOR ALPHA"]
+    return alpha if restricted else [alpha, root[f"{side} EIGENVECTOR BETA"]]
+
+
+def _solver_field(results: Any, name: str) -> Any:
+    return results[name] if isinstance(results, dict) else getattr(results, name)
+
+
+def solve_fresh(wfn: Any, n_states: int, tda: bool, triplets: bool,
+                convergence: float, max_iterations: int) -> List[Dict[str, Any]]:
+    """Excited states from the default (orbital-energy difference) guess."""
+    from psi4.driver.procrouting.response.scf_response import tdscf_excitations
+    
+    return tdscf_excitations(
+        wfn, states=n_states, triplets="ONLY" if triplets else "NONE", tda=tda,
+        r_convergence=convergence, maxiter=max_iterations,
+    )
+
+
+def solve_restarted(wfn: Any, guess: List[Any], n_states: int, tda: bool, triplets: bool,
+                    convergence: float, max_iterations: int) -> List[Dict[str, Any]]:
+    """
+    Excited states from stored eigenvectors.
+    
+    The stored vectors span the converged lower roots; the solver gets
+    them plus orbital-energy-difference guesses for the new roots, so the
+    lower roots converge in a few iterations and the search effort goes
+    into the new ones. Transition moments follow the TDSCF driver.
+    """
+    import psi4
+    from psi4.driver.p4util import solvers
+    from psi4.driver.procrouting.response.scf_products import TDRSCFEngine, TDUSCFEngine
+    
+    ptype = "tda" if tda else "rpa"
+    restricted = wfn.same_a_b_orbs()
+    if restricted:
+        engine = TDRSCFEngine(wfn, ptype=ptype, triplet=triplets)
+    else:
+        engine = TDUSCFEngine(wfn, ptype=ptype)
+    engine.reset_for_state_symmetry(0)
+    n_new = max(n_states - len(guess), 0)
+    guess = list(guess) + list(engine.generate_guess(len(guess) + 4 * max(n_new, 1)))
+    
+    solve = solvers.davidson_solver if tda else solvers.hamiltonian_solver
+    results = solve(
+        engine=engine, guess=guess, nroot=n_states, r_convergence=convergence,
+        max_ss_size=VECTORS_PER_ROOT * n_states, maxiter=max_iterations, verbose=0,
+    )
+    
+    mints = psi4.core.MintsHelper(wfn.basisset())
+    dipole, nabla, angular = mints.so_dipole(), mints.so_nabla(), mints.so_angular_momentum()
+    roots = []
+    for energy, (right, left) in zip(_solver_field(results, "eigvals"), _solver_field(results, "eigvecs")):
+        energy = float(energy)
+        root: Dict[str, Any] = {"EXCITATION ENERGY": energy}
+        if restricted:
+            root.update({"RIGHT EIGENVECTOR ALPHA": right, "LEFT EIGENVECTOR ALPHA": left})
+        else:
+            root.update({
+                "RIGHT EIGENVECTOR ALPHA": right[0], "RIGHT EIGENVECTOR BETA": right[1],
+                "LEFT EIGENVECTOR ALPHA": left[0], "LEFT EIGENVECTOR BETA": left[1],
+            })
+        if not triplets:
+            edtm_length = np.asarray(engine.residue(right, dipole))
+            edtm_velocity = np.asarray(engine.residue(left, nabla))
+            # 1/2 is the Bohr magneton in atomic units
+            mdtm = 0.5 * np.asarray(engine.residue(left, angular))
+            root.update({
+                "ELECTRIC DIPOLE TRANSITION MOMENT (LEN)": edtm_length,
+                "OSCILLATOR STRENGTH (LEN)": 2 * energy / 3 * float(edtm_length @ edtm_length),
+                "ELECTRIC DIPOLE TRANSITION MOMENT (VEL)": edtm_velocity,
+                "OSCILLATOR STRENGTH (VEL)": 2 / (3 * energy) * float(edtm_velocity @ edtm_velocity),
+                "MAGNETIC DIPOLE TRANSITION MOMENT": mdtm,
+                "ROTATORY STRENGTH (LEN)": float(edtm_length @ mdtm),
+                "ROTATORY STRENGTH (VEL)": -float(edtm_velocity @ mdtm) / energy,
+            })
+        roots.append(root)
+    return roots
+
+
+def _apply_roots(record: ExcitedStateRecord, roots: List[Dict[str, Any]]) -> None:
+    restricted = record.wavefunction.same_a_b_orbs()
+    for name, values in _root_arrays(roots).items():
+        setattr(record, name, values)
+    record.right_vectors = [_root_vectors(r, restricted, "RIGHT") for r in roots]
+    record.left_vectors = [_root_vectors(r, restricted, "LEFT") for r in roots]
+
+
+def get_excited_states(
+    geometry: str,
+    method: str = "b3lyp",
+    basis: str = "cc-pvdz",
+    charge: int = 0,
+    multiplicity: int = 1,
+    n_states: int = 5,
+    tda: bool = False,
+    triplets: bool = False,
+    convergence: float = 1e-4,
+    max_iterations: int = 60,
+    memory: int = 2000,
+    n_threads: int = 1,
+) -> ExcitedStateRecord:
+    """
+    Excited states of a molecule from the shared store.
+    
+    Served from the stored record when it holds enough roots at the
+    requested convergence; extended from the stored vectors when it does
+    not; computed (SCF and response) only for a new molecule / method.
+    
+    Args:
+        geometry: Molecular geometry (without charge / multiplicity line)
+        method: SCF method for the ground state (functional, or "hf")
+        basis: Basis set
+        charge: Molecular charge
+        multiplicity: Spin multiplicity
+        n_states: Number of excited states
+        tda: Tamm-Dancoff approximation instead of full linear response
+        triplets: Triplet instead of singlet states (restricted references)
+        convergence: Residual convergence of the response solver
+        max_iterations: Maximum response solver iterations
+        memory: Memory in MB
+        n_threads: Number of threads
+    
+    Returns:
+        Record holding at least n_states roots (fewer if the solver found
+        fewer)
+    """
+    store = get_excited_state_store()
+    key = excited_state_key(geometry, charge, multiplicity, method, basis, tda, triplets)
+    record = store.get(key)
+    if record is not None and record.n_roots >= n_states and record.convergence <= convergence:
+        record.source = "stored"
+        return record
+    
+    import psi4
+    
+    start = time.time()
+    psi4.set_memory(f"{memory} MB")
+    psi4.set_num_threads(n_threads)
+    
+    if record is not None and record.wavefunction is not None and record.right_vectors:
+        # Keep every stored root
+        n_states = max(n_states, record.n_roots)
+        convergence = min(convergence, record.convergence)
+        try:
+            try:
+                roots = solve_restarted(
+                    record.wavefunction, record.right_vectors, n_states, tda, triplets,
+                    convergence, max_iterations,
+                )
+            except (ImportError, AttributeError, TypeError) as e:
+                # Solver internals differ between Psi4 versions; the SCF is still reused
+                logger.debug(f"Restarted response solve unavailable ({e}), solving from scratch")
+                roots = solve_fresh(record.wavefunction, n_states, tda, triplets, convergence, max_iterations)
+        except Exception as e:
+            logger.warning(f"Stored excited states unusable ({e}), recomputing")
+            store.remove(key)
+        else:
+            _apply_roots(record, roots)
+            record.convergence = convergence
+            record.n_solves += 1
+            record.source = "expanded"
+            store.put(record)
+            logger.info(f"Expanded excited states to {record.n_roots} roots in {time.time() - start:.1f} s")
+            return record
+    
+    psi4.core.clean()
+    psi4.core.set_output_file(calculation_output_path("psi4_excited_states.out"), False)
+    mol_string = f"{charge} {multiplicity}\n{geometry}"
+    if "symmetry" not in geometry.lower():
+        # All roots in one irrep, so root counts and stored vectors line up
+        mol_string += "\nsymmetry c1"
+    molecule = psi4.geometry(mol_string)
+    psi4.set_options({
+        "basis": basis,
+        "reference": "rhf" if multiplicity == 1 else "uhf",
+        "save_jk": True,
+    })
+    energy, wfn = psi4.energy(f"{method}/{basis}", return_wfn=True, molecule=molecule)
+    roots = solve_fresh(wfn, n_states, tda, triplets, convergence, max_iterations)
+    
+    record = ExcitedStateRecord(
+        key=key, method=method, basis=basis, tda=tda, triplets=triplets,
+        ground_state_energy=float(energy), convergence=convergence, wavefunction=wfn,
+        **{name: np.zeros(0) for name in (
+            "excitation_energies", "oscillator_length", "oscillator_velocity",
+            "rotatory_length", "rotatory_velocity",
+        )},
+        **{name: np.zeros((0, 3)) for name in ("dipole_length", "dipole_velocity", "magnetic_dipole")},
+    )
+    _apply_roots(record, roots)
+    store.put(record)
+    logger.info(f"Computed {record.n_roots} excited states in {time.time() - start:.1f} s")
+    return record
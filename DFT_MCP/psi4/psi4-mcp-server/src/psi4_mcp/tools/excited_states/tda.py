@@ -13,6 +13,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.excited_states.store import get_excited_states
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +59,7 @@ class TDATool(BaseTool[TDAToolInput, ToolOutput]):
         "Faster than full TD-DFT with similar accuracy for most cases."
     )
     category: ClassVar[ToolCategory] = ToolCategory.EXCITED_STATES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -76,72 +77,36 @@ class TDATool(BaseTool[TDAToolInput, ToolOutput]):
     def _execute(self, input_data: TDAToolInput) -> Result[ToolOutput]:
         """Execute TDA calculation."""
         try:
-            import psi4
-            
-            # Configure Psi4
-            psi4.core.clean()
-            psi4.set_memory(f"{input_data.memory} MB")
-            psi4.set_num_threads(input_data.n_threads)
-            
-            # Build molecule
-            mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-            molecule = psi4.geometry(mol_string)
-            
-            # Set options - TDA enabled
-            psi4.set_options({
-                "basis": input_data.basis,
-                "roots_per_irrep": [input_data.n_states],
-                "tdscf_r_convergence": input_data.convergence,
-                "tdscf_maxiter": input_data.max_iterations,
-                "tda": True,  # Tamm-Dancoff Approximation
-            })
-            
-            if input_data.triplets:
-                psi4.set_options({"tdscf_triplets": True})
-            
-            # Run TDA
-            method_str = f"td-{input_data.functional}/{input_data.basis}"
-            energy, wfn = psi4.energy(method_str, return_wfn=True, molecule=molecule)
-            
-            # Extract excited states
-            HARTREE_TO_EV = 27.2114
-            HARTREE_TO_NM = 45.56335 * 27.2114
-            
-            excitations = []
-            for i in range(input_data.n_states):
-                try:
-                    var_prefix = f"TD-{input_data.functional.upper()} ROOT 0 -> ROOT {i+1}"
-                    exc_energy = psi4.variable(f"{var_prefix} EXCITATION ENERGY")
-                    osc_str = psi4.variable(f"{var_prefix} OSCILLATOR STRENGTH (LEN)")
-                    
-                    exc_ev = float(exc_energy) * HARTREE_TO_EV
-                    wavelength = HARTREE_TO_NM / float(exc_energy) if exc_energy > 0 else 0
-                    
-                    excitations.append({
-                        "state": i + 1,
-                        "energy_hartree": float(exc_energy),
-                        "energy_ev": exc_ev,
-                        "wavelength_nm": wavelength,
-                        "oscillator_strength": float(osc_str),
-                    })
-                except Exception:
-                    break
+            record = get_excited_states(
+                input_data.geometry,
+                method=input_data.functional,
+                basis=input_data.basis,
+                charge=input_data.charge,
+                multiplicity=input_data.multiplicity,
+                n_states=input_data.n_states,
+                tda=True,  # Tamm-Dancoff Approximation
+                triplets=input_data.triplets,
+                convergence=input_data.convergence,
+                max_iterations=input_data.max_iterations,
+                memory=input_data.memory,
+                n_threads=input_data.n_threads,
+            )
+            excitations = record.excitations(input_data.n_states)
             
             # Build output
             data = {
-                "ground_state_energy": float(energy),
+                "ground_state_energy": record.ground_state_energy,
                 "functional": input_data.functional,
                 "basis": input_data.basis,
                 "method": "TDA (Tamm-Dancoff)",
                 "n_states_computed": len(excitations),
                 "excitations": excitations,
                 "triplets": input_data.triplets,
+                "excited_state_store": record.summary(),
                 "units": {"energy": "eV", "wavelength": "nm"}
             }
             
-            message = f"TDA: {len(excitations)} excited states"
-            
-            psi4.core.clean()
+            message = f"TDA: {len(excitations)} excited states ({record.source})"
             
             return Result.success(ToolOutput(
                 success=True,
@@ -13,6 +13,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.excited_states.store import get_excited_states
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,7 @@ class TDDFTToolInput(ToolInput):
     triplets: bool = Field(default=False, description="Compute triplet states")
     roots_per_irrep: Optional[list[int]] = Field(
         default=None,
-        description="States per irreducible representation"
+        description="States per irreducible representation (summed; states are solved in C1)"
     )
     convergence: float = Field(default=1e-5, description="Convergence threshold")
     max_iterations: int = Field(default=60, description="Maximum iterations")
@@ -54,7 +55,7 @@ class TDDFTTool(BaseTool[TDDFTToolInput, ToolOutput]):
         "Returns excitation energies, oscillator strengths, and transitions."
     )
     category: ClassVar[ToolCategory] = ToolCategory.EXCITED_STATES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -73,72 +74,26 @@ class TDDFTTool(BaseTool[TDDFTToolInput, ToolOutput]):
     def _execute(self, input_data: TDDFTToolInput) -> Result[ToolOutput]:
         """Execute TD-DFT calculation."""
         try:
-            import psi4
-            
-            # Configure Psi4
-            psi4.core.clean()
-            psi4.set_memory(f"{input_data.memory} MB")
-            psi4.set_num_threads(input_data.n_threads)
-            
-            # Build molecule
-            mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-            molecule = psi4.geometry(mol_string)
-            
-            # Set options
             roots = input_data.roots_per_irrep or [input_data.n_states]
-            psi4.set_options({
-                "basis": input_data.basis,
-                "roots_per_irrep": roots,
-                "tdscf_r_convergence": input_data.convergence,
-                "tdscf_maxiter": input_data.max_iterations,
-                "tda": False,  # Full TD-DFT
-            })
-            
-            if input_data.triplets:
-                psi4.set_options({"tdscf_triplets": True})
-            
-            # Run TD-DFT
-            method_str = f"td-{input_data.functional}/{input_data.basis}"
-            energy, wfn = psi4.energy(method_str, return_wfn=True, molecule=molecule)
-            
-            # Extract excited state information
-            HARTREE_TO_EV = 27.2114
-            HARTREE_TO_NM = 45.56335 * 27.2114
-            
-            excitations = []
-            for i in range(input_data.n_states):
-                try:
-                    var_prefix = f"TD-{input_data.functional.upper()} ROOT 0 -> ROOT {i+1}"
-                    exc_energy = psi4.variable(f"{var_prefix} EXCITATION ENERGY")
-                    osc_str = psi4.variable(f"{var_prefix} OSCILLATOR STRENGTH (LEN)")
-                    
-                    exc_ev = float(exc_energy) * HARTREE_TO_EV
-                    wavelength = HARTREE_TO_NM / float(exc_energy) if exc_energy > 0 else 0
-                    
-                    # Get transition dipole
-                    try:
-                        tdm_x = psi4.variable(f"{var_prefix} TRANSITION DIPOLE X")
-                        tdm_y = psi4.variable(f"{var_prefix} TRANSITION DIPOLE Y")
-                        tdm_z = psi4.variable(f"{var_prefix} TRANSITION DIPOLE Z")
-                        transition_dipole = [float(tdm_x), float(tdm_y), float(tdm_z)]
-                    except Exception:
-                        transition_dipole = None
-                    
-                    excitations.append({
-                        "state": i + 1,
-                        "energy_hartree": float(exc_energy),
-                        "energy_ev": exc_ev,
-                        "wavelength_nm": wavelength,
-                        "oscillator_strength": float(osc_str),
-                        "transition_dipole": transition_dipole,
-                        "spin_state": "triplet" if input_data.triplets else "singlet",
-                    })
-                except Exception:
-                    break
+            record = get_excited_states(
+                input_data.geometry,
+                method=input_data.functional,
+                basis=input_data.basis,
+                charge=input_data.charge,
+                multiplicity=input_data.multiplicity,
+                n_states=sum(roots),
+                tda=False,  # Full TD-DFT
+                triplets=input_data.triplets,
+                convergence=input_data.convergence,
+                max_iterations=input_data.max_iterations,
+                memory=input_data.memory,
+                n_threads=input_data.n_threads,
+            )
+            excitations = record.excitations(sum(roots))
             
             # Build output
             data = {
-                "ground_state_energy": float(energy),
+                "ground_state_energy": record.ground_state_energy,
                 "functional": input_data.functional,
                 "basis": input_data.basis,
                 "method": "TD-DFT (RPA)",
@@ -146,6 +101,7 @@ class TDDFTTool(BaseTool[TDDFTToolInput, ToolOutput]):
                 "n_states_computed": len(excitations),
                 "excitations": excitations,
                 "triplets": input_data.triplets,
+                "excited_state_store": record.summary(),
                 "units": {
                     "energy": "eV",
                     "wavelength": "nm",
@@ -158,9 +114,7 @@ class TDDFTTool(BaseTool[TDDFTToolInput, ToolOutput]):
                 brightest = max(excitations, key=lambda x: x["oscillator_strength"])
                 data["brightest_state"] = brightest
             
-            message = f"TD-DFT: {len(excitations)} excited states computed"
-            
-            psi4.core.clean()
+            message = f"TD-DFT: {len(excitations)} excited states ({record.source})"
             
             return Result.success(ToolOutput(
                 success=True,
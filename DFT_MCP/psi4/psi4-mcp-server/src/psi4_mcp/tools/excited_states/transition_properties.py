@@ -13,6 +13,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.excited_states.store import get_excited_states
 
 logger = logging.getLogger(__name__)
 
@@ -58,7 +59,7 @@ class TransitionPropertiesTool(BaseTool[TransitionPropertiesToolInput, ToolOutpu
         "oscillator strengths, and natural transition orbitals."
     )
     category: ClassVar[ToolCategory] = ToolCategory.EXCITED_STATES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -77,85 +78,52 @@ class TransitionPropertiesTool(BaseTool[TransitionPropertiesToolInput, ToolOutpu
     def _execute(self, input_data: TransitionPropertiesToolInput) -> Result[ToolOutput]:
         """Execute transition properties calculation."""
         try:
-            import psi4
             import numpy as np
             
-            # Configure Psi4
-            psi4.core.clean()
-            psi4.set_memory(f"{input_data.memory} MB")
-            psi4.set_num_threads(input_data.n_threads)
+            record = get_excited_states(
+                input_data.geometry,
+                method=input_data.method,
+                basis=input_data.basis,
+                charge=input_data.charge,
+                multiplicity=input_data.multiplicity,
+                n_states=input_data.n_states,
+                memory=input_data.memory,
+                n_threads=input_data.n_threads,
+            )
             
-            # Build molecule
-            mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-            molecule = psi4.geometry(mol_string)
-            
-            # Set options
-            psi4.set_options({
-                "basis": input_data.basis,
-                "roots_per_irrep": [input_data.n_states],
-            })
-            
-            # Run TD-DFT
-            method_str = f"td-{input_data.method}/{input_data.basis}"
-            energy, wfn = psi4.energy(method_str, return_wfn=True, molecule=molecule)
-            
-            # Extract transition properties
-            HARTREE_TO_EV = 27.2114
+            # Transition properties from the stored moments
             transitions = []
             
-            for i in range(input_data.n_states):
-                state_num = i + 1
-                var_prefix = f"TD-{input_data.method.upper()} ROOT 0 -> ROOT {state_num}"
-                
-                try:
-                    exc_energy = psi4.variable(f"{var_prefix} EXCITATION ENERGY")
-                except Exception:
-                    break
-                
+            for state in record.excitations(input_data.n_states):
+                i = state["state"] - 1
                 transition_data = {
-                    "state": state_num,
-                    "excitation_energy_ev": float(exc_energy) * HARTREE_TO_EV,
+                    "state": state["state"],
+                    "excitation_energy_ev": state["energy_ev"],
                 }
                 
-                # Transition dipole (length gauge)
+                # Transition dipoles (length and velocity gauge) and magnetic dipole
                 if "dipole" in input_data.properties:
-                    try:
-                        tdm_x = psi4.variable(f"{var_prefix} TRANSITION DIPOLE X")
-                        tdm_y = psi4.variable(f"{var_prefix} TRANSITION DIPOLE Y")
-                        tdm_z = psi4.variable(f"{var_prefix} TRANSITION DIPOLE Z")
-                        tdm = [float(tdm_x), float(tdm_y), float(tdm_z)]
-                        tdm_mag = np.linalg.norm(tdm)
-                        
-                        transition_data["transition_dipole_length"] = {
-                            "x": tdm[0],
-                            "y": tdm[1],
-                            "z": tdm[2],
-                            "magnitude": float(tdm_mag),
+                    for name, moment in (
+                        ("transition_dipole_length", record.dipole_length[i]),
+                        ("transition_dipole_velocity", record.dipole_velocity[i]),
+                        ("magnetic_transition_dipole", record.magnetic_dipole[i]),
+                    ):
+                        transition_data[name] = {
+                            "x": float(moment[0]),
+                            "y": float(moment[1]),
+                            "z": float(moment[2]),
+                            "magnitude": float(np.linalg.norm(moment)),
                             "units": "au"
                         }
-                    except Exception:
-                        pass
                 
                 # Oscillator strength
                 if "oscillator" in input_data.properties:
-                    try:
-                        osc_len = psi4.variable(f"{var_prefix} OSCILLATOR STRENGTH (LEN)")
-                        transition_data["oscillator_strength_length"] = float(osc_len)
-                        
-                        try:
-                            osc_vel = psi4.variable(f"{var_prefix} OSCILLATOR STRENGTH (VEL)")
-                            transition_data["oscillator_strength_velocity"] = float(osc_vel)
-                        except Exception:
-                            pass
-                    except Exception:
-                        pass
+                    transition_data["oscillator_strength_length"] = state["oscillator_strength"]
+                    transition_data["oscillator_strength_velocity"] = state["oscillator_strength_velocity"]
                 
                 # Rotatory strength (for ECD)
-                try:
-                    rot_len = psi4.variable(f"{var_prefix} ROTATORY STRENGTH (LEN)")
-                    transition_data["rotatory_strength_length"] = float(rot_len)
-                except Exception:
-                    pass
+                transition_data["rotatory_strength_length"] = state["rotatory_strength"]
+                transition_data["rotatory_strength_velocity"] = state["rotatory_strength_velocity"]
                 
                 # NTO analysis would require additional implementation
                 if "nto" in input_data.properties:
@@ -184,6 +152,7 @@ class TransitionPropertiesTool(BaseTool[TransitionPropertiesToolInput, ToolOutpu
                 "n_states": len(transitions),
                 "transitions": transitions,
                 "computed_properties": input_data.properties,
+                "excited_state_store": record.summary(),
                 "units": {
                     "energy": "eV",
                     "transition_dipole": "au",
@@ -196,9 +165,7 @@ class TransitionPropertiesTool(BaseTool[TransitionPropertiesToolInput, ToolOutpu
                 }
             }
             
-            message = f"Transition properties for {len(transitions)} states"
-            
-            psi4.core.clean()
+            message = f"Transition properties for {len(transitions)} states ({record.source})"
             
             return Result.success(ToolOutput(
                 success=True,
@@ -29,6 +29,8 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.models.outputs.orbitals import BondOrderAnalysis
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -86,19 +88,78 @@ class MayerAtomicValence:
 
 @dataclass
 class MayerAnalysisResult:
-    """Complete Mayer bond order analysis results."""
-    bond_orders: List[MayerBondOrder]
-    atomic_valences: List[MayerAtomicValence]
-    bond_order_matrix: List[List[float]]
-    total_bond_order_sum: float
+    """
+    Complete Mayer bond order analysis results.
+    
+    The bond order matrix lives in an array-backed BondOrderAnalysis
+    (its total_valences are the bonded valences); per-bond and per-atom
+    entries are built on demand.
+    """
+    analysis: BondOrderAnalysis
+    covalent_matrix: Optional[Any]
+    gross_populations: Any
+    total_valences: Any
     is_open_shell: bool
     method: str
     basis: str
     
+    @property
+    def bond_order_matrix(self) -> List[List[float]]:
+        return self.analysis.matrix.tolist()
+    
+    @property
+    def total_bond_order_sum(self) -> float:
+        return float(self.analysis.matrix.sum() / 2.0)
+    
+    @property
+    def bond_orders(self) -> List[MayerBondOrder]:
+        return [MayerBondOrder(**entry) for entry in self._bond_entries()]
+    
+    @property
+    def atomic_valences(self) -> List[MayerAtomicValence]:
+        return [MayerAtomicValence(**entry) for entry in self._valence_entries()]
+    
+    def _bond_entries(self) -> List[Dict[str, Any]]:
+        symbols = self.analysis.symbols
+        matrix = self.analysis.matrix
+        entries = []
+        for i, j in self.analysis.bonded_pairs():
+            bo = float(matrix[i, j])
+            covalent = float(self.covalent_matrix[i, j]) if self.covalent_matrix is not None else 0.0
+            entries.append({
+                "atom_i": i,
+                "atom_j": j,
+                "element_i": symbols[i],
+                "element_j": symbols[j],
+                "bond_order": bo,
+                "covalent_component": covalent,
+                "ionic_component": bo - covalent if self.covalent_matrix is not None else 0.0,
+                "shared_electrons": bo,
+            })
+        return entries
+    
+    def _valence_entries(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "atom_index": i,
+                "element": element,
+                "total_valence": total,
+                "bonded_valence": bonded,
+                "free_valence": max(0.0, total - bonded),
+                "gross_population": gross,
+            }
+            for i, (element, total, bonded, gross) in enumerate(zip(
+                self.analysis.symbols,
+                self.total_valences.tolist(),
+                self.analysis.total_valences,
+                self.gross_populations.tolist(),
+            ))
+        ]
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "bond_orders": [b.to_dict() for b in self.bond_orders],
-            "atomic_valences": [v.to_dict() for v in self.atomic_valences],
+            "bond_orders": self._bond_entries(),
+            "atomic_valences": self._valence_entries(),
             "bond_order_matrix": self.bond_order_matrix,
             "total_bond_order_sum": self.total_bond_order_sum,
             "is_open_shell": self.is_open_shell,
@@ -197,81 +258,33 @@ def compute_mayer_bond_orders(
         n_func = basisset.shell(shell_idx).nfunction
         bf_to_atom.extend([atom_idx] * n_func)
     
-    # Compute Mayer bond order matrix
-    mayer_matrix = np.zeros((natoms, natoms))
-    covalent_matrix = np.zeros((natoms, natoms))
-    
-    for mu in range(nbf):
-        atom_mu = bf_to_atom[mu]
-        for nu in range(nbf):
-            atom_nu = bf_to_atom[nu]
-            
-            if atom_mu != atom_nu:
-                mayer_contribution = DSa[mu, nu] * DSa[nu, mu] + DSb[mu, nu] * DSb[nu, mu]
-                mayer_matrix[atom_mu, atom_nu] += mayer_contribution
-                
-                if compute_components:
-                    covalent = 0.5 * (DSa[mu, nu] * DSa[nu, mu] + DSb[mu, nu] * DSb[nu, mu])
-                    covalent_matrix[atom_mu, atom_nu] += covalent
+    # Atom projector: summing basis-function blocks is P @ X @ P.T
+    projector = np.zeros((natoms, nbf))
+    projector[bf_to_atom, np.arange(nbf)] = 1.0
     
-    # Compute gross atomic populations
-    gross_pop = np.zeros(natoms)
-    for mu in range(nbf):
-        atom_mu = bf_to_atom[mu]
-        gross_pop[atom_mu] += DS_total[mu, mu]
-    
-    # Extract significant bonds
-    bond_orders = []
-    for i in range(natoms):
-        for j in range(i + 1, natoms):
-            bo = mayer_matrix[i, j]
-            if bo > bond_threshold:
-                covalent = covalent_matrix[i, j] if compute_components else 0.0
-                ionic = bo - covalent if compute_components else 0.0
-                
-                bond_orders.append(MayerBondOrder(
-                    atom_i=i,
-                    atom_j=j,
-                    element_i=elements[i] if i < len(elements) else mol.label(i),
-                    element_j=elements[j] if j < len(elements) else mol.label(j),
-                    bond_order=float(bo),
-                    covalent_component=float(covalent),
-                    ionic_component=float(ionic),
-                    shared_electrons=float(bo),
-                ))
+    # Compute Mayer bond order matrix
+    mayer_matrix = projector @ (DSa * DSa.T + DSb * DSb.T) @ projector.T
+    np.fill_diagonal(mayer_matrix, 0.0)
+    covalent_matrix = 0.5 * mayer_matrix if compute_components else None
     
-    # Compute atomic valences
-    atomic_valences = []
-    for i in range(natoms):
-        element = elements[i] if i < len(elements) else mol.label(i)
-        bonded_valence = np.sum(mayer_matrix[i, :])
-        
-        diag_contribution = 0.0
-        for mu in range(nbf):
-            if bf_to_atom[mu] == i:
-                for nu in range(nbf):
-                    if bf_to_atom[nu] == i:
-                        diag_contribution += DS_total[mu, nu] * DS_total[nu, mu]
-        
-        total_valence = 2 * gross_pop[i] - diag_contribution
-        free_valence = max(0, total_valence - bonded_valence)
-        
-        atomic_valences.append(MayerAtomicValence(
-            atom_index=i,
-            element=element,
-            total_valence=float(total_valence),
-            bonded_valence=float(bonded_valence),
-            free_valence=float(free_valence),
-            gross_population=float(gross_pop[i]),
-        ))
+    # Compute gross atomic populations and total valences
+    gross_pop = projector @ np.diag(DS_total)
+    diag_contribution = np.diag(projector @ (DS_total * DS_total.T) @ projector.T)
+    total_valences = 2 * gross_pop - diag_contribution
     
-    total_bo_sum = np.sum(mayer_matrix) / 2.0
+    symbols = [elements[i] if i < len(elements) else mol.label(i) for i in range(natoms)]
+    analysis = BondOrderAnalysis.from_matrix(
+        method="Mayer",
+        symbols=symbols,
+        matrix=mayer_matrix,
+        threshold=bond_threshold,
+    )
     
     return MayerAnalysisResult(
-        bond_orders=bond_orders,
-        atomic_valences=atomic_valences,
-        bond_order_matrix=mayer_matrix.tolist(),
-        total_bond_order_sum=float(total_bo_sum),
+        analysis=analysis,
+        covalent_matrix=covalent_matrix,
+        gross_populations=gross_pop,
+        total_valences=total_valences,
         is_open_shell=is_open_shell,
         method=wfn.name(),
         basis=basisset.name(),
@@ -289,7 +302,7 @@ class MayerBondOrderTool(BaseTool[MayerBondOrderInput, ToolOutput]):
     name: ClassVar[str] = "calculate_mayer_bond_orders"
     description: ClassVar[str] = "Calculate Mayer bond indices for covalent bonding analysis."
     category: ClassVar[ToolCategory] = ToolCategory.PROPERTIES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     def _validate_input(self, input_data: MayerBondOrderInput) -> Optional[ValidationError]:
         return validate_mayer_input(input_data)
@@ -300,7 +313,7 @@ class MayerBondOrderTool(BaseTool[MayerBondOrderInput, ToolOutput]):
         psi4.core.clean()
         psi4.set_memory(f"{input_data.memory} MB")
         psi4.set_num_threads(input_data.n_threads)
-        psi4.core.set_output_file("psi4_mayer.out", False)
+        psi4.core.set_output_file(calculation_output_path("psi4_mayer.out"), False)
         
         mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
         mol = psi4.geometry(mol_string)
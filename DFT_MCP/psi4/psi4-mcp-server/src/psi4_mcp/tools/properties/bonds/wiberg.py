@@ -28,6 +28,8 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.models.outputs.orbitals import BondOrderAnalysis
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -113,18 +115,76 @@ class AtomicValence:
 
 @dataclass
 class WibergAnalysisResult:
-    """Complete Wiberg bond order analysis results."""
-    bond_orders: List[WibergBondOrder]
-    atomic_valences: List[AtomicValence]
-    bond_order_matrix: List[List[float]]
-    total_bond_order_sum: float
+    """
+    Complete Wiberg bond order analysis results.
+    
+    The bond order matrix lives in an array-backed BondOrderAnalysis next
+    to its alpha part; per-bond and per-atom entries are built on demand.
+    """
+    analysis: BondOrderAnalysis
+    alpha_matrix: Any
+    expected_valences: List[float]
     method: str
     basis: str
     
+    @property
+    def bond_order_matrix(self) -> List[List[float]]:
+        return self.analysis.matrix.tolist()
+    
+    @property
+    def total_bond_order_sum(self) -> float:
+        return float(self.analysis.matrix.sum() / 2.0)  # Each bond counted twice
+    
+    @property
+    def bond_orders(self) -> List[WibergBondOrder]:
+        return [WibergBondOrder(**entry) for entry in self._bond_entries()]
+    
+    @property
+    def atomic_valences(self) -> List[AtomicValence]:
+        return [AtomicValence(**entry) for entry in self._valence_entries()]
+    
+    def _bond_entries(self) -> List[Dict[str, Any]]:
+        symbols = self.analysis.symbols
+        matrix = self.analysis.matrix
+        entries = []
+        for i, j in self.analysis.bonded_pairs():
+            bo = float(matrix[i, j])
+            alpha = float(self.alpha_matrix[i, j])
+            entries.append({
+                "atom_i": i,
+                "atom_j": j,
+                "element_i": symbols[i],
+                "element_j": symbols[j],
+                "bond_order": bo,
+                "bond_type": classify_bond(bo),
+                "alpha_contribution": alpha,
+                "beta_contribution": bo - alpha,
+            })
+        return entries
+    
+    def _valence_entries(self) -> List[Dict[str, Any]]:
+        bonded = [[] for _ in self.analysis.symbols]
+        for i, j in self.analysis.bonded_pairs():
+            bonded[i].append(j)
+            bonded[j].append(i)
+        return [
+            {
+                "atom_index": i,
+                "element": element,
+                "total_valence": total,
+                "free_valence": max(0.0, expected - total),
+                "n_bonds": len(bonded[i]),
+                "bonded_atoms": sorted(bonded[i]),
+            }
+            for i, (element, total, expected) in enumerate(zip(
+                self.analysis.symbols, self.analysis.total_valences, self.expected_valences,
+            ))
+        ]
+    
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "bond_orders": [b.to_dict() for b in self.bond_orders],
-            "atomic_valences": [v.to_dict() for v in self.atomic_valences],
+            "bond_orders": self._bond_entries(),
+            "atomic_valences": self._valence_entries(),
             "bond_order_matrix": self.bond_order_matrix,
             "total_bond_order_sum": self.total_bond_order_sum,
             "method": self.method,
@@ -231,70 +291,28 @@ def compute_wiberg_bond_orders(
         n_func = basisset.shell(shell_idx).nfunction
         bf_to_atom.extend([atom_idx] * n_func)
     
-    # Compute Wiberg bond order matrix
-    wiberg_matrix = np.zeros((natoms, natoms))
-    wiberg_alpha = np.zeros((natoms, natoms))
-    wiberg_beta = np.zeros((natoms, natoms))
-    
-    for mu in range(nbf):
-        atom_mu = bf_to_atom[mu]
-        for nu in range(nbf):
-            atom_nu = bf_to_atom[nu]
-            
-            if atom_mu != atom_nu:
-                wiberg_alpha[atom_mu, atom_nu] += DSa[mu, nu] * DSa[nu, mu]
-                wiberg_beta[atom_mu, atom_nu] += DSb[mu, nu] * DSb[nu, mu]
-    
-    wiberg_matrix = wiberg_alpha + wiberg_beta
+    # Atom projector: summing basis-function blocks is P @ X @ P.T
+    projector = np.zeros((natoms, nbf))
+    projector[bf_to_atom, np.arange(nbf)] = 1.0
     
-    # Extract significant bonds
-    bond_orders = []
-    for i in range(natoms):
-        for j in range(i + 1, natoms):
-            bo = wiberg_matrix[i, j]
-            if bo > bond_threshold:
-                bond_orders.append(WibergBondOrder(
-                    atom_i=i,
-                    atom_j=j,
-                    element_i=elements[i] if i < len(elements) else mol.label(i),
-                    element_j=elements[j] if j < len(elements) else mol.label(j),
-                    bond_order=float(bo),
-                    bond_type=classify_bond(bo),
-                    alpha_contribution=float(wiberg_alpha[i, j]),
-                    beta_contribution=float(wiberg_beta[i, j]),
-                ))
-    
-    # Compute atomic valences
-    atomic_valences = []
-    for i in range(natoms):
-        element = elements[i] if i < len(elements) else mol.label(i)
-        total_valence = np.sum(wiberg_matrix[i, :])
-        
-        # Find bonded atoms
-        bonded = [j for j in range(natoms) if j != i and wiberg_matrix[i, j] > bond_threshold]
-        n_bonds = len(bonded)
-        
-        # Calculate free valence
-        expected = expected_valences.get(element, 4.0)
-        free_valence = max(0, expected - total_valence)
-        
-        atomic_valences.append(AtomicValence(
-            atom_index=i,
-            element=element,
-            total_valence=float(total_valence),
-            free_valence=float(free_valence),
-            n_bonds=n_bonds,
-            bonded_atoms=bonded,
-        ))
+    # Compute Wiberg bond order matrix
+    wiberg_alpha = projector @ (DSa * DSa.T) @ projector.T
+    wiberg_beta = projector @ (DSb * DSb.T) @ projector.T
+    np.fill_diagonal(wiberg_alpha, 0.0)
+    np.fill_diagonal(wiberg_beta, 0.0)
     
-    # Total bond order sum
-    total_bo_sum = np.sum(wiberg_matrix) / 2.0  # Each bond counted twice
+    symbols = [elements[i] if i < len(elements) else mol.label(i) for i in range(natoms)]
+    analysis = BondOrderAnalysis.from_matrix(
+        method="Wiberg",
+        symbols=symbols,
+        matrix=wiberg_alpha + wiberg_beta,
+        threshold=bond_threshold,
+    )
     
     return WibergAnalysisResult(
-        bond_orders=bond_orders,
-        atomic_valences=atomic_valences,
-        bond_order_matrix=wiberg_matrix.tolist(),
-        total_bond_order_sum=float(total_bo_sum),
+        analysis=analysis,
+        alpha_matrix=wiberg_alpha,
+        expected_valences=[expected_valences.get(symbol, 4.0) for symbol in symbols],
         method=wfn.name(),
         basis=basisset.name(),
     )
@@ -311,7 +329,7 @@ class WibergBondOrderTool(BaseTool[WibergBondOrderInput, ToolOutput]):
     name: ClassVar[str] = "calculate_wiberg_bond_orders"
     description: ClassVar[str] = "Calculate Wiberg bond indices to analyze covalent bonding."
     category: ClassVar[ToolCategory] = ToolCategory.PROPERTIES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     def _validate_input(self, input_data: WibergBondOrderInput) -> Optional[ValidationError]:
         return validate_wiberg_input(input_data)
@@ -322,7 +340,7 @@ class WibergBondOrderTool(BaseTool[WibergBondOrderInput, ToolOutput]):
         psi4.core.clean()
         psi4.set_memory(f"{input_data.memory} MB")
         psi4.set_num_threads(input_data.n_threads)
-        psi4.core.set_output_file("psi4_wiberg.out", False)
+        psi4.core.set_output_file(calculation_output_path("psi4_wiberg.out"), False)
         
         mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
         mol = psi4.geometry(mol_string)
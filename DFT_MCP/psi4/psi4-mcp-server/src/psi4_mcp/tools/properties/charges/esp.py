@@ -31,6 +31,7 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -367,7 +368,7 @@ class ESPChargesTool(BaseTool[ESPChargesInput, ToolOutput]):
         psi4.core.clean()
         psi4.set_memory(f"{input_data.memory} MB")
         psi4.set_num_threads(input_data.n_threads)
-        psi4.core.set_output_file("psi4_esp.out", False)
+        psi4.core.set_output_file(calculation_output_path("psi4_esp.out"), False)
         
         mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
         mol = psi4.geometry(mol_string)
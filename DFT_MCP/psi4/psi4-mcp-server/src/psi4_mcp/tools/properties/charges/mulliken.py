@@ -29,6 +29,8 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.models.outputs.orbitals import PopulationAnalysis
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -102,19 +104,58 @@ class MullikenBondPopulation:
 
 @dataclass
 class MullikenAnalysisResult:
-    """Complete Mulliken population analysis results."""
-    atomic_charges: List[MullikenAtomicCharge]
-    total_charge: float
-    total_spin: float
+    """
+    Complete Mulliken population analysis results.
+    
+    The charges live in an array-backed PopulationAnalysis next to the
+    alpha/beta population arrays; per-atom entries are built on demand.
+    """
+    population: PopulationAnalysis
+    alpha_populations: Any
+    beta_populations: Any
     orbital_populations: Optional[List[MullikenOrbitalPopulation]]
     bond_populations: Optional[List[MullikenBondPopulation]]
     method: str
     basis: str
     
+    @property
+    def total_charge(self) -> float:
+        """Sum of the atomic charges."""
+        return self.population.total_charge
+    
+    @property
+    def total_spin(self) -> float:
+        """Sum of the atomic spin populations."""
+        return float((self.alpha_populations - self.beta_populations).sum())
+    
+    @property
+    def atomic_charges(self) -> List[MullikenAtomicCharge]:
+        """Per-atom charges and populations."""
+        return [MullikenAtomicCharge(**entry) for entry in self._atomic_charge_entries()]
+    
+    def _atomic_charge_entries(self) -> List[Dict[str, Any]]:
+        return [
+            {
+                "atom_index": i,
+                "element": element,
+                "charge": charge,
+                "alpha_population": alpha,
+                "beta_population": beta,
+                "total_population": alpha + beta,
+                "spin_population": alpha - beta,
+            }
+            for i, (element, charge, alpha, beta) in enumerate(zip(
+                self.population.symbols,
+                self.population.atomic_charges.tolist(),
+                self.alpha_populations.tolist(),
+                self.beta_populations.tolist(),
+            ))
+        ]
+    
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         result = {
-            "atomic_charges": [c.to_dict() for c in self.atomic_charges],
+            "atomic_charges": self._atomic_charge_entries(),
             "total_charge": self.total_charge,
             "total_spin": self.total_spin,
             "method": self.method,
@@ -289,39 +330,18 @@ def compute_mulliken_charges_from_wfn(
         shell_to_atom.extend([atom_idx] * n_functions)
     
     # Compute atomic populations
-    alpha_pops = np.zeros(natoms)
-    beta_pops = np.zeros(natoms)
-    
-    nbf = basisset.nbf()
-    for mu in range(nbf):
-        atom = shell_to_atom[mu]
-        alpha_pops[atom] += PS_alpha[mu, mu]
-        beta_pops[atom] += PS_beta[mu, mu]
-    
-    # Get nuclear charges
-    nuclear_charges = []
-    for i in range(natoms):
-        nuclear_charges.append(mol.Z(i))
+    alpha_pops = np.bincount(shell_to_atom, weights=np.diag(PS_alpha), minlength=natoms)
+    beta_pops = np.bincount(shell_to_atom, weights=np.diag(PS_beta), minlength=natoms)
     
     # Compute Mulliken charges
-    atomic_charges = []
-    for i in range(natoms):
-        total_pop = alpha_pops[i] + beta_pops[i]
-        spin_pop = alpha_pops[i] - beta_pops[i]
-        charge = nuclear_charges[i] - total_pop
-        
-        atomic_charges.append(MullikenAtomicCharge(
-            atom_index=i,
-            element=elements[i] if i < len(elements) else mol.label(i),
-            charge=float(charge),
-            alpha_population=float(alpha_pops[i]),
-            beta_population=float(beta_pops[i]),
-            total_population=float(total_pop),
-            spin_population=float(spin_pop),
-        ))
-    
-    total_charge = sum(c.charge for c in atomic_charges)
-    total_spin = sum(c.spin_population for c in atomic_charges)
+    nuclear_charges = np.array([mol.Z(i) for i in range(natoms)], dtype=float)
+    symbols = [elements[i] if i < len(elements) else mol.label(i) for i in range(natoms)]
+    population = PopulationAnalysis.from_arrays(
+        method="Mulliken",
+        symbols=symbols,
+        charges=nuclear_charges - alpha_pops - beta_pops,
+        spin_multiplicity=mol.multiplicity(),
+    )
     
     # Compute orbital populations if requested
     orbital_populations = None
@@ -338,9 +358,9 @@ def compute_mulliken_charges_from_wfn(
         )
     
     return MullikenAnalysisResult(
-        atomic_charges=atomic_charges,
-        total_charge=total_charge,
-        total_spin=total_spin,
+        population=population,
+        alpha_populations=alpha_pops,
+        beta_populations=beta_pops,
         orbital_populations=orbital_populations,
         bond_populations=bond_populations,
         method=wfn.name(),
@@ -459,7 +479,7 @@ class MullikenChargesTool(BaseTool[MullikenChargesInput, ToolOutput]):
         "orbital populations, and bond populations."
     )
     category: ClassVar[ToolCategory] = ToolCategory.PROPERTIES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     def _validate_input(self, input_data: MullikenChargesInput) -> Optional[ValidationError]:
         """Validate input parameters."""
@@ -473,7 +493,7 @@ class MullikenChargesTool(BaseTool[MullikenChargesInput, ToolOutput]):
         psi4.core.clean()
         psi4.set_memory(f"{input_data.memory} MB")
         psi4.set_num_threads(input_data.n_threads)
-        psi4.core.set_output_file("psi4_mulliken.out", False)
+        psi4.core.set_output_file(calculation_output_path("psi4_mulliken.out"), False)
         
         # Build molecule
         mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
@@ -511,8 +531,10 @@ class MullikenChargesTool(BaseTool[MullikenChargesInput, ToolOutput]):
         
         # Format output
         charges_str = ", ".join(
-            f"{c.element}({c.atom_index}): {c.charge:+.4f}"
-            for c in result.atomic_charges
+            f"{element}({i}): {charge:+.4f}"
+            for i, (element, charge) in enumerate(zip(
+                result.population.symbols, result.population.atomic_charges,
+            ))
         )
         
         message = (
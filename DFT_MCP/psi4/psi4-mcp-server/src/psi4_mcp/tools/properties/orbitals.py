@@ -13,6 +13,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.utils.parsing.orbitals import build_orbital_output
 
 logger = logging.getLogger(__name__)
 
@@ -39,7 +40,7 @@ class OrbitalsTool(BaseTool[OrbitalsToolInput, ToolOutput]):
         "orbital energies, and occupations."
     )
     category: ClassVar[ToolCategory] = ToolCategory.PROPERTIES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -71,29 +72,31 @@ class OrbitalsTool(BaseTool[OrbitalsToolInput, ToolOutput]):
             
             energy, wfn = energy_result.value
             
-            # Extract orbital info
-            n_alpha = wfn.nalpha()
-            n_beta = wfn.nbeta()
-            epsilon_a = wfn.epsilon_a()
+            # Orbitals in energy order over all irreps, as array-backed models
+            orbitals = build_orbital_output(wfn, include_coefficients=False)
+            alpha = orbitals.alpha
+            n_alpha = orbitals.n_alpha
+            n_beta = orbitals.n_beta
             
             homo_idx = n_alpha - 1
             lumo_idx = n_alpha
             
-            homo_energy = epsilon_a.get(homo_idx) if homo_idx >= 0 else None
-            lumo_energy = epsilon_a.get(lumo_idx) if lumo_idx < epsilon_a.dim() else None
+            homo_energy = alpha.homo_energy
+            lumo_energy = alpha.lumo_energy
             
             gap = (lumo_energy - homo_energy) if homo_energy and lumo_energy else None
             
             # Get range of orbital energies
             orb_energies = []
             start_idx = max(0, homo_idx - input_data.n_orbitals)
-            end_idx = min(epsilon_a.dim(), lumo_idx + input_data.n_orbitals)
+            end_idx = min(alpha.n_orbitals, lumo_idx + input_data.n_orbitals)
             
             for i in range(start_idx, end_idx):
+                orbital = alpha.get_orbital(i)
                 orb_energies.append({
                     "index": i,
-                    "energy_hartree": epsilon_a.get(i),
-                    "energy_eV": epsilon_a.get(i) * 27.2114,
+                    "energy_hartree": orbital.energy,
+                    "energy_eV": orbital.energy_ev,
                     "occupation": 2 if i < n_alpha else 0,
                     "type": "occupied" if i < n_alpha else "virtual",
                 })
@@ -110,6 +113,7 @@ class OrbitalsTool(BaseTool[OrbitalsToolInput, ToolOutput]):
                 "homo_lumo_gap_hartree": gap,
                 "homo_lumo_gap_eV": gap * 27.2114 if gap else None,
                 "orbital_energies": orb_energies,
+                "orbitals": orbitals.to_dict(),
             }
             
             message = (
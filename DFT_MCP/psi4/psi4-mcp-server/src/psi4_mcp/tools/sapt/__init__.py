@@ -5,9 +5,10 @@ from psi4_mcp.tools.sapt.sapt2_plus import SAPT2PlusTool, calculate_sapt2_plus
 from psi4_mcp.tools.sapt.sapt2_plus_3 import SAPT2Plus3Tool, calculate_sapt2_plus_3
 from psi4_mcp.tools.sapt.fisapt import FISAPTTool, calculate_fisapt
 from psi4_mcp.tools.sapt.sapt_dft import SAPTDFTTool, calculate_sapt_dft
+from psi4_mcp.tools.sapt.scan import SAPTScanTool, calculate_sapt_scan
 from psi4_mcp.tools.sapt.analysis import SAPTAnalysisTool, analyze_sapt
 
 __all__ = ["SAPT0Tool", "calculate_sapt0", "SAPT2Tool", "calculate_sapt2",
            "SAPT2PlusTool", "calculate_sapt2_plus", "SAPT2Plus3Tool", "calculate_sapt2_plus_3",
            "FISAPTTool", "calculate_fisapt", "SAPTDFTTool", "calculate_sapt_dft",
-           "SAPTAnalysisTool", "analyze_sapt"]
+           "SAPTScanTool", "calculate_sapt_scan", "SAPTAnalysisTool", "analyze_sapt"]
@@ -29,6 +29,7 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -242,7 +243,7 @@ def run_sapt0_calculation(
     psi4.core.clean()
     psi4.set_memory(f"{memory} MB")
     psi4.set_num_threads(n_threads)
-    psi4.core.set_output_file("psi4_sapt0.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_sapt0.out"), False)
     
     # Parse monomers
     monomer_a, monomer_b = parse_dimer_geometry(dimer_geometry)
@@ -28,6 +28,7 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -221,7 +222,7 @@ def run_sapt2_calculation(input_data: SAPT2Input) -> SAPT2Result:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_sapt2.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_sapt2.out"), False)
     
     # Build dimer molecule
     parts = input_data.dimer_geometry.split("--")
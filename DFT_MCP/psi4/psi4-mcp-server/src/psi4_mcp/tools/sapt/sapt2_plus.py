@@ -28,6 +28,7 @@ from psi4_mcp.tools.core.base_tool import (
     register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -152,7 +153,7 @@ def run_sapt2_plus_calculation(input_data: SAPT2PlusInput) -> SAPT2PlusResult:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_sapt2plus.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_sapt2plus.out"), False)
     
     # Build dimer
     parts = input_data.dimer_geometry.split("--")
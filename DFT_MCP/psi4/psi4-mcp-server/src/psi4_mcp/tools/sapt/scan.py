@@ -0,0 +1,678 @@
+"""
+SAPT Scan Tool.
+
+Computes SAPT component curves over a set of dimer geometries generated
+by rigidly displacing monomer B: a dissociation curve (centroid
+separations along the intermolecular axis), an orientation scan
+(rotations of B about its centroid) or a grid of both.
+
+Key Features:
+    - Any SAPT level (SAPT0, SAPT2, SAPT2+, SAPT2+(3), SAPT(DFT))
+    - Scan points run in parallel workers, cached by content
+    - Monomer quantities (SAPT(DFT) GRAC shifts) computed once per scan,
+      since the monomers are rigid across all points
+    - Electrostatics, exchange, induction, dispersion and total as arrays
+    - Curve minimum with a parabolic estimate of the equilibrium distance
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+import logging
+import time
+
+import numpy as np
+from pydantic import Field
+
+from psi4_mcp.tools.core.base_tool import (
+    BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
+)
+from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.tools.sapt.sapt0 import parse_dimer_geometry
+from psi4_mcp.tools.sapt.sapt_dft import estimate_grac_shift
+from psi4_mcp.utils.caching.results import (
+    CalculationType, cache_calculation_result, get_cached_result,
+)
+from psi4_mcp.utils.parallel.workers import run_worker_tasks, share_resources
+
+
+logger = logging.getLogger(__name__)
+HARTREE_TO_KCAL = 627.5094740631
+
+SCAN_METHODS = ("sapt0", "sapt2", "sapt2+", "sapt2+(3)", "sapt(dft)")
+
+# Component curves and the Psi4 variables they are read from
+SAPT_COMPONENTS = {
+    "electrostatics": "SAPT ELST ENERGY",
+    "exchange": "SAPT EXCH ENERGY",
+    "induction": "SAPT IND ENERGY",
+    "dispersion": "SAPT DISP ENERGY",
+    "total": "SAPT TOTAL ENERGY",
+}
+
+# Closest allowed contact between the monomers (Angstrom)
+MIN_CONTACT_DISTANCE = 0.5
+
+Atom = Tuple[str, float, float, float]
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+@dataclass
+class ScanPoint:
+    """One displaced dimer geometry."""
+    index: int
+    distance: float
+    angle: float
+    atoms_b: List[Atom]
+
+    @property
+    def label(self) -> str:
+        return f"point_{self.index}"
+
+
+@dataclass
+class SAPTScanResult:
+    """SAPT component curves over a scan."""
+    method: str
+    basis: str
+    distances: np.ndarray
+    angles: np.ndarray
+    # (n_angles, n_distances) layout of the points
+    shape: Tuple[int, int]
+    # Component name -> kcal/mol per point (NaN where a point failed)
+    components: Dict[str, np.ndarray]
+    grac_shift_a: Optional[float] = None
+    grac_shift_b: Optional[float] = None
+    n_computed: int = 0
+    n_cached: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)
+    wall_time: float = 0.0
+    
+    def minimum(self) -> Optional[Dict[str, float]]:
+        """Lowest total interaction energy, refined by a parabola along distance."""
+        total = self.components["total"]
+        if not np.isfinite(total).any():
+            return None
+        i = int(np.nanargmin(total))
+        minimum = {
+            "index": i,
+            "distance_angstrom": float(self.distances[i]),
+            "angle_degrees": float(self.angles[i]),
+            "total_kcal": float(total[i]),
+        }
+        # Neighbours along distance at the same angle, whatever the input order
+        n_distances = self.shape[1]
+        row = np.arange(n_distances) + (i // n_distances) * n_distances
+        row = row[np.argsort(self.distances[row], kind="stable")]
+        k = int(np.flatnonzero(row == i)[0])
+        if 0 < k < n_distances - 1:
+            x, y = self.distances[row[k - 1:k + 2]], total[row[k - 1:k + 2]]
+            if np.isfinite(y).all() and len(np.unique(x)) == 3:
+                a, b, c = np.polyfit(x, y, 2)
+                if a > 0:
+                    r = -b / (2 * a)
+                    minimum["equilibrium_distance_angstrom"] = float(r)
+                    minimum["equilibrium_total_kcal"] = float(c - b * b / (4 * a))
+        return minimum
+    
+    def to_dict(self) -> Dict[str, Any]:
+        def values(array: np.ndarray) -> List[Optional[float]]:
+            return [float(v) if np.isfinite(v) else None for v in array]
+        
+        return {
+            "method": self.method,
+            "basis": self.basis,
+            "distances_angstrom": values(self.distances),
+            "angles_degrees": values(self.angles),
+            "shape": list(self.shape),
+            "components_kcal": {name: values(curve) for name, curve in self.components.items()},
+            "minimum": self.minimum(),
+            "grac_shift_a": self.grac_shift_a,
+            "grac_shift_b": self.grac_shift_b,
+            "n_points": len(self.distances),
+            "n_computed": self.n_computed,
+            "n_cached": self.n_cached,
+            "failed": self.failed,
+            "wall_time_seconds": self.wall_time,
+        }
+
+
+# =============================================================================
+# INPUT SCHEMA
+# =============================================================================
+
+class SAPTScanInput(ToolInput):
+    """Input schema for a SAPT scan."""
+    
+    dimer_geometry: str = Field(
+        ...,
+        description="Reference dimer geometry (Angstrom) with monomers separated by '--' line",
+    )
+    
+    method: str = Field(
+        default="sapt0",
+        description=f"SAPT level: {', '.join(SCAN_METHODS)}",
+    )
+    
+    basis: str = Field(default="jun-cc-pvdz", description="Basis set")
+    
+    distances: Optional[List[float]] = Field(
+        default=None,
+        description="Separations (Angstrom) of the monomer centroids along the scan direction",
+    )
+    
+    angles: Optional[List[float]] = Field(
+        default=None,
+        description="Rotations (degrees) of monomer B about its centroid",
+    )
+    
+    direction: Optional[List[float]] = Field(
+        default=None,
+        description="Displacement direction for distances (default: centroid A to centroid B)",
+    )
+    
+    rotation_axis: List[float] = Field(
+        default=[0.0, 0.0, 1.0],
+        description="Axis for the rotations of monomer B",
+    )
+    
+    charge_a: int = Field(default=0, description="Charge of monomer A")
+    charge_b: int = Field(default=0, description="Charge of monomer B")
+    multiplicity_a: int = Field(default=1, description="Multiplicity of monomer A")
+    multiplicity_b: int = Field(default=1, description="Multiplicity of monomer B")
+    
+    functional: str = Field(default="pbe0", description="Monomer functional for SAPT(DFT)")
+    grac_shift_a: Optional[float] = Field(
+        default=None,
+        description="SAPT(DFT) GRAC shift for monomer A (computed once per scan if None)",
+    )
+    grac_shift_b: Optional[float] = Field(
+        default=None,
+        description="SAPT(DFT) GRAC shift for monomer B (computed once per scan if None)",
+    )
+    
+    freeze_core: bool = Field(default=True, description="Freeze core electrons")
+    density_fitting: bool = Field(default=True, description="Use density fitting")
+    
+    max_workers: int = Field(
+        default=1,
+        description="Worker processes for the scan points (1 = serial)",
+    )
+    memory: int = Field(default=4000, description="Memory limit in MB (shared by the workers)")
+    n_threads: int = Field(default=1, description="Threads (shared by the workers)")
+
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+def parse_monomer(block: str) -> List[Atom]:
+    """Atoms of a monomer block of 'symbol x y z' lines."""
+    atoms = []
+    for line in block.strip().splitlines():
+        tokens = line.split()
+        if not tokens:
+            continue
+        if len(tokens) != 4:
+            raise ValueError(f"Expected 'symbol x y z', got '{line.strip()}'")
+        atoms.append((tokens[0], float(tokens[1]), float(tokens[2]), float(tokens[3])))
+    if not atoms:
+        raise ValueError("Monomer has no atoms")
+    return atoms
+
+
+def _coordinates(atoms: List[Atom]) -> np.ndarray:
+    return np.array([a[1:4] for a in atoms], dtype=float)
+
+
+def rotation_matrix(axis: np.ndarray, angle_degrees: float) -> np.ndarray:
+    """Rotation by an angle about an axis (Rodrigues)."""
+    u = axis / np.linalg.norm(axis)
+    theta = np.radians(angle_degrees)
+    k = np.array([[0.0, -u[2], u[1]], [u[2], 0.0, -u[0]], [-u[1], u[0], 0.0]])
+    return np.eye(3) + np.sin(theta) * k + (1.0 - np.cos(theta)) * (k @ k)
+
+
+def scan_direction(atoms_a: List[Atom], atoms_b: List[Atom], direction: Optional[List[float]]) -> np.ndarray:
+    """Unit displacement direction (centroid A to centroid B by default)."""
+    if direction is not None:
+        vector = np.asarray(direction, dtype=float)
+    else:
+        vector = _coordinates(atoms_b).mean(axis=0) - _coordinates(atoms_a).mean(axis=0)
+    norm = np.linalg.norm(vector)
+    if norm < 1e-8:
+        raise ValueError("Scan direction is undefined (monomer centroids coincide)")
+    return vector / norm
+
+
+def scan_points(
+    atoms_a: List[Atom],
+    atoms_b: List[Atom],
+    distances: Optional[List[float]],
+    angles: Optional[List[float]],
+    direction: Optional[List[float]] = None,
+    rotation_axis: Optional[List[float]] = None,
+) -> List[ScanPoint]:
+    """
+    Rigid displacements of monomer B, angle-major over the distance grid.
+    
+    B is rotated about its centroid, then translated along the scan
+    direction until the centroid separation projected on it is the
+    requested distance. Monomer A never moves.
+    """
+    xyz_a = _coordinates(atoms_a)
+    xyz_b = _coordinates(atoms_b)
+    center_b = xyz_b.mean(axis=0)
+    u = scan_direction(atoms_a, atoms_b, direction)
+    current = float((center_b - xyz_a.mean(axis=0)) @ u)
+    axis = np.asarray(rotation_axis if rotation_axis is not None else [0.0, 0.0, 1.0], dtype=float)
+    
+    points = []
+    for angle in (angles if angles else [0.0]):
+        rotated = (xyz_b - center_b) @ rotation_matrix(axis, angle).T + center_b
+        for distance in (distances if distances else [current]):
+            moved = rotated + (distance - current) * u
+            points.append(ScanPoint(
+                index=len(points), distance=float(distance), angle=float(angle),
+                atoms_b=[(a[0], *map(float, xyz)) for a, xyz in zip(atoms_b, moved)],
+            ))
+    return points
+
+
+def closest_contact(atoms_a: List[Atom], atoms_b: List[Atom]) -> float:
+    """Shortest distance between an atom of A and an atom of B."""
+    delta = _coordinates(atoms_a)[:, None, :] - _coordinates(atoms_b)[None, :, :]
+    return float(np.sqrt((delta ** 2).sum(axis=-1)).min())
+
+
+def _atom_lines(atoms: List[Atom]) -> str:
+    return "\n".join(f"{a[0]} {a[1]:.10f} {a[2]:.10f} {a[3]:.10f}" for a in atoms)
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def validate_sapt_scan_input(input_data: SAPTScanInput) -> Optional[ValidationError]:
+    """Validate SAPT scan input."""
+    if not input_data.dimer_geometry or "--" not in input_data.dimer_geometry:
+        return ValidationError(field="dimer_geometry", message="Dimer geometry must contain '--' separator")
+    
+    if input_data.method.lower() not in SCAN_METHODS:
+        return ValidationError(field="method", message=f"Method must be one of {', '.join(SCAN_METHODS)}")
+    
+    if not input_data.distances and not input_data.angles:
+        return ValidationError(field="distances", message="Give distances, angles or both to scan")
+    
+    if input_data.distances and min(input_data.distances) <= 0:
+        return ValidationError(field="distances", message="Distances must be positive")
+    
+    for name in ("direction", "rotation_axis"):
+        vector = getattr(input_data, name)
+        if vector is not None and (len(vector) != 3 or np.linalg.norm(vector) < 1e-8):
+            return ValidationError(field=name, message=f"{name} must be a non-zero 3-vector")
+    
+    if input_data.max_workers < 1:
+        return ValidationError(field="max_workers", message="max_workers must be at least 1")
+    
+    try:
+        block_a, block_b = parse_dimer_geometry(input_data.dimer_geometry)
+        atoms_a, atoms_b = parse_monomer(block_a), parse_monomer(block_b)
+        points = scan_points(
+            atoms_a, atoms_b, input_data.distances, input_data.angles,
+            input_data.direction, input_data.rotation_axis,
+        )
+    except ValueError as e:
+        return ValidationError(field="dimer_geometry", message=str(e))
+    
+    for point in points:
+        if closest_contact(atoms_a, point.atoms_b) < MIN_CONTACT_DISTANCE:
+            return ValidationError(
+                field="distances",
+                message=f"Scan point at {point.distance:.3f} A, {point.angle:.1f} deg puts the monomers "
+                        f"closer than {MIN_CONTACT_DISTANCE} A",
+            )
+    
+    return None
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+def run_scan_point(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    SAPT components of one dimer geometry.
+    
+    Returns:
+        Dict with label, components (Hartree), runtime (or error)
+    """
+    import psi4
+    
+    start = time.time()
+    try:
+        psi4.core.clean()
+        psi4.set_memory(f"{task['memory']} MB")
+        psi4.set_num_threads(task["n_threads"])
+        if task.get("output_file"):
+            psi4.core.set_output_file(task["output_file"], True)
+        
+        dimer = psi4.geometry(task["molecule"])
+        dimer.update_geometry()
+        psi4.set_options(task["options"])
+        
+        energy = psi4.energy(task["method"], molecule=dimer)
+        components = {
+            name: float(psi4.variable(variable)) if psi4.core.has_variable(variable) else 0.0
+            for name, variable in SAPT_COMPONENTS.items()
+        }
+        if not psi4.core.has_variable(SAPT_COMPONENTS["total"]):
+            components["total"] = float(energy)
+        return {"label": task["label"], "components": components, "runtime": time.time() - start}
+    except Exception as e:
+        logger.warning(f"SAPT scan {task['label']} failed: {e}")
+        return {"label": task["label"], "error": str(e), "runtime": time.time() - start}
+    finally:
+        psi4.core.clean()
+
+
+def run_grac_shift(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    GRAC shift of one monomer: ionization potential (cation minus neutral
+    energy) plus the HOMO energy, with the SAPT(DFT) functional.
+    
+    Returns:
+        Dict with label, grac_shift (Hartree), runtime (or error)
+    """
+    import psi4
+    
+    start = time.time()
+    try:
+        psi4.core.clean()
+        psi4.set_memory(f"{task['memory']} MB")
+        psi4.set_num_threads(task["n_threads"])
+        if task.get("output_file"):
+            psi4.core.set_output_file(task["output_file"], True)
+        
+        charge, mult = task["charge"], task["multiplicity"]
+        settings = "units angstrom\nsymmetry c1\nno_reorient\nno_com"
+        neutral = psi4.geometry(f"{charge} {mult}\n{task['atoms']}\n{settings}")
+        psi4.set_options({"basis": task["basis"], "reference": "rks" if mult == 1 else "uks"})
+        e_neutral, wfn = psi4.energy(task["functional"], molecule=neutral, return_wfn=True)
+        homo = float(wfn.epsilon_a().np[wfn.nalpha() - 1])
+        if wfn.nbeta() > 0 and mult > 1:
+            homo = max(homo, float(wfn.epsilon_b().np[wfn.nbeta() - 1]))
+        
+        cation_mult = mult - 1 if mult > 1 else 2
+        cation = psi4.geometry(f"{charge + 1} {cation_mult}\n{task['atoms']}\n{settings}")
+        psi4.set_options({"reference": "uks"})
+        e_cation = psi4.energy(task["functional"], molecule=cation)
+        
+        shift = estimate_grac_shift(homo, float(e_cation - e_neutral))
+        return {"label": task["label"], "grac_shift": shift, "runtime": time.time() - start}
+    except Exception as e:
+        logger.warning(f"GRAC shift {task['label']} failed: {e}")
+        return {"label": task["label"], "error": str(e), "runtime": time.time() - start}
+    finally:
+        psi4.core.clean()
+
+
+# =============================================================================
+# SCAN
+# =============================================================================
+
+def monomer_grac_shifts(
+    atoms: Tuple[List[Atom], List[Atom]],
+    input_data: SAPTScanInput,
+) -> Tuple[Dict[str, float], Dict[str, str]]:
+    """
+    GRAC shifts of the monomers not given in the input.
+    
+    The monomers are rigid over the scan, so each shift is computed once
+    (both monomers in parallel) and reused at every point; shifts are also
+    cached by monomer geometry across scans.
+    """
+    given = {"A": input_data.grac_shift_a, "B": input_data.grac_shift_b}
+    spins = {"A": (input_data.charge_a, input_data.multiplicity_a),
+             "B": (input_data.charge_b, input_data.multiplicity_b)}
+    shifts = {label: value for label, value in given.items() if value is not None}
+    basis = input_data.basis.lower()
+    functional = input_data.functional.lower()
+    
+    tasks, cache_keys = [], {}
+    for label, monomer in zip(("A", "B"), atoms):
+        if label in shifts:
+            continue
+        charge, mult = spins[label]
+        cache_key = dict(
+            calculation_type=CalculationType.ENERGY, geometry=monomer, charge=charge,
+            multiplicity=mult, method=f"grac/{functional}", basis=basis,
+            reference="rks" if mult == 1 else "uks",
+        )
+        cached = get_cached_result(**cache_key, near_duplicates=True)
+        if cached is not None and "grac_shift" in cached:
+            shifts[label] = cached["grac_shift"]
+            continue
+        tasks.append({
+            "label": label, "atoms": _atom_lines(monomer),
+            "charge": charge, "multiplicity": mult, "functional": functional, "basis": basis,
+            "memory": input_data.memory, "n_threads": input_data.n_threads, "output_file": None,
+        })
+        cache_keys[label] = cache_key
+    
+    failed = {}
+    workers = share_resources(
+        tasks, input_data.max_workers, input_data.memory, input_data.n_threads, "psi4_sapt_scan_grac.out",
+    )
+    for result in run_worker_tasks(run_grac_shift, tasks, workers, "psi4_sapt_scan"):
+        label = result["label"]
+        if "error" in result:
+            failed[f"grac_{label}"] = result["error"]
+            continue
+        shifts[label] = result["grac_shift"]
+        cache_calculation_result(
+            result={"grac_shift": result["grac_shift"]},
+            computation_time=result.get("runtime", 0.0), **cache_keys[label],
+        )
+    return shifts, failed
+
+
+def run_sapt_scan(input_data: SAPTScanInput) -> SAPTScanResult:
+    """Execute a SAPT scan."""
+    start = time.time()
+    method = input_data.method.lower()
+    basis = input_data.basis.lower()
+    block_a, block_b = parse_dimer_geometry(input_data.dimer_geometry)
+    atoms_a, atoms_b = parse_monomer(block_a), parse_monomer(block_b)
+    points = scan_points(
+        atoms_a, atoms_b, input_data.distances, input_data.angles,
+        input_data.direction, input_data.rotation_axis,
+    )
+    shape = (max(len(input_data.angles or []), 1), len(points) // max(len(input_data.angles or []), 1))
+    n = len(points)
+    components = {name: np.full(n, np.nan) for name in SAPT_COMPONENTS}
+    result = SAPTScanResult(
+        method=method, basis=basis,
+        distances=np.array([p.distance for p in points]),
+        angles=np.array([p.angle for p in points]),
+        shape=shape, components=components,
+    )
+    
+    options: Dict[str, Any] = {
+        "basis": basis,
+        "freeze_core": input_data.freeze_core,
+        "scf_type": "df" if input_data.density_fitting else "pk",
+    }
+    if method == "sapt(dft)":
+        shifts, failed = monomer_grac_shifts((atoms_a, atoms_b), input_data)
+        result.failed.update(failed)
+        if failed:
+            result.wall_time = time.time() - start
+            return result
+        result.grac_shift_a, result.grac_shift_b = shifts["A"], shifts["B"]
+        options.update({
+            "sapt_dft_functional": input_data.functional.lower(),
+            "sapt_dft_grac_shift_a": shifts["A"],
+            "sapt_dft_grac_shift_b": shifts["B"],
+        })
+    logger.info(f"SAPT scan: {method}/{basis}, {n} points")
+    
+    # Look up cached points, queue the rest
+    spin = {
+        "charges": [input_data.charge_a, input_data.charge_b],
+        "multiplicities": [input_data.multiplicity_a, input_data.multiplicity_b],
+        "n_atoms_a": len(atoms_a),
+    }
+    monomer_a = _atom_lines(atoms_a)
+    tasks: List[Dict[str, Any]] = []
+    pending: Dict[str, Tuple[ScanPoint, Dict[str, Any]]] = {}
+    for point in points:
+        cache_key = dict(
+            calculation_type=CalculationType.SAPT, geometry=atoms_a + point.atoms_b,
+            charge=input_data.charge_a + input_data.charge_b, multiplicity=1,
+            method=method, basis=basis, options=dict(options, **spin),
+        )
+        cached = get_cached_result(**cache_key)
+        if cached is not None and "components" in cached:
+            for name, value in cached["components"].items():
+                components[name][point.index] = value * HARTREE_TO_KCAL
+            result.n_cached += 1
+            continue
+        
+        tasks.append({
+            "label": point.label, "method": method, "options": options,
+            "molecule": (
+                f"{input_data.charge_a} {input_data.multiplicity_a}\n{monomer_a}\n--\n"
+                f"{input_data.charge_b} {input_data.multiplicity_b}\n{_atom_lines(point.atoms_b)}\n"
+                "units angstrom\nsymmetry c1\nno_reorient\nno_com"
+            ),
+            "memory": input_data.memory, "n_threads": input_data.n_threads, "output_file": None,
+        })
+        pending[point.label] = (point, cache_key)
+    
+    workers = share_resources(
+        tasks, input_data.max_workers, input_data.memory, input_data.n_threads, "psi4_sapt_scan.out",
+    )
+    for outcome in run_worker_tasks(run_scan_point, tasks, workers, "psi4_sapt_scan"):
+        point, cache_key = pending[outcome["label"]]
+        if "error" in outcome:
+            result.failed[point.label] = outcome["error"]
+            continue
+        for name, value in outcome["components"].items():
+            components[name][point.index] = value * HARTREE_TO_KCAL
+        result.n_computed += 1
+        cache_calculation_result(
+            result={"components": outcome["components"]},
+            computation_time=outcome.get("runtime", 0.0), **cache_key,
+        )
+    
+    result.wall_time = time.time() - start
+    return result
+
+
+# =============================================================================
+# TOOL CLASS
+# =============================================================================
+
+@register_tool
+class SAPTScanTool(BaseTool[SAPTScanInput, ToolOutput]):
+    """
+    Tool for SAPT dissociation curves and orientation scans.
+    
+    Runs the scan points in parallel workers and returns each SAPT
+    component as a curve over the scan coordinate.
+    """
+    
+    name: ClassVar[str] = "calculate_sapt_scan"
+    description: ClassVar[str] = (
+        "Calculate SAPT component curves (electrostatics, exchange, induction, "
+        "dispersion) over dimer separations and/or orientations."
+    )
+    category: ClassVar[ToolCategory] = ToolCategory.INTERMOLECULAR
+    version: ClassVar[str] = "1.0.1"
+    
+    def _validate_input(self, input_data: SAPTScanInput) -> Optional[ValidationError]:
+        return validate_sapt_scan_input(input_data)
+    
+    def _execute(self, input_data: SAPTScanInput) -> Result[ToolOutput]:
+        result = run_sapt_scan(input_data)
+        c = result.components
+        
+        lines = [
+            f"SAPT Scan: {result.method.upper()}/{result.basis}",
+            "=" * 72,
+            f"{'R (A)':>8} {'Angle':>7} {'Elst':>10} {'Exch':>10} {'Ind':>10} {'Disp':>10} {'Total':>10}",
+            "-" * 72,
+        ]
+        for i in range(len(result.distances)):
+            lines.append(
+                f"{result.distances[i]:8.3f} {result.angles[i]:7.1f} "
+                f"{c['electrostatics'][i]:10.4f} {c['exchange'][i]:10.4f} {c['induction'][i]:10.4f} "
+                f"{c['dispersion'][i]:10.4f} {c['total'][i]:10.4f}"
+            )
+        lines.append("=" * 72)
+        lines.append("Energies in kcal/mol")
+        minimum = result.minimum()
+        if minimum is not None:
+            lines.append(
+                f"Minimum: {minimum['total_kcal']:.4f} kcal/mol at "
+                f"{minimum['distance_angstrom']:.3f} A, {minimum['angle_degrees']:.1f} deg"
+            )
+            if "equilibrium_distance_angstrom" in minimum:
+                lines.append(f"Equilibrium distance (parabolic): {minimum['equilibrium_distance_angstrom']:.3f} A")
+        if result.grac_shift_a is not None:
+            lines.append(f"GRAC shifts: A {result.grac_shift_a:.5f}, B {result.grac_shift_b:.5f} Eh")
+        lines.append(
+            f"Points: {result.n_computed} computed, {result.n_cached} cached, "
+            f"{len(result.failed)} failed ({result.wall_time:.1f} s)"
+        )
+        if result.failed:
+            lines.append("Failed: " + ", ".join(sorted(result.failed)))
+        
+        return Result.success(ToolOutput(
+            success=not result.failed or result.n_computed + result.n_cached > 0,
+            message="\n".join(lines),
+            data=result.to_dict(),
+        ))
+
+
+# =============================================================================
+# CONVENIENCE FUNCTION
+# =============================================================================
+
+def calculate_sapt_scan(
+    dimer_geometry: str,
+    distances: Optional[List[float]] = None,
+    angles: Optional[List[float]] = None,
+    method: str = "sapt0",
+    basis: str = "jun-cc-pvdz",
+    max_workers: int = 1,
+    **kwargs: Any,
+) -> ToolOutput:
+    """
+    Calculate SAPT component curves over a scan of dimer geometries.
+    
+    Args:
+        dimer_geometry: Reference dimer geometry with '--' separator.
+        distances: Centroid separations (Angstrom) for a dissociation curve.
+        angles: Rotations (degrees) of monomer B about its centroid.
+        method: SAPT level.
+        basis: Basis set.
+        max_workers: Worker processes for the scan points.
+        **kwargs: Additional options.
+    
+    Returns:
+        ToolOutput with the component curves.
+    """
+    tool = SAPTScanTool()
+    return tool.run({
+        "dimer_geometry": dimer_geometry,
+        "distances": distances,
+        "angles": angles,
+        "method": method,
+        "basis": basis,
+        "max_workers": max_workers,
+        **kwargs,
+    })
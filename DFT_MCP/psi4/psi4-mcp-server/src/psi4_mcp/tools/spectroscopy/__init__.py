@@ -36,8 +36,10 @@ from psi4_mcp.tools.spectroscopy.ord import (
 from psi4_mcp.tools.spectroscopy.nmr import (
     NMRShieldingTool,
     NMRCouplingTool,
+    NMREnsembleTool,
     calculate_nmr_shielding,
     calculate_nmr_coupling,
+    calculate_nmr_ensemble,
     simulate_nmr_spectrum,
 )
 
@@ -67,8 +69,10 @@ __all__ = [
     # NMR
     "NMRShieldingTool",
     "NMRCouplingTool",
+    "NMREnsembleTool",
     "calculate_nmr_shielding",
     "calculate_nmr_coupling",
+    "calculate_nmr_ensemble",
     "simulate_nmr_spectrum",
     # EPR
     "GTensorTool",
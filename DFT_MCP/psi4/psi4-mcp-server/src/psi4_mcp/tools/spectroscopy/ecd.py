@@ -13,6 +13,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.excited_states.store import get_excited_states
 
 logger = logging.getLogger(__name__)
 
@@ -52,7 +53,7 @@ class ECDTool(BaseTool[ECDToolInput, ToolOutput]):
         "Returns excitation energies, rotatory strengths, and simulated spectrum."
     )
     category: ClassVar[ToolCategory] = ToolCategory.SPECTROSCOPY
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -70,56 +71,22 @@ class ECDTool(BaseTool[ECDToolInput, ToolOutput]):
     def _execute(self, input_data: ECDToolInput) -> Result[ToolOutput]:
         """Execute ECD calculation."""
         try:
-            import psi4
             import numpy as np
             
-            # Configure Psi4
-            psi4.core.clean()
-            psi4.set_memory(f"{input_data.memory} MB")
-            psi4.set_num_threads(input_data.n_threads)
-            
-            # Build molecule
-            mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-            molecule = psi4.geometry(mol_string)
-            
-            # Set options
-            psi4.set_options({
-                "basis": input_data.basis,
-                "roots_per_irrep": [input_data.n_states],
-                "tda": input_data.use_tda,
-            })
-            
-            # Run TD-DFT (ECD requires rotatory strengths)
-            method_str = f"td-{input_data.method}/{input_data.basis}"
-            energy, wfn = psi4.energy(method_str, return_wfn=True, molecule=molecule)
-            
-            # Extract excitations with rotatory strengths
+            # Excitations from the shared excited-state store
+            record = get_excited_states(
+                input_data.geometry,
+                method=input_data.method,
+                basis=input_data.basis,
+                charge=input_data.charge,
+                multiplicity=input_data.multiplicity,
+                n_states=input_data.n_states,
+                tda=input_data.use_tda,
+                memory=input_data.memory,
+                n_threads=input_data.n_threads,
+            )
+            excitations = record.excitations(input_data.n_states)
             HARTREE_TO_NM = 45.56335 * 27.2114
-            excitations = []
-            
-            for i in range(input_data.n_states):
-                try:
-                    exc_energy = psi4.variable(f"TD-{input_data.method.upper()} ROOT 0 -> ROOT {i+1} EXCITATION ENERGY")
-                    osc_str = psi4.variable(f"TD-{input_data.method.upper()} ROOT 0 -> ROOT {i+1} OSCILLATOR STRENGTH (LEN)")
-                    
-                    # Try to get rotatory strength (may not be available in all Psi4 versions)
-                    try:
-                        rot_str = psi4.variable(f"TD-{input_data.method.upper()} ROOT 0 -> ROOT {i+1} ROTATORY STRENGTH (LEN)")
-                    except Exception:
-                        rot_str = 0.0
-                    
-                    exc_ev = float(exc_energy) * 27.2114
-                    wavelength = HARTREE_TO_NM / float(exc_energy) if exc_energy > 0 else 0
-                    
-                    excitations.append({
-                        "state": i + 1,
-                        "energy_ev": exc_ev,
-                        "wavelength_nm": wavelength,
-                        "oscillator_strength": float(osc_str),
-                        "rotatory_strength": float(rot_str),
-                    })
-                except Exception:
-                    break
             
             # Generate ECD spectrum
             wavelengths = np.linspace(
@@ -154,6 +121,7 @@ class ECDTool(BaseTool[ECDToolInput, ToolOutput]):
                     "wavelength_nm": wavelengths.tolist(),
                     "delta_epsilon": ecd_spectrum.tolist(),  # Δε (L mol^-1 cm^-1)
                 },
+                "excited_state_store": record.summary(),
                 "absorption_spectrum": {
                     "wavelength_nm": wavelengths.tolist(),
                     "epsilon": abs_spectrum.tolist(),
@@ -166,8 +134,6 @@ class ECDTool(BaseTool[ECDToolInput, ToolOutput]):
             
             message = f"ECD spectrum: {len(excitations)} excitations"
             
-            psi4.core.clean()
-            
             return Result.success(ToolOutput(
                 success=True,
                 message=message,
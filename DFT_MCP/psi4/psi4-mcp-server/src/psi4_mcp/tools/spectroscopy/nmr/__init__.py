@@ -5,6 +5,7 @@ MCP tools for Nuclear Magnetic Resonance calculations:
     - Chemical shielding tensors
     - Spin-spin coupling constants (J-coupling)
     - NMR spectrum simulation
+    - Boltzmann-averaged shifts and spectra of conformer ensembles
 """
 
 from psi4_mcp.tools.spectroscopy.nmr.shielding import (
@@ -22,12 +23,19 @@ from psi4_mcp.tools.spectroscopy.nmr.spectra import (
     simulate_nmr_spectrum,
 )
 
+from psi4_mcp.tools.spectroscopy.nmr.ensemble import (
+    NMREnsembleTool,
+    calculate_nmr_ensemble,
+)
+
 
 __all__ = [
     "NMRShieldingTool",
     "NMRCouplingTool",
     "NMRSpectrumTool",
+    "NMREnsembleTool",
     "calculate_nmr_shielding",
     "calculate_nmr_coupling",
     "simulate_nmr_spectrum",
+    "calculate_nmr_ensemble",
 ]
@@ -13,9 +13,15 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.spectroscopy.nmr.pairs import bond_graph, bond_paths, coupling_pairs
 
 logger = logging.getLogger(__name__)
 
+BOHR_TO_ANGSTROM = 0.529177
+
+# Bond-path depth used to fill n_bonds when max_bonds is not given
+NBOND_SEARCH_DEPTH = 4
+
 
 class NMRCouplingToolInput(ToolInput):
     """Input schema for NMR coupling calculation."""
@@ -33,6 +39,10 @@ class NMRCouplingToolInput(ToolInput):
         default=None,
         description="Maximum distance for coupling pairs (Angstrom)"
     )
+    max_bonds: Optional[int] = Field(
+        default=None,
+        description="Maximum number of bonds between coupled atoms (e.g. 3 for up to 3J)"
+    )
     memory: int = Field(default=4000, description="Memory in MB")
     n_threads: int = Field(default=1, description="Number of threads")
 
@@ -45,6 +55,9 @@ class NMRCouplingTool(BaseTool[NMRCouplingToolInput, ToolOutput]):
     Computes J-coupling constants including Fermi contact, spin-dipolar,
     and paramagnetic spin-orbit contributions.
     
+    Pairs are selected through a bond-path or spatial neighbour index
+    rather than by comparing every pair.
+    
     Note: J-coupling calculations are computationally intensive.
     Use specialized J-optimized basis sets for best accuracy.
     """
@@ -55,7 +68,7 @@ class NMRCouplingTool(BaseTool[NMRCouplingToolInput, ToolOutput]):
         "Returns scalar couplings between specified atom pairs."
     )
     category: ClassVar[ToolCategory] = ToolCategory.SPECTROSCOPY
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.1"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -69,6 +82,8 @@ class NMRCouplingTool(BaseTool[NMRCouplingToolInput, ToolOutput]):
                     "type": "array",
                     "items": {"type": "array", "items": {"type": "integer"}},
                 },
+                "max_distance": {"type": "number"},
+                "max_bonds": {"type": "integer"},
             },
             "required": ["geometry"],
         }
@@ -89,23 +104,28 @@ class NMRCouplingTool(BaseTool[NMRCouplingToolInput, ToolOutput]):
             molecule = psi4.geometry(mol_string)
             n_atoms = molecule.natom()
             
-            # Determine atom pairs
+            # Determine atom pairs from the neighbour index
+            elements = [molecule.symbol(i).capitalize() for i in range(n_atoms)]
+            coordinates = np.asarray(molecule.geometry().np) * BOHR_TO_ANGSTROM
+            path_bonds = input_data.max_bonds or NBOND_SEARCH_DEPTH
             if input_data.atom_pairs:
-                pairs = input_data.atom_pairs
-            else:
-                # Generate all pairs (or filter by distance)
+                paths = bond_paths(bond_graph(elements, coordinates), path_bonds)
                 pairs = []
-                for i in range(n_atoms):
-                    for j in range(i + 1, n_atoms):
-                        if input_data.max_distance:
-                            # Calculate distance
-                            xyz_i = np.array([molecule.x(i), molecule.y(i), molecule.z(i)])
-                            xyz_j = np.array([molecule.x(j), molecule.y(j), molecule.z(j)])
-                            dist = np.linalg.norm(xyz_i - xyz_j) * 0.529177  # Bohr to Angstrom
-                            if dist <= input_data.max_distance:
-                                pairs.append((i, j))
-                        else:
-                            pairs.append((i, j))
+                for i, j in input_data.atom_pairs:
+                    path = paths.get((min(i, j), max(i, j)))
+                    pairs.append({
+                        "i": i,
+                        "j": j,
+                        "distance": float(np.linalg.norm(coordinates[i] - coordinates[j])),
+                        "n_bonds": len(path) - 1 if path is not None else None,
+                    })
+            else:
+                pairs = coupling_pairs(
+                    elements, coordinates,
+                    max_bonds=input_data.max_bonds,
+                    max_distance=input_data.max_distance,
+                    path_depth=path_bonds,
+                )
             
             # Set options
             psi4.set_options({
@@ -120,14 +140,8 @@ class NMRCouplingTool(BaseTool[NMRCouplingToolInput, ToolOutput]):
             # This is a simplified interface
             
             couplings = []
-            for i, j in pairs:
-                element_i = molecule.symbol(i)
-                element_j = molecule.symbol(j)
-                
-                # Get distance
-                xyz_i = np.array([molecule.x(i), molecule.y(i), molecule.z(i)])
-                xyz_j = np.array([molecule.x(j), molecule.y(j), molecule.z(j)])
-                dist = np.linalg.norm(xyz_i - xyz_j) * 0.529177
+            for pair in pairs:
+                i, j = pair["i"], pair["j"]
                 
                 # Try to get coupling from Psi4 variables
                 try:
@@ -138,12 +152,12 @@ class NMRCouplingTool(BaseTool[NMRCouplingToolInput, ToolOutput]):
                 
                 couplings.append({
                     "atom_i": i,
-                    "element_i": element_i,
+                    "element_i": elements[i],
                     "atom_j": j,
-                    "element_j": element_j,
-                    "distance_angstrom": round(dist, 3),
+                    "element_j": elements[j],
+                    "distance_angstrom": round(pair["distance"], 3),
                     "j_coupling_hz": float(j_coupling) if j_coupling else None,
-                    "n_bonds": None,  # Would require connectivity analysis
+                    "n_bonds": pair["n_bonds"],
                 })
             
             # Build output
@@ -0,0 +1,754 @@
+"""
+NMR Conformer Ensemble Tool.
+
+Computes NMR chemical shifts and spectra of a flexible molecule as
+Boltzmann averages over a set of conformers (same atoms, same order).
+
+Key Features:
+    - Conformer shieldings run in parallel workers, cached by content
+    - Linear scaling references, delta = (sigma - intercept) / slope,
+      defaulting to slope -1 with the reference shieldings
+    - Boltzmann weights from given relative energies or the SCF energies
+    - Coupling pairs from a bond-path or spatial neighbour index; 3J(H,H)
+      from the Karplus relation per conformer where Psi4 gives no coupling
+    - Averaged shifts, first-order multiplets and the Lorentzian spectrum
+      evaluated as arrays over conformers, atoms and lines
+"""
+
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+import logging
+import time
+
+import numpy as np
+from pydantic import Field
+
+from psi4_mcp.tools.core.base_tool import (
+    BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
+)
+from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.tools.spectroscopy.nmr.pairs import coupling_pairs
+from psi4_mcp.tools.spectroscopy.nmr.shielding import REFERENCE_SHIELDINGS
+from psi4_mcp.utils.caching.results import (
+    CalculationType, cache_calculation_result, get_cached_result,
+)
+from psi4_mcp.utils.parallel.workers import run_worker_tasks, share_resources
+
+
+logger = logging.getLogger(__name__)
+HARTREE_TO_KCAL = 627.5094740631
+BOLTZMANN_KCAL = 0.0019872041  # kcal/(mol K)
+
+NUCLEUS_ELEMENTS = {"1H": "H", "13C": "C", "15N": "N", "19F": "F", "31P": "P"}
+
+# Default linear scaling (slope, intercept): delta = reference - sigma
+DEFAULT_SCALING = {
+    NUCLEUS_ELEMENTS[isotope]: (-1.0, next(v for v in refs.values() if isinstance(v, float)))
+    for isotope, refs in REFERENCE_SHIELDINGS.items()
+}
+
+COUPLING_MODES = ("bonds", "distance", "none")
+
+# Karplus coefficients (Hz) for vicinal H-H: A cos^2(phi) + B cos(phi) + C
+KARPLUS_COEFFICIENTS = (7.76, -1.10, 1.40)
+
+# Couplings (Hz) below this do not split a peak
+MIN_SPLITTING_HZ = 0.1
+
+# Lines per block of the vectorized spectrum sum
+SPECTRUM_BLOCK_LINES = 512
+
+Atom = Tuple[str, float, float, float]
+
+
+# =============================================================================
+# DATA CLASSES
+# =============================================================================
+
+@dataclass
+class NMREnsembleResult:
+    """Boltzmann-averaged NMR data of a conformer ensemble."""
+    method: str
+    basis: str
+    nucleus: str
+    temperature: float
+    elements: List[str]
+    # Per conformer
+    energies_kcal: np.ndarray
+    weights: np.ndarray
+    shieldings: np.ndarray  # (n_conformers, n_atoms), NaN where missing
+    shifts: np.ndarray  # (n_conformers, n_atoms), NaN without scaling
+    # Averaged
+    average_shieldings: np.ndarray
+    average_shifts: np.ndarray
+    couplings: List[Dict[str, Any]] = field(default_factory=list)
+    peaks: List[Dict[str, Any]] = field(default_factory=list)
+    ppm: Optional[np.ndarray] = None
+    spectrum: Optional[np.ndarray] = None
+    n_computed: int = 0
+    n_cached: int = 0
+    failed: Dict[str, str] = field(default_factory=dict)
+    wall_time: float = 0.0
+    
+    def to_dict(self) -> Dict[str, Any]:
+        def values(array: np.ndarray) -> List[Any]:
+            return [None if np.isnan(v) else float(v) for v in np.asarray(array, dtype=float).ravel()]
+        
+        return {
+            "method": self.method,
+            "basis": self.basis,
+            "nucleus": self.nucleus,
+            "temperature": self.temperature,
+            "n_conformers": len(self.weights),
+            "elements": self.elements,
+            "relative_energies_kcal": values(self.energies_kcal),
+            "boltzmann_weights": values(self.weights),
+            "conformer_shieldings_ppm": [values(row) for row in self.shieldings],
+            "conformer_shifts_ppm": [values(row) for row in self.shifts],
+            "average_shieldings_ppm": values(self.average_shieldings),
+            "average_shifts_ppm": values(self.average_shifts),
+            "couplings": self.couplings,
+            "peaks": self.peaks,
+            "spectrum": {
+                "ppm": self.ppm.tolist() if self.ppm is not None else [],
+                "intensity": self.spectrum.tolist() if self.spectrum is not None else [],
+            },
+            "n_computed": self.n_computed,
+            "n_cached": self.n_cached,
+            "failed": self.failed,
+            "wall_time": self.wall_time,
+            "units": {
+                "shielding": "ppm",
+                "chemical_shift": "ppm",
+                "energy": "kcal/mol",
+                "j_coupling": "Hz",
+                "intensity": "arbitrary (normalized)",
+            },
+        }
+
+
+# =============================================================================
+# INPUT SCHEMA
+# =============================================================================
+
+class NMREnsembleInput(ToolInput):
+    """Input schema for a conformer-ensemble NMR calculation."""
+    
+    conformers: List[str] = Field(
+        ...,
+        description="Conformer geometries (Angstrom, 'symbol x y z' lines, same atom order)",
+    )
+    energies: Optional[List[float]] = Field(
+        default=None,
+        description="Relative conformer energies (kcal/mol); None = SCF energies",
+    )
+    temperature: float = Field(default=298.15, description="Temperature (K) for Boltzmann weights")
+    
+    method: str = Field(default="b3lyp", description="DFT functional")
+    basis: str = Field(default="cc-pvtz", description="Basis set")
+    charge: int = Field(default=0, description="Molecular charge")
+    multiplicity: int = Field(default=1, description="Spin multiplicity")
+    
+    scaling: Optional[Dict[str, List[float]]] = Field(
+        default=None,
+        description="Linear scaling [slope, intercept] per element, delta = (sigma - intercept) / slope",
+    )
+    equivalent_atoms: Optional[List[List[int]]] = Field(
+        default=None,
+        description="Groups of chemically equivalent atoms (0-indexed), e.g. methyl protons",
+    )
+    
+    nucleus: str = Field(default="1H", description="Nucleus of the spectrum (1H, 13C, etc.)")
+    coupling_mode: str = Field(
+        default="bonds",
+        description=f"Coupling pair selection: {', '.join(COUPLING_MODES)}",
+    )
+    max_bonds: int = Field(default=3, description="Maximum bonds between coupled nuclei")
+    max_distance: float = Field(default=3.0, description="Maximum distance (Angstrom) in distance mode")
+    
+    field_strength_mhz: float = Field(default=400.0, description="Spectrometer frequency (MHz)")
+    linewidth_hz: float = Field(default=1.0, description="Linewidth for broadening (Hz)")
+    ppm_range: Tuple[float, float] = Field(default=(-1.0, 12.0), description="Chemical shift range (ppm)")
+    n_points: int = Field(default=8192, description="Number of spectrum points")
+    
+    max_workers: int = Field(
+        default=1,
+        description="Worker processes for the conformers (1 = serial)",
+    )
+    memory: int = Field(default=2000, description="Memory limit in MB (shared by the workers)")
+    n_threads: int = Field(default=1, description="Threads (shared by the workers)")
+
+
+# =============================================================================
+# GEOMETRY
+# =============================================================================
+
+def parse_conformer(block: str) -> List[Atom]:
+    """Atoms of a conformer block of 'symbol x y z' lines."""
+    atoms = []
+    for line in block.strip().splitlines():
+        tokens = line.split()
+        if not tokens:
+            continue
+        if len(tokens) != 4:
+            raise ValueError(f"Expected 'symbol x y z', got '{line.strip()}'")
+        atoms.append((tokens[0].capitalize(), float(tokens[1]), float(tokens[2]), float(tokens[3])))
+    if not atoms:
+        raise ValueError("Conformer has no atoms")
+    return atoms
+
+
+def _atom_lines(atoms: List[Atom]) -> str:
+    return "\n".join(f"{a[0]} {a[1]:.10f} {a[2]:.10f} {a[3]:.10f}" for a in atoms)
+
+
+def nucleus_element(nucleus: str) -> str:
+    """Element symbol of a nucleus label ('1H' -> 'H')."""
+    return NUCLEUS_ELEMENTS.get(nucleus, nucleus.lstrip("0123456789").capitalize())
+
+
+def dihedral_angles(coordinates: np.ndarray, quads: np.ndarray) -> np.ndarray:
+    """
+    Dihedral angles (radians) of atom quadruples in every conformer.
+    
+    Args:
+        coordinates: (n_conformers, n_atoms, 3)
+        quads: (n_quads, 4) atom indices
+    
+    Returns:
+        (n_conformers, n_quads) angles
+    """
+    p = coordinates[:, quads]
+    b0 = p[:, :, 0] - p[:, :, 1]
+    b1 = p[:, :, 2] - p[:, :, 1]
+    b2 = p[:, :, 3] - p[:, :, 2]
+    b1 = b1 / np.linalg.norm(b1, axis=-1, keepdims=True)
+    v = b0 - (b0 * b1).sum(axis=-1, keepdims=True) * b1
+    w = b2 - (b2 * b1).sum(axis=-1, keepdims=True) * b1
+    x = (v * w).sum(axis=-1)
+    y = (np.cross(b1, v) * w).sum(axis=-1)
+    return np.arctan2(y, x)
+
+
+def karplus(phi: np.ndarray) -> np.ndarray:
+    """Vicinal H-H coupling (Hz) from the dihedral angle (radians)."""
+    a, b, c = KARPLUS_COEFFICIENTS
+    cos_phi = np.cos(phi)
+    return a * cos_phi ** 2 + b * cos_phi + c
+
+
+# =============================================================================
+# AVERAGING AND SPECTRUM
+# =============================================================================
+
+def boltzmann_weights(energies_kcal: np.ndarray, temperature: float) -> np.ndarray:
+    """Normalized Boltzmann weights; conformers with NaN energy get weight 0."""
+    energies = np.asarray(energies_kcal, dtype=float)
+    valid = ~np.isnan(energies)
+    weights = np.zeros(len(energies))
+    if valid.any():
+        exponent = -(energies[valid] - energies[valid].min()) / (BOLTZMANN_KCAL * temperature)
+        weights[valid] = np.exp(exponent)
+        weights /= weights.sum()
+    return weights
+
+
+def weighted_average(values: np.ndarray, weights: np.ndarray) -> np.ndarray:
+    """Average over the first axis, renormalizing the weights where values are NaN."""
+    defined = ~np.isnan(values)
+    w = np.where(defined, weights.reshape(-1, *([1] * (values.ndim - 1))), 0.0)
+    total = w.sum(axis=0)
+    summed = (np.where(defined, values, 0.0) * w).sum(axis=0)
+    return np.divide(summed, total, out=np.full(total.shape, np.nan), where=total > 0)
+
+
+def scale_shieldings(shieldings: np.ndarray, elements: List[str], scaling: Dict[str, Tuple[float, float]]) -> np.ndarray:
+    """Chemical shifts from shieldings by per-element linear scaling."""
+    slope = np.array([scaling.get(e, (np.nan, np.nan))[0] for e in elements])
+    intercept = np.array([scaling.get(e, (np.nan, np.nan))[1] for e in elements])
+    return (shieldings - intercept) / slope
+
+
+def multiplet_lines(couplings_hz: np.ndarray, multiplicities: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    First-order multiplet: offsets (Hz) and intensities of the lines of a
+    peak split by groups of equivalent spin-1/2 nuclei.
+    
+    Each nucleus doubles the lines; coincident lines are merged, which
+    yields the binomial patterns of equivalent groups.
+    """
+    offsets = np.zeros(1)
+    intensities = np.ones(1)
+    for j, n in zip(couplings_hz.tolist(), multiplicities.tolist()):
+        for _ in range(int(n)):
+            offsets = (offsets[:, None] + np.array([-0.5 * j, 0.5 * j])).ravel()
+            intensities = np.repeat(0.5 * intensities, 2)
+            keys, inverse = np.unique(np.round(offsets, 6), return_inverse=True)
+            intensities = np.bincount(inverse.ravel(), weights=intensities)
+            offsets = keys
+    return offsets, intensities
+
+
+def lorentzian_spectrum(
+    ppm: np.ndarray,
+    positions: np.ndarray,
+    intensities: np.ndarray,
+    gamma: float,
+) -> np.ndarray:
+    """Sum of Lorentzians evaluated in blocks of lines."""
+    spectrum = np.zeros_like(ppm)
+    for start in range(0, len(positions), SPECTRUM_BLOCK_LINES):
+        x0 = positions[start:start + SPECTRUM_BLOCK_LINES, None]
+        height = intensities[start:start + SPECTRUM_BLOCK_LINES, None]
+        spectrum += (height * gamma ** 2 / ((ppm[None, :] - x0) ** 2 + gamma ** 2)).sum(axis=0)
+    return spectrum
+
+
+def equivalence_groups(n_atoms: int, atoms: List[int], equivalent: Optional[List[List[int]]]) -> List[List[int]]:
+    """Groups of the given atoms: the equivalent sets, then the remaining atoms alone."""
+    members = set(atoms)
+    groups, seen = [], set()
+    for group in equivalent or []:
+        group = sorted(set(group) & members)
+        if group:
+            groups.append(group)
+            seen.update(group)
+    groups.extend([i] for i in atoms if i not in seen)
+    return groups
+
+
+# =============================================================================
+# VALIDATION
+# =============================================================================
+
+def validate_nmr_ensemble_input(input_data: NMREnsembleInput) -> Optional[ValidationError]:
+    """Validate NMR ensemble input."""
+    if not input_data.conformers:
+        return ValidationError(field="conformers", message="At least one conformer is required")
+    
+    try:
+        conformers = [parse_conformer(block) for block in input_data.conformers]
+    except ValueError as e:
+        return ValidationError(field="conformers", message=str(e))
+    
+    elements = [a[0] for a in conformers[0]]
+    for index, atoms in enumerate(conformers[1:], start=1):
+        if [a[0] for a in atoms] != elements:
+            return ValidationError(
+                field="conformers",
+                message=f"Conformer {index} does not have the atoms of conformer 0 in the same order",
+            )
+    
+    if input_data.energies is not None and len(input_data.energies) != len(conformers):
+        return ValidationError(field="energies", message="Give one energy per conformer")
+    
+    if input_data.temperature <= 0:
+        return ValidationError(field="temperature", message="Temperature must be positive")
+    
+    for element, values in (input_data.scaling or {}).items():
+        if len(values) != 2 or abs(values[0]) < 1e-12:
+            return ValidationError(
+                field="scaling",
+                message=f"Scaling for {element} must be [slope, intercept] with non-zero slope",
+            )
+    
+    for group in input_data.equivalent_atoms or []:
+        if any(i < 0 or i >= len(elements) for i in group):
+            return ValidationError(field="equivalent_atoms", message=f"Atom index out of range in {group}")
+    
+    if input_data.coupling_mode not in COUPLING_MODES:
+        return ValidationError(field="coupling_mode", message=f"coupling_mode must be one of {', '.join(COUPLING_MODES)}")
+    
+    if input_data.max_bonds < 1 or input_data.max_distance <= 0:
+        return ValidationError(field="max_bonds", message="max_bonds and max_distance must be positive")
+    
+    if input_data.ppm_range[0] >= input_data.ppm_range[1] or input_data.n_points < 2:
+        return ValidationError(field="ppm_range", message="ppm_range must be increasing with n_points > 1")
+    
+    if input_data.field_strength_mhz <= 0 or input_data.linewidth_hz <= 0:
+        return ValidationError(field="linewidth_hz", message="Field strength and linewidth must be positive")
+    
+    if input_data.max_workers < 1:
+        return ValidationError(field="max_workers", message="max_workers must be at least 1")
+    
+    return None
+
+
+# =============================================================================
+# WORKERS
+# =============================================================================
+
+def run_conformer_shielding(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Isotropic shieldings of one conformer.
+    
+    Returns:
+        Dict with label, energy (Hartree), shieldings (ppm, None where
+        missing), couplings (Hz, keyed "i-j" 0-indexed, when Psi4 reports
+        them), runtime (or error)
+    """
+    import psi4
+    
+    start = time.time()
+    try:
+        psi4.core.clean()
+        psi4.set_memory(f"{task['memory']} MB")
+        psi4.set_num_threads(task["n_threads"])
+        if task.get("output_file"):
+            psi4.core.set_output_file(task["output_file"], True)
+        
+        molecule = psi4.geometry(task["molecule"])
+        psi4.set_options({"basis": task["basis"]})
+        energy, wfn = psi4.energy(task["method"], return_wfn=True, molecule=molecule)
+        psi4.oeprop(wfn, "NMR")
+        
+        shieldings = []
+        for i in range(molecule.natom()):
+            variable = f"NMR SHIELDING {i+1}"
+            shieldings.append(float(psi4.variable(variable)) if psi4.core.has_variable(variable) else None)
+        
+        couplings = {}
+        for name, value in psi4.core.variables().items():
+            if name.upper().startswith("J COUPLING "):
+                i, j = (int(k) - 1 for k in name.split()[-1].split("-"))
+                couplings[f"{min(i, j)}-{max(i, j)}"] = float(value)
+        
+        return {
+            "label": task["label"], "energy": float(energy), "shieldings": shieldings,
+            "couplings": couplings, "runtime": time.time() - start,
+        }
+    except Exception as e:
+        logger.warning(f"NMR conformer {task['label']} failed: {e}")
+        return {"label": task["label"], "error": str(e), "runtime": time.time() - start}
+    finally:
+        psi4.core.clean()
+
+
+# =============================================================================
+# ENSEMBLE
+# =============================================================================
+
+def ensemble_couplings(
+    elements: List[str],
+    coordinates: np.ndarray,
+    computed: List[Dict[str, float]],
+    weights: np.ndarray,
+    input_data: NMREnsembleInput,
+) -> List[Dict[str, Any]]:
+    """
+    Boltzmann-averaged homonuclear couplings of the spectrum nucleus.
+    
+    Pairs come from the bond graph of the first conformer (the topology is
+    shared) or, in distance mode, from the spatial index of every
+    conformer. Per conformer, a coupling reported by Psi4 is used; else
+    3J(H,H) follows from the Karplus relation.
+    """
+    if input_data.coupling_mode == "none":
+        return []
+    target = nucleus_element(input_data.nucleus)
+    
+    if input_data.coupling_mode == "bonds":
+        pairs = coupling_pairs(
+            elements, coordinates[0], max_bonds=input_data.max_bonds, elements_filter=[target],
+        )
+    else:
+        found: Dict[Tuple[int, int], Dict[str, Any]] = {}
+        for conformer in coordinates:
+            for pair in coupling_pairs(
+                elements, conformer, max_distance=input_data.max_distance,
+                elements_filter=[target], path_depth=input_data.max_bonds,
+            ):
+                found.setdefault((pair["i"], pair["j"]), pair)
+        pairs = [found[key] for key in sorted(found)]
+    if not pairs:
+        return []
+    
+    n_conformers = len(coordinates)
+    values = np.full((n_conformers, len(pairs)), np.nan)
+    for c, couplings in enumerate(computed):
+        for p, pair in enumerate(pairs):
+            values[c, p] = couplings.get(f"{pair['i']}-{pair['j']}", np.nan)
+    from_psi4 = ~np.isnan(values)
+    
+    vicinal = [p for p, pair in enumerate(pairs) if pair["n_bonds"] == 3 and target == "H"]
+    if vicinal:
+        quads = np.array([pairs[p]["path"] for p in vicinal])
+        estimate = karplus(dihedral_angles(coordinates, quads))
+        values[:, vicinal] = np.where(np.isnan(values[:, vicinal]), estimate, values[:, vicinal])
+    
+    average = weighted_average(values, weights)
+    distances = np.linalg.norm(
+        coordinates[:, [p["i"] for p in pairs]] - coordinates[:, [p["j"] for p in pairs]], axis=-1
+    )
+    mean_distance = weights @ distances
+    
+    result = []
+    for p, pair in enumerate(pairs):
+        if np.isnan(average[p]):
+            source = None
+        elif from_psi4[:, p].all():
+            source = "psi4"
+        elif from_psi4[:, p].any():
+            source = "psi4+karplus"
+        else:
+            source = "karplus"
+        result.append({
+            "atom_i": pair["i"],
+            "atom_j": pair["j"],
+            "n_bonds": pair["n_bonds"],
+            "distance_angstrom": round(float(mean_distance[p]), 3),
+            "j_coupling_hz": None if np.isnan(average[p]) else float(average[p]),
+            "source": source,
+        })
+    return result
+
+
+def ensemble_spectrum(
+    result: NMREnsembleResult,
+    input_data: NMREnsembleInput,
+) -> None:
+    """First-order peaks and the Lorentzian spectrum of the averaged shifts."""
+    target = nucleus_element(input_data.nucleus)
+    atoms = [i for i, e in enumerate(result.elements) if e == target and not np.isnan(result.average_shifts[i])]
+    groups = equivalence_groups(len(result.elements), atoms, input_data.equivalent_atoms)
+    if not groups:
+        return
+    
+    group_of = np.full(len(result.elements), -1)
+    for g, group in enumerate(groups):
+        group_of[group] = g
+    
+    # Mean coupling between groups over their member pairs
+    n_groups = len(groups)
+    j_sum = np.zeros((n_groups, n_groups))
+    j_count = np.zeros((n_groups, n_groups))
+    for coupling in result.couplings:
+        gi, gj = group_of[coupling["atom_i"]], group_of[coupling["atom_j"]]
+        if coupling["j_coupling_hz"] is None or gi < 0 or gj < 0 or gi == gj:
+            continue
+        j_sum[gi, gj] += coupling["j_coupling_hz"]
+        j_sum[gj, gi] += coupling["j_coupling_hz"]
+        j_count[gi, gj] += 1
+        j_count[gj, gi] += 1
+    j_group = np.divide(j_sum, j_count, out=np.zeros_like(j_sum), where=j_count > 0)
+    sizes = np.array([len(group) for group in groups])
+    
+    shifts = np.array([result.average_shifts[group].mean() for group in groups])
+    positions, heights = [], []
+    for g, group in enumerate(groups):
+        partners = np.flatnonzero(np.abs(j_group[g]) >= MIN_SPLITTING_HZ)
+        offsets, intensities = multiplet_lines(j_group[g, partners], sizes[partners])
+        positions.append(shifts[g] + offsets / input_data.field_strength_mhz)
+        heights.append(intensities * sizes[g])
+        result.peaks.append({
+            "atoms": group,
+            "chemical_shift_ppm": float(shifts[g]),
+            "intensity": float(sizes[g]),
+            "n_lines": len(offsets),
+            "couplings_hz": {
+                "+".join(map(str, groups[k])): float(j_group[g, k]) for k in partners.tolist()
+            },
+        })
+    
+    ppm = np.linspace(input_data.ppm_range[0], input_data.ppm_range[1], input_data.n_points)
+    gamma = input_data.linewidth_hz / input_data.field_strength_mhz / 2
+    spectrum = lorentzian_spectrum(ppm, np.concatenate(positions), np.concatenate(heights), gamma)
+    if spectrum.max() > 0:
+        spectrum = spectrum / spectrum.max()
+    result.ppm, result.spectrum = ppm, spectrum
+
+
+def run_nmr_ensemble(input_data: NMREnsembleInput) -> NMREnsembleResult:
+    """Execute a conformer-ensemble NMR calculation."""
+    start = time.time()
+    method = input_data.method.lower()
+    basis = input_data.basis.lower()
+    conformers = [parse_conformer(block) for block in input_data.conformers]
+    elements = [a[0] for a in conformers[0]]
+    coordinates = np.array([[a[1:4] for a in atoms] for atoms in conformers], dtype=float)
+    n_conformers, n_atoms = coordinates.shape[:2]
+    
+    shieldings = np.full((n_conformers, n_atoms), np.nan)
+    scf_energies = np.full(n_conformers, np.nan)
+    computed: List[Dict[str, float]] = [{} for _ in range(n_conformers)]
+    failed: Dict[str, str] = {}
+    n_computed = n_cached = 0
+    logger.info(f"NMR ensemble: {method}/{basis}, {n_conformers} conformers")
+    
+    def store(index: int, outcome: Dict[str, Any]) -> None:
+        shieldings[index] = [np.nan if s is None else s for s in outcome["shieldings"]]
+        scf_energies[index] = outcome["energy"]
+        computed[index] = outcome.get("couplings", {})
+    
+    # Look up cached conformers, queue the rest
+    tasks: List[Dict[str, Any]] = []
+    pending: Dict[str, Tuple[int, Dict[str, Any]]] = {}
+    for index, atoms in enumerate(conformers):
+        label = f"conformer_{index}"
+        cache_key = dict(
+            calculation_type=CalculationType.PROPERTIES, geometry=atoms, charge=input_data.charge,
+            multiplicity=input_data.multiplicity, method=f"nmr/{method}", basis=basis,
+            reference="rks" if input_data.multiplicity == 1 else "uks",
+        )
+        # Shieldings and couplings are per atom: the key includes the atom order
+        cached = get_cached_result(**cache_key, per_atom=True)
+        if cached is not None and "shieldings" in cached:
+            store(index, cached)
+            n_cached += 1
+            continue
+        tasks.append({
+            "label": label, "method": method, "basis": basis,
+            "molecule": (
+                f"{input_data.charge} {input_data.multiplicity}\n{_atom_lines(atoms)}\n"
+                "units angstrom\nsymmetry c1\nno_reorient\nno_com"
+            ),
+            "memory": input_data.memory, "n_threads": input_data.n_threads, "output_file": None,
+        })
+        pending[label] = (index, cache_key)
+    
+    workers = share_resources(
+        tasks, input_data.max_workers, input_data.memory, input_data.n_threads, "psi4_nmr_ensemble.out",
+    )
+    for outcome in run_worker_tasks(run_conformer_shielding, tasks, workers, "psi4_nmr_ensemble"):
+        index, cache_key = pending[outcome["label"]]
+        if "error" in outcome:
+            failed[outcome["label"]] = outcome["error"]
+            continue
+        store(index, outcome)
+        n_computed += 1
+        cache_calculation_result(
+            result={k: outcome[k] for k in ("energy", "shieldings", "couplings")},
+            computation_time=outcome.get("runtime", 0.0), per_atom=True, **cache_key,
+        )
+    
+    # Boltzmann weights over the conformers that succeeded
+    if input_data.energies is not None:
+        energies = np.array(input_data.energies, dtype=float)
+    else:
+        energies = scf_energies * HARTREE_TO_KCAL
+    energies = np.where(np.isnan(scf_energies), np.nan, energies)
+    if not np.isnan(energies).all():
+        energies = energies - np.nanmin(energies)
+    weights = boltzmann_weights(energies, input_data.temperature)
+    
+    scaling = dict(DEFAULT_SCALING)
+    scaling.update({e.capitalize(): (v[0], v[1]) for e, v in (input_data.scaling or {}).items()})
+    shifts = scale_shieldings(shieldings, elements, scaling)
+    average_shieldings = weighted_average(shieldings, weights)
+    average_shifts = weighted_average(shifts, weights)
+    for group in input_data.equivalent_atoms or []:
+        average_shieldings[group] = np.nanmean(average_shieldings[group]) if group else np.nan
+        average_shifts[group] = np.nanmean(average_shifts[group]) if group else np.nan
+    
+    result = NMREnsembleResult(
+        method=method, basis=basis, nucleus=input_data.nucleus, temperature=input_data.temperature,
+        elements=elements, energies_kcal=energies, weights=weights,
+        shieldings=shieldings, shifts=shifts,
+        average_shieldings=average_shieldings, average_shifts=average_shifts,
+        n_computed=n_computed, n_cached=n_cached, failed=failed,
+    )
+    if weights.sum() > 0:
+        result.couplings = ensemble_couplings(elements, coordinates, computed, weights, input_data)
+        ensemble_spectrum(result, input_data)
+    result.wall_time = time.time() - start
+    return result
+
+
+# =============================================================================
+# TOOL CLASS
+# =============================================================================
+
+@register_tool
+class NMREnsembleTool(BaseTool[NMREnsembleInput, ToolOutput]):
+    """
+    Tool for Boltzmann-averaged NMR shifts and spectra of conformer ensembles.
+    
+    Runs the conformer shieldings in parallel workers, applies linear
+    scaling, averages over the Boltzmann populations and simulates the
+    first-order spectrum of the chosen nucleus.
+    """
+    
+    name: ClassVar[str] = "calculate_nmr_ensemble"
+    description: ClassVar[str] = (
+        "Calculate Boltzmann-averaged NMR chemical shifts, couplings and a simulated "
+        "spectrum over a set of conformers."
+    )
+    category: ClassVar[ToolCategory] = ToolCategory.SPECTROSCOPY
+    version: ClassVar[str] = "1.0.1"
+    
+    def _validate_input(self, input_data: NMREnsembleInput) -> Optional[ValidationError]:
+        return validate_nmr_ensemble_input(input_data)
+    
+    def _execute(self, input_data: NMREnsembleInput) -> Result[ToolOutput]:
+        result = run_nmr_ensemble(input_data)
+        
+        lines = [
+            f"NMR Ensemble: {result.method.upper()}/{result.basis}, {len(result.weights)} conformers "
+            f"at {result.temperature:.2f} K",
+            "=" * 60,
+            f"{'Conformer':>10} {'Rel. E (kcal/mol)':>18} {'Weight':>10}",
+            "-" * 60,
+        ]
+        for c, (energy, weight) in enumerate(zip(result.energies_kcal, result.weights)):
+            energy_text = "failed" if np.isnan(energy) else f"{energy:.3f}"
+            lines.append(f"{c:>10} {energy_text:>18} {weight:10.4f}")
+        lines.append("-" * 60)
+        lines.append(f"{result.nucleus} peaks (ppm):")
+        for peak in result.peaks:
+            atoms = ",".join(map(str, peak["atoms"]))
+            lines.append(
+                f"  {peak['chemical_shift_ppm']:8.3f}  {peak['intensity']:.0f}{result.nucleus[-1]} "
+                f"({peak['n_lines']} lines)  atoms {atoms}"
+            )
+        lines.append(
+            f"Conformers: {result.n_computed} computed, {result.n_cached} cached, "
+            f"{len(result.failed)} failed ({result.wall_time:.1f} s)"
+        )
+        if result.failed:
+            lines.append("Failed: " + ", ".join(sorted(result.failed)))
+        
+        return Result.success(ToolOutput(
+            success=result.n_computed + result.n_cached > 0,
+            message="\n".join(lines),
+            data=result.to_dict(),
+        ))
+
+
+# =============================================================================
+# CONVENIENCE FUNCTION
+# =============================================================================
+
+def calculate_nmr_ensemble(
+    conformers: List[str],
+    energies: Optional[List[float]] = None,
+    nucleus: str = "1H",
+    method: str = "b3lyp",
+    basis: str = "cc-pvtz",
+    max_workers: int = 1,
+    **kwargs: Any,
+) -> ToolOutput:
+    """
+    Calculate Boltzmann-averaged NMR shifts and spectrum of a conformer set.
+    
+    Args:
+        conformers: Conformer geometries (same atom order).
+        energies: Relative conformer energies (kcal/mol); None = SCF energies.
+        nucleus: Nucleus of the spectrum.
+        method: DFT functional.
+        basis: Basis set.
+        max_workers: Worker processes for the conformers.
+        **kwargs: Additional options.
+    
+    Returns:
+        ToolOutput with averaged shifts, couplings and spectrum.
+    """
+    tool = NMREnsembleTool()
+    return tool.run({
+        "conformers": conformers,
+        "energies": energies,
+        "nucleus": nucleus,
+        "method": method,
+        "basis": basis,
+        "max_workers": max_workers,
+        **kwargs
+    })
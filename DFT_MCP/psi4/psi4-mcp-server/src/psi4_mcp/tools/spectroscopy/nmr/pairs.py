@@ -0,0 +1,134 @@
+"""
+NMR Coupling Pair Selection.
+
+Atom pairs for spin-spin couplings, found without comparing every pair:
+
+- Spatial pairs: cell-list neighbor search (utils.geometry.neighbors).
+- Bonded pairs: bonds come from the spatial pairs within covalent-radius
+  cutoffs; pairs n bonds apart (nJ couplings) are found by breadth-first
+  search over the bond graph, keeping one shortest path per pair.
+"""
+
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+from psi4_mcp.utils.geometry.analysis import COVALENT_RADII
+from psi4_mcp.utils.geometry.neighbors import neighbor_pairs
+
+logger = logging.getLogger(__name__)
+
+# Covalent-radius sum multiplier for bond detection
+BOND_TOLERANCE = 1.3
+
+# Default covalent radius for elements missing from the table (Angstrom)
+DEFAULT_RADIUS = 1.5
+
+
+def bond_graph(
+    elements: Sequence[str],
+    coordinates: np.ndarray,
+    tolerance: float = BOND_TOLERANCE,
+) -> List[List[int]]:
+    """Bonded neighbours of each atom from covalent radii."""
+    radii = np.array([COVALENT_RADII.get(e, DEFAULT_RADIUS) for e in elements])
+    adjacency: List[List[int]] = [[] for _ in elements]
+    if len(radii) < 2:
+        return adjacency
+    i, j, d = neighbor_pairs(coordinates, 2 * float(radii.max()) * tolerance)
+    bonded = d < (radii[i] + radii[j]) * tolerance
+    for a, b in zip(i[bonded].tolist(), j[bonded].tolist()):
+        adjacency[a].append(b)
+        adjacency[b].append(a)
+    return adjacency
+
+
+def bond_paths(adjacency: List[List[int]], max_bonds: int) -> Dict[Tuple[int, int], Tuple[int, ...]]:
+    """
+    Shortest bond path of every pair at most max_bonds bonds apart.
+
+    Returns:
+        Path (atom indices from i to j) keyed by pair (i < j)
+    """
+    paths: Dict[Tuple[int, int], Tuple[int, ...]] = {}
+    for start in range(len(adjacency)):
+        parent = {start: -1}
+        frontier = [start]
+        for _ in range(max_bonds):
+            next_frontier = []
+            for atom in frontier:
+                for neighbour in adjacency[atom]:
+                    if neighbour not in parent:
+                        parent[neighbour] = atom
+                        next_frontier.append(neighbour)
+            frontier = next_frontier
+        for end in parent:
+            if end <= start:
+                continue
+            path = [end]
+            while parent[path[-1]] != -1:
+                path.append(parent[path[-1]])
+            paths[(start, end)] = tuple(reversed(path))
+    return paths
+
+
+def coupling_pairs(
+    elements: Sequence[str],
+    coordinates: np.ndarray,
+    max_bonds: Optional[int] = None,
+    max_distance: Optional[float] = None,
+    elements_filter: Optional[Sequence[str]] = None,
+    path_depth: Optional[int] = None,
+) -> List[Dict[str, object]]:
+    """
+    Coupling pairs by bond path and/or distance.
+
+    With neither max_bonds nor max_distance every pair is returned.
+
+    Args:
+        elements: Element symbols
+        coordinates: (n_atoms, 3) coordinates (Angstrom)
+        max_bonds: Keep pairs at most this many bonds apart
+        max_distance: Keep pairs within this distance (Angstrom)
+        elements_filter: Keep pairs whose atoms are both of these elements
+        path_depth: Bond-path search depth for n_bonds when max_bonds is None
+
+    Returns:
+        Dicts with i, j, distance, n_bonds and path (None for pairs further
+        apart than the search depth), sorted by (i, j)
+    """
+    coords = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    depth = max_bonds or path_depth
+    paths = bond_paths(bond_graph(elements, coords), depth) if depth else {}
+
+    if max_distance is not None:
+        i, j, d = neighbor_pairs(coords, max_distance)
+    elif max_bonds:
+        bonded = sorted(paths)
+        i = np.array([p[0] for p in bonded], dtype=int)
+        j = np.array([p[1] for p in bonded], dtype=int)
+        d = np.linalg.norm(coords[i] - coords[j], axis=1) if bonded else np.zeros(0)
+    else:
+        i, j = np.triu_indices(len(coords), k=1)
+        d = np.linalg.norm(coords[i] - coords[j], axis=1)
+
+    if elements_filter is not None:
+        allowed = np.isin(np.asarray(elements), list(elements_filter))
+        keep = allowed[i] & allowed[j]
+        i, j, d = i[keep], j[keep], d[keep]
+
+    pairs = []
+    for a, b, dist in zip(i.tolist(), j.tolist(), d.tolist()):
+        path = paths.get((a, b))
+        if max_bonds and path is None:
+            continue
+        pairs.append({
+            "i": a,
+            "j": b,
+            "distance": dist,
+            "n_bonds": len(path) - 1 if path is not None else None,
+            "path": path,
+        })
+    logger.debug(f"{len(pairs)} coupling pairs for {len(coords)} atoms")
+    return pairs
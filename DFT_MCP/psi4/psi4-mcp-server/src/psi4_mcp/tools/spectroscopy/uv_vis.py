@@ -14,6 +14,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, CalculationError
+from psi4_mcp.tools.excited_states.store import get_excited_states
 
 logger = logging.getLogger(__name__)
 
@@ -57,7 +58,7 @@ class UVVisTool(BaseTool[UVVisToolInput, ToolOutput]):
         "Returns excitation energies, oscillator strengths, and simulated spectrum."
     )
     category: ClassVar[ToolCategory] = ToolCategory.SPECTROSCOPY
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     @classmethod
     def get_input_schema(cls) -> dict[str, Any]:
@@ -76,52 +77,23 @@ class UVVisTool(BaseTool[UVVisToolInput, ToolOutput]):
     def _execute(self, input_data: UVVisToolInput) -> Result[ToolOutput]:
         """Execute UV-Vis calculation."""
         try:
-            import psi4
             import numpy as np
             
-            # Configure Psi4
-            psi4.core.clean()
-            psi4.set_memory(f"{input_data.memory} MB")
-            psi4.set_num_threads(input_data.n_threads)
-            
-            # Build molecule
-            mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-            molecule = psi4.geometry(mol_string)
-            
-            # Set options for TD-DFT
-            psi4.set_options({
-                "basis": input_data.basis,
-                "roots_per_irrep": [input_data.n_states],
-                "tda": input_data.use_tda,
-            })
-            
-            # Run TD-DFT
-            method_str = f"td-{input_data.method}/{input_data.basis}"
-            energy, wfn = psi4.energy(method_str, return_wfn=True, molecule=molecule)
-            
-            # Extract excited state information
-            excitations = []
-            EV_TO_HARTREE = 0.0367493  # Conversion factor
+            # Excitations from the shared excited-state store
+            record = get_excited_states(
+                input_data.geometry,
+                method=input_data.method,
+                basis=input_data.basis,
+                charge=input_data.charge,
+                multiplicity=input_data.multiplicity,
+                n_states=input_data.n_states,
+                tda=input_data.use_tda,
+                memory=input_data.memory,
+                n_threads=input_data.n_threads,
+            )
+            excitations = record.excitations(input_data.n_states)
             HARTREE_TO_NM = 45.56335 * 27.2114  # ~1239.84
             
-            for i in range(input_data.n_states):
-                try:
-                    exc_energy = psi4.variable(f"TD-{input_data.method.upper()} ROOT 0 -> ROOT {i+1} EXCITATION ENERGY")
-                    osc_str = psi4.variable(f"TD-{input_data.method.upper()} ROOT 0 -> ROOT {i+1} OSCILLATOR STRENGTH (LEN)")
-                    
-                    exc_ev = float(exc_energy) * 27.2114  # Hartree to eV
-                    wavelength = HARTREE_TO_NM / float(exc_energy) if exc_energy > 0 else 0
-                    
-                    excitations.append({
-                        "state": i + 1,
-                        "energy_hartree": float(exc_energy),
-                        "energy_ev": exc_ev,
-                        "wavelength_nm": wavelength,
-                        "oscillator_strength": float(osc_str),
-                    })
-                except Exception:
-                    break  # No more states available
-            
             # Generate simulated spectrum
             wavelengths = np.linspace(
                 input_data.wavelength_range[0],
@@ -145,7 +117,7 @@ class UVVisTool(BaseTool[UVVisToolInput, ToolOutput]):
             
             # Build output
             data = {
-                "ground_state_energy": float(energy),
+                "ground_state_energy": record.ground_state_energy,
                 "method": input_data.method,
                 "basis": input_data.basis,
                 "approximation": "TDA" if input_data.use_tda else "Full TD-DFT",
@@ -157,6 +129,7 @@ class UVVisTool(BaseTool[UVVisToolInput, ToolOutput]):
                     "broadening_ev": input_data.broadening_ev,
                 },
                 "lambda_max": None,
+                "excited_state_store": record.summary(),
                 "units": {
                     "energy": "eV",
                     "wavelength": "nm",
@@ -176,8 +149,6 @@ class UVVisTool(BaseTool[UVVisToolInput, ToolOutput]):
             if data["lambda_max"]:
                 message += f", λmax = {data['lambda_max']['wavelength_nm']:.1f} nm"
             
-            psi4.core.clean()
-            
             return Result.success(ToolOutput(
                 success=True,
                 message=message,
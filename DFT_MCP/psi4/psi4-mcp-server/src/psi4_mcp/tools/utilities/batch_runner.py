@@ -16,6 +16,7 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
@@ -95,7 +96,7 @@ def run_single_job(geometry: str, method: str, basis: str, charge: int,
     psi4.core.clean()
     psi4.set_memory(f"{memory} MB")
     psi4.set_num_threads(n_threads)
-    psi4.core.set_output_file("psi4_batch.out", False)
+    psi4.core.set_output_file(calculation_output_path("psi4_batch.out"), False)
     
     mol_string = f"{charge} {multiplicity}\n{geometry}"
     mol = psi4.geometry(mol_string)
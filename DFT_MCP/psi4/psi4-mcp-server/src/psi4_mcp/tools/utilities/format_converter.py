@@ -9,6 +9,8 @@ Key Features:
     - Energy unit conversion
     - Output format standardization
     - Data export utilities
+    - Streaming conversion of multi-frame XYZ/PDB/mol2 files and
+      parallel conversion of whole directories
 """
 
 from dataclasses import dataclass
@@ -21,6 +23,10 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.conversion.structures import (
+    READ_FORMATS, WRITE_FORMATS, convert_directory, convert_structure_file,
+    detect_structure_format, parse_frame_selection,
+)
 
 
 logger = logging.getLogger(__name__)
@@ -85,6 +91,32 @@ class GeometryConversion:
         }
 
 
+@dataclass
+class FileConversion:
+    """Result of a structure file or directory conversion."""
+    from_format: str
+    to_format: str
+    files: List[Dict[str, Any]]
+    
+    @property
+    def n_frames(self) -> int:
+        return sum(f.get("n_frames", 0) for f in self.files)
+    
+    @property
+    def failed(self) -> List[Dict[str, Any]]:
+        return [f for f in self.files if "error" in f]
+    
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "from_format": self.from_format,
+            "target_format": self.to_format,
+            "files": self.files,
+            "n_files": len(self.files),
+            "n_frames": self.n_frames,
+            "n_failed": len(self.failed),
+        }
+
+
 class FormatConverterInput(ToolInput):
     """Input for format converter."""
     # Energy/unit conversion
@@ -97,6 +129,16 @@ class FormatConverterInput(ToolInput):
     geometry_from: Optional[str] = Field(default="xyz", description="Source format")
     geometry_to: Optional[str] = Field(default="zmatrix", description="Target format")
     
+    # Structure file conversion (multi-frame XYZ, PDB, mol2)
+    input_file: Optional[str] = Field(default=None, description="Structure file to convert")
+    output_file: Optional[str] = Field(default=None, description="Converted structure file")
+    input_directory: Optional[str] = Field(default=None, description="Directory of structure files to convert")
+    output_directory: Optional[str] = Field(default=None, description="Directory for converted files")
+    file_from: Optional[str] = Field(default=None, description="Input file format (default: from extension)")
+    file_to: Optional[str] = Field(default=None, description="Output file format (default: from extension)")
+    frames: Optional[str] = Field(default=None, description="Frame selection, e.g. '10', '0:100', '::10'")
+    max_workers: Optional[int] = Field(default=None, description="Worker processes for directory conversion")
+    
     # List available conversions
     list_units: bool = Field(default=False, description="List available unit conversions")
 
@@ -108,6 +150,32 @@ def validate_format_converter_input(input_data: FormatConverterInput) -> Optiona
                 field="from_unit",
                 message="Both from_unit and to_unit required for energy conversion",
             )
+    if input_data.input_file and not input_data.output_file:
+        return ValidationError(field="output_file", message="output_file required for file conversion")
+    if input_data.input_directory:
+        if not input_data.output_directory:
+            return ValidationError(
+                field="output_directory", message="output_directory required for directory conversion",
+            )
+        if (input_data.file_to or "").lower() not in WRITE_FORMATS:
+            return ValidationError(
+                field="file_to", message=f"file_to must be one of: {', '.join(WRITE_FORMATS)}",
+            )
+    if input_data.input_file:
+        from_format = (input_data.file_from or detect_structure_format(input_data.input_file) or "").lower()
+        to_format = (input_data.file_to or detect_structure_format(input_data.output_file) or "").lower()
+        if from_format not in READ_FORMATS:
+            return ValidationError(
+                field="file_from", message=f"Input format must be one of: {', '.join(READ_FORMATS)}",
+            )
+        if to_format not in WRITE_FORMATS:
+            return ValidationError(
+                field="file_to", message=f"Output format must be one of: {', '.join(WRITE_FORMATS)}",
+            )
+    try:
+        parse_frame_selection(input_data.frames)
+    except ValueError as e:
+        return ValidationError(field="frames", message=str(e))
     return None
 
 
@@ -236,13 +304,38 @@ def convert_geometry_format(geometry: str, from_format: str, to_format: str) ->
     )
 
 
+def convert_structure_files(input_data: FormatConverterInput) -> FileConversion:
+    """Stream-convert one structure file, or every file of a directory in parallel."""
+    frames = parse_frame_selection(input_data.frames)
+    to_format = (input_data.file_to or "").lower() or None
+    from_format = (input_data.file_from or "").lower() or None
+    
+    if input_data.input_directory:
+        files = convert_directory(
+            input_data.input_directory, input_data.output_directory, to_format,
+            from_format=from_format, frames=frames, max_workers=input_data.max_workers,
+        )
+        return FileConversion(from_format or "auto", to_format, files)
+    
+    from_format = from_format or detect_structure_format(input_data.input_file)
+    to_format = to_format or detect_structure_format(input_data.output_file)
+    try:
+        n_frames = convert_structure_file(
+            input_data.input_file, input_data.output_file, from_format, to_format, frames,
+        )
+        files = [{"input": input_data.input_file, "output": input_data.output_file, "n_frames": n_frames}]
+    except (ValueError, OSError) as e:
+        files = [{"input": input_data.input_file, "error": str(e)}]
+    return FileConversion(from_format, to_format, files)
+
+
 @register_tool
 class FormatConverterTool(BaseTool[FormatConverterInput, ToolOutput]):
     """Tool for format conversions."""
     name: ClassVar[str] = "convert_format"
-    description: ClassVar[str] = "Convert between units and geometry formats."
+    description: ClassVar[str] = "Convert between units, geometry formats and multi-frame structure files."
     category: ClassVar[ToolCategory] = ToolCategory.UTILITIES
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     def _validate_input(self, input_data: FormatConverterInput) -> Optional[ValidationError]:
         return validate_format_converter_input(input_data)
@@ -276,12 +369,29 @@ class FormatConverterTool(BaseTool[FormatConverterInput, ToolOutput]):
             result_data = result.to_dict()
             message = f"Converted {result.n_atoms} atoms from {result.original_format} to {result.target_format}"
         
+        elif input_data.input_file or input_data.input_directory:
+            result = convert_structure_files(input_data)
+            result_data = result.to_dict()
+            message = (
+                f"Converted {len(result.files) - len(result.failed)} of {len(result.files)} files "
+                f"({result.n_frames} frames) from {result.from_format} to {result.to_format}"
+            )
+            for failure in result.failed:
+                message += f"\n  {failure['input']}: {failure['error']}"
+            if result.failed:
+                return Result.success(ToolOutput(success=False, message=message, data=result_data))
+        
         else:
             message = "No conversion requested"
         
         return Result.success(ToolOutput(success=True, message=message, data=result_data))
 
 
+def convert_structure_file_format(input_file: str, output_file: str, **kwargs: Any) -> ToolOutput:
+    """Convert a (multi-frame) structure file."""
+    return FormatConverterTool().run({"input_file": input_file, "output_file": output_file, **kwargs})
+
+
 def convert_units(value: float, from_unit: str, to_unit: str) -> ToolOutput:
     """Convert energy or length units."""
     return FormatConverterTool().run({
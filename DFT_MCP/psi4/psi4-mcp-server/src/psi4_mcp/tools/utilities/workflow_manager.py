@@ -2,12 +2,26 @@
 Workflow Manager Tool.
 
 Orchestrates multi-step computational workflows combining
-different calculation types in sequence.
+different calculation types.
+
+Steps form a DAG: each step names the steps it depends on and receives
+their outputs - the geometry to run at, the converged orbitals (used as
+SCF guess) and the Hessian (initial optimizer Hessian, or the Hessian
+of a frequency analysis). Identical steps are merged, and results that
+a dependency already produced are reused instead of recomputed (the
+energy at an optimized geometry, the density for one-electron
+properties). Independent branches run in parallel worker processes,
+and completed steps are checkpointed so a failed workflow can be rerun
+with resume=True to continue where it stopped.
 """
 
-from dataclasses import dataclass
-from typing import Any, ClassVar, Dict, List, Optional
+from concurrent.futures import FIRST_COMPLETED, Future, wait
+from dataclasses import dataclass, field
+from typing import Any, ClassVar, Dict, List, Optional, Tuple
+import hashlib
+import json
 import logging
+import os
 import time
 
 from pydantic import Field
@@ -16,18 +30,49 @@ from psi4_mcp.tools.core.base_tool import (
     BaseTool, ToolInput, ToolOutput, ToolCategory, register_tool,
 )
 from psi4_mcp.models.errors import Result, ValidationError
+from psi4_mcp.utils.convergence.restart import psi4_options_applied
+from psi4_mcp.utils.parallel.workers import spawn_pool, submit_task, worker_resources
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
 
 
 logger = logging.getLogger(__name__)
 HARTREE_TO_KCAL = 627.5094740631
 
+STEP_TYPES = ("energy", "optimize", "frequency", "hessian", "properties", "tddft")
+
+# Step types whose energy refers to the geometry they output
+GEOMETRY_STEPS = ("optimize",)
+
 
-WORKFLOW_TEMPLATES = {
-    "optimization": ["energy", "optimize", "energy"],
-    "thermochemistry": ["optimize", "frequency"],
-    "full_characterization": ["optimize", "frequency", "properties"],
-    "reaction_energy": ["optimize", "energy"],
-    "vertical_excitation": ["optimize", "tddft"],
+# Each step: id, type, optional "after" (dependencies), method, basis, options
+WORKFLOW_TEMPLATES: Dict[str, List[Dict[str, Any]]] = {
+    "optimization": [
+        {"id": "initial_energy", "type": "energy"},
+        {"id": "optimize", "type": "optimize"},
+        {"id": "final_energy", "type": "energy", "after": ["optimize"]},
+    ],
+    "thermochemistry": [
+        {"id": "optimize", "type": "optimize"},
+        {"id": "frequency", "type": "frequency", "after": ["optimize"]},
+    ],
+    "full_characterization": [
+        {"id": "optimize", "type": "optimize"},
+        {"id": "frequency", "type": "frequency", "after": ["optimize"]},
+        {"id": "properties", "type": "properties", "after": ["optimize"]},
+    ],
+    "reaction_energy": [
+        {"id": "optimize", "type": "optimize"},
+        {"id": "energy", "type": "energy", "after": ["optimize"]},
+    ],
+    "vertical_excitation": [
+        {"id": "optimize", "type": "optimize"},
+        {"id": "tddft", "type": "tddft", "after": ["optimize"]},
+    ],
+    "spectroscopy": [
+        {"id": "optimize", "type": "optimize"},
+        {"id": "frequency", "type": "frequency", "after": ["optimize"]},
+        {"id": "tddft", "type": "tddft", "after": ["optimize"]},
+    ],
 }
 
 
@@ -42,13 +87,19 @@ class WorkflowStep:
     energy: Optional[float]
     runtime_seconds: float
     output_data: Dict[str, Any]
+    step_id: str = ""
+    depends_on: List[str] = field(default_factory=list)
+    source: str = "computed"  # computed, reused, checkpoint, merged
+    error: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
-            "step": self.step_number, "type": self.step_type,
+            "step": self.step_number, "id": self.step_id, "type": self.step_type,
+            "depends_on": self.depends_on,
             "method": self.method, "basis": self.basis,
-            "status": self.status, "energy_hartree": self.energy,
+            "status": self.status, "source": self.source, "energy_hartree": self.energy,
             "runtime_seconds": self.runtime_seconds, "data": self.output_data,
+            "error": self.error,
         }
 
 
@@ -61,6 +112,9 @@ class WorkflowResult:
     final_energy: float
     total_runtime: float
     all_completed: bool
+    wall_time: float = 0.0
+    n_workers: int = 1
+    checkpoint_dir: Optional[str] = None
     
     def to_dict(self) -> Dict[str, Any]:
         return {
@@ -69,6 +123,9 @@ class WorkflowResult:
             "final_geometry": self.final_geometry,
             "final_energy_hartree": self.final_energy,
             "total_runtime_seconds": self.total_runtime,
+            "wall_time_seconds": self.wall_time,
+            "n_workers": self.n_workers,
+            "checkpoint_dir": self.checkpoint_dir,
             "all_completed": self.all_completed,
         }
 
@@ -77,66 +134,573 @@ class WorkflowInput(ToolInput):
     """Input for workflow execution."""
     geometry: str = Field(..., description="Initial geometry")
     workflow: str = Field(default="thermochemistry",
-        description="Workflow: optimization, thermochemistry, full_characterization, reaction_energy")
+        description="Workflow: optimization, thermochemistry, full_characterization, reaction_energy, "
+                    "vertical_excitation, spectroscopy")
     
     method: str = Field(default="b3lyp")
     basis: str = Field(default="cc-pvdz")
     charge: int = Field(default=0)
     multiplicity: int = Field(default=1)
     
-    custom_steps: Optional[List[str]] = Field(default=None, description="Custom step sequence")
+    custom_steps: Optional[List[str]] = Field(
+        default=None,
+        description="Custom step sequence (run as a chain; unknown types run as energies)",
+    )
+    custom_graph: Optional[List[Dict[str, Any]]] = Field(
+        default=None,
+        description="Custom step graph: [{id, type, after, method, basis, options}, ...]",
+    )
+    
+    max_workers: int = Field(default=1, description="Worker processes for independent branches")
+    checkpoint_dir: Optional[str] = Field(default=None, description="Directory for step checkpoints")
+    resume: bool = Field(default=False, description="Reuse checkpointed steps from earlier runs")
     
     memory: int = Field(default=4000)
     n_threads: int = Field(default=1)
 
 
+# =============================================================================
+# WORKFLOW GRAPH
+# =============================================================================
+
+@dataclass
+class WorkflowNode:
+    """Step of a workflow graph."""
+    node_id: str
+    step_type: str
+    method: str
+    basis: str
+    depends_on: List[str] = field(default_factory=list)
+    options: Dict[str, Any] = field(default_factory=dict)
+    
+    @property
+    def level(self) -> Tuple[str, str]:
+        return (self.method.lower(), self.basis.lower())
+
+
+class WorkflowGraph:
+    """Steps and their dependencies."""
+    
+    def __init__(self, nodes: List[WorkflowNode], strict: bool = True):
+        self.strict = strict
+        self.nodes: Dict[str, WorkflowNode] = {}
+        for node in nodes:
+            if node.node_id in self.nodes:
+                raise ValueError(f"Duplicate step id '{node.node_id}'")
+            self.nodes[node.node_id] = node
+        # Step id -> id of the identical step it was merged into
+        self.aliases: Dict[str, str] = {}
+        self._validate()
+    
+    @classmethod
+    def from_spec(cls, spec: List[Dict[str, Any]], method: str, basis: str,
+                  strict: bool = True) -> "WorkflowGraph":
+        """
+        Build from step dicts; method and basis default to the workflow's.
+        
+        Unknown step types are rejected if strict, else run as energies.
+        """
+        nodes = []
+        for i, step in enumerate(spec):
+            after = step.get("after", [])
+            nodes.append(WorkflowNode(
+                node_id=str(step.get("id", f"step_{i + 1}")),
+                step_type=str(step.get("type", "")).lower(),
+                method=step.get("method", method),
+                basis=step.get("basis", basis),
+                depends_on=[after] if isinstance(after, str) else list(after),
+                options=dict(step.get("options", {})),
+            ))
+        return cls(nodes, strict)
+    
+    @classmethod
+    def chain(cls, step_types: List[str], method: str, basis: str) -> "WorkflowGraph":
+        """Linear workflow: every step depends on the previous one (unknown types run as energies)."""
+        return cls.from_spec([
+            {"id": f"step_{i + 1}", "type": t, "after": [f"step_{i}"] if i else []}
+            for i, t in enumerate(step_types)
+        ], method, basis, strict=False)
+    
+    def _validate(self) -> None:
+        for node in self.nodes.values():
+            if node.step_type not in STEP_TYPES:
+                if self.strict:
+                    raise ValueError(f"Unknown step type '{node.step_type}' (use: {', '.join(STEP_TYPES)})")
+                logger.warning(f"Step {node.node_id}: unknown type '{node.step_type}', run as energy")
+            for dep in node.depends_on:
+                if dep not in self.nodes:
+                    raise ValueError(f"Step '{node.node_id}' depends on unknown step '{dep}'")
+        self.topological_order()
+    
+    def topological_order(self) -> List[str]:
+        """Step ids with dependencies first (stable w.r.t. definition order)."""
+        order: List[str] = []
+        state: Dict[str, int] = {}
+        
+        def visit(node_id: str) -> None:
+            if state.get(node_id) == 2:
+                return
+            if state.get(node_id) == 1:
+                raise ValueError(f"Workflow has a dependency cycle through '{node_id}'")
+            state[node_id] = 1
+            for dep in self.nodes[node_id].depends_on:
+                visit(dep)
+            state[node_id] = 2
+            order.append(node_id)
+        
+        for node_id in self.nodes:
+            visit(node_id)
+        return order
+    
+    def resolve(self, node_id: str) -> str:
+        return self.aliases.get(node_id, node_id)
+    
+    def merge_duplicates(self) -> Dict[str, str]:
+        """
+        Merge steps with the same type, level, options and dependencies.
+        
+        Returns:
+            Mapping of merged step id -> step id kept
+        """
+        seen: Dict[Tuple, str] = {}
+        for node_id in self.topological_order():
+            node = self.nodes[node_id]
+            node.depends_on = list(dict.fromkeys(self.resolve(d) for d in node.depends_on))
+            signature = (
+                node.step_type, node.level,
+                json.dumps(node.options, sort_keys=True, default=str),
+                tuple(sorted(node.depends_on)),
+            )
+            if signature in seen:
+                self.aliases[node_id] = seen[signature]
+            else:
+                seen[signature] = node_id
+        for node_id in self.aliases:
+            del self.nodes[node_id]
+        return dict(self.aliases)
+
+
+def build_workflow_graph(input_data: WorkflowInput) -> WorkflowGraph:
+    """Graph of the requested workflow (custom graph, custom chain or template)."""
+    if input_data.custom_graph:
+        return WorkflowGraph.from_spec(input_data.custom_graph, input_data.method, input_data.basis)
+    if input_data.custom_steps:
+        return WorkflowGraph.chain(input_data.custom_steps, input_data.method, input_data.basis)
+    return WorkflowGraph.from_spec(
+        WORKFLOW_TEMPLATES[input_data.workflow], input_data.method, input_data.basis,
+    )
+
+
 def validate_workflow_input(input_data: WorkflowInput) -> Optional[ValidationError]:
     if not input_data.geometry or not input_data.geometry.strip():
         return ValidationError(field="geometry", message="Geometry cannot be empty")
-    if input_data.workflow not in WORKFLOW_TEMPLATES and not input_data.custom_steps:
+    if (input_data.workflow not in WORKFLOW_TEMPLATES
+            and not input_data.custom_steps and not input_data.custom_graph):
         return ValidationError(field="workflow",
                               message=f"Unknown workflow. Use: {', '.join(WORKFLOW_TEMPLATES.keys())}")
+    if input_data.max_workers < 1:
+        return ValidationError(field="max_workers", message="max_workers must be at least 1")
+    try:
+        build_workflow_graph(input_data)
+    except ValueError as e:
+        field_name = "custom_graph" if input_data.custom_graph else "custom_steps"
+        return ValidationError(field=field_name, message=str(e))
     return None
 
 
-def run_workflow_step(mol, step_type: str, method: str, basis: str) -> tuple:
-    """Run a single workflow step."""
+# =============================================================================
+# STEP EXECUTION
+# =============================================================================
+
+def _geometry_block(mol) -> str:
+    """Cartesian geometry of a Psi4 molecule without the charge line."""
+    lines = mol.save_string_xyz().strip().splitlines()
+    if lines and len(lines[0].split()) == 2:
+        lines = lines[1:]
+    return "\n".join(line.strip() for line in lines)
+
+
+def _write_hessian(hessian, path: str) -> str:
+    import numpy as np
+    np.save(path, np.asarray(hessian))
+    return path if path.endswith(".npy") else path + ".npy"
+
+
+def _load_cartesian_hessian(mol, hessian_file: str) -> None:
+    """Place a Hessian where the optimizer reads it (CART_HESS_READ)."""
+    import numpy as np
     import psi4
+    from psi4.driver.qcdb import hessparse
+    
+    filename = psi4.core.get_writer_file_prefix(mol.name()) + ".hess"
+    with open(filename, "wb") as handle:
+        hessparse.to_string(np.load(hessian_file), handle, dtype="psi4")
+
+
+def run_workflow_step(mol, step_type: str, method: str, basis: str,
+                      inputs: Optional[Dict[str, Any]] = None,
+                      artifact_prefix: Optional[str] = None) -> tuple:
+    """
+    Run a single workflow step.
+    
+    Args:
+        mol: Psi4 molecule at the step's geometry
+        step_type: One of STEP_TYPES (other types run as energies)
+        method: Method
+        basis: Basis set
+        inputs: Outputs of dependencies: restart_file (orbitals used as
+            SCF guess), wavefunction_file (converged wavefunction at this
+            geometry and level), hessian_file (Hessian at this geometry)
+        artifact_prefix: Path prefix for the wavefunction/Hessian written
+            for dependants
     
+    Returns:
+        (energy, runtime, output_data, artifacts)
+    """
+    import numpy as np
+    import psi4
+    
+    inputs = inputs or {}
     start = time.time()
-    output_data = {}
+    output_data: Dict[str, Any] = {}
+    artifacts: Dict[str, str] = {}
+    kwargs: Dict[str, Any] = {"molecule": mol}
+    if inputs.get("restart_file"):
+        kwargs["restart_file"] = inputs["restart_file"]
+    wfn = None
     
-    if step_type == "energy":
-        energy = psi4.energy(f"{method}/{basis}", molecule=mol)
+    if step_type == "energy" or step_type not in STEP_TYPES:
+        energy, wfn = psi4.energy(f"{method}/{basis}", return_wfn=True, **kwargs)
         output_data["energy"] = energy
         
     elif step_type == "optimize":
-        energy = psi4.optimize(f"{method}/{basis}", molecule=mol)
+        # restart_file would be re-read at every optimization step
+        kwargs.pop("restart_file", None)
+        options = {}
+        if inputs.get("hessian_file"):
+            _load_cartesian_hessian(mol, inputs["hessian_file"])
+            options["cart_hess_read"] = True
+        with psi4_options_applied(options):
+            energy, wfn = psi4.optimize(f"{method}/{basis}", return_wfn=True, **kwargs)
         output_data["energy"] = energy
-        output_data["geometry"] = mol.save_string_xyz()
+        output_data["geometry"] = _geometry_block(mol)
         
-    elif step_type == "frequency":
-        energy, wfn = psi4.frequency(f"{method}/{basis}", return_wfn=True, molecule=mol)
+    elif step_type in ("frequency", "hessian"):
+        if inputs.get("hessian_file") and inputs.get("wavefunction_file"):
+            # Frequency analysis of a Hessian a dependency already computed
+            wfn = psi4.core.Wavefunction.from_file(inputs["wavefunction_file"])
+            hessian = np.load(inputs["hessian_file"])
+            energy = wfn.energy()
+            psi4.core.set_variable("CURRENT ENERGY", energy)
+            if step_type == "frequency":
+                psi4.driver.vibanal_wfn(wfn, hess=hessian)
+        elif step_type == "frequency":
+            energy, wfn = psi4.frequency(f"{method}/{basis}", return_wfn=True, **kwargs)
+            hessian = wfn.hessian().np
+        else:
+            hessian, wfn = psi4.hessian(f"{method}/{basis}", return_wfn=True, **kwargs)
+            hessian = hessian.np
+            energy = wfn.energy()
         output_data["energy"] = energy
-        output_data["zpe"] = psi4.variable("ZPVE")
-        
+        if step_type == "frequency":
+            output_data["zpe"] = psi4.variable("ZPVE")
+            frequencies = wfn.frequencies()
+            if frequencies is not None:
+                output_data["frequencies_cm"] = [float(f) for f in frequencies.np]
+        if artifact_prefix:
+            artifacts["hessian_file"] = _write_hessian(hessian, artifact_prefix + ".hessian.npy")
+            
     elif step_type == "properties":
-        energy, wfn = psi4.energy(f"{method}/{basis}", return_wfn=True, molecule=mol)
-        psi4.oeprop(wfn, "DIPOLE")
+        if inputs.get("wavefunction_file"):
+            # One-electron properties of the dependency's converged density
+            wfn = psi4.core.Wavefunction.from_file(inputs["wavefunction_file"])
+            energy = wfn.energy()
+            source = "reused"
+        else:
+            energy, wfn = psi4.energy(f"{method}/{basis}", return_wfn=True, **kwargs)
+            source = "computed"
+        psi4.oeprop(wfn, "DIPOLE", title="SCF")
         output_data["energy"] = energy
-        output_data["dipole"] = psi4.variable("SCF DIPOLE")
+        output_data["dipole"] = np.asarray(psi4.variable("SCF DIPOLE")).tolist()
+        output_data["density_source"] = source
         
     elif step_type == "tddft":
-        psi4.set_options({"roots_per_irrep": [5]})
-        energy, wfn = psi4.energy(f"td-{method}/{basis}", return_wfn=True, molecule=mol)
+        with psi4_options_applied({"roots_per_irrep": [5]}):
+            energy, wfn = psi4.energy(f"td-{method}/{basis}", return_wfn=True, **kwargs)
         output_data["ground_energy"] = energy
     
-    else:
-        energy = psi4.energy(f"{method}/{basis}", molecule=mol)
-        output_data["energy"] = energy
+    if wfn is not None and artifact_prefix and step_type != "properties":
+        filename = artifact_prefix + ".wfn.npy"
+        wfn.to_file(filename)
+        artifacts["wavefunction_file"] = filename
     
     runtime = time.time() - start
-    return output_data.get("energy", 0), runtime, output_data
+    energy = output_data.get("energy", output_data.get("ground_energy", 0))
+    return energy, runtime, output_data, artifacts
+
+
+def execute_workflow_node(task: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Run one workflow step from a task description.
+    
+    Used both in-process and in worker processes; the task holds
+    everything the step needs (geometry, level, resources, inputs from
+    dependencies) so it can be sent to another process.
+    """
+    import psi4
+    
+    try:
+        psi4.core.clean()
+        psi4.set_memory(f"{task['memory']} MB")
+        psi4.set_num_threads(task["n_threads"])
+        if task.get("output_file"):
+            psi4.core.set_output_file(task["output_file"], True)
+        
+        mol = psi4.geometry(f"{task['charge']} {task['multiplicity']}\n{task['geometry']}")
+        mol.update_geometry()
+        psi4.set_options({
+            "basis": task["basis"],
+            "reference": "rhf" if task["multiplicity"] == 1 else "uhf",
+        })
+        
+        with psi4_options_applied(task.get("options") or {}):
+            energy, runtime, output_data, artifacts = run_workflow_step(
+                mol, task["step_type"], task["method"], task["basis"],
+                task.get("inputs"), task.get("artifact_prefix"),
+            )
+        output_data.setdefault("geometry", task["geometry"])
+        return {
+            "success": True, "energy": energy, "runtime": runtime,
+            "output_data": output_data, "artifacts": artifacts,
+        }
+    except Exception as e:
+        logger.warning(f"Workflow step {task['node_id']} failed: {e}")
+        return {"success": False, "error": str(e)}
+    finally:
+        psi4.core.clean()
+
+
+# =============================================================================
+# CHECKPOINTS
+# =============================================================================
+
+def default_checkpoint_dir() -> str:
+    from psi4_mcp.config import get_config
+    return os.path.join(get_config().scratch_dir, "workflows")
+
+
+class WorkflowCheckpoint:
+    """
+    Completed steps stored by content key.
+    
+    The key covers everything that determines a step's result (type,
+    level, options, charge, multiplicity and the geometry it runs at), so
+    a rerun of a failed workflow - or any workflow sharing steps with it -
+    picks completed steps up again.
+    """
+    
+    def __init__(self, directory: str):
+        self.directory = directory
+        os.makedirs(directory, exist_ok=True)
+    
+    @staticmethod
+    def step_key(task: Dict[str, Any]) -> str:
+        content = {k: task.get(k) for k in (
+            "step_type", "method", "basis", "options", "charge", "multiplicity", "geometry",
+        )}
+        content["method"] = content["method"].lower()
+        content["basis"] = content["basis"].lower()
+        return hashlib.sha1(json.dumps(content, sort_keys=True, default=str).encode()).hexdigest()[:20]
+    
+    def artifact_prefix(self, key: str) -> str:
+        return os.path.join(self.directory, key)
+    
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        path = os.path.join(self.directory, f"{key}.json")
+        try:
+            with open(path) as f:
+                record = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if not all(os.path.exists(p) for p in record.get("artifacts", {}).values()):
+            return None
+        return record
+    
+    def save(self, key: str, record: Dict[str, Any]) -> None:
+        path = os.path.join(self.directory, f"{key}.json")
+        tmp = f"{path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(record, f, default=str)
+        os.replace(tmp, path)
+
+
+# =============================================================================
+# WORKFLOW EXECUTION
+# =============================================================================
+
+class WorkflowExecutor:
+    """Runs a workflow graph, dependencies first and branches in parallel."""
+    
+    def __init__(self, input_data: WorkflowInput, graph: WorkflowGraph):
+        self.input_data = input_data
+        self.graph = graph
+        self.merged = graph.merge_duplicates()
+        self.checkpoint = WorkflowCheckpoint(input_data.checkpoint_dir or default_checkpoint_dir())
+        self.order = graph.topological_order()
+        self.n_workers = max(1, min(input_data.max_workers, self._max_width()))
+        self.records: Dict[str, Dict[str, Any]] = {}
+    
+    def _max_width(self) -> int:
+        """Largest number of steps that can run at the same time (upper bound)."""
+        depth: Dict[str, int] = {}
+        for node_id in self.order:
+            deps = self.graph.nodes[node_id].depends_on
+            depth[node_id] = 1 + max((depth[d] for d in deps), default=0)
+        counts: Dict[int, int] = {}
+        for d in depth.values():
+            counts[d] = counts.get(d, 0) + 1
+        return max(counts.values(), default=1)
+    
+    def _resources(self) -> Tuple[int, int]:
+        """Memory and threads per running step (the tool's budget is shared)."""
+        return worker_resources(self.input_data.memory, self.input_data.n_threads, self.n_workers)
+    
+    def _dependency_outputs(self, node: WorkflowNode) -> List[Tuple[WorkflowNode, Dict[str, Any]]]:
+        return [(self.graph.nodes[d], self.records[d]) for d in node.depends_on]
+    
+    def _make_task(self, node: WorkflowNode) -> Dict[str, Any]:
+        """Task for a step whose dependencies completed."""
+        deps = self._dependency_outputs(node)
+        
+        # Geometry: from an optimization among the dependencies, else the first one
+        geometry = self.input_data.geometry.strip()
+        if deps:
+            source = next((r for d, r in deps if d.step_type in GEOMETRY_STEPS), deps[0][1])
+            geometry = source["output_data"].get("geometry", geometry)
+        
+        inputs: Dict[str, Any] = {}
+        for dep, record in deps:
+            artifacts = record.get("artifacts", {})
+            same_geometry = record["output_data"].get("geometry") == geometry
+            if "wavefunction_file" in artifacts and dep.basis.lower() == node.basis.lower():
+                inputs.setdefault("restart_file", artifacts["wavefunction_file"])
+            if same_geometry and dep.level == node.level and not node.options:
+                if "wavefunction_file" in artifacts:
+                    inputs.setdefault("wavefunction_file", artifacts["wavefunction_file"])
+            if same_geometry and "hessian_file" in artifacts:
+                if node.step_type == "optimize" or dep.level == node.level:
+                    inputs.setdefault("hessian_file", artifacts["hessian_file"])
+        
+        # Frequencies from a dependency's Hessian need its wavefunction too
+        if node.step_type == "frequency" and "wavefunction_file" not in inputs:
+            inputs.pop("hessian_file", None)
+        
+        memory, n_threads = self._resources()
+        task = {
+            "node_id": node.node_id, "step_type": node.step_type,
+            "method": node.method, "basis": node.basis, "options": node.options,
+            "charge": self.input_data.charge, "multiplicity": self.input_data.multiplicity,
+            "geometry": geometry, "inputs": inputs,
+            "memory": memory, "n_threads": n_threads,
+        }
+        task["key"] = WorkflowCheckpoint.step_key(task)
+        task["artifact_prefix"] = self.checkpoint.artifact_prefix(task["key"])
+        return task
+    
+    def _reuse(self, node: WorkflowNode, task: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Result of an energy step that a dependency already computed."""
+        if node.step_type != "energy" or node.options:
+            return None
+        for dep, record in self._dependency_outputs(node):
+            output = record["output_data"]
+            if (dep.level == node.level and "energy" in output
+                    and output.get("geometry") == task["geometry"]):
+                return {
+                    "success": True, "energy": output["energy"], "runtime": 0.0,
+                    "output_data": {"energy": output["energy"], "geometry": task["geometry"],
+                                    "reused_from": dep.node_id},
+                    "artifacts": {k: v for k, v in record.get("artifacts", {}).items()
+                                  if k == "wavefunction_file"},
+                }
+        return None
+    
+    def _prepare(self, node_id: str) -> Tuple[Dict[str, Any], Optional[Dict[str, Any]]]:
+        """Task of a step, and its result if no computation is needed."""
+        node = self.graph.nodes[node_id]
+        task = self._make_task(node)
+        
+        reused = self._reuse(node, task)
+        if reused is not None:
+            return task, dict(reused, source="reused")
+        
+        if self.input_data.resume:
+            record = self.checkpoint.load(task["key"])
+            if record is not None:
+                logger.info(f"  {node_id}: resumed from checkpoint {task['key']}")
+                return task, dict(record, success=True, source="checkpoint")
+        return task, None
+    
+    def _complete(self, node_id: str, task: Dict[str, Any], result: Dict[str, Any],
+                  source: str = "computed") -> None:
+        result.setdefault("source", source)
+        self.records[node_id] = result
+        if result["success"] and result["source"] == "computed":
+            self.checkpoint.save(task["key"], {
+                "energy": result["energy"], "runtime": result["runtime"],
+                "output_data": result["output_data"], "artifacts": result["artifacts"],
+            })
+    
+    def run(self) -> Dict[str, Dict[str, Any]]:
+        """Execute all steps; a failed step skips its dependants only."""
+        pending = list(self.order)
+        running: Dict[Future, Tuple[str, Dict[str, Any]]] = {}
+        pool = spawn_pool(self.n_workers) if self.n_workers > 1 else None
+        try:
+            while pending or running:
+                for node_id in list(pending):
+                    deps = self.graph.nodes[node_id].depends_on
+                    if any(d not in self.records for d in deps):
+                        continue
+                    pending.remove(node_id)
+                    failed = [d for d in deps if not self.records[d]["success"]]
+                    if failed:
+                        self.records[node_id] = {
+                            "success": False, "source": "skipped",
+                            "error": f"Dependency {failed[0]} failed",
+                        }
+                        continue
+                    
+                    task, result = self._prepare(node_id)
+                    if result is not None:
+                        self._complete(node_id, task, result)
+                    elif pool is None:
+                        logger.info(f"  Step {node_id}: {task['step_type']}")
+                        task["output_file"] = None
+                        self._complete(node_id, task, execute_workflow_node(task))
+                    else:
+                        logger.info(f"  Step {node_id}: {task['step_type']} (worker)")
+                        future = submit_task(pool, execute_workflow_node, task, "psi4_workflow")
+                        running[future] = (node_id, task)
+                
+                if running:
+                    done, _ = wait(list(running), return_when=FIRST_COMPLETED)
+                    for future in done:
+                        node_id, task = running.pop(future)
+                        try:
+                            result = future.result()
+                        except Exception as e:
+                            result = {"success": False, "error": f"Worker failed: {e}"}
+                        self._complete(node_id, task, result)
+        finally:
+            if pool is not None:
+                pool.shutdown(wait=True)
+        
+        for alias, node_id in self.merged.items():
+            record = self.records[node_id]
+            self.records[alias] = dict(record, merged_into=node_id)
+            if record["success"]:
+                self.records[alias]["source"] = "merged"
+        return self.records
 
 
 def run_workflow(input_data: WorkflowInput) -> WorkflowResult:
@@ -146,56 +710,63 @@ def run_workflow(input_data: WorkflowInput) -> WorkflowResult:
     psi4.core.clean()
     psi4.set_memory(f"{input_data.memory} MB")
     psi4.set_num_threads(input_data.n_threads)
-    psi4.core.set_output_file("psi4_workflow.out", False)
-    
-    mol_string = f"{input_data.charge} {input_data.multiplicity}\n{input_data.geometry}"
-    mol = psi4.geometry(mol_string)
-    mol.update_geometry()
+    psi4.core.set_output_file(calculation_output_path("psi4_workflow.out"), False)
     
-    psi4.set_options({
-        "basis": input_data.basis,
-        "reference": "rhf" if input_data.multiplicity == 1 else "uhf",
-    })
+    graph = build_workflow_graph(input_data)
+    spec = {node_id: (node.step_type, node.method, node.basis, list(node.depends_on))
+            for node_id, node in graph.nodes.items()}
     
-    steps_to_run = input_data.custom_steps or WORKFLOW_TEMPLATES[input_data.workflow]
+    logger.info(f"Running workflow: {input_data.workflow} ({len(spec)} steps)")
     
-    logger.info(f"Running workflow: {input_data.workflow}")
+    start = time.time()
+    executor = WorkflowExecutor(input_data, graph)
+    records = executor.run()
+    wall_time = time.time() - start
     
     steps = []
     total_runtime = 0.0
     final_energy = 0.0
     final_geometry = None
-    all_completed = True
     
-    for i, step_type in enumerate(steps_to_run):
-        logger.info(f"  Step {i+1}/{len(steps_to_run)}: {step_type}")
-        
-        energy, runtime, output_data = run_workflow_step(
-            mol, step_type, input_data.method, input_data.basis
-        )
-        
-        total_runtime += runtime
-        final_energy = energy
-        
-        if "geometry" in output_data:
-            final_geometry = output_data["geometry"]
+    for i, (node_id, (step_type, method, basis, depends_on)) in enumerate(spec.items()):
+        record = records[node_id]
+        if record["success"]:
+            output_data = dict(record["output_data"])
+            if "merged_into" in record:
+                output_data["merged_into"] = record["merged_into"]
+            energy = record["energy"]
+            if record["source"] == "computed":
+                total_runtime += record["runtime"]
+            final_energy = energy if energy else final_energy
+            if step_type in GEOMETRY_STEPS:
+                final_geometry = output_data.get("geometry")
+            status = "completed"
+        else:
+            output_data, energy = {}, None
+            status = "skipped" if record["source"] == "skipped" else "failed"
         
         steps.append(WorkflowStep(
             step_number=i+1, step_type=step_type,
-            method=input_data.method, basis=input_data.basis,
-            status="completed", energy=energy,
-            runtime_seconds=runtime, output_data=output_data,
+            method=method, basis=basis,
+            status=status, energy=energy,
+            runtime_seconds=record.get("runtime", 0.0) if record["source"] == "computed" else 0.0,
+            output_data=output_data,
+            step_id=node_id, depends_on=depends_on,
+            source=record["source"], error=record.get("error"),
         ))
     
     psi4.core.clean()
     
     return WorkflowResult(
-        workflow_name=input_data.workflow,
+        workflow_name=input_data.workflow if not (input_data.custom_steps or input_data.custom_graph) else "custom",
         steps=steps,
         final_geometry=final_geometry,
         final_energy=final_energy,
         total_runtime=total_runtime,
-        all_completed=all_completed,
+        all_completed=all(s.status == "completed" for s in steps),
+        wall_time=wall_time,
+        n_workers=executor.n_workers,
+        checkpoint_dir=executor.checkpoint.directory,
     )
 
 
@@ -205,7 +776,7 @@ class WorkflowManagerTool(BaseTool[WorkflowInput, ToolOutput]):
     name: ClassVar[str] = "run_workflow"
     description: ClassVar[str] = "Execute multi-step computational workflow."
     category: ClassVar[ToolCategory] = ToolCategory.UTILITY
-    version: ClassVar[str] = "1.0.0"
+    version: ClassVar[str] = "1.1.0"
     
     def _validate_input(self, input_data: WorkflowInput) -> Optional[ValidationError]:
         return validate_workflow_input(input_data)
@@ -213,15 +784,21 @@ class WorkflowManagerTool(BaseTool[WorkflowInput, ToolOutput]):
     def _execute(self, input_data: WorkflowInput) -> Result[ToolOutput]:
         result = run_workflow(input_data)
         
-        step_lines = [f"  {s.step_number}. {s.step_type}: {s.energy:.10f} Eh ({s.runtime_seconds:.1f}s)"
-                      for s in result.steps]
+        step_lines = []
+        for s in result.steps:
+            energy = f"{s.energy:.10f} Eh" if s.energy is not None else s.error or s.status
+            note = f"{s.runtime_seconds:.1f}s" if s.source == "computed" else s.source
+            step_lines.append(f"  {s.step_number}. {s.step_id} ({s.step_type}): {energy} ({note})")
         message = (
             f"Workflow: {result.workflow_name}\n{'='*40}\n"
             + "\n".join(step_lines) + "\n"
             f"Final Energy: {result.final_energy:.10f} Eh\n"
-            f"Total Runtime: {result.total_runtime:.2f}s"
+            f"Total Runtime: {result.total_runtime:.2f}s (wall {result.wall_time:.2f}s, "
+            f"{result.n_workers} worker{'s' if result.n_workers > 1 else ''})"
         )
-        return Result.success(ToolOutput(success=True, message=message, data=result.to_dict()))
+        if not result.all_completed:
+            message += "\nIncomplete: rerun with resume=True to continue from the completed steps"
+        return Result.success(ToolOutput(success=result.all_completed, message=message, data=result.to_dict()))
 
 
 def run_workflow_calc(geometry: str, workflow: str = "thermochemistry", **kwargs: Any) -> ToolOutput:
@@ -9,6 +9,8 @@ Submodules:
     - caching: Result and molecular caching systems
     - convergence: SCF and optimization convergence helpers
     - conversion: Format and unit conversion utilities
+    - cube: Volumetric data on grids (densities, orbitals, ESP)
+    - dispersion: Post-SCF empirical dispersion corrections
     - error_handling: Error detection, recovery, and suggestions
     - geometry: Molecular geometry manipulation and analysis
     - helpers: Constants, math, strings, and unit helpers
@@ -17,6 +19,7 @@ Submodules:
     - molecular: Molecular descriptors and similarity
     - parallel: Parallelization utilities
     - parsing: Output file parsing utilities
+    - profiling: Per-call phase timing and metrics
     - validation: Input validation utilities
     - visualization: Molecular and spectral visualization
 
@@ -58,6 +61,8 @@ __all__: List[str] = [
     "caching",
     "convergence",
     "conversion",
+    "cube",
+    "dispersion",
     "error_handling",
     "geometry",
     "helpers",
@@ -66,6 +71,7 @@ __all__: List[str] = [
     "molecular",
     "parallel",
     "parsing",
+    "profiling",
     "validation",
     "visualization",
 ]
@@ -51,6 +51,7 @@ from psi4_mcp.utils.basis.parser import (
 
 from psi4_mcp.utils.basis.optimizer import (
     BasisOptimizer,
+    ObjectiveEvaluator,
     OptimizationTarget,
     optimize_exponents,
     optimize_contraction_coefficients,
@@ -90,6 +91,7 @@ __all__ = [
     
     # Optimizer
     "BasisOptimizer",
+    "ObjectiveEvaluator",
     "OptimizationTarget",
     "optimize_exponents",
     "optimize_contraction_coefficients",
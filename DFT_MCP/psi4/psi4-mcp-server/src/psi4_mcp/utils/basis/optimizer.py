@@ -3,16 +3,31 @@ Basis Set Optimizer for Psi4 MCP Server.
 
 Provides utilities for optimizing basis set parameters
 (exponents and contraction coefficients).
+
+The objective (typically a full quantum-chemistry energy) dominates the
+cost, so each iteration evaluates its gradient perturbations, and each
+round of line-search trial steps, as one batch: concurrently in worker
+processes or through a user-supplied batch objective. Values are cached
+by parameter set.
 """
 
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Callable, Dict, List, Optional, Tuple
+import logging
 import math
+import multiprocessing
+import pickle
+
+import numpy as np
 
 from psi4_mcp.utils.basis.generator import ContractedFunction, ShellType
 
 
+logger = logging.getLogger(__name__)
+
+
 class OptimizationTarget(str, Enum):
     """Target property for basis optimization."""
     ENERGY = "energy"
@@ -31,6 +46,130 @@ class OptimizationResult:
     initial_value: float
     optimized_function: ContractedFunction
     message: str = ""
+    n_evaluations: int = 0
+    n_cached: int = 0
+
+
+# Objective of a single function, and of a batch of functions at once
+ObjectiveFunction = Callable[[ContractedFunction], float]
+BatchObjectiveFunction = Callable[[List[ContractedFunction]], List[float]]
+
+
+def _parameter_key(func: ContractedFunction) -> Tuple:
+    """Cache key of a contracted function (parameters to 12 significant digits)."""
+    return (
+        func.shell_type.value,
+        func.element,
+        tuple(float(f"{p.exponent:.12g}") for p in func.primitives),
+        tuple(float(f"{p.coefficient:.12g}") for p in func.primitives),
+    )
+
+
+def _evaluate_in_worker(task: Tuple[ObjectiveFunction, ContractedFunction]) -> float:
+    objective_func, func = task
+    return float(objective_func(func))
+
+
+class ObjectiveEvaluator:
+    """
+    Batched, cached evaluation of a basis objective.
+    
+    Each batch is reduced to the parameter sets not seen before, which are
+    evaluated together: by the batch objective if one is given, otherwise
+    by the single objective in a pool of worker processes (kept for the
+    whole optimization) or serially. Failed evaluations count as inf.
+    
+    Args:
+        objective_func: Objective of one function (picklable for workers)
+        batch_objective_func: Objective of a list of functions
+        max_workers: Worker processes for objective_func (1 = serial)
+        cache: Dict of objective values by parameter key (shared if given)
+    """
+    
+    def __init__(
+        self,
+        objective_func: Optional[ObjectiveFunction] = None,
+        batch_objective_func: Optional[BatchObjectiveFunction] = None,
+        max_workers: int = 1,
+        cache: Optional[Dict[Tuple, float]] = None,
+    ):
+        if objective_func is None and batch_objective_func is None:
+            raise ValueError("An objective function or batch objective function is required")
+        self.objective_func = objective_func
+        self.batch_objective_func = batch_objective_func
+        self.max_workers = max_workers
+        self.cache = cache if cache is not None else {}
+        self.n_evaluations = 0
+        self.n_cached = 0
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    def __enter__(self) -> "ObjectiveEvaluator":
+        return self
+    
+    def __exit__(self, *exc) -> None:
+        self.close()
+    
+    def close(self) -> None:
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def _workers_available(self) -> bool:
+        if self.max_workers <= 1 or self._pool is not None:
+            return self._pool is not None
+        try:
+            pickle.dumps(self.objective_func)
+        except Exception as e:
+            logger.warning(f"Objective cannot be sent to worker processes, evaluating serially: {e}")
+            self.max_workers = 1
+            return False
+        context = multiprocessing.get_context("spawn")
+        self._pool = ProcessPoolExecutor(max_workers=self.max_workers, mp_context=context)
+        return True
+    
+    def _run(self, functions: List[ContractedFunction]) -> List[float]:
+        if self.batch_objective_func is not None:
+            try:
+                return [float(v) for v in self.batch_objective_func(functions)]
+            except Exception as e:
+                logger.warning(f"Batch objective evaluation failed: {e}")
+                return [math.inf] * len(functions)
+        
+        if len(functions) > 1 and self._workers_available():
+            futures = [self._pool.submit(_evaluate_in_worker, (self.objective_func, f)) for f in functions]
+            values = []
+            for future in futures:
+                try:
+                    values.append(future.result())
+                except Exception as e:
+                    logger.warning(f"Objective evaluation failed in worker: {e}")
+                    values.append(math.inf)
+            return values
+        
+        values = []
+        for func in functions:
+            try:
+                values.append(float(self.objective_func(func)))
+            except Exception as e:
+                logger.warning(f"Objective evaluation failed: {e}")
+                values.append(math.inf)
+        return values
+    
+    def evaluate(self, functions: List[ContractedFunction]) -> np.ndarray:
+        """Objective values of a batch of functions."""
+        keys = [_parameter_key(f) for f in functions]
+        missing: Dict[Tuple, ContractedFunction] = {}
+        for key, func in zip(keys, functions):
+            if key in self.cache:
+                self.n_cached += 1
+            elif key not in missing:
+                missing[key] = func
+        if missing:
+            values = self._run(list(missing.values()))
+            self.n_evaluations += len(missing)
+            for key, value in zip(missing, values):
+                self.cache[key] = math.inf if math.isnan(value) else value
+        return np.array([self.cache[key] for key in keys], dtype=float)
 
 
 @dataclass
@@ -40,17 +179,34 @@ class BasisOptimizer:
     
     Provides methods to optimize exponents and contraction
     coefficients for specific target properties.
+    
+    Both use a quasi-Newton (BFGS) iteration: exponents in the log
+    parametrization x = ln(alpha), which keeps them positive and makes
+    steps relative; coefficients directly. The central-difference
+    gradient and the trial steps of the line search are each evaluated
+    as one batch (see ObjectiveEvaluator), and values are cached by
+    parameter set, so revisited points cost nothing.
     """
     
     max_iterations: int = 100
     tolerance: float = 1e-6
+    # Largest finite-difference step (relative); sqrt(tolerance) if smaller
     step_size: float = 0.01
+    # Worker processes for the objective (1 = serial)
+    max_workers: int = 1
+    # Objective values by parameter key; pass a dict to share across runs
+    objective_cache: Optional[Dict[Tuple, float]] = None
+    # Largest change of a parameter (ln alpha for exponents) in one step
+    max_step: float = 1.0
+    # Trial step lengths per line-search batch (default: max_workers)
+    line_search_batch: Optional[int] = None
     
     def optimize_exponents(
         self,
         initial_function: ContractedFunction,
-        objective_func: Callable[[ContractedFunction], float],
+        objective_func: Optional[ObjectiveFunction] = None,
         minimize: bool = True,
+        batch_objective_func: Optional[BatchObjectiveFunction] = None,
     ) -> OptimizationResult:
         """
         Optimize exponents of a contracted function.
@@ -59,88 +215,33 @@ class BasisOptimizer:
             initial_function: Starting contracted function
             objective_func: Function to evaluate (lower is better if minimize=True)
             minimize: Whether to minimize or maximize
+            batch_objective_func: Evaluates a list of functions at once
+                (used instead of objective_func when given)
             
         Returns:
             OptimizationResult with optimized function
         """
-        current = _copy_contracted_function(initial_function)
-        initial_value = objective_func(current)
-        current_value = initial_value
+        template = _copy_contracted_function(initial_function)
         
-        sign = 1.0 if minimize else -1.0
+        def build(x: np.ndarray) -> ContractedFunction:
+            func = _copy_contracted_function(template)
+            for prim, value in zip(func.primitives, np.exp(x).tolist()):
+                prim.exponent = value
+            return func
         
-        for iteration in range(self.max_iterations):
-            # Compute numerical gradient for each exponent
-            gradients = []
-            for i, prim in enumerate(current.primitives):
-                # Forward difference
-                delta = max(prim.exponent * self.step_size, 1e-8)
-                
-                # Test function with perturbed exponent
-                test_func = _copy_contracted_function(current)
-                test_func.primitives[i].exponent += delta
-                value_plus = objective_func(test_func)
-                
-                gradient = sign * (value_plus - current_value) / delta
-                gradients.append(gradient)
-            
-            # Update exponents using gradient descent
-            max_gradient = max(abs(g) for g in gradients) if gradients else 0.0
-            
-            if max_gradient < self.tolerance:
-                return OptimizationResult(
-                    converged=True,
-                    n_iterations=iteration + 1,
-                    final_value=current_value,
-                    initial_value=initial_value,
-                    optimized_function=current,
-                    message="Converged: gradient below tolerance"
-                )
-            
-            # Line search with backtracking
-            step = self.step_size
-            for _ in range(10):  # Max backtracking iterations
-                test_func = _copy_contracted_function(current)
-                for i, grad in enumerate(gradients):
-                    new_exp = test_func.primitives[i].exponent - step * grad
-                    # Ensure exponent stays positive
-                    test_func.primitives[i].exponent = max(new_exp, 1e-10)
-                
-                new_value = objective_func(test_func)
-                
-                if (minimize and new_value < current_value) or \
-                   (not minimize and new_value > current_value):
-                    current = test_func
-                    current_value = new_value
-                    break
-                
-                step *= 0.5
-            else:
-                # No improvement found
-                return OptimizationResult(
-                    converged=False,
-                    n_iterations=iteration + 1,
-                    final_value=current_value,
-                    initial_value=initial_value,
-                    optimized_function=current,
-                    message="Failed: line search found no improvement"
-                )
-        
-        return OptimizationResult(
-            converged=False,
-            n_iterations=self.max_iterations,
-            final_value=current_value,
-            initial_value=initial_value,
-            optimized_function=current,
-            message="Reached maximum iterations"
+        x0 = np.log(np.maximum(np.array(template.exponents, dtype=float), 1e-10))
+        return self._quasi_newton(
+            x0, build, lambda x: np.full(len(x), self._difference_step()),
+            objective_func, batch_objective_func, minimize,
         )
     
     def optimize_coefficients(
         self,
         initial_function: ContractedFunction,
-        objective_func: Callable[[ContractedFunction], float],
+        objective_func: Optional[ObjectiveFunction] = None,
         minimize: bool = True,
         normalize: bool = True,
+        batch_objective_func: Optional[BatchObjectiveFunction] = None,
     ) -> OptimizationResult:
         """
         Optimize contraction coefficients of a contracted function.
@@ -150,80 +251,145 @@ class BasisOptimizer:
             objective_func: Function to evaluate
             minimize: Whether to minimize or maximize
             normalize: Whether to enforce normalization
+            batch_objective_func: Evaluates a list of functions at once
+                (used instead of objective_func when given)
             
         Returns:
             OptimizationResult with optimized function
         """
-        current = _copy_contracted_function(initial_function)
-        initial_value = objective_func(current)
-        current_value = initial_value
+        template = _copy_contracted_function(initial_function)
+        
+        def build(x: np.ndarray) -> ContractedFunction:
+            func = _copy_contracted_function(template)
+            for prim, value in zip(func.primitives, x.tolist()):
+                prim.coefficient = value
+            if normalize:
+                func.normalize()
+            return func
         
+        x0 = np.array(template.coefficients, dtype=float)
+        return self._quasi_newton(
+            x0, build, lambda x: np.maximum(np.abs(x) * self._difference_step(), 1e-8),
+            objective_func, batch_objective_func, minimize,
+        )
+    
+    def _difference_step(self) -> float:
+        """Finite-difference step (relative); central differences err by O(step**2)."""
+        return min(self.step_size, math.sqrt(self.tolerance))
+    
+    def _quasi_newton(
+        self,
+        x0: np.ndarray,
+        build: Callable[[np.ndarray], ContractedFunction],
+        differences: Callable[[np.ndarray], np.ndarray],
+        objective_func: Optional[ObjectiveFunction],
+        batch_objective_func: Optional[BatchObjectiveFunction],
+        minimize: bool,
+    ) -> OptimizationResult:
+        """
+        BFGS minimization of sign * objective(build(x)).
+        
+        Converges when the largest gradient component (with respect to x)
+        is below tolerance. A run that stops improving first (no line-search
+        progress, or a decrease below tolerance**2) is reported as not
+        converged, with the remaining gradient in the message.
+        """
         sign = 1.0 if minimize else -1.0
+        n = len(x0)
+        batch = max(1, self.line_search_batch or self.max_workers)
         
-        for iteration in range(self.max_iterations):
-            # Compute gradient for each coefficient
-            gradients = []
-            for i, prim in enumerate(current.primitives):
-                delta = max(abs(prim.coefficient) * self.step_size, 1e-8)
-                
-                test_func = _copy_contracted_function(current)
-                test_func.primitives[i].coefficient += delta
-                if normalize:
-                    test_func.normalize()
-                
-                value_plus = objective_func(test_func)
-                gradient = sign * (value_plus - current_value) / delta
-                gradients.append(gradient)
-            
-            max_gradient = max(abs(g) for g in gradients) if gradients else 0.0
+        with ObjectiveEvaluator(
+            objective_func, batch_objective_func, self.max_workers, self.objective_cache,
+        ) as evaluator:
+            x = x0.copy()
+            initial_value = float(evaluator.evaluate([build(x)])[0])
+            f = sign * initial_value
+            inverse_hessian = np.eye(n)
+            previous: Optional[Tuple[np.ndarray, np.ndarray]] = None
             
-            if max_gradient < self.tolerance:
+            def finish(converged: bool, iterations: int, message: str) -> OptimizationResult:
                 return OptimizationResult(
-                    converged=True,
-                    n_iterations=iteration + 1,
-                    final_value=current_value,
+                    converged=converged,
+                    n_iterations=iterations,
+                    final_value=sign * f,
                     initial_value=initial_value,
-                    optimized_function=current,
-                    message="Converged: gradient below tolerance"
+                    optimized_function=build(x),
+                    message=message,
+                    n_evaluations=evaluator.n_evaluations,
+                    n_cached=evaluator.n_cached,
                 )
             
-            # Update coefficients
-            step = self.step_size
-            for _ in range(10):
-                test_func = _copy_contracted_function(current)
-                for i, grad in enumerate(gradients):
-                    test_func.primitives[i].coefficient -= step * grad
+            if not math.isfinite(f):
+                return finish(False, 0, "Failed: objective could not be evaluated at the initial point")
+            
+            def line_search(direction: np.ndarray, gradient: np.ndarray) -> Optional[Tuple[float, float]]:
+                """Backtracking (Armijo) line search, trial steps evaluated in batches."""
+                largest = np.max(np.abs(direction))
+                if largest > self.max_step:
+                    direction = direction * (self.max_step / largest)
+                slope = float(direction @ gradient)
+                steps = [0.5 ** k for k in range(10)]
+                for start in range(0, len(steps), batch):
+                    trial = steps[start:start + batch]
+                    values = sign * evaluator.evaluate([build(x + t * direction) for t in trial])
+                    for t, value in zip(trial, values):
+                        if value < f + 1e-4 * t * slope:
+                            return t * direction, float(value)
+                return None
+            
+            for iteration in range(self.max_iterations):
+                # Central-difference gradient, all perturbations in one batch
+                h = differences(x)
+                shifts = np.concatenate([np.diag(h), -np.diag(h)])
+                values = sign * evaluator.evaluate([build(row) for row in x[None, :] + shifts])
+                gradient = (values[:n] - values[n:]) / (2 * h)
+                if not np.all(np.isfinite(gradient)):
+                    return finish(False, iteration + 1, "Failed: objective could not be evaluated for the gradient")
+                gradient_norm = float(np.max(np.abs(gradient), initial=0.0))
+                if gradient_norm < self.tolerance:
+                    return finish(True, iteration + 1, "Converged: gradient below tolerance")
                 
-                if normalize:
-                    test_func.normalize()
+                # BFGS update from the last step and gradient change
+                if previous is not None:
+                    s, y = x - previous[0], gradient - previous[1]
+                    sy = float(s @ y)
+                    if sy > 1e-12:
+                        if iteration == 1:
+                            inverse_hessian = np.eye(n) * sy / float(y @ y)
+                        rho = 1.0 / sy
+                        v = np.eye(n) - rho * np.outer(s, y)
+                        inverse_hessian = v @ inverse_hessian @ v.T + rho * np.outer(s, s)
                 
-                new_value = objective_func(test_func)
+                accepted = None
+                for restart in (False, True):
+                    if restart:
+                        # Retry once from steepest descent
+                        inverse_hessian = np.eye(n)
+                    direction = -inverse_hessian @ gradient
+                    if float(direction @ gradient) >= 0:
+                        # Not a descent direction: restart from steepest descent
+                        inverse_hessian = np.eye(n)
+                        direction = -gradient
+                    accepted = line_search(direction, gradient)
+                    if accepted is not None:
+                        break
                 
-                if (minimize and new_value < current_value) or \
-                   (not minimize and new_value > current_value):
-                    current = test_func
-                    current_value = new_value
-                    break
+                if accepted is None:
+                    return finish(
+                        False, iteration + 1,
+                        f"Stopped: line search found no improvement (gradient {gradient_norm:.1e})",
+                    )
                 
-                step *= 0.5
-            else:
-                return OptimizationResult(
-                    converged=False,
-                    n_iterations=iteration + 1,
-                    final_value=current_value,
-                    initial_value=initial_value,
-                    optimized_function=current,
-                    message="Failed: line search found no improvement"
-                )
-        
-        return OptimizationResult(
-            converged=False,
-            n_iterations=self.max_iterations,
-            final_value=current_value,
-            initial_value=initial_value,
-            optimized_function=current,
-            message="Reached maximum iterations"
-        )
+                previous = (x, gradient)
+                x = x + accepted[0]
+                change, f = f - accepted[1], accepted[1]
+                if change < self.tolerance ** 2:
+                    return finish(
+                        False, iteration + 1,
+                        f"Stopped: objective no longer decreasing (gradient {gradient_norm:.1e})",
+                    )
+            
+            return finish(False, self.max_iterations, "Reached maximum iterations")
 
 
 def optimize_exponents(
@@ -232,6 +398,7 @@ def optimize_exponents(
     minimize: bool = True,
     max_iterations: int = 100,
     tolerance: float = 1e-6,
+    max_workers: int = 1,
 ) -> OptimizationResult:
     """
     Convenience function to optimize exponents.
@@ -242,6 +409,7 @@ def optimize_exponents(
         minimize: Whether to minimize (True) or maximize (False)
         max_iterations: Maximum iterations
         tolerance: Convergence tolerance
+        max_workers: Worker processes for objective evaluations
         
     Returns:
         OptimizationResult
@@ -249,6 +417,7 @@ def optimize_exponents(
     optimizer = BasisOptimizer(
         max_iterations=max_iterations,
         tolerance=tolerance,
+        max_workers=max_workers,
     )
     return optimizer.optimize_exponents(initial_function, objective_func, minimize)
 
@@ -260,6 +429,7 @@ def optimize_contraction_coefficients(
     normalize: bool = True,
     max_iterations: int = 100,
     tolerance: float = 1e-6,
+    max_workers: int = 1,
 ) -> OptimizationResult:
     """
     Convenience function to optimize contraction coefficients.
@@ -271,6 +441,7 @@ def optimize_contraction_coefficients(
         normalize: Whether to enforce normalization
         max_iterations: Maximum iterations
         tolerance: Convergence tolerance
+        max_workers: Worker processes for objective evaluations
         
     Returns:
         OptimizationResult
@@ -278,6 +449,7 @@ def optimize_contraction_coefficients(
     optimizer = BasisOptimizer(
         max_iterations=max_iterations,
         tolerance=tolerance,
+        max_workers=max_workers,
     )
     return optimizer.optimize_coefficients(
         initial_function, objective_func, minimize, normalize
@@ -31,12 +31,20 @@ from psi4_mcp.utils.caching.cache_manager import (
     clear_cache,
 )
 
+from psi4_mcp.utils.caching.geometry_index import (
+    GeometryIndex,
+    CanonicalGeometry,
+    canonicalize,
+    aligned_rmsd,
+)
+
 from psi4_mcp.utils.caching.molecular import (
     MolecularCache,
     MolecularCacheEntry,
     cache_molecule,
     get_cached_molecule,
     compute_molecule_hash,
+    atom_order_hash,
 )
 
 from psi4_mcp.utils.caching.results import (
@@ -58,12 +66,19 @@ __all__ = [
     "get_cache",
     "clear_cache",
     
+    # Geometry Index
+    "GeometryIndex",
+    "CanonicalGeometry",
+    "canonicalize",
+    "aligned_rmsd",
+    
     # Molecular Cache
     "MolecularCache",
     "MolecularCacheEntry",
     "cache_molecule",
     "get_cached_molecule",
     "compute_molecule_hash",
+    "atom_order_hash",
     
     # Results Cache
     "ResultsCache",
@@ -0,0 +1,286 @@
+"""
+Near-Duplicate Geometry Index for Psi4 MCP Server.
+
+Finds stored geometries that are the same molecule as a query up to atom
+order, rigid motion and small coordinate noise:
+
+- Canonicalization centers a geometry, rotates it onto its principal
+  axes and orders atoms by element and distance from the center.
+- The index key is the formula, charge, multiplicity and the quantized
+  principal radii of gyration. These do not depend on atom order or
+  orientation, and move by at most the RMSD between two geometries, so
+  probing the bins within the tolerance finds every true duplicate.
+- Candidates are confirmed by an RMSD over all of them at once: matching
+  atoms of each element to the nearest candidate atoms and superimposing
+  (Kabsch), iterated from the principal-axes orientations.
+"""
+
+from dataclasses import dataclass
+from functools import lru_cache
+from itertools import product
+from typing import Dict, List, Optional, Sequence, Tuple
+import logging
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+# Default RMSD (Angstrom) under which geometries count as the same
+NEAR_DUPLICATE_RMSD = 1e-3
+
+# Relative gap below which principal moments are treated as degenerate
+DEGENERACY_TOLERANCE = 0.02
+
+Geometry = Sequence[Tuple[str, float, float, float]]
+
+
+@dataclass
+class CanonicalGeometry:
+    """Geometry in its principal-axes frame with atoms in canonical order."""
+    elements: Tuple[str, ...]
+    coordinates: np.ndarray
+    # order[i]: input index of canonical atom i
+    order: np.ndarray
+    # Principal radii of gyration, descending
+    radii: np.ndarray
+    formula: str
+
+    @property
+    def n_atoms(self) -> int:
+        return len(self.elements)
+
+    def groups(self) -> List[slice]:
+        """Slices of atoms of each element."""
+        groups = []
+        start = 0
+        for i in range(1, self.n_atoms + 1):
+            if i == self.n_atoms or self.elements[i] != self.elements[start]:
+                groups.append(slice(start, i))
+                start = i
+        return groups
+
+
+def _formula(elements: Sequence[str]) -> str:
+    counts: Dict[str, int] = {}
+    for element in elements:
+        counts[element] = counts.get(element, 0) + 1
+    return "".join(f"{e}{counts[e] if counts[e] > 1 else ''}" for e in sorted(counts))
+
+
+def canonicalize(geometry: Geometry) -> CanonicalGeometry:
+    """
+    Canonical form of a geometry.
+
+    Args:
+        geometry: List of (element, x, y, z) tuples
+    """
+    elements = [str(atom[0]).capitalize() for atom in geometry]
+    xyz = np.array([atom[1:4] for atom in geometry], dtype=float).reshape(-1, 3)
+    xyz = xyz - xyz.mean(axis=0) if len(xyz) else xyz
+
+    covariance = xyz.T @ xyz / max(len(xyz), 1)
+    moments, axes = np.linalg.eigh(covariance)
+    moments, axes = moments[::-1], axes[:, ::-1]
+    # Orient axes by the third moment (skew), then keep the frame right-handed
+    projected = xyz @ axes
+    skew = (projected ** 3).sum(axis=0)
+    axes = axes * np.where(skew < 0, -1.0, 1.0)
+    if np.linalg.det(axes) < 0:
+        axes[:, 2] = -axes[:, 2]
+    coordinates = xyz @ axes
+
+    distances = np.linalg.norm(coordinates, axis=1)
+    order = np.array(sorted(range(len(elements)), key=lambda i: (elements[i], distances[i])), dtype=int)
+    return CanonicalGeometry(
+        elements=tuple(elements[i] for i in order),
+        coordinates=coordinates[order],
+        order=order,
+        radii=np.sqrt(np.maximum(moments, 0.0)),
+        formula=_formula(elements),
+    )
+
+
+@lru_cache(maxsize=None)
+def _sampled_rotations(n: int, seed: int = 7) -> np.ndarray:
+    """n rotation matrices from uniformly random unit quaternions."""
+    q = np.random.default_rng(seed).normal(size=(n, 4))
+    w, x, y, z = (q / np.linalg.norm(q, axis=1)[:, None]).T
+    return np.stack([
+        np.stack([1 - 2 * (y * y + z * z), 2 * (x * y - z * w), 2 * (x * z + y * w)], axis=1),
+        np.stack([2 * (x * y + z * w), 1 - 2 * (x * x + z * z), 2 * (y * z - x * w)], axis=1),
+        np.stack([2 * (x * z - y * w), 2 * (y * z + x * w), 1 - 2 * (x * x + y * y)], axis=1),
+    ], axis=1)
+
+
+def trial_rotations(radii: np.ndarray) -> np.ndarray:
+    """
+    Starting rotations between two principal-axes frames.
+
+    Axis signs are ambiguous when a geometry is (nearly) symmetric, so all
+    proper sign flips are tried; degenerate moments leave the axes free to
+    rotate, so additional orientations are sampled around (or over) them.
+    """
+    flips = [np.diag(s) for s in product((1.0, -1.0), repeat=3) if np.prod(s) > 0]
+    scale = max(radii[0] ** 2, 1e-12)
+    gaps = np.abs(np.diff(radii ** 2)) / scale
+    degenerate = gaps < DEGENERACY_TOLERANCE
+    if degenerate.all():
+        return np.concatenate([np.array(flips), _sampled_rotations(92)])
+    if degenerate.any():
+        # Rotations about the non-degenerate axis
+        axis = 2 if degenerate[0] else 0
+        u, v = [i for i in range(3) if i != axis]
+        rotations = []
+        for angle in np.arange(0.0, 2 * np.pi, np.pi / 12):
+            r = np.eye(3)
+            r[u, u] = r[v, v] = np.cos(angle)
+            r[u, v], r[v, u] = -np.sin(angle), np.sin(angle)
+            rotations.extend(r @ f for f in flips)
+        return np.array(rotations)
+    return np.array(flips)
+
+
+def aligned_rmsd(
+    query: CanonicalGeometry,
+    targets: np.ndarray,
+    iterations: int = 3,
+) -> np.ndarray:
+    """
+    Minimum RMSD over atom matchings and rotations for several targets.
+
+    Args:
+        query: Canonical query geometry
+        targets: Canonical coordinates (k, n, 3) with the query's element order
+        iterations: Matching / superposition refinements
+
+    Returns:
+        RMSD per target (inf where no consistent atom matching was found)
+    """
+    targets = np.asarray(targets, dtype=float)
+    k, n = targets.shape[:2]
+    if n == 0:
+        return np.zeros(k)
+    trials = trial_rotations(query.radii)
+    t = len(trials)
+    current = np.broadcast_to(np.einsum("tij,nj->tni", trials, query.coordinates), (k, t, n, 3)).copy()
+    groups = query.groups()
+
+    for step in range(iterations + 1):
+        matched = np.empty_like(current)
+        valid = np.ones((k, t), dtype=bool)
+        for group in groups:
+            m = group.stop - group.start
+            target_group = targets[:, None, group, :]
+            distance = ((current[:, :, group, None, :] - target_group[:, :, None, :, :]) ** 2).sum(axis=-1)
+            nearest = distance.argmin(axis=-1)
+            valid &= (np.sort(nearest, axis=-1) == np.arange(m)).all(axis=-1)
+            matched[:, :, group] = np.take_along_axis(
+                np.broadcast_to(target_group, (k, t, m, 3)), nearest[..., None], axis=2
+            )
+        if step == iterations:
+            break
+        # Kabsch: rotation R minimizing |current R - matched|
+        u, _, vt = np.linalg.svd(np.einsum("ktni,ktnj->ktij", current, matched))
+        d = np.where(np.linalg.det(u @ vt) < 0, -1.0, 1.0)
+        u[..., :, 2] *= d[..., None]
+        current = current @ (u @ vt)
+
+    rmsd = np.sqrt(((current - matched) ** 2).sum(axis=-1).mean(axis=-1))
+    rmsd[~valid] = np.inf
+    return rmsd.min(axis=1)
+
+
+class GeometryIndex:
+    """
+    Locality-sensitive index of canonical geometries.
+
+    Args:
+        bin_size: Width (Angstrom) of the radius-of-gyration bins; queries
+            probe every bin within their tolerance
+        tolerance: Default RMSD (Angstrom) for near duplicates
+    """
+
+    def __init__(self, bin_size: float = 0.05, tolerance: float = NEAR_DUPLICATE_RMSD):
+        self.bin_size = bin_size
+        self.tolerance = tolerance
+        self._entries: Dict[str, Tuple[Tuple, CanonicalGeometry]] = {}
+        self._buckets: Dict[Tuple, List[str]] = {}
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._entries
+
+    def _prefix(self, canonical: CanonicalGeometry, charge: int, multiplicity: int) -> Tuple:
+        return (canonical.formula, charge, multiplicity)
+
+    def _bins(self, radii: np.ndarray) -> Tuple[int, ...]:
+        return tuple(np.floor(radii / self.bin_size).astype(int).tolist())
+
+    def add(self, key: str, geometry: Geometry, charge: int = 0, multiplicity: int = 1) -> CanonicalGeometry:
+        """Add or replace a geometry."""
+        self.remove(key)
+        canonical = canonicalize(geometry)
+        bucket = self._prefix(canonical, charge, multiplicity) + self._bins(canonical.radii)
+        self._entries[key] = (bucket, canonical)
+        self._buckets.setdefault(bucket, []).append(key)
+        return canonical
+
+    def remove(self, key: str) -> bool:
+        entry = self._entries.pop(key, None)
+        if entry is None:
+            return False
+        bucket = entry[0]
+        self._buckets[bucket].remove(key)
+        if not self._buckets[bucket]:
+            del self._buckets[bucket]
+        return True
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._buckets.clear()
+
+    def query(
+        self,
+        geometry: Geometry,
+        charge: int = 0,
+        multiplicity: int = 1,
+        tolerance: Optional[float] = None,
+    ) -> List[Tuple[str, float]]:
+        """
+        Stored geometries within tolerance of the query.
+
+        Returns:
+            (key, RMSD in Angstrom) pairs, closest first
+        """
+        tolerance = self.tolerance if tolerance is None else tolerance
+        canonical = canonicalize(geometry)
+        prefix = self._prefix(canonical, charge, multiplicity)
+
+        # Every bin within the tolerance of each radius
+        ranges = [
+            range(int(np.floor((r - tolerance) / self.bin_size)), int(np.floor((r + tolerance) / self.bin_size)) + 1)
+            for r in canonical.radii
+        ]
+        keys = [key for bins in product(*ranges) for key in self._buckets.get(prefix + bins, [])]
+        if not keys:
+            return []
+
+        logger.debug(f"{len(keys)} candidate geometries for {canonical.formula}")
+        targets = np.stack([self._entries[key][1].coordinates for key in keys])
+        rmsd = aligned_rmsd(canonical, targets)
+        order = np.argsort(rmsd, kind="stable")
+        return [(keys[i], float(rmsd[i])) for i in order if rmsd[i] <= tolerance]
+
+    def find(
+        self,
+        geometry: Geometry,
+        charge: int = 0,
+        multiplicity: int = 1,
+        tolerance: Optional[float] = None,
+    ) -> Optional[str]:
+        """Key of the closest stored geometry within tolerance, or None."""
+        matches = self.query(geometry, charge, multiplicity, tolerance)
+        return matches[0][0] if matches else None
@@ -3,6 +3,11 @@ Molecular Structure Caching for Psi4 MCP Server.
 
 Provides specialized caching for molecular structures,
 including geometry hashing and fingerprint-based lookup.
+
+Lookups by geometry fall back from the exact hash to a GeometryIndex, so
+the same molecule with reordered atoms or a different orientation still
+hits the cache; a looser tolerance (e.g. NEAR_DUPLICATE_RMSD) also
+accepts small coordinate noise.
 """
 
 from dataclasses import dataclass, field
@@ -11,6 +16,13 @@ from typing import Any, Dict, List, Optional, Tuple
 import hashlib
 import math
 
+from psi4_mcp.utils.caching.geometry_index import GeometryIndex
+
+
+# Default RMSD (Angstrom) for geometry lookups, as strict as matching
+# every coordinate to 1e-6
+MATCH_TOLERANCE = 1e-6
+
 
 @dataclass
 class MolecularCacheEntry:
@@ -51,7 +63,8 @@ class MolecularCache:
     Specialized cache for molecular structures.
     
     Provides fast lookup of molecules by geometry hash,
-    with support for fuzzy matching based on coordinate tolerance.
+    with support for fuzzy matching based on coordinate tolerance
+    (permutation- and orientation-invariant RMSD).
     """
     
     def __init__(self, max_entries: int = 1000):
@@ -64,6 +77,7 @@ class MolecularCache:
         self.max_entries = max_entries
         self._cache: Dict[str, MolecularCacheEntry] = {}
         self._formula_index: Dict[str, List[str]] = {}  # formula -> [hashes]
+        self._geometry_index = GeometryIndex()
     
     def get(self, molecule_hash: str) -> Optional[MolecularCacheEntry]:
         """
@@ -82,7 +96,7 @@ class MolecularCache:
         geometry: List[Tuple[str, float, float, float]],
         charge: int = 0,
         multiplicity: int = 1,
-        tolerance: float = 1e-6,
+        tolerance: float = MATCH_TOLERANCE,
     ) -> Optional[MolecularCacheEntry]:
         """
         Get molecule by geometry with fuzzy matching.
@@ -91,7 +105,8 @@ class MolecularCache:
             geometry: List of (element, x, y, z) tuples
             charge: Molecular charge
             multiplicity: Spin multiplicity
-            tolerance: Coordinate tolerance for matching
+            tolerance: Maximum RMSD (Angstrom) after matching atoms and
+                superimposing the geometries
             
         Returns:
             Matching cached entry or None
@@ -102,17 +117,9 @@ class MolecularCache:
         if exact_match:
             return exact_match
         
-        # Try formula-based lookup with geometry comparison
-        formula = _compute_molecular_formula(geometry)
-        candidate_hashes = self._formula_index.get(formula, [])
-        
-        for candidate_hash in candidate_hashes:
-            entry = self._cache.get(candidate_hash)
-            if entry and entry.charge == charge and entry.multiplicity == multiplicity:
-                if entry.matches_geometry(geometry, tolerance):
-                    return entry
-        
-        return None
+        # Near duplicates: reordered, moved or slightly perturbed
+        match = self._geometry_index.find(geometry, charge, multiplicity, tolerance)
+        return self._cache.get(match) if match else None
     
     def set(
         self,
@@ -133,11 +140,12 @@ class MolecularCache:
         Returns:
             Created cache entry
         """
+        mol_hash = compute_molecule_hash(geometry, charge, multiplicity)
+        
         # Evict if necessary
-        if len(self._cache) >= self.max_entries:
+        if mol_hash not in self._cache and len(self._cache) >= self.max_entries:
             self._evict_oldest()
         
-        mol_hash = compute_molecule_hash(geometry, charge, multiplicity)
         formula = _compute_molecular_formula(geometry)
         
         entry = MolecularCacheEntry(
@@ -151,6 +159,7 @@ class MolecularCache:
         )
         
         self._cache[mol_hash] = entry
+        self._geometry_index.add(mol_hash, geometry, charge, multiplicity)
         
         # Update formula index
         if formula not in self._formula_index:
@@ -184,12 +193,14 @@ class MolecularCache:
                 del self._formula_index[formula]
         
         del self._cache[molecule_hash]
+        self._geometry_index.remove(molecule_hash)
         return True
     
     def clear(self) -> None:
         """Clear all cached molecules."""
         self._cache.clear()
         self._formula_index.clear()
+        self._geometry_index.clear()
     
     def get_by_formula(self, formula: str) -> List[MolecularCacheEntry]:
         """
@@ -272,7 +283,7 @@ def get_cached_molecule(
     geometry: List[Tuple[str, float, float, float]],
     charge: int = 0,
     multiplicity: int = 1,
-    tolerance: float = 1e-6,
+    tolerance: float = MATCH_TOLERANCE,
 ) -> Optional[MolecularCacheEntry]:
     """
     Get a cached molecule by geometry.
@@ -281,7 +292,7 @@ def get_cached_molecule(
         geometry: List of (element, x, y, z) tuples
         charge: Molecular charge
         multiplicity: Spin multiplicity
-        tolerance: Coordinate tolerance
+        tolerance: Maximum RMSD (Angstrom) for near duplicates
         
     Returns:
         Cached entry or None
@@ -313,10 +324,7 @@ def compute_molecule_hash(
     """
     # Sort atoms for consistent ordering
     # Use element then coordinates for deterministic sort
-    sorted_geom = sorted(
-        geometry,
-        key=lambda a: (a[0], round(a[1], precision), round(a[2], precision), round(a[3], precision))
-    )
+    sorted_geom = sorted(geometry, key=lambda a: _atom_sort_key(a, precision))
     
     # Build hash string
     parts = [f"{charge}_{multiplicity}"]
@@ -327,6 +335,32 @@ def compute_molecule_hash(
     return hashlib.md5(hash_string.encode()).hexdigest()
 
 
+def atom_order_hash(
+    geometry: List[Tuple[str, float, float, float]],
+    precision: int = 6,
+) -> str:
+    """
+    Compute a hash of the atom order of a geometry.
+    
+    compute_molecule_hash sorts the atoms, so the same molecule written
+    in another atom order has the same hash. Results stored per atom
+    (charges, shieldings) add this hash to their cache key.
+    
+    Args:
+        geometry: List of (element, x, y, z) tuples
+        precision: Decimal places to use for coordinates
+        
+    Returns:
+        MD5 hash of the input positions of the sorted atoms
+    """
+    order = sorted(range(len(geometry)), key=lambda i: _atom_sort_key(geometry[i], precision))
+    return hashlib.md5(",".join(map(str, order)).encode()).hexdigest()
+
+
+def _atom_sort_key(atom: Tuple[str, float, float, float], precision: int) -> Tuple:
+    return (atom[0], round(atom[1], precision), round(atom[2], precision), round(atom[3], precision))
+
+
 def _compute_molecular_formula(
     geometry: List[Tuple[str, float, float, float]],
 ) -> str:
@@ -3,9 +3,14 @@ Calculation Results Caching for Psi4 MCP Server.
 
 Provides specialized caching for quantum chemistry calculation
 results, with support for method/basis/geometry-based lookup.
+
+Cached molecules are also registered in the molecular cache, so results
+that do not depend on atom order or orientation (energies) can be found
+for the same molecule given with reordered atoms, rotated or with small
+coordinate noise.
 """
 
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime
 from enum import Enum
 from typing import Any, Dict, List, Optional, Tuple
@@ -378,6 +383,7 @@ def cache_calculation_result(
     reference: str = "rhf",
     options: Optional[Dict[str, Any]] = None,
     computation_time: float = 0.0,
+    per_atom: bool = False,
 ) -> ResultsCacheEntry:
     """
     Cache a calculation result.
@@ -393,11 +399,18 @@ def cache_calculation_result(
         reference: Reference type
         options: Calculation options
         computation_time: Time taken
+        per_atom: The result holds per-atom values in geometry order; the
+            key then includes the atom order
         
     Returns:
         Cache entry
     """
+    from psi4_mcp.utils.caching.molecular import atom_order_hash, cache_molecule
+    
     cache = get_results_cache()
+    cache_molecule(geometry, charge, multiplicity)
+    if per_atom:
+        options = dict(options or {}, atom_order=atom_order_hash(geometry))
     key = CalculationKey.create(
         calculation_type=calculation_type,
         geometry=geometry,
@@ -420,6 +433,8 @@ def get_cached_result(
     basis: str,
     reference: str = "rhf",
     options: Optional[Dict[str, Any]] = None,
+    near_duplicates: bool = False,
+    per_atom: bool = False,
 ) -> Optional[Dict[str, Any]]:
     """
     Get a cached calculation result.
@@ -433,11 +448,23 @@ def get_cached_result(
         basis: Basis set
         reference: Reference type
         options: Calculation options
+        near_duplicates: Also accept a result cached for the same molecule
+            with other atom order, orientation or coordinates within
+            NEAR_DUPLICATE_RMSD; only for results that do not depend on
+            these (energies)
+        per_atom: Look up a result cached with per_atom=True, i.e. with
+            per-atom values for this atom order (no near duplicates)
         
     Returns:
         Cached result dictionary or None
     """
+    from psi4_mcp.utils.caching.geometry_index import NEAR_DUPLICATE_RMSD
+    from psi4_mcp.utils.caching.molecular import atom_order_hash, get_cached_molecule
+    
     cache = get_results_cache()
+    if per_atom:
+        options = dict(options or {}, atom_order=atom_order_hash(geometry))
+        near_duplicates = False
     key = CalculationKey.create(
         calculation_type=calculation_type,
         geometry=geometry,
@@ -449,6 +476,10 @@ def get_cached_result(
         options=options,
     )
     entry = cache.get(key)
+    if entry is None and near_duplicates:
+        match = get_cached_molecule(geometry, charge, multiplicity, tolerance=NEAR_DUPLICATE_RMSD)
+        if match is not None and match.molecule_hash != key.molecule_hash:
+            entry = cache.get(replace(key, molecule_hash=match.molecule_hash))
     if entry:
         return entry.result
     return None
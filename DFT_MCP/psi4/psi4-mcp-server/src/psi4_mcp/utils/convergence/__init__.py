@@ -49,6 +49,13 @@ from psi4_mcp.utils.convergence.strategies import (
     get_strategy_sequence,
 )
 
+from psi4_mcp.utils.convergence.restart import (
+    RestartCheckpoint,
+    capture_convergence_failure,
+    psi4_options_applied,
+    release_restart_files,
+)
+
 from psi4_mcp.utils.convergence.tddft import (
     TDDFTConvergenceHelper,
     TDDFTConvergenceSettings,
@@ -86,6 +93,12 @@ __all__ = [
     "apply_convergence_strategy",
     "get_strategy_sequence",
     
+    # Restart
+    "RestartCheckpoint",
+    "capture_convergence_failure",
+    "psi4_options_applied",
+    "release_restart_files",
+    
     # TDDFT
     "TDDFTConvergenceHelper",
     "TDDFTConvergenceSettings",
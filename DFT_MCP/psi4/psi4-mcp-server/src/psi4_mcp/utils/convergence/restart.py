@@ -0,0 +1,234 @@
+"""
+Restart Checkpoints for Psi4 MCP Server.
+
+Captures the state of a calculation that failed to converge so a retry
+can continue from it instead of starting over:
+
+- SCF: the last orbitals of the non-converged wavefunction are written to
+  Psi4's orbital file (180) and retained, and the retry uses GUESS READ.
+- Geometry optimization: the last coordinates reached replace those of the
+  input geometry for the retry; the rest of the input (fragments, charge
+  and multiplicity, directives, ghost atoms) is kept as given.
+
+Psi4 attaches the wavefunction to its convergence exceptions when they are
+raised; tools usually turn exceptions into error results, so the state is
+recorded as the exception is created.
+"""
+
+import logging
+import re
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+
+logger = logging.getLogger(__name__)
+
+PSI4_ORBITAL_FILE = 180
+BOHR_TO_ANGSTROM = 0.52917721067
+
+# Values of Psi4's "units" directive meaning bohr
+BOHR_UNITS = ("bohr", "au", "a.u.")
+
+# Dummy atom labels (X, X1, X_a; not atoms of the Psi4 molecule)
+DUMMY_LABEL = re.compile(r"^x(\d+|_\w+)?$", re.IGNORECASE)
+
+_local = threading.local()
+_hooks_installed = False
+_hooks_lock = threading.Lock()
+
+
+@dataclass
+class RestartCheckpoint:
+    """Last known state of a calculation that failed to converge."""
+    orbital_file: Optional[str] = None
+    scf_iterations: Optional[int] = None
+    coordinates: Optional[List[Tuple[float, float, float]]] = None
+    optimization_steps: Optional[int] = None
+
+    @property
+    def has_orbitals(self) -> bool:
+        return self.orbital_file is not None
+
+    @property
+    def has_geometry(self) -> bool:
+        return self.coordinates is not None
+
+    def restart_options(self) -> Dict[str, Any]:
+        """Psi4 options that make the next attempt start from this state."""
+        if self.has_orbitals:
+            return {"guess": "read"}
+        return {}
+
+    def record_scf(self, error: Any) -> None:
+        """Save the orbitals of a non-converged SCF."""
+        wfn = getattr(error, "wfn", None)
+        self.scf_iterations = getattr(error, "iteration", None)
+        if wfn is None:
+            return
+        try:
+            import psi4
+            filename = wfn.get_scratch_filename(PSI4_ORBITAL_FILE)
+            wfn.to_file(filename)
+            psi4.core.IOManager.shared_object().set_specific_retention(PSI4_ORBITAL_FILE, True)
+            self.orbital_file = filename
+        except Exception as e:
+            logger.debug(f"Could not save orbitals for restart: {e}")
+
+    def restart_geometry(self, geometry: str) -> Optional[str]:
+        """
+        The input geometry with the last coordinates reached.
+
+        Only the coordinates of Cartesian atom lines are rewritten (in the
+        input's units); other lines are kept verbatim.
+
+        Returns:
+            The updated geometry, or None if the input's atoms cannot be
+            matched to the saved coordinates (e.g. a Z-matrix)
+        """
+        if self.coordinates is None:
+            return None
+        units = re.search(r"^\s*units\s+(\S+)", geometry, re.IGNORECASE | re.MULTILINE)
+        scale = 1.0 if units and units.group(1).lower() in BOHR_UNITS else BOHR_TO_ANGSTROM
+
+        lines = geometry.split("\n")
+        atom_lines = [i for i, line in enumerate(lines) if _is_atom_line(line)]
+        if len(atom_lines) != len(self.coordinates):
+            logger.debug(
+                f"Restart geometry not applied: {len(atom_lines)} atom lines, "
+                f"{len(self.coordinates)} saved atoms"
+            )
+            return None
+        for i, xyz in zip(atom_lines, self.coordinates):
+            indent = lines[i][:len(lines[i]) - len(lines[i].lstrip())]
+            parts = lines[i].split()
+            coords = " ".join(f"{c * scale:.10f}" for c in xyz)
+            lines[i] = " ".join([f"{indent}{parts[0]}", coords] + parts[4:])
+        return "\n".join(lines)
+
+    def record_optimization(self, error: Any) -> None:
+        """Save the last coordinates (bohr) of a non-converged optimization."""
+        wfn = getattr(error, "wfn", None)
+        self.optimization_steps = getattr(error, "iteration", None)
+        if wfn is None:
+            return
+        try:
+            molecule = wfn.molecule()
+            self.coordinates = [
+                (molecule.x(i), molecule.y(i), molecule.z(i)) for i in range(molecule.natom())
+            ]
+        except Exception as e:
+            logger.debug(f"Could not save geometry for restart: {e}")
+
+
+def _is_number(token: str) -> bool:
+    try:
+        float(token)
+    except ValueError:
+        return False
+    return True
+
+
+def _is_atom_line(line: str) -> bool:
+    """Cartesian atom line (ghosts included, dummy atoms excluded)."""
+    parts = line.split()
+    return (
+        len(parts) >= 4
+        and not _is_number(parts[0])
+        and not DUMMY_LABEL.match(parts[0])
+        and all(_is_number(p) for p in parts[1:4])
+    )
+
+
+def _install_hooks() -> bool:
+    """Record Psi4 convergence exceptions into the active checkpoint."""
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return True
+        try:
+            from psi4.driver.p4util import exceptions as psi4_exceptions
+        except ImportError:
+            return False
+
+        def hook(cls, record):
+            original = cls.__init__
+
+            def __init__(self, *args, **kwargs):
+                original(self, *args, **kwargs)
+                checkpoint = getattr(_local, "checkpoint", None)
+                if checkpoint is not None:
+                    record(checkpoint, self)
+
+            cls.__init__ = __init__
+
+        hook(psi4_exceptions.SCFConvergenceError, RestartCheckpoint.record_scf)
+        hook(psi4_exceptions.OptimizationConvergenceError, RestartCheckpoint.record_optimization)
+        _hooks_installed = True
+        return True
+
+
+@contextmanager
+def capture_convergence_failure() -> Iterator[RestartCheckpoint]:
+    """
+    Record restart state of convergence failures raised in this block.
+
+    Yields:
+        RestartCheckpoint filled in if an SCF or optimization fails to converge
+    """
+    checkpoint = RestartCheckpoint()
+    if not _install_hooks():
+        yield checkpoint
+        return
+
+    previous = getattr(_local, "checkpoint", None)
+    _local.checkpoint = checkpoint
+    try:
+        yield checkpoint
+    finally:
+        _local.checkpoint = previous
+
+
+def release_restart_files() -> None:
+    """Stop retaining saved orbitals so the next clean() removes them."""
+    try:
+        import psi4
+        psi4.core.IOManager.shared_object().set_specific_retention(PSI4_ORBITAL_FILE, False)
+    except ImportError:
+        pass
+
+
+@contextmanager
+def psi4_options_applied(options: Dict[str, Any]) -> Iterator[None]:
+    """
+    Apply global Psi4 options for the duration of the block.
+
+    Previous values (and their "changed" state) are restored afterwards,
+    so retries do not leak recovery options into later calculations.
+    """
+    try:
+        import psi4
+    except ImportError:
+        yield
+        return
+
+    previous = {}
+    for key in options:
+        name = key.upper()
+        previous[name] = (
+            psi4.core.has_global_option_changed(name),
+            psi4.core.get_global_option(name),
+        )
+
+    psi4.set_options(options)
+    try:
+        yield
+    finally:
+        for name, (changed, value) in previous.items():
+            try:
+                psi4.core.set_global_option(name, value)
+                if not changed:
+                    psi4.core.revoke_global_option_changed(name)
+            except Exception as e:
+                logger.debug(f"Could not restore option {name}: {e}")
@@ -163,7 +163,7 @@ class LevelShiftStrategy(ConvergenceStrategy):
         """Get Psi4 level shift options."""
         return {
             "level_shift": self.level_shift,
-            "level_shift_convergence": self.level_shift_convergence,
+            "level_shift_cutoff": self.level_shift_convergence,
         }
     
     def get_description(self) -> str:
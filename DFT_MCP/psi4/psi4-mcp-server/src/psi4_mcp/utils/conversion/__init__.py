@@ -7,6 +7,7 @@ This package provides comprehensive conversion utilities for:
 - Geometry format conversions (XYZ, Z-matrix, Psi4, PDB)
 - Basis set name normalization and validation
 - Output format conversions (JSON, text, CSV, QCSchema)
+- Streaming multi-frame structure I/O (XYZ, PDB, mol2 trajectories)
 
 Example Usage:
     from psi4_mcp.utils.conversion import (
@@ -165,6 +166,29 @@ from psi4_mcp.utils.conversion.output import (
     format_with_uncertainty,
 )
 
+# Streaming structure I/O
+from psi4_mcp.utils.conversion.structures import (
+    # Data classes
+    Frame,
+    StructureReader,
+    
+    # Reading
+    detect_structure_format,
+    parse_frame_selection,
+    index_frames,
+    parse_frame,
+    read_frames,
+    
+    # Writing
+    format_frame,
+    iter_formatted,
+    write_frames,
+    
+    # Conversion
+    convert_structure_file,
+    convert_directory,
+)
+
 
 __all__ = [
     # Unit conversions
@@ -239,4 +263,18 @@ __all__ = [
     "format_scientific",
     "format_fixed",
     "format_with_uncertainty",
+    
+    # Streaming structure I/O
+    "Frame",
+    "StructureReader",
+    "detect_structure_format",
+    "parse_frame_selection",
+    "index_frames",
+    "parse_frame",
+    "read_frames",
+    "format_frame",
+    "iter_formatted",
+    "write_frames",
+    "convert_structure_file",
+    "convert_directory",
 ]
@@ -494,12 +494,12 @@ def parse_psi4_geometry(content: str) -> Optional[Geometry]:
             current_fragment += 1
             continue
         
-        # Check for options (key = value or single keywords)
-        if '=' in line or line.lower() in ('noreorient', 'nocom', 'symmetry'):
+        # Check for options (key = value, "units bohr", "symmetry c1", ...)
+        if '=' in line or line.lower().split()[0] in ('units', 'noreorient', 'nocom', 'symmetry'):
             lower_line = line.lower()
             
             if lower_line.startswith('units'):
-                if 'bohr' in lower_line or 'au' in lower_line:
+                if lower_line.replace('=', ' ').split()[-1] in ('bohr', 'au', 'a.u.'):
                     units = LengthUnitType.BOHR
                 else:
                     units = LengthUnitType.ANGSTROM
@@ -0,0 +1,539 @@
+"""
+Streaming Structure I/O.
+
+Multi-frame XYZ, PDB and mol2 files (MD snapshots, optimization and scan
+trajectories) are read without loading them into memory:
+
+- The file is memory-mapped and scanned once for frame boundaries; the
+  resulting byte-offset index gives random access to any frame.
+- Frames are parsed lazily, one at a time, by generator-based readers,
+  and written by generator-based writers as they arrive.
+- Whole directories are converted file by file in a process pool.
+
+Example Usage:
+    with StructureReader("traj.xyz") as reader:
+        print(len(reader), reader[-1].comment)
+        write_frames("traj.pdb", reader.iter_frames(slice(0, None, 10)), "pdb")
+"""
+
+import itertools
+import json
+import logging
+import mmap
+import multiprocessing
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+# Formats that can be streamed frame by frame
+READ_FORMATS = ("xyz", "pdb", "mol2")
+WRITE_FORMATS = ("xyz", "pdb", "mol2", "psi4", "json")
+
+STRUCTURE_EXTENSIONS = {
+    ".xyz": "xyz",
+    ".pdb": "pdb",
+    ".ent": "pdb",
+    ".mol2": "mol2",
+    ".dat": "psi4",
+    ".in": "psi4",
+    ".json": "json",
+}
+
+# Bytes scanned at a time when indexing line starts
+INDEX_CHUNK_SIZE = 1 << 25
+
+_PDB_FRAME_END = re.compile(rb"^(?:ENDMDL|END)[ \t\r]*$", re.MULTILINE)
+_PDB_ATOM = re.compile(rb"^(?:ATOM  |HETATM)", re.MULTILINE)
+_MOL2_MOLECULE = re.compile(rb"^[ \t]*@<TRIPOS>MOLECULE", re.MULTILINE)
+
+
+@dataclass
+class Frame:
+    """One structure of a trajectory; coordinates in Angstrom."""
+    elements: List[str]
+    coordinates: np.ndarray
+    comment: str = ""
+    charge: int = 0
+    multiplicity: int = 1
+
+    @property
+    def n_atoms(self) -> int:
+        return len(self.elements)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "elements": list(self.elements),
+            "coordinates": self.coordinates.tolist(),
+            "comment": self.comment,
+            "charge": self.charge,
+            "multiplicity": self.multiplicity,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "Frame":
+        return cls(
+            elements=list(data["elements"]),
+            coordinates=np.asarray(data["coordinates"], dtype=float).reshape(-1, 3),
+            comment=data.get("comment", ""),
+            charge=data.get("charge", 0),
+            multiplicity=data.get("multiplicity", 1),
+        )
+
+
+def detect_structure_format(path: Union[str, Path]) -> Optional[str]:
+    """Structure format from the file extension."""
+    return STRUCTURE_EXTENSIONS.get(Path(path).suffix.lower())
+
+
+def parse_frame_selection(selection: Optional[str]) -> Optional[slice]:
+    """
+    Parse a frame selection such as "10", "0:100", "::10" or "-1:".
+
+    A single index selects that frame only. Returns None for all frames.
+    """
+    if selection is None or not selection.strip():
+        return None
+    parts = selection.strip().split(":")
+    if len(parts) > 3:
+        raise ValueError(f"Invalid frame selection: {selection}")
+    try:
+        values = [int(part) if part.strip() else None for part in parts]
+    except ValueError:
+        raise ValueError(f"Invalid frame selection: {selection}") from None
+    if len(values) == 1:
+        index = values[0]
+        if index is None:
+            return None
+        return slice(index, index + 1 if index != -1 else None)
+    return slice(*values)
+
+
+# =============================================================================
+# FRAME INDEXING
+# =============================================================================
+
+def _line_starts(buffer: Any, chunk_size: int = INDEX_CHUNK_SIZE) -> Iterator[int]:
+    """Byte offsets of all lines of the buffer, found chunk by chunk with numpy."""
+    size = len(buffer)
+    if size == 0:
+        return
+    yield 0
+    for start in range(0, size, chunk_size):
+        # Slicing copies the chunk, so no buffer export keeps the mmap open
+        chunk = np.frombuffer(buffer[start:start + chunk_size], dtype=np.uint8)
+        for offset in (np.flatnonzero(chunk == 10) + (start + 1)).tolist():
+            if offset < size:
+                yield offset
+
+
+def _index_xyz(buffer: Any) -> List[List[int]]:
+    """XYZ frames: atom count line, comment line, then that many atom lines."""
+    size = len(buffer)
+    spans: List[List[int]] = []
+    starts = _line_starts(buffer)
+    for line_start in starts:
+        line_end = buffer.find(b"\n", line_start)
+        header = buffer[line_start:line_end if line_end >= 0 else size].strip()
+        if not header:
+            continue
+        try:
+            n_atoms = int(header)
+        except ValueError:
+            raise ValueError(f"Malformed XYZ atom count at byte {line_start}: {header[:40]!r}") from None
+        if spans:
+            spans[-1][1] = line_start
+        spans.append([line_start, size])
+        # Skip the comment and atom lines
+        next(itertools.islice(starts, n_atoms + 1, n_atoms + 1), None)
+    return spans
+
+
+def _index_pdb(buffer: Any) -> List[List[int]]:
+    """PDB frames: MODEL/ENDMDL blocks or END-separated structures."""
+    spans: List[List[int]] = []
+    start = 0
+    boundaries = [m.end() for m in _PDB_FRAME_END.finditer(buffer)] + [len(buffer)]
+    for end in boundaries:
+        # Skip segments without atoms (header records, a trailing END)
+        if end > start and _PDB_ATOM.search(buffer, start, end):
+            spans.append([start, end])
+        start = end
+    return spans
+
+
+def _index_mol2(buffer: Any) -> List[List[int]]:
+    """mol2 frames: one per @<TRIPOS>MOLECULE record."""
+    starts = [m.start() for m in _MOL2_MOLECULE.finditer(buffer)]
+    return [[s, e] for s, e in zip(starts, starts[1:] + [len(buffer)])]
+
+
+_INDEXERS = {"xyz": _index_xyz, "pdb": _index_pdb, "mol2": _index_mol2}
+
+
+def index_frames(buffer: Any, format: str) -> np.ndarray:
+    """
+    Byte-offset index of the frames in a buffer.
+
+    Returns:
+        Array of shape (n_frames, 2) with the [start, end) offset of each frame
+    """
+    spans = _INDEXERS[format](buffer)
+    return np.array(spans, dtype=np.int64).reshape(-1, 2)
+
+
+# =============================================================================
+# FRAME PARSING
+# =============================================================================
+
+def _parse_xyz_frame(text: str) -> Frame:
+    lines = text.splitlines()
+    n_atoms = int(lines[0])
+    comment = lines[1].strip() if len(lines) > 1 else ""
+    rows = [line.split() for line in lines[2:2 + n_atoms]]
+    rows = [row for row in rows if len(row) >= 4]
+    if len(rows) != n_atoms:
+        raise ValueError(f"XYZ frame declares {n_atoms} atoms but has {len(rows)}")
+    coordinates = np.array([row[1:4] for row in rows], dtype=float).reshape(-1, 3)
+    return Frame([row[0] for row in rows], coordinates, comment)
+
+
+def _parse_pdb_frame(text: str) -> Frame:
+    elements = []
+    coordinates = []
+    comment = ""
+    for line in text.splitlines():
+        if line.startswith(("ATOM", "HETATM")):
+            if len(line) < 54:
+                continue
+            try:
+                coordinates.append((float(line[30:38]), float(line[38:46]), float(line[46:54])))
+            except ValueError:
+                continue
+            # Element from columns 77-78, else from the atom name
+            element = line[76:78].strip() if len(line) >= 78 else ""
+            elements.append(element or line[12:16].strip()[0])
+        elif line.startswith(("TITLE", "COMPND")) and not comment:
+            comment = line[10:].strip()
+        elif line.startswith("MODEL") and not comment:
+            comment = f"Model {line[10:14].strip()}"
+    return Frame(elements, np.array(coordinates, dtype=float).reshape(-1, 3), comment)
+
+
+def _parse_mol2_frame(text: str) -> Frame:
+    elements = []
+    coordinates = []
+    lines = text.splitlines()
+    comment = lines[1].strip() if len(lines) > 1 else ""
+    in_atom_section = False
+    for line in lines:
+        if "@<TRIPOS>ATOM" in line:
+            in_atom_section = True
+            continue
+        elif line.lstrip().startswith("@<TRIPOS>"):
+            in_atom_section = False
+            continue
+        if in_atom_section:
+            parts = line.split()
+            if len(parts) >= 6:
+                try:
+                    coordinates.append((float(parts[2]), float(parts[3]), float(parts[4])))
+                except ValueError:
+                    continue
+                # Remove atom type suffix
+                elements.append(parts[5].split(".")[0])
+    return Frame(elements, np.array(coordinates, dtype=float).reshape(-1, 3), comment)
+
+
+_PARSERS = {"xyz": _parse_xyz_frame, "pdb": _parse_pdb_frame, "mol2": _parse_mol2_frame}
+
+
+def parse_frame(data: Union[bytes, str], format: str) -> Frame:
+    """Parse the text of one frame."""
+    if isinstance(data, bytes):
+        data = data.decode("utf-8", errors="replace")
+    return _PARSERS[format](data)
+
+
+# =============================================================================
+# READER
+# =============================================================================
+
+class StructureReader:
+    """
+    Memory-mapped multi-frame structure file with random access.
+
+    Args:
+        path: XYZ, PDB or mol2 file
+        format: File format (detected from the extension if not given)
+        index: Frame index from a previous reader of the same file
+    """
+
+    def __init__(self, path: Union[str, Path], format: Optional[str] = None,
+                 index: Optional[np.ndarray] = None):
+        self.path = Path(path)
+        self.format = (format or detect_structure_format(self.path) or "").lower()
+        if self.format not in READ_FORMATS:
+            raise ValueError(f"Cannot stream format '{self.format or self.path.suffix}'; "
+                             f"supported: {', '.join(READ_FORMATS)}")
+        self._file = open(self.path, "rb")
+        size = os.fstat(self._file.fileno()).st_size
+        self._buffer: Any = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if size else b""
+        self._index = index
+
+    @property
+    def index(self) -> np.ndarray:
+        """[start, end) byte offsets of all frames, built on first use."""
+        if self._index is None:
+            self._index = index_frames(self._buffer, self.format)
+            logger.debug(f"Indexed {len(self._index)} frames in {self.path}")
+        return self._index
+
+    def __len__(self) -> int:
+        return len(self.index)
+
+    def __getitem__(self, i: int) -> Frame:
+        n_frames = len(self)
+        if i < 0:
+            i += n_frames
+        if not 0 <= i < n_frames:
+            raise IndexError(f"Frame {i} out of range ({n_frames} frames)")
+        start, end = self.index[i]
+        return parse_frame(self._buffer[start:end], self.format)
+
+    def __iter__(self) -> Iterator[Frame]:
+        return self.iter_frames()
+
+    def iter_frames(self, frames: Optional[slice] = None) -> Iterator[Frame]:
+        """Parse frames one at a time, optionally a slice of them."""
+        indices = range(len(self))
+        if frames is not None:
+            indices = indices[frames]
+        for i in indices:
+            yield self[i]
+
+    def close(self) -> None:
+        if isinstance(self._buffer, mmap.mmap):
+            self._buffer.close()
+        self._file.close()
+
+    def __enter__(self) -> "StructureReader":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def read_frames(path: Union[str, Path], format: Optional[str] = None,
+                frames: Optional[slice] = None) -> Iterator[Frame]:
+    """Stream the frames of a structure file."""
+    with StructureReader(path, format) as reader:
+        yield from reader.iter_frames(frames)
+
+
+# =============================================================================
+# WRITERS
+# =============================================================================
+
+def _format_xyz(frame: Frame, number: int) -> str:
+    lines = [str(frame.n_atoms), frame.comment.replace("\n", " ")]
+    for elem, (x, y, z) in zip(frame.elements, frame.coordinates.tolist()):
+        lines.append(f"{elem:2s} {x:15.10f} {y:15.10f} {z:15.10f}")
+    return "\n".join(lines) + "\n"
+
+
+def _format_pdb(frame: Frame, number: int) -> str:
+    lines = [f"MODEL     {number:4d}"]
+    for serial, (elem, (x, y, z)) in enumerate(zip(frame.elements, frame.coordinates.tolist()), 1):
+        name = f" {elem:<3s}" if len(elem) == 1 else f"{elem:<4s}"
+        lines.append(
+            f"HETATM{serial % 100000:5d} {name} MOL A   1    "
+            f"{x:8.3f}{y:8.3f}{z:8.3f}{1.0:6.2f}{0.0:6.2f}          {elem.upper():>2s}"
+        )
+    lines.append("ENDMDL")
+    return "\n".join(lines) + "\n"
+
+
+def _format_mol2(frame: Frame, number: int) -> str:
+    lines = [
+        "@<TRIPOS>MOLECULE",
+        frame.comment.replace("\n", " ") or f"frame_{number}",
+        f"{frame.n_atoms:5d} 0 1 0 0",
+        "SMALL",
+        "NO_CHARGES",
+        "",
+        "@<TRIPOS>ATOM",
+    ]
+    for serial, (elem, (x, y, z)) in enumerate(zip(frame.elements, frame.coordinates.tolist()), 1):
+        lines.append(
+            f"{serial:7d} {elem + str(serial):<8s}{x:10.4f}{y:10.4f}{z:10.4f} {elem:<5s}  1 MOL  0.0000"
+        )
+    return "\n".join(lines) + "\n"
+
+
+def _format_psi4(frame: Frame, number: int) -> str:
+    # Frame numbers name the molecules of multi-frame output
+    header = f"molecule frame_{number} {{" if number else "molecule {"
+    lines = [header, f"  {frame.charge} {frame.multiplicity}"]
+    for elem, (x, y, z) in zip(frame.elements, frame.coordinates.tolist()):
+        lines.append(f"  {elem:2s} {x:15.10f} {y:15.10f} {z:15.10f}")
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+_FORMATTERS = {"xyz": _format_xyz, "pdb": _format_pdb, "mol2": _format_mol2, "psi4": _format_psi4}
+
+
+def format_frame(frame: Frame, format: str, number: int = 1) -> str:
+    """Text of one frame in the given format (number is 1-based)."""
+    if format == "json":
+        return json.dumps(frame.to_dict(), indent=2)
+    return _FORMATTERS[format](frame, number)
+
+
+def iter_formatted(frames: Iterable[Frame], format: str) -> Iterator[str]:
+    """
+    Format frames one at a time.
+
+    A single frame gives the same output as format_frame; multiple frames
+    become a JSON array, named Psi4 molecules, PDB models, and so on.
+    """
+    if format not in WRITE_FORMATS:
+        raise ValueError(f"Cannot write format '{format}'; supported: {', '.join(WRITE_FORMATS)}")
+    frames = iter(frames)
+    first = next(frames, None)
+    if first is None:
+        return
+    second = next(frames, None)
+    if second is None:
+        yield format_frame(first, format, 0 if format == "psi4" else 1)
+        if format == "pdb":
+            yield "END\n"
+        return
+
+    if format == "json":
+        yield "["
+    for number, frame in enumerate(itertools.chain((first, second), frames), 1):
+        if format == "json":
+            yield ("," if number > 1 else "") + "\n" + json.dumps(frame.to_dict())
+        else:
+            yield format_frame(frame, format, number)
+            if format == "psi4":
+                yield "\n"
+    if format == "json":
+        yield "\n]\n"
+    elif format == "pdb":
+        yield "END\n"
+
+
+def write_frames(path: Union[str, Path], frames: Iterable[Frame], format: Optional[str] = None) -> int:
+    """
+    Stream frames to a file.
+
+    Returns:
+        Number of frames written
+    """
+    format = (format or detect_structure_format(path) or "").lower()
+    count = 0
+
+    def counted() -> Iterator[Frame]:
+        nonlocal count
+        for frame in frames:
+            count += 1
+            yield frame
+
+    with open(path, "w") as f:
+        f.writelines(iter_formatted(counted(), format))
+    return count
+
+
+# =============================================================================
+# FILE AND DIRECTORY CONVERSION
+# =============================================================================
+
+def convert_structure_file(
+    input_path: Union[str, Path],
+    output_path: Union[str, Path],
+    from_format: Optional[str] = None,
+    to_format: Optional[str] = None,
+    frames: Optional[slice] = None,
+) -> int:
+    """
+    Convert a (multi-frame) structure file, streaming frame by frame.
+
+    Returns:
+        Number of frames written
+    """
+    to_format = to_format or detect_structure_format(output_path)
+    with StructureReader(input_path, from_format) as reader:
+        return write_frames(output_path, reader.iter_frames(frames), to_format)
+
+
+def _convert_in_worker(task: Dict[str, Any]) -> Dict[str, Any]:
+    try:
+        n_frames = convert_structure_file(
+            task["input"], task["output"], task["from_format"], task["to_format"], task["frames"],
+        )
+        return {"input": task["input"], "output": task["output"], "n_frames": n_frames}
+    except Exception as e:
+        return {"input": task["input"], "error": str(e)}
+
+
+def convert_directory(
+    input_dir: Union[str, Path],
+    output_dir: Union[str, Path],
+    to_format: str,
+    from_format: Optional[str] = None,
+    frames: Optional[slice] = None,
+    max_workers: Optional[int] = None,
+) -> List[Dict[str, Any]]:
+    """
+    Convert every structure file of a directory, one file per worker process.
+
+    Args:
+        input_dir: Directory with the input files
+        output_dir: Directory for the converted files (created if missing)
+        to_format: Output format
+        from_format: Only convert files of this format (default: all readable formats)
+        frames: Frame selection applied to every file
+        max_workers: Worker processes (default: CPU count)
+
+    Returns:
+        Per file, {"input", "output", "n_frames"} or {"input", "error"}
+    """
+    output_dir = Path(output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    extension = ".dat" if to_format == "psi4" else f".{to_format}"
+    tasks = []
+    for path in sorted(Path(input_dir).iterdir()):
+        file_format = detect_structure_format(path)
+        if not path.is_file() or file_format not in READ_FORMATS:
+            continue
+        if from_format and file_format != from_format:
+            continue
+        tasks.append({
+            "input": str(path), "output": str(output_dir / (path.stem + extension)),
+            "from_format": file_format, "to_format": to_format, "frames": frames,
+        })
+
+    max_workers = min(max_workers or os.cpu_count() or 1, len(tasks))
+    if max_workers <= 1:
+        return [_convert_in_worker(task) for task in tasks]
+
+    results = []
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=max_workers, mp_context=context) as pool:
+        futures = {pool.submit(_convert_in_worker, task): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                results.append({"input": futures[future]["input"], "error": f"Worker failed: {e}"})
+    return sorted(results, key=lambda result: result["input"])
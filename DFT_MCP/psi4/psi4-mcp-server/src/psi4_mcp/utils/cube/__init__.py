@@ -0,0 +1,30 @@
+"""
+Cube Grid Utilities for Psi4 MCP Server.
+
+Evaluation of densities, orbitals and electrostatic potentials on cubic
+grids, volume arithmetic and statistics, and volume storage (binary
+volume files and Gaussian cube export).
+"""
+
+from psi4_mcp.utils.cube.volume import (
+    VOLUME_EXTENSION,
+    CubeGrid,
+    VolumeStatistics,
+    Volume,
+    volume_statistics,
+    read_volume_header,
+    combine_volumes,
+)
+from psi4_mcp.utils.cube.engine import VOLUME_PROPERTIES, VolumeEngine
+
+__all__ = [
+    "VOLUME_EXTENSION",
+    "CubeGrid",
+    "VolumeStatistics",
+    "Volume",
+    "volume_statistics",
+    "read_volume_header",
+    "combine_volumes",
+    "VOLUME_PROPERTIES",
+    "VolumeEngine",
+]
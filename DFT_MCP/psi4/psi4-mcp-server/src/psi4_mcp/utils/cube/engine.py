@@ -0,0 +1,210 @@
+"""
+Grid Evaluation Engine.
+
+Evaluates densities and orbitals of a Psi4 wavefunction on a CubeGrid
+in-process, replacing cubeprop's text files:
+
+- The grid is split into compact bricks; for each brick the AO values
+  (only the basis functions that reach the brick) are computed once with
+  Psi4's BasisFunctions.
+- All requested quantities are contracted from the same AO block:
+  densities as rho = sum_mn phi_m D_mn phi_n, orbitals as phi @ C for all
+  requested orbitals at once.
+- The electrostatic potential uses Psi4's ESPPropCalc on the grid points.
+
+Spin densities and density differences follow from Volume arithmetic, so
+they never need another SCF.
+"""
+
+import logging
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from psi4_mcp.utils.cube.volume import CubeGrid, Volume
+from psi4_mcp.utils.helpers.constants import BOHR_TO_ANGSTROM
+
+
+logger = logging.getLogger(__name__)
+
+VOLUME_PROPERTIES = ("density", "alpha_density", "beta_density", "spin_density", "esp",
+                     "homo", "lumo", "orbital")
+
+# Points per ESP integral batch
+ESP_BATCH_SIZE = 20000
+
+
+class VolumeEngine:
+    """
+    Evaluates volumes of one wavefunction on one grid.
+
+    Args:
+        wfn: Psi4 wavefunction (SCF, or loaded with Wavefunction.from_file)
+        grid: Grid to evaluate on (default: 0.2 bohr around the molecule)
+        block_size: Edge of the grid bricks, in points
+        basis_tolerance: Basis functions below this value in a brick are skipped
+    """
+
+    def __init__(self, wfn: Any, grid: Optional[CubeGrid] = None,
+                 block_size: int = 16, basis_tolerance: float = 1e-12):
+        self.wfn = wfn
+        self.molecule = wfn.molecule()
+        self.coordinates = np.asarray(self.molecule.geometry().np, dtype=float)
+        self.atomic_numbers = [int(self.molecule.Z(i)) for i in range(self.molecule.natom())]
+        self.grid = grid or CubeGrid.around(self.coordinates, spacing=0.2)
+        self.block_size = block_size
+        self.basis_tolerance = basis_tolerance
+
+    # ----- orbitals and densities -----
+
+    def orbital_energies(self, spin: str = "alpha") -> np.ndarray:
+        """Orbital energies in energy order (C1, AO basis)."""
+        eps = self.wfn.epsilon_a_subset("AO", "ALL") if spin == "alpha" else self.wfn.epsilon_b_subset("AO", "ALL")
+        return np.asarray(eps.np, dtype=float)
+
+    def frontier_index(self, which: str, spin: str = "alpha") -> int:
+        """0-based index of the HOMO or LUMO in energy order."""
+        n_occ = self.wfn.nalpha() if spin == "alpha" else self.wfn.nbeta()
+        return n_occ - 1 if which == "homo" else n_occ
+
+    def _coefficients(self, spin: str) -> np.ndarray:
+        c = self.wfn.Ca_subset("AO", "ALL") if spin == "alpha" else self.wfn.Cb_subset("AO", "ALL")
+        return np.asarray(c.np, dtype=float)
+
+    def _density_matrix(self, spin: str) -> np.ndarray:
+        d = self.wfn.Da_subset("AO") if spin == "alpha" else self.wfn.Db_subset("AO")
+        return np.asarray(d.np, dtype=float)
+
+    def _volume(self, values: np.ndarray, label: str) -> Volume:
+        return Volume(self.grid, values, label, self.atomic_numbers, self.coordinates)
+
+    def evaluate(
+        self,
+        densities: Optional[Dict[str, np.ndarray]] = None,
+        orbitals: Optional[Dict[str, np.ndarray]] = None,
+    ) -> Dict[str, Volume]:
+        """
+        Evaluate densities and orbitals in one pass over the grid.
+
+        Args:
+            densities: Label -> AO density matrix (nbf, nbf)
+            orbitals: Label -> AO coefficient vector (nbf,)
+
+        Returns:
+            Label -> Volume
+        """
+        import psi4
+
+        densities = densities or {}
+        orbitals = orbitals or {}
+        basis = self.wfn.basisset()
+        nbf = basis.nbf()
+        max_points = self.block_size ** 3
+        functions = psi4.core.BasisFunctions(basis, max_points, nbf)
+        extents = psi4.core.BasisExtents(basis, self.basis_tolerance)
+
+        orbital_labels = list(orbitals)
+        coefficients = (np.column_stack([orbitals[label] for label in orbital_labels])
+                        if orbital_labels else np.zeros((nbf, 0)))
+        values = {label: np.zeros(self.grid.shape) for label in list(densities) + orbital_labels}
+
+        for index, points in self.grid.iter_blocks(self.block_size):
+            n = len(points)
+            block = psi4.core.BlockOPoints(
+                psi4.core.Vector.from_array(points[:, 0]),
+                psi4.core.Vector.from_array(points[:, 1]),
+                psi4.core.Vector.from_array(points[:, 2]),
+                psi4.core.Vector.from_array(np.zeros(n)),
+                extents,
+            )
+            local = np.asarray(block.functions_local_to_global(), dtype=int)
+            if local.size == 0:
+                continue
+            functions.compute_functions(block)
+            phi = np.asarray(functions.basis_values()["PHI"].np)[:n, :local.size]
+            shape = tuple(s.stop - s.start for s in index)
+
+            for label, matrix in densities.items():
+                d_local = matrix[np.ix_(local, local)]
+                values[label][index] = np.einsum("pm,pm->p", phi @ d_local, phi).reshape(shape)
+            if orbital_labels:
+                block_orbitals = phi @ coefficients[local]
+                for k, label in enumerate(orbital_labels):
+                    values[label][index] = block_orbitals[:, k].reshape(shape)
+
+        return {label: self._volume(v, label) for label, v in values.items()}
+
+    def esp(self) -> Volume:
+        """Total electrostatic potential (nuclei + electrons) on the grid."""
+        import psi4
+
+        calc = psi4.core.ESPPropCalc(self.wfn)
+        # Psi4 reads grid coordinates in the molecule's input units
+        scale = BOHR_TO_ANGSTROM if self.molecule.units() == "Angstrom" else 1.0
+        points = self.grid.points()
+        values = np.empty(len(points))
+        for start in range(0, len(points), ESP_BATCH_SIZE):
+            batch = psi4.core.Matrix.from_array(points[start:start + ESP_BATCH_SIZE] * scale)
+            values[start:start + ESP_BATCH_SIZE] = np.asarray(calc.compute_esp_over_grid_in_memory(batch).np)
+        return self._volume(values.reshape(self.grid.shape), "esp")
+
+    def compute(self, properties: Sequence[str], orbital_indices: Sequence[int] = ()) -> Dict[str, Volume]:
+        """
+        Evaluate named properties; orbitals, densities and their
+        combinations share a single pass over the grid.
+
+        Args:
+            properties: Names from VOLUME_PROPERTIES
+            orbital_indices: 0-based orbital indices (energy order) for "orbital"
+
+        Returns:
+            Label -> Volume (orbitals are labelled e.g. "homo", "orbital_5", "homo_beta")
+        """
+        restricted = self.wfn.same_a_b_dens()
+        densities: Dict[str, np.ndarray] = {}
+        orbitals: Dict[str, np.ndarray] = {}
+        need_spin = any(p in ("density", "spin_density", "alpha_density", "beta_density") for p in properties)
+        if need_spin:
+            densities["alpha_density"] = self._density_matrix("alpha")
+            if not restricted:
+                densities["beta_density"] = self._density_matrix("beta")
+
+        spins = ["alpha"] if restricted else ["alpha", "beta"]
+        for spin in spins:
+            coefficients = None
+            suffix = "" if spin == "alpha" else "_beta"
+            requests: List[Tuple[str, int]] = []
+            for prop in properties:
+                if prop in ("homo", "lumo"):
+                    requests.append((prop + suffix, self.frontier_index(prop, spin)))
+                elif prop == "orbital":
+                    requests.extend((f"orbital_{i}{suffix}", i) for i in orbital_indices)
+            for label, i in requests:
+                if coefficients is None:
+                    coefficients = self._coefficients(spin)
+                if not 0 <= i < coefficients.shape[1]:
+                    raise ValueError(f"Orbital index {i} out of range (0-{coefficients.shape[1] - 1})")
+                orbitals[label] = coefficients[:, i]
+
+        volumes = self.evaluate(densities, orbitals)
+
+        result: Dict[str, Volume] = {}
+        if need_spin:
+            alpha = volumes.pop("alpha_density")
+            beta = volumes.pop("beta_density", None)
+            if beta is None:
+                beta = self._volume(alpha.values, "beta_density")
+            if "density" in properties:
+                result["density"] = alpha + beta
+                result["density"].label = "density"
+            if "alpha_density" in properties:
+                result["alpha_density"] = alpha
+            if "beta_density" in properties:
+                result["beta_density"] = beta
+            if "spin_density" in properties:
+                result["spin_density"] = alpha - beta
+                result["spin_density"].label = "spin_density"
+        result.update(volumes)
+        if "esp" in properties:
+            result["esp"] = self.esp()
+        return result
@@ -0,0 +1,397 @@
+"""
+Volumetric Data on Cubic Grids.
+
+A Volume is a 3D array of values on an axis-aligned grid (bohr) together
+with the atoms of the molecule. Volumes support arithmetic on a common
+grid (density differences, spin densities, orbital combinations) and
+compute their statistics from the actual values.
+
+Storage:
+    - Binary volume files (.vol): a JSON header followed by the raw array,
+      either zlib-compressed or stored uncompressed and 64-byte aligned so
+      that it can be memory-mapped. The header carries the grid, atoms and
+      statistics, so files can be listed without reading the values.
+    - Gaussian cube text files for export to external viewers.
+"""
+
+import json
+import logging
+import struct
+import zlib
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Sequence, Tuple, Union
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+VOLUME_MAGIC = b"PSI4VOL1"
+VOLUME_EXTENSION = ".vol"
+# Payload alignment of uncompressed volumes (for memory mapping)
+VOLUME_ALIGNMENT = 64
+CUBE_VALUES_PER_LINE = 6
+
+
+# =============================================================================
+# GRID
+# =============================================================================
+
+@dataclass(frozen=True)
+class CubeGrid:
+    """Axis-aligned grid; origin and spacing in bohr."""
+    origin: Tuple[float, float, float]
+    spacing: Tuple[float, float, float]
+    shape: Tuple[int, int, int]
+
+    @classmethod
+    def around(
+        cls,
+        coordinates: np.ndarray,
+        spacing: Optional[float] = None,
+        padding: float = 4.0,
+        points: Optional[int] = None,
+    ) -> "CubeGrid":
+        """
+        Grid enclosing a molecule.
+
+        Args:
+            coordinates: Atomic coordinates in bohr, shape (n_atoms, 3)
+            spacing: Grid spacing in bohr
+            padding: Distance from the outermost atoms to the grid edge (bohr)
+            points: Number of points along the longest edge; used when no
+                spacing is given
+
+        Returns:
+            The grid
+        """
+        coordinates = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+        low = coordinates.min(axis=0) - padding
+        extent = coordinates.max(axis=0) + padding - low
+        if spacing is None:
+            spacing = float(extent.max()) / max((points or 50) - 1, 1)
+        shape = np.ceil(extent / spacing).astype(int) + 1
+        # Center the molecule in the grid
+        low -= ((shape - 1) * spacing - extent) / 2.0
+        return cls(tuple(low.tolist()), (spacing,) * 3, tuple(int(n) for n in shape))
+
+    @property
+    def n_points(self) -> int:
+        return int(np.prod(self.shape))
+
+    @property
+    def voxel_volume(self) -> float:
+        return float(np.prod(self.spacing))
+
+    def axis(self, i: int) -> np.ndarray:
+        """Coordinates of the grid planes along axis i."""
+        return self.origin[i] + self.spacing[i] * np.arange(self.shape[i])
+
+    def points(self, index: Tuple[slice, slice, slice] = (slice(None),) * 3) -> np.ndarray:
+        """Coordinates of the points of a sub-box, shape (n, 3), z fastest."""
+        x, y, z = (self.axis(i)[index[i]] for i in range(3))
+        mesh = np.meshgrid(x, y, z, indexing="ij")
+        return np.stack([m.ravel() for m in mesh], axis=1)
+
+    def iter_blocks(self, block_size: int = 16) -> Iterator[Tuple[Tuple[slice, slice, slice], np.ndarray]]:
+        """
+        Split the grid into compact bricks of at most block_size^3 points.
+
+        Yields:
+            (index of the brick in the value array, point coordinates (n, 3))
+        """
+        nx, ny, nz = self.shape
+        for i in range(0, nx, block_size):
+            for j in range(0, ny, block_size):
+                for k in range(0, nz, block_size):
+                    index = (slice(i, min(i + block_size, nx)),
+                             slice(j, min(j + block_size, ny)),
+                             slice(k, min(k + block_size, nz)))
+                    yield index, self.points(index)
+
+    def compatible(self, other: "CubeGrid", tol: float = 1e-8) -> bool:
+        return (self.shape == other.shape
+                and np.allclose(self.origin, other.origin, atol=tol)
+                and np.allclose(self.spacing, other.spacing, atol=tol))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {"origin": list(self.origin), "spacing": list(self.spacing), "shape": list(self.shape)}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "CubeGrid":
+        return cls(tuple(data["origin"]), tuple(data["spacing"]), tuple(int(n) for n in data["shape"]))
+
+
+# =============================================================================
+# STATISTICS
+# =============================================================================
+
+@dataclass
+class VolumeStatistics:
+    """Statistics of the values of a volume."""
+    min_value: float
+    max_value: float
+    mean: float
+    std: float
+    integral: float
+    positive_integral: float
+    negative_integral: float
+    n_points: int
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "min_value": self.min_value,
+            "max_value": self.max_value,
+            "mean": self.mean,
+            "std": self.std,
+            "integral": self.integral,
+            "positive_integral": self.positive_integral,
+            "negative_integral": self.negative_integral,
+            "n_points": self.n_points,
+        }
+
+
+def volume_statistics(values: np.ndarray, voxel_volume: float, chunk: int = 1 << 22) -> VolumeStatistics:
+    """Statistics in float64, accumulated in chunks (works on memory-mapped values)."""
+    flat = values.reshape(-1)
+    total = positive = square = 0.0
+    low, high = np.inf, -np.inf
+    for start in range(0, flat.size, chunk):
+        block = np.asarray(flat[start:start + chunk], dtype=np.float64)
+        low = min(low, float(block.min()))
+        high = max(high, float(block.max()))
+        total += float(block.sum())
+        positive += float(block[block > 0].sum())
+        square += float(np.dot(block, block))
+    n = flat.size
+    mean = total / n if n else 0.0
+    variance = max(square / n - mean * mean, 0.0) if n else 0.0
+    return VolumeStatistics(
+        min_value=low if n else 0.0,
+        max_value=high if n else 0.0,
+        mean=mean,
+        std=float(np.sqrt(variance)),
+        integral=total * voxel_volume,
+        positive_integral=positive * voxel_volume,
+        negative_integral=(total - positive) * voxel_volume,
+        n_points=n,
+    )
+
+
+# =============================================================================
+# VOLUME
+# =============================================================================
+
+@dataclass
+class Volume:
+    """Values of one property on a grid."""
+    grid: CubeGrid
+    values: np.ndarray
+    label: str = ""
+    atomic_numbers: List[int] = field(default_factory=list)
+    coordinates: Optional[np.ndarray] = None  # bohr
+    _statistics: Optional[VolumeStatistics] = field(default=None, repr=False, compare=False)
+
+    @property
+    def statistics(self) -> VolumeStatistics:
+        if self._statistics is None:
+            self._statistics = volume_statistics(self.values, self.grid.voxel_volume)
+        return self._statistics
+
+    def _combine(self, other: Any, op: Any, symbol: str) -> "Volume":
+        if isinstance(other, Volume):
+            if not self.grid.compatible(other.grid):
+                raise ValueError(f"Cannot combine volumes on different grids: {self.grid} and {other.grid}")
+            values = op(np.asarray(self.values, dtype=np.float64), other.values)
+            label = f"({self.label} {symbol} {other.label})"
+        else:
+            values = op(np.asarray(self.values, dtype=np.float64), float(other))
+            label = f"({self.label} {symbol} {other})"
+        return Volume(self.grid, values, label, self.atomic_numbers, self.coordinates)
+
+    def __add__(self, other: Any) -> "Volume":
+        return self._combine(other, np.add, "+")
+
+    def __sub__(self, other: Any) -> "Volume":
+        return self._combine(other, np.subtract, "-")
+
+    def __mul__(self, other: Any) -> "Volume":
+        return self._combine(other, np.multiply, "*")
+
+    __radd__ = __add__
+    __rmul__ = __mul__
+
+    def __neg__(self) -> "Volume":
+        return self * -1.0
+
+    def squared(self) -> "Volume":
+        """Squared values (orbital -> orbital density)."""
+        return Volume(self.grid, np.square(self.values, dtype=np.float64), f"{self.label}^2",
+                      self.atomic_numbers, self.coordinates)
+
+    def to_dict(self, include_values: bool = False) -> Dict[str, Any]:
+        data = {
+            "label": self.label,
+            "grid": self.grid.to_dict(),
+            "statistics": self.statistics.to_dict(),
+        }
+        if include_values:
+            data["values"] = np.asarray(self.values).ravel().tolist()
+        return data
+
+    # ----- binary volume files -----
+
+    def save(self, path: Union[str, Path], compress: bool = True, dtype: str = "float32") -> Path:
+        """
+        Write a binary volume file.
+
+        Args:
+            path: Output path (.vol is appended when missing)
+            compress: zlib-compress the values; uncompressed files can be memory-mapped
+            dtype: Storage precision, float32 or float64
+
+        Returns:
+            The written path
+        """
+        path = Path(path)
+        if path.suffix != VOLUME_EXTENSION:
+            path = path.with_name(path.name + VOLUME_EXTENSION)
+        data = np.ascontiguousarray(self.values, dtype=dtype)
+        payload = zlib.compress(data.tobytes(), 6) if compress else None
+        header = json.dumps({
+            "label": self.label,
+            "grid": self.grid.to_dict(),
+            "dtype": np.dtype(dtype).str,
+            "compression": "zlib" if compress else None,
+            "atomic_numbers": [int(z) for z in self.atomic_numbers],
+            "coordinates": None if self.coordinates is None else np.asarray(self.coordinates).tolist(),
+            "statistics": self.statistics.to_dict(),
+        }).encode()
+        prefix = len(VOLUME_MAGIC) + 8
+        padding = (-(prefix + len(header))) % VOLUME_ALIGNMENT
+        header += b" " * padding
+
+        with open(path, "wb") as f:
+            f.write(VOLUME_MAGIC)
+            f.write(struct.pack("<Q", len(header)))
+            f.write(header)
+            if payload is not None:
+                f.write(payload)
+            else:
+                data.tofile(f)
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path], mmap: bool = True) -> "Volume":
+        """
+        Read a binary volume file; uncompressed values are memory-mapped unless mmap is False.
+        """
+        header, offset = read_volume_header(path)
+        grid = CubeGrid.from_dict(header["grid"])
+        dtype = np.dtype(header["dtype"])
+        if header.get("compression") == "zlib":
+            with open(path, "rb") as f:
+                f.seek(offset)
+                values = np.frombuffer(zlib.decompress(f.read()), dtype=dtype).reshape(grid.shape)
+        elif mmap:
+            values = np.memmap(path, dtype=dtype, mode="r", offset=offset, shape=grid.shape)
+        else:
+            values = np.fromfile(path, dtype=dtype, offset=offset).reshape(grid.shape)
+        coordinates = header.get("coordinates")
+        statistics = header.get("statistics")
+        return cls(
+            grid=grid,
+            values=values,
+            label=header.get("label", ""),
+            atomic_numbers=header.get("atomic_numbers", []),
+            coordinates=None if coordinates is None else np.asarray(coordinates, dtype=float),
+            _statistics=VolumeStatistics(**statistics) if statistics else None,
+        )
+
+    # ----- Gaussian cube files -----
+
+    def write_cube(self, path: Union[str, Path], comment: str = "") -> Path:
+        """Export as a Gaussian cube text file."""
+        path = Path(path)
+        nx, ny, nz = self.grid.shape
+        coordinates = np.zeros((0, 3)) if self.coordinates is None else np.asarray(self.coordinates)
+        lines = [
+            self.label or "Psi4 MCP volume",
+            comment or f"min {self.statistics.min_value:.6e} max {self.statistics.max_value:.6e}",
+            f"{len(self.atomic_numbers):5d}{self.grid.origin[0]:12.6f}"
+            f"{self.grid.origin[1]:12.6f}{self.grid.origin[2]:12.6f}",
+        ]
+        for i, n in enumerate(self.grid.shape):
+            vector = [0.0, 0.0, 0.0]
+            vector[i] = self.grid.spacing[i]
+            lines.append(f"{n:5d}{vector[0]:12.6f}{vector[1]:12.6f}{vector[2]:12.6f}")
+        for z, (x, y, zc) in zip(self.atomic_numbers, coordinates.tolist()):
+            lines.append(f"{int(z):5d}{float(z):12.6f}{x:12.6f}{y:12.6f}{zc:12.6f}")
+
+        # Values with z fastest, 6 per line, each z-row starting a new line
+        row_format = ("%13.5E" * CUBE_VALUES_PER_LINE + "\n") * (nz // CUBE_VALUES_PER_LINE)
+        if nz % CUBE_VALUES_PER_LINE:
+            row_format += "%13.5E" * (nz % CUBE_VALUES_PER_LINE) + "\n"
+        rows = np.asarray(self.values).reshape(nx * ny, nz)
+        rows_per_write = max(1, (1 << 20) // max(nz, 1))
+        with open(path, "w") as f:
+            f.write("\n".join(lines) + "\n")
+            for start in range(0, nx * ny, rows_per_write):
+                chunk = rows[start:start + rows_per_write]
+                f.write((row_format * len(chunk)) % tuple(chunk.ravel().tolist()))
+        return path
+
+    @classmethod
+    def read_cube(cls, path: Union[str, Path]) -> "Volume":
+        """Read a Gaussian cube text file (axis-aligned grids)."""
+        with open(path) as f:
+            label = f.readline().strip()
+            f.readline()
+            parts = f.readline().split()
+            n_atoms = abs(int(parts[0]))
+            origin = tuple(float(v) for v in parts[1:4])
+            shape, spacing = [], []
+            for i in range(3):
+                parts = f.readline().split()
+                shape.append(int(parts[0]))
+                spacing.append(float(parts[1 + i]))
+            numbers, coordinates = [], []
+            for _ in range(n_atoms):
+                parts = f.readline().split()
+                numbers.append(int(parts[0]))
+                coordinates.append([float(v) for v in parts[2:5]])
+            values = np.array(f.read().split(), dtype=float)
+        grid = CubeGrid(origin, tuple(spacing), tuple(shape))
+        return cls(grid, values[:grid.n_points].reshape(grid.shape), label, numbers,
+                   np.array(coordinates, dtype=float).reshape(-1, 3))
+
+
+def read_volume_header(path: Union[str, Path]) -> Tuple[Dict[str, Any], int]:
+    """
+    Header of a binary volume file without reading its values.
+
+    Returns:
+        (header, byte offset of the values)
+    """
+    with open(path, "rb") as f:
+        if f.read(len(VOLUME_MAGIC)) != VOLUME_MAGIC:
+            raise ValueError(f"Not a volume file: {path}")
+        (length,) = struct.unpack("<Q", f.read(8))
+        header = json.loads(f.read(length))
+    return header, len(VOLUME_MAGIC) + 8 + length
+
+
+def combine_volumes(volumes: Sequence[Volume], coefficients: Sequence[float], label: str = "") -> Volume:
+    """Linear combination sum_i c_i V_i of volumes on the same grid."""
+    if not volumes or len(volumes) != len(coefficients):
+        raise ValueError("Need one coefficient per volume")
+    first = volumes[0]
+    values = np.zeros(first.grid.shape)
+    for volume, coefficient in zip(volumes, coefficients):
+        if not first.grid.compatible(volume.grid):
+            raise ValueError(f"Volume '{volume.label}' is on a different grid")
+        values += coefficient * np.asarray(volume.values, dtype=np.float64)
+    if not label:
+        label = " ".join(f"{c:+g}*{v.label}" for c, v in zip(coefficients, volumes))
+    return Volume(first.grid, values, label, first.atomic_numbers, first.coordinates)
@@ -0,0 +1,31 @@
+"""
+Dispersion Correction Utilities for Psi4 MCP Server.
+
+Post-SCF empirical dispersion corrections for many variants and
+geometries on top of a single DFT energy.
+
+Example Usage:
+    from psi4_mcp.utils.dispersion import DispersionEngine
+
+    engine = DispersionEngine([8, 1, 1], "b3lyp")
+    results = engine.compute(positions_bohr, ["d2", "d3bj"], gradient=True)
+"""
+
+from psi4_mcp.utils.dispersion.engine import (
+    DISPERSION_VARIANTS,
+    D2_PARAMETERS,
+    D2_S6,
+    DispersionEnergy,
+    DispersionEngine,
+    d2_dispersion,
+)
+
+
+__all__ = [
+    "DISPERSION_VARIANTS",
+    "D2_PARAMETERS",
+    "D2_S6",
+    "DispersionEnergy",
+    "DispersionEngine",
+    "d2_dispersion",
+]
@@ -0,0 +1,295 @@
+"""
+Dispersion Correction Engine for Psi4 MCP Server.
+
+Empirical dispersion corrections depend only on the geometry, not on the
+density, so they can be evaluated for many variants and geometries on
+top of one DFT energy:
+
+- D2 is evaluated here as a vectorized pairwise sum over all atom pairs
+  and all geometries at once (energies and analytic gradients).
+- D3 variants (zero, BJ, modified zero, modified BJ; optional
+  three-body ATM) use the s-dftd3 library and D4 uses dftd4, keeping
+  one model per molecule that is only updated between geometries.
+- Without those libraries, Psi4's EmpiricalDispersion is used.
+"""
+
+import logging
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+
+logger = logging.getLogger(__name__)
+
+DISPERSION_VARIANTS = ("d2", "d3", "d3bj", "d3m", "d3mbj", "d4")
+
+# J nm^6 mol^-1 -> Eh bohr^6
+C6_CONVERSION = 17.345276977465467
+BOHR_TO_ANGSTROM = 0.529177210903
+
+# Grimme D2 (J. Comput. Chem. 2006, 27, 1787): C6 in J nm^6 mol^-1, R0 in Angstrom
+D2_PARAMETERS: Dict[int, Tuple[float, float]] = {
+    1: (0.14, 1.001), 2: (0.08, 1.012),
+    3: (1.61, 0.825), 4: (1.61, 1.408), 5: (3.13, 1.485), 6: (1.75, 1.452),
+    7: (1.23, 1.397), 8: (0.70, 1.342), 9: (0.75, 1.287), 10: (0.63, 1.243),
+    11: (5.71, 1.144), 12: (5.71, 1.364), 13: (10.79, 1.639), 14: (9.23, 1.716),
+    15: (7.84, 1.705), 16: (5.57, 1.683), 17: (5.07, 1.639), 18: (4.61, 1.595),
+    19: (10.80, 1.485), 20: (10.80, 1.474),
+    **{z: (10.80, 1.562) for z in range(21, 31)},
+    31: (16.99, 1.649), 32: (17.10, 1.727), 33: (16.37, 1.760), 34: (12.64, 1.771),
+    35: (12.47, 1.749), 36: (12.01, 1.727),
+    37: (24.67, 1.628), 38: (24.67, 1.606),
+    **{z: (24.67, 1.639) for z in range(39, 49)},
+    49: (37.32, 1.672), 50: (38.71, 1.804), 51: (38.44, 1.881), 52: (31.74, 1.892),
+    53: (31.50, 1.892), 54: (29.99, 1.881),
+}
+
+# Global D2 scaling factors
+D2_S6: Dict[str, float] = {
+    "b3lyp": 1.05, "pbe": 0.75, "blyp": 1.2, "bp86": 1.05, "tpss": 1.0,
+    "b97-d": 1.25, "pbe0": 0.6, "b2plyp": 0.55, "revpbe": 1.25,
+}
+D2_DAMPING = 20.0
+
+# Psi4 EmpiricalDispersion level names (two-body, with ATM)
+PSI4_LEVELS: Dict[str, Tuple[str, str]] = {
+    "d2": ("d2", "d2"),
+    "d3": ("d3zero2b", "d3zeroatm"),
+    "d3bj": ("d3bj2b", "d3bjatm"),
+    "d3m": ("d3mzero2b", "d3mzeroatm"),
+    "d3mbj": ("d3mbj2b", "d3mbjatm"),
+    "d4": ("d4bjeeqatm", "d4bjeeqatm"),
+}
+
+
+@dataclass
+class DispersionEnergy:
+    """Dispersion correction of one variant at one geometry."""
+    variant: str
+    energy: float
+    two_body: float
+    three_body: Optional[float] = None
+    gradient: Optional[np.ndarray] = None
+    backend: str = "numpy"
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "variant": self.variant.upper(),
+            "energy_hartree": self.energy,
+            "two_body_hartree": self.two_body,
+            "three_body_hartree": self.three_body,
+            "gradient": self.gradient.tolist() if self.gradient is not None else None,
+            "backend": self.backend,
+        }
+
+
+# =============================================================================
+# D2 (VECTORIZED)
+# =============================================================================
+
+def d2_dispersion(
+    numbers: Sequence[int],
+    positions: np.ndarray,
+    s6: float,
+    gradient: bool = False,
+) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    D2 energies (and gradients) of a batch of geometries.
+
+    Args:
+        numbers: Atomic numbers
+        positions: Coordinates in bohr, shape (n_atoms, 3) or (n_geometries, n_atoms, 3)
+        s6: Global scaling factor of the functional
+        gradient: Also return gradients
+
+    Returns:
+        (energies of shape (n_geometries,), gradients of shape
+        (n_geometries, n_atoms, 3) or None)
+    """
+    positions = np.asarray(positions, dtype=float)
+    if positions.ndim == 2:
+        positions = positions[None]
+    numbers = list(numbers)
+    missing = sorted({z for z in numbers if z not in D2_PARAMETERS})
+    if missing:
+        raise ValueError(f"No D2 parameters for atomic numbers {missing}")
+
+    c6 = np.array([D2_PARAMETERS[z][0] for z in numbers]) * C6_CONVERSION
+    r0 = np.array([D2_PARAMETERS[z][1] for z in numbers]) / BOHR_TO_ANGSTROM
+
+    i, j = np.triu_indices(len(numbers), k=1)
+    c6_ij = np.sqrt(c6[i] * c6[j])
+    r0_ij = r0[i] + r0[j]
+
+    diff = positions[:, i, :] - positions[:, j, :]
+    r = np.linalg.norm(diff, axis=-1)
+    exp_term = np.exp(-D2_DAMPING * (r / r0_ij - 1.0))
+    damping = 1.0 / (1.0 + exp_term)
+    r6 = r ** 6
+    energies = -s6 * np.sum(c6_ij * damping / r6, axis=-1)
+
+    if not gradient:
+        return energies, None
+
+    d_damping = damping * damping * exp_term * D2_DAMPING / r0_ij
+    d_energy = -s6 * c6_ij * (d_damping / r6 - 6.0 * damping / (r6 * r))
+    pair_grad = (d_energy / r)[..., None] * diff
+    gradients = np.zeros_like(positions)
+    for g in range(positions.shape[0]):
+        np.add.at(gradients[g], i, pair_grad[g])
+        np.add.at(gradients[g], j, -pair_grad[g])
+    return energies, gradients
+
+
+# =============================================================================
+# ENGINE
+# =============================================================================
+
+class DispersionEngine:
+    """
+    Dispersion corrections of one molecule for many variants and geometries.
+
+    Args:
+        numbers: Atomic numbers
+        functional: Functional whose damping parameters are used
+        charge: Molecular charge (D4 charge model)
+    """
+
+    def __init__(self, numbers: Sequence[int], functional: str, charge: int = 0):
+        self.numbers = np.asarray(numbers, dtype=int)
+        self.functional = functional.lower()
+        self.charge = charge
+        self._models: Dict[str, Any] = {}
+        self._params: Dict[Tuple[str, bool], Any] = {}
+
+    def compute(
+        self,
+        positions: np.ndarray,
+        variants: Sequence[str],
+        three_body: bool = False,
+        gradient: bool = False,
+    ) -> List[Dict[str, DispersionEnergy]]:
+        """
+        Evaluate variants for a batch of geometries.
+
+        Args:
+            positions: Coordinates in bohr, (n_atoms, 3) or (n_geometries, n_atoms, 3)
+            variants: Variants from DISPERSION_VARIANTS
+            three_body: Include the three-body ATM term (D4 always includes it)
+            gradient: Also compute gradients (Eh/bohr)
+
+        Returns:
+            Per geometry, the results keyed by variant
+        """
+        positions = np.asarray(positions, dtype=float)
+        if positions.ndim == 2:
+            positions = positions[None]
+        if positions.shape[1] != len(self.numbers):
+            raise ValueError(f"Geometries have {positions.shape[1]} atoms, expected {len(self.numbers)}")
+
+        results: List[Dict[str, DispersionEnergy]] = [{} for _ in range(positions.shape[0])]
+        for variant in variants:
+            variant = variant.lower()
+            if variant == "d2":
+                s6 = D2_S6.get(self.functional)
+                if s6 is not None:
+                    energies, grads = d2_dispersion(self.numbers, positions, s6, gradient)
+                    for g, result in enumerate(results):
+                        result[variant] = DispersionEnergy(
+                            variant, float(energies[g]), float(energies[g]),
+                            gradient=grads[g] if grads is not None else None,
+                        )
+                    continue
+            for g, result in enumerate(results):
+                result[variant] = self._compute_single(variant, positions[g], three_body, gradient)
+        return results
+
+    def _compute_single(self, variant: str, positions: np.ndarray,
+                        three_body: bool, gradient: bool) -> DispersionEnergy:
+        if variant.startswith("d3"):
+            model = self._model("d3", positions)
+            if model is not None:
+                return self._library_dispersion(model, "s-dftd3", variant, three_body, gradient)
+        elif variant == "d4":
+            model = self._model("d4", positions)
+            if model is not None:
+                return self._library_dispersion(model, "dftd4", variant, True, gradient)
+        return self._psi4_dispersion(variant, positions, three_body, gradient)
+
+    def _model(self, family: str, positions: np.ndarray) -> Optional[Any]:
+        """Library model of the molecule, moved to the given geometry."""
+        model = self._models.get(family)
+        if model is not None:
+            model.update(positions)
+            return model
+        if family in self._models:
+            return None
+        try:
+            if family == "d3":
+                from dftd3.interface import DispersionModel
+                model = DispersionModel(self.numbers, positions)
+            else:
+                from dftd4.interface import DispersionModel
+                model = DispersionModel(self.numbers, positions, charge=self.charge)
+        except ImportError:
+            model = None
+        self._models[family] = model
+        return model
+
+    def _param(self, variant: str, atm: bool) -> Any:
+        key = (variant, atm)
+        if key not in self._params:
+            if variant == "d4":
+                from dftd4.interface import DampingParam
+                self._params[key] = DampingParam(method=self.functional, s9=1.0 if atm else 0.0)
+            else:
+                from dftd3 import interface
+                cls = {
+                    "d3": interface.ZeroDampingParam,
+                    "d3bj": interface.RationalDampingParam,
+                    "d3m": interface.ModifiedZeroDampingParam,
+                    "d3mbj": interface.ModifiedRationalDampingParam,
+                }[variant]
+                self._params[key] = cls(method=self.functional, atm=atm)
+        return self._params[key]
+
+    def _library_dispersion(self, model: Any, backend: str, variant: str,
+                            three_body: bool, gradient: bool) -> DispersionEnergy:
+        result = model.get_dispersion(self._param(variant, False), grad=gradient)
+        two_body = float(result["energy"])
+        grad = np.asarray(result["gradient"]) if gradient else None
+        if not three_body:
+            return DispersionEnergy(variant, two_body, two_body, gradient=grad, backend=backend)
+
+        full = model.get_dispersion(self._param(variant, True), grad=gradient)
+        energy = float(full["energy"])
+        return DispersionEnergy(
+            variant, energy, two_body, three_body=energy - two_body,
+            gradient=np.asarray(full["gradient"]) if gradient else None, backend=backend,
+        )
+
+    def _psi4_dispersion(self, variant: str, positions: np.ndarray,
+                         three_body: bool, gradient: bool) -> DispersionEnergy:
+        import psi4
+        from psi4.driver.procrouting.empirical_dispersion import EmpiricalDispersion
+
+        mol = psi4.core.Molecule.from_arrays(
+            geom=positions, elez=self.numbers, units="Bohr",
+            molecular_charge=self.charge, fix_com=True, fix_orientation=True,
+        )
+        two_body_level, atm_level = PSI4_LEVELS[variant]
+
+        def evaluate(level: str) -> Tuple[float, Optional[np.ndarray]]:
+            disp = EmpiricalDispersion(name_hint=self.functional, level_hint=level)
+            energy = float(disp.compute_energy(mol))
+            grad = np.asarray(disp.compute_gradient(mol)) if gradient else None
+            return energy, grad
+
+        two_body, grad = evaluate(two_body_level)
+        if not three_body or atm_level == two_body_level:
+            return DispersionEnergy(variant, two_body, two_body, gradient=grad, backend="psi4")
+        energy, grad = evaluate(atm_level)
+        return DispersionEnergy(
+            variant, energy, two_body, three_body=energy - two_body, gradient=grad, backend="psi4",
+        )
@@ -30,6 +30,7 @@ from psi4_mcp.utils.error_handling.categorization import (
 from psi4_mcp.utils.error_handling.detection import (
     ErrorDetector,
     ErrorPattern,
+    ErrorMatch,
     detect_error,
     detect_psi4_error,
     parse_error_message,
@@ -48,7 +49,10 @@ from psi4_mcp.utils.error_handling.recovery import (
     RecoveryResult,
     attempt_recovery,
     get_recovery_strategies,
+    get_recovery_manager,
+    system_signatures,
     RecoveryManager,
+    RecoveryHistory,
 )
 
 from psi4_mcp.utils.error_handling.suggestions import (
@@ -70,6 +74,7 @@ __all__ = [
     # Detection
     "ErrorDetector",
     "ErrorPattern",
+    "ErrorMatch",
     "detect_error",
     "detect_psi4_error",
     "parse_error_message",
@@ -86,7 +91,10 @@ __all__ = [
     "RecoveryResult",
     "attempt_recovery",
     "get_recovery_strategies",
+    "get_recovery_manager",
+    "system_signatures",
     "RecoveryManager",
+    "RecoveryHistory",
     
     # Suggestions
     "ErrorSuggestion",
@@ -2,11 +2,19 @@
 Error Detection for Psi4 MCP Server.
 
 Provides error detection and pattern matching for Psi4 errors.
+
+Detection is a single pass: the trigger literals every pattern starts
+with are searched as one alternation over the lower-cased text, chunk by
+chunk, and a pattern's own regex is only run (anchored) where one of its
+triggers occurs. Output files are memory-mapped, so large CC/SAPT outputs
+are never loaded into memory at once.
 """
 
+import mmap
 import re
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Pattern, Tuple
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Pattern, Tuple, Union
 
 from psi4_mcp.utils.error_handling.categorization import (
     ErrorCategory,
@@ -16,9 +24,22 @@ from psi4_mcp.utils.error_handling.categorization import (
 )
 
 
+_PLACEHOLDER = re.compile(r"\{(\w+)\}")
+_ASCII_LOWER = str.maketrans("ABCDEFGHIJKLMNOPQRSTUVWXYZ", "abcdefghijklmnopqrstuvwxyz")
+SCAN_CHUNK_SIZE = 1 << 23
+
+Text = Union[str, bytes, mmap.mmap]
+
+
 @dataclass
 class ErrorPattern:
-    """Pattern for detecting specific errors."""
+    """
+    Pattern for detecting specific errors.
+    
+    triggers are lower-case literals a match must start with; they let the
+    detector skip text where the pattern cannot match. Patterns without
+    triggers are searched on their own.
+    """
     name: str
     pattern: str
     category: ErrorCategory
@@ -26,10 +47,21 @@ class ErrorPattern:
     message_template: str
     suggestions: List[str] = field(default_factory=list)
     extract_groups: List[str] = field(default_factory=list)
+    triggers: List[str] = field(default_factory=list)
     
     def __post_init__(self):
         """Compile the pattern."""
         self._compiled: Pattern = re.compile(self.pattern, re.IGNORECASE | re.MULTILINE)
+        self._compiled_bytes: Optional[Pattern] = None
+        self.triggers = [t.lower() for t in self.triggers]
+    
+    def compiled(self, binary: bool = False) -> Pattern:
+        """Compiled pattern for str (or bytes/mmap) input."""
+        if not binary:
+            return self._compiled
+        if self._compiled_bytes is None:
+            self._compiled_bytes = re.compile(self.pattern.encode(), re.IGNORECASE | re.MULTILINE)
+        return self._compiled_bytes
     
     def match(self, text: str) -> Optional[re.Match]:
         """Match pattern against text."""
@@ -41,8 +73,46 @@ class ErrorPattern:
         for group in self.extract_groups:
             value = match.group(group) if group in match.groupdict() else None
             if value:
+                if isinstance(value, bytes):
+                    value = value.decode("utf-8", errors="replace")
                 result[group] = value
         return result
+    
+    def format_message(self, extracted: Dict[str, str]) -> str:
+        """Fill the message template; unknown placeholders are kept."""
+        return _PLACEHOLDER.sub(
+            lambda m: str(extracted.get(m.group(1), m.group(0))), self.message_template
+        )
+
+
+@dataclass
+class ErrorMatch:
+    """Where a pattern matched (character offsets for str, byte offsets otherwise)."""
+    pattern: ErrorPattern
+    start: int
+    end: int
+    line_number: int
+    extracted: Dict[str, str] = field(default_factory=dict)
+    text: str = ""
+
+
+class _LineCounter:
+    """Line numbers for increasing positions, counted incrementally."""
+    
+    def __init__(self, text: Text):
+        self._text = text
+        self._newline = "\n" if isinstance(text, str) else b"\n"
+        self._pos = 0
+        self._line = 1
+    
+    def line_at(self, pos: int) -> int:
+        if pos < self._pos:
+            self._pos, self._line = 0, 1
+        while self._pos < pos:
+            end = min(pos, self._pos + SCAN_CHUNK_SIZE)
+            self._line += self._text[self._pos:end].count(self._newline)
+            self._pos = end
+        return self._line
 
 
 class ErrorDetector:
@@ -56,6 +126,7 @@ class ErrorDetector:
     def __init__(self):
         """Initialize with default error patterns."""
         self._patterns: List[ErrorPattern] = []
+        self._combined: Dict[Tuple[Tuple[int, ...], bool], Optional[Pattern]] = {}
         self._setup_default_patterns()
     
     def _setup_default_patterns(self) -> None:
@@ -63,12 +134,23 @@ class ErrorDetector:
         # SCF convergence errors
         self._patterns.append(ErrorPattern(
             name="scf_not_converged",
-            pattern=r"could not converge scf in (?P<iterations>\d+) iterations",
+            pattern=r"could not converge scf(?: iterations)? in (?P<iterations>\d+) iterations",
             category=ErrorCategory.SCF_CONVERGENCE,
             severity=ErrorSeverity.ERROR,
             message_template="SCF did not converge in {iterations} iterations",
             suggestions=["Try SOSCF", "Increase damping", "Try level shift"],
             extract_groups=["iterations"],
+            triggers=["could not converge scf"],
+        ))
+        
+        self._patterns.append(ErrorPattern(
+            name="scf_aborted",
+            pattern=r"calculation aborted early: scf not converging",
+            category=ErrorCategory.SCF_CONVERGENCE,
+            severity=ErrorSeverity.ERROR,
+            message_template="SCF stopped early: not converging",
+            suggestions=["Try SOSCF", "Increase damping", "Try level shift"],
+            triggers=["calculation aborted early"],
         ))
         
         self._patterns.append(ErrorPattern(
@@ -79,17 +161,19 @@ class ErrorDetector:
             message_template="DIIS error: {error}",
             suggestions=["Increase DIIS vectors", "Try SOSCF"],
             extract_groups=["error"],
+            triggers=["diis error"],
         ))
         
         # Geometry optimization errors
         self._patterns.append(ErrorPattern(
             name="geom_not_converged",
-            pattern=r"geometry optimization did not converge in (?P<steps>\d+) steps",
+            pattern=r"(?:geometry optimization did not converge|could not converge geometry optimization) in (?P<steps>\d+) (?:steps|iterations)",
             category=ErrorCategory.GEOMETRY_CONVERGENCE,
             severity=ErrorSeverity.ERROR,
             message_template="Optimization did not converge in {steps} steps",
             suggestions=["Increase max iterations", "Try smaller step size"],
             extract_groups=["steps"],
+            triggers=["geometry optimization did not converge", "could not converge geometry"],
         ))
         
         self._patterns.append(ErrorPattern(
@@ -100,6 +184,7 @@ class ErrorDetector:
             message_template="Step size too large: {size}",
             suggestions=["Reduce trust radius", "Use internal coordinates"],
             extract_groups=["size"],
+            triggers=["step"],
         ))
         
         # Memory errors
@@ -111,6 +196,7 @@ class ErrorDetector:
             message_template="Insufficient memory: need {needed} {unit}",
             suggestions=["Increase memory allocation", "Use density fitting", "Reduce basis set"],
             extract_groups=["needed", "unit"],
+            triggers=["insufficient", "not enough"],
         ))
         
         self._patterns.append(ErrorPattern(
@@ -121,6 +207,7 @@ class ErrorDetector:
             message_template="Memory allocation failed",
             suggestions=["Increase system memory", "Reduce calculation size"],
             extract_groups=[],
+            triggers=["malloc", "allocation"],
         ))
         
         # Basis set errors
@@ -132,6 +219,7 @@ class ErrorDetector:
             message_template="Basis set '{basis}' not found",
             suggestions=["Check basis set name spelling", "Try alternative basis set"],
             extract_groups=["basis"],
+            triggers=["basis set"],
         ))
         
         self._patterns.append(ErrorPattern(
@@ -142,6 +230,7 @@ class ErrorDetector:
             message_template="No basis functions for element {element}",
             suggestions=["Use different basis set", "Check element symbol"],
             extract_groups=["element"],
+            triggers=["no basis"],
         ))
         
         # Geometry errors
@@ -153,6 +242,7 @@ class ErrorDetector:
             message_template="Atoms too close: {distance} {unit}",
             suggestions=["Check geometry", "Increase interatomic distances"],
             extract_groups=["distance", "unit"],
+            triggers=["atoms"],
         ))
         
         self._patterns.append(ErrorPattern(
@@ -163,6 +253,7 @@ class ErrorDetector:
             message_template="Linear molecule detected",
             suggestions=["Check symmetry settings", "Use C1 symmetry"],
             extract_groups=[],
+            triggers=["linear molecule"],
         ))
         
         # Linear dependency
@@ -174,6 +265,7 @@ class ErrorDetector:
             message_template="Linear dependency: eigenvalue {eigenvalue}",
             suggestions=["Use smaller basis set", "Adjust S_MIN_EIGENVALUE"],
             extract_groups=["eigenvalue"],
+            triggers=["linear dependency"],
         ))
         
         # TDDFT errors
@@ -185,6 +277,7 @@ class ErrorDetector:
             message_template="TDDFT root {root} did not converge" if "{root}" else "TDDFT did not converge",
             suggestions=["Increase max iterations", "Try TDA", "Increase guess vectors"],
             extract_groups=["root"],
+            triggers=["tddft", "tdscf"],
         ))
         
         # Numerical errors
@@ -196,11 +289,136 @@ class ErrorDetector:
             message_template="NaN detected in calculation",
             suggestions=["Check geometry", "Try different initial guess", "Use more stable algorithm"],
             extract_groups=[],
+            triggers=["nan", "not a number"],
         ))
     
     def add_pattern(self, pattern: ErrorPattern) -> None:
         """Add a custom error pattern."""
         self._patterns.append(pattern)
+        self._combined.clear()
+    
+    def _trigger_pattern(self, active: Tuple[int, ...], binary: bool) -> Optional[Pattern]:
+        """One literal alternation over the triggers of the active patterns."""
+        key = (active, binary)
+        if key not in self._combined:
+            literals = sorted({t for i in active for t in self._patterns[i].triggers}, key=len, reverse=True)
+            source = "|".join(re.escape(t) for t in literals)
+            self._combined[key] = (
+                re.compile(source.encode() if binary else source) if literals else None
+            )
+        return self._combined[key]
+    
+    def _record(self, found: Dict[int, ErrorMatch], index: int, match: re.Match,
+                lines: _LineCounter, binary: bool) -> None:
+        pattern = self._patterns[index]
+        original = match.group(0)
+        found[index] = ErrorMatch(
+            pattern=pattern,
+            start=match.start(),
+            end=match.end(),
+            line_number=lines.line_at(match.start()),
+            extracted=pattern.extract_info(match),
+            text=original.decode("utf-8", errors="replace") if binary else original,
+        )
+    
+    def scan(self, text: Text, first_only: bool = False) -> List[ErrorMatch]:
+        """
+        Find the first match of every pattern in a single pass.
+        
+        Args:
+            text: str, bytes or mmap to search
+            first_only: Stop once no pattern registered earlier than the
+                best one found so far can still match
+            
+        Returns:
+            Matches in pattern registration order
+        """
+        binary = not isinstance(text, str)
+        lines = _LineCounter(text)
+        found: Dict[int, ErrorMatch] = {}
+        
+        by_trigger: Dict[Any, List[int]] = {}
+        for index, pattern in enumerate(self._patterns):
+            for trigger in pattern.triggers:
+                by_trigger.setdefault(trigger.encode() if binary else trigger, []).append(index)
+        active = [i for i, pattern in enumerate(self._patterns) if pattern.triggers]
+        overlap = max((len(t) for t in by_trigger), default=1) - 1
+        
+        size = len(text)
+        chunk_start = 0
+        while active and chunk_start < size:
+            chunk_end = min(size, chunk_start + SCAN_CHUNK_SIZE)
+            window = text[chunk_start:min(size, chunk_end + overlap)]
+            lowered = window.lower() if binary else window.translate(_ASCII_LOWER)
+            limit = chunk_end - chunk_start
+            
+            pos = 0
+            while active:
+                trigger_regex = self._trigger_pattern(tuple(active), binary)
+                hit = trigger_regex.search(lowered, pos) if trigger_regex else None
+                if hit is None or hit.start() >= limit:
+                    break
+                
+                at = chunk_start + hit.start()
+                # Several triggers can start here (e.g. a shared prefix)
+                candidates = sorted({
+                    index for trigger, indices in by_trigger.items()
+                    if lowered.startswith(trigger, hit.start()) for index in indices
+                })
+                for index in candidates:
+                    if index not in active:
+                        continue
+                    match = self._patterns[index].compiled(binary).match(text, at)
+                    if match is None:
+                        continue
+                    self._record(found, index, match, lines, binary)
+                    active.remove(index)
+                    if first_only:
+                        active = [i for i in active if i < index]
+                pos = hit.start() + 1
+            
+            chunk_start = chunk_end
+        
+        # Patterns without triggers are searched on their own
+        for index, pattern in enumerate(self._patterns):
+            if pattern.triggers or (first_only and found and index > min(found)):
+                continue
+            match = pattern.compiled(binary).search(text)
+            if match is not None:
+                self._record(found, index, match, lines, binary)
+        
+        return [found[i] for i in sorted(found)]
+    
+    def scan_file(self, path: Union[str, Path], first_only: bool = False) -> List[ErrorMatch]:
+        """
+        Scan a file through a read-only memory map (byte offsets).
+        
+        Args:
+            path: Output file to search
+            first_only: See scan()
+            
+        Returns:
+            Matches in pattern registration order
+        """
+        path = Path(path)
+        if not path.is_file() or path.stat().st_size == 0:
+            return []
+        with open(path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return self.scan(mapped, first_only=first_only)
+    
+    @staticmethod
+    def _to_error_info(match: ErrorMatch) -> ErrorInfo:
+        pattern = match.pattern
+        return ErrorInfo(
+            category=pattern.category,
+            severity=pattern.severity,
+            message=pattern.format_message(match.extracted),
+            original_error=match.text,
+            line_number=match.line_number,
+            recoverable=pattern.severity != ErrorSeverity.CRITICAL,
+            suggestions=list(pattern.suggestions),
+            context={**match.extracted, "position": match.start},
+        )
     
     def detect(self, text: str) -> List[ErrorInfo]:
         """
@@ -212,31 +430,19 @@ class ErrorDetector:
         Returns:
             List of detected ErrorInfo objects
         """
-        detected = []
-        
-        for pattern in self._patterns:
-            match = pattern.match(text)
-            if match:
-                # Extract information from match
-                extracted = pattern.extract_info(match)
-                
-                # Format message with extracted info
-                message = pattern.message_template
-                for key, value in extracted.items():
-                    message = message.replace(f"{{{key}}}", str(value))
-                
-                error_info = ErrorInfo(
-                    category=pattern.category,
-                    severity=pattern.severity,
-                    message=message,
-                    original_error=match.group(0),
-                    recoverable=pattern.severity != ErrorSeverity.CRITICAL,
-                    suggestions=list(pattern.suggestions),
-                    context=extracted,
-                )
-                detected.append(error_info)
+        return [self._to_error_info(match) for match in self.scan(text)]
+    
+    def detect_file(self, path: Union[str, Path]) -> List[ErrorInfo]:
+        """
+        Detect all errors in an output file without reading it into memory.
         
-        return detected
+        Args:
+            path: Output file to search
+            
+        Returns:
+            List of detected ErrorInfo objects
+        """
+        return [self._to_error_info(match) for match in self.scan_file(path)]
     
     def detect_first(self, text: str) -> Optional[ErrorInfo]:
         """
@@ -248,8 +454,8 @@ class ErrorDetector:
         Returns:
             First detected error or None
         """
-        errors = self.detect(text)
-        return errors[0] if errors else None
+        matches = self.scan(text, first_only=True)
+        return self._to_error_info(matches[0]) if matches else None
     
     def detect_by_category(
         self,
@@ -301,6 +507,7 @@ def detect_error(text: str) -> Optional[ErrorInfo]:
 def detect_psi4_error(
     output: str,
     error_message: Optional[str] = None,
+    output_file: Optional[Union[str, Path]] = None,
 ) -> Optional[ErrorInfo]:
     """
     Detect Psi4-specific error from output.
@@ -308,6 +515,7 @@ def detect_psi4_error(
     Args:
         output: Psi4 output text
         error_message: Optional error message from exception
+        output_file: Optional Psi4 output file, scanned memory-mapped
         
     Returns:
         Detected error information
@@ -321,9 +529,15 @@ def detect_psi4_error(
             return error
     
     # Then check the full output
-    error = detector.detect_first(output)
-    if error:
-        return error
+    if output:
+        error = detector.detect_first(output)
+        if error:
+            return error
+    
+    if output_file is not None:
+        matches = detector.scan_file(output_file, first_only=True)
+        if matches:
+            return detector._to_error_info(matches[0])
     
     # Fall back to basic categorization
     if error_message:
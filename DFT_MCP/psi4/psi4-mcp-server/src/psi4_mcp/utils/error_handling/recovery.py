@@ -4,11 +4,17 @@ Error Recovery for Psi4 MCP Server.
 Provides automatic and assisted error recovery strategies.
 """
 
+import json
+import os
+import tempfile
+import threading
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Type
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Sequence, Type
 
+from psi4_mcp.utils.convergence.strategies import ConvergenceStrategy, create_aggressive_strategy
 from psi4_mcp.utils.error_handling.categorization import ErrorCategory, ErrorInfo
 
 
@@ -89,6 +95,11 @@ class RecoveryStrategy(ABC):
     def get_description(self) -> str:
         """Get human-readable description."""
         pass
+    
+    @property
+    def key(self) -> str:
+        """Stable identifier used in the recovery history."""
+        return self.get_description()
 
 
 class SCFDampingRecovery(RecoveryStrategy):
@@ -142,7 +153,7 @@ class SCFLevelShiftRecovery(RecoveryStrategy):
         """Apply level shift to options."""
         options = dict(current_options)
         options["level_shift"] = self.level_shift
-        options["level_shift_convergence"] = 1e-4
+        options["level_shift_cutoff"] = 1e-4
         return options
     
     def get_description(self) -> str:
@@ -254,8 +265,8 @@ class OptimizationRecovery(RecoveryStrategy):
         options = dict(current_options)
         
         # Reduce step size
-        current_step = options.get("step_limit", 0.3)
-        options["step_limit"] = current_step * 0.5
+        current_step = options.get("intrafrag_step_limit", 0.5)
+        options["intrafrag_step_limit"] = current_step * 0.5
         
         # Increase iterations
         current_iter = options.get("geom_maxiter", 50)
@@ -267,6 +278,90 @@ class OptimizationRecovery(RecoveryStrategy):
         return "Reduce step size and increase max iterations"
 
 
+class ConvergenceStrategyRecovery(RecoveryStrategy):
+    """Recovery that applies a convergence strategy from utils.convergence."""
+    
+    def __init__(
+        self,
+        strategy: ConvergenceStrategy,
+        applicable_categories: List[ErrorCategory],
+        priority: int = 50,
+    ):
+        super().__init__(
+            name=strategy.name,
+            applicable_categories=applicable_categories,
+            priority=priority,
+        )
+        self.strategy = strategy
+    
+    def get_modified_options(
+        self,
+        error_info: ErrorInfo,
+        current_options: Dict[str, Any],
+    ) -> Dict[str, Any]:
+        """Merge the strategy's Psi4 options."""
+        options = dict(current_options)
+        options.update(self.strategy.get_options())
+        return options
+    
+    def get_description(self) -> str:
+        return self.strategy.get_description()
+
+
+class RecoveryHistory:
+    """
+    Persistent record of which strategies fixed which kinds of systems.
+    
+    Stored as JSON: {signature: {strategy key: {successes, failures,
+    total_cost}}}, where cost is the wall time of the attempt in seconds.
+    """
+    
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path) if path else None
+        self._lock = threading.Lock()
+        self._records: Dict[str, Dict[str, Dict[str, float]]] = self._load()
+    
+    def _load(self) -> Dict[str, Dict[str, Dict[str, float]]]:
+        if self.path is None or not self.path.exists():
+            return {}
+        try:
+            with open(self.path, "r") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _save(self) -> None:
+        if self.path is None:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_name = tempfile.mkstemp(dir=self.path.parent, suffix=".tmp")
+        with os.fdopen(fd, "w") as f:
+            json.dump(self._records, f, indent=2)
+        os.replace(tmp_name, self.path)
+    
+    def record(self, signatures: Sequence[str], strategy_key: str, success: bool, cost: float) -> None:
+        """Record one attempt under every signature of the system."""
+        with self._lock:
+            for signature in signatures:
+                entry = self._records.setdefault(signature, {}).setdefault(
+                    strategy_key, {"successes": 0, "failures": 0, "total_cost": 0.0}
+                )
+                if success:
+                    entry["successes"] += 1
+                    entry["total_cost"] += cost
+                else:
+                    entry["failures"] += 1
+            self._save()
+    
+    def lookup(self, signatures: Sequence[str]) -> Dict[str, Dict[str, float]]:
+        """Records of the most specific signature that has any."""
+        with self._lock:
+            for signature in signatures:
+                if self._records.get(signature):
+                    return dict(self._records[signature])
+        return {}
+
+
 class RecoveryManager:
     """
     Manager for error recovery strategies.
@@ -275,11 +370,12 @@ class RecoveryManager:
     recovery attempts.
     """
     
-    def __init__(self):
+    def __init__(self, history_path: Optional[Path] = None):
         """Initialize with default strategies."""
         self._strategies: List[RecoveryStrategy] = []
         self._setup_default_strategies()
         self._attempts: Dict[str, List[RecoveryResult]] = {}
+        self.history = RecoveryHistory(history_path)
     
     def _setup_default_strategies(self) -> None:
         """Set up default recovery strategies."""
@@ -292,6 +388,11 @@ class RecoveryManager:
             MemoryReductionRecovery(),
             LinearDependencyRecovery(),
             OptimizationRecovery(),
+            ConvergenceStrategyRecovery(
+                create_aggressive_strategy(),
+                applicable_categories=[ErrorCategory.SCF_CONVERGENCE, ErrorCategory.CONVERGENCE],
+                priority=40,
+            ),
         ])
         
         # Sort by priority
@@ -340,6 +441,49 @@ class RecoveryManager:
             for s in strategies
         ]
     
+    def rank_strategies(
+        self,
+        error_info: ErrorInfo,
+        signatures: Sequence[str] = (),
+    ) -> List[RecoveryStrategy]:
+        """
+        Order the applicable strategy ladder using past outcomes.
+        
+        Strategies that already fixed a similar system come first, cheapest
+        (mean wall time) first; untried ones keep their escalation order;
+        strategies that only ever failed go last.
+        
+        Args:
+            error_info: Error information
+            signatures: System signatures, most specific first
+            
+        Returns:
+            Strategies in the order they should be tried
+        """
+        records = self.history.lookup(signatures)
+        
+        def rank(indexed: tuple) -> tuple:
+            index, strategy = indexed
+            entry = records.get(strategy.key)
+            if entry is None:
+                return (1, index, 0.0)
+            if entry["successes"] > 0:
+                return (0, entry["total_cost"] / entry["successes"], index)
+            return (2, index, 0.0)
+        
+        applicable = list(enumerate(self.get_applicable_strategies(error_info)))
+        return [strategy for _, strategy in sorted(applicable, key=rank)]
+    
+    def record_outcome(
+        self,
+        signatures: Sequence[str],
+        strategy: RecoveryStrategy,
+        success: bool,
+        cost: float,
+    ) -> None:
+        """Record whether a strategy fixed a system, and at what cost."""
+        self.history.record(signatures, strategy.key, success, cost)
+    
     def record_attempt(
         self,
         calculation_id: str,
@@ -373,10 +517,52 @@ def get_recovery_manager() -> RecoveryManager:
     """Get the global recovery manager."""
     global _recovery_manager
     if _recovery_manager is None:
-        _recovery_manager = RecoveryManager()
+        from psi4_mcp.config import get_config
+        config = get_config()
+        _recovery_manager = RecoveryManager(
+            history_path=Path(config.output_dir) / "recovery_history.json"
+        )
     return _recovery_manager
 
 
+TRANSITION_METALS = frozenset({
+    "Sc", "Ti", "V", "Cr", "Mn", "Fe", "Co", "Ni", "Cu", "Zn",
+    "Y", "Zr", "Nb", "Mo", "Tc", "Ru", "Rh", "Pd", "Ag", "Cd",
+    "Hf", "Ta", "W", "Re", "Os", "Ir", "Pt", "Au", "Hg",
+})
+
+
+def system_signatures(
+    category: ErrorCategory,
+    elements: Sequence[str],
+    method: str = "",
+    multiplicity: int = 1,
+) -> List[str]:
+    """
+    Signatures under which recovery outcomes are shared, most specific first.
+    
+    The exact signature uses the element set, method and multiplicity; the
+    coarse one only whether transition metals are present and whether the
+    system is open-shell, so new molecules still benefit from experience.
+    
+    Args:
+        category: Error category being recovered
+        elements: Element symbols of the molecule
+        method: Method or functional name
+        multiplicity: Spin multiplicity
+        
+    Returns:
+        List of signature strings
+    """
+    element_set = sorted({e.capitalize() for e in elements})
+    has_tm = any(e in TRANSITION_METALS for e in element_set)
+    shell = "open" if multiplicity > 1 else "closed"
+    return [
+        f"{category.value}|{'-'.join(element_set)}|{method.lower()}|m{multiplicity}",
+        f"{category.value}|{'tm' if has_tm else 'main'}|{shell}",
+    ]
+
+
 def attempt_recovery(
     error_info: ErrorInfo,
     current_options: Dict[str, Any],
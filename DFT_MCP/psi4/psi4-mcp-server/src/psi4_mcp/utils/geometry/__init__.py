@@ -6,6 +6,7 @@ This module provides utilities for molecular geometry operations:
 - Geometry analysis (bonds, angles, dihedrals)
 - Symmetry detection
 - Structure alignment
+- Cell-list neighbor search
 - Geometry builders
 
 Example Usage:
@@ -58,6 +59,8 @@ from psi4_mcp.utils.geometry.symmetry import (
     is_symmetric,
 )
 
+from psi4_mcp.utils.geometry.neighbors import neighbor_pairs
+
 from psi4_mcp.utils.geometry.transformations import (
     cartesian_to_internal,
     internal_to_cartesian,
@@ -99,6 +102,9 @@ __all__ = [
     "get_symmetry_operations",
     "is_symmetric",
     
+    # Neighbor search
+    "neighbor_pairs",
+    
     # Transformations
     "cartesian_to_internal",
     "internal_to_cartesian",
@@ -0,0 +1,63 @@
+"""
+Neighbor Search.
+
+Atom pairs within a distance cutoff without comparing every pair: atoms
+are binned into cubic cells of the cutoff size and only atoms in
+neighboring cells are compared, in vectorized blocks.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# Cell offsets of a cell and its 26 neighbors
+_OFFSETS = [(a, b, c) for a in (-1, 0, 1) for b in (-1, 0, 1) for c in (-1, 0, 1)]
+
+
+def neighbor_pairs(coordinates: np.ndarray, cutoff: float) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Atom pairs within a distance cutoff.
+
+    Args:
+        coordinates: (n_atoms, 3) coordinates
+        cutoff: Maximum distance (same units as coordinates)
+
+    Returns:
+        (i, j, distance) arrays with i < j, sorted by (i, j)
+    """
+    coords = np.asarray(coordinates, dtype=float).reshape(-1, 3)
+    if len(coords) < 2 or cutoff <= 0:
+        empty = np.zeros(0, dtype=int)
+        return empty, empty, np.zeros(0)
+
+    keys = np.floor(coords / cutoff).astype(np.int64)
+    cells: Dict[Tuple[int, int, int], np.ndarray] = {}
+    order = np.lexsort(keys.T[::-1])
+    bounds = np.flatnonzero(np.any(np.diff(keys[order], axis=0) != 0, axis=1)) + 1
+    for block in np.split(order, bounds):
+        cells[tuple(keys[block[0]].tolist())] = block
+
+    found_i, found_j, found_d = [], [], []
+    for cell, idx_a in cells.items():
+        for offset in _OFFSETS:
+            neighbor = (cell[0] + offset[0], cell[1] + offset[1], cell[2] + offset[2])
+            # Visit each pair of cells once
+            if neighbor < cell or neighbor not in cells:
+                continue
+            idx_b = cells[neighbor]
+            dist = np.linalg.norm(coords[idx_a][:, None, :] - coords[idx_b][None, :, :], axis=-1)
+            mask = dist <= cutoff
+            if neighbor == cell:
+                mask &= idx_a[:, None] < idx_b[None, :]
+            ia, ib = np.nonzero(mask)
+            found_i.append(idx_a[ia])
+            found_j.append(idx_b[ib])
+            found_d.append(dist[ia, ib])
+
+    i = np.concatenate(found_i) if found_i else np.zeros(0, dtype=int)
+    j = np.concatenate(found_j) if found_j else np.zeros(0, dtype=int)
+    d = np.concatenate(found_d) if found_d else np.zeros(0)
+    i, j = np.minimum(i, j), np.maximum(i, j)
+    order = np.lexsort((j, i))
+    return i[order], j[order], d[order]
@@ -7,11 +7,13 @@ Provides utilities for molecular data handling.
 from psi4_mcp.utils.molecular.database import MoleculeDatabase, MoleculeRecord, get_molecule_database
 from psi4_mcp.utils.molecular.descriptors import MolecularDescriptors, calculate_descriptors
 from psi4_mcp.utils.molecular.fingerprints import MolecularFingerprint, calculate_fingerprint
+from psi4_mcp.utils.molecular.index import SIMILARITY_METRICS, FingerprintIndex
 from psi4_mcp.utils.molecular.similarity import calculate_similarity, find_similar_molecules
 
 __all__ = [
     "MoleculeDatabase", "MoleculeRecord", "get_molecule_database",
     "MolecularDescriptors", "calculate_descriptors",
     "MolecularFingerprint", "calculate_fingerprint",
+    "SIMILARITY_METRICS", "FingerprintIndex",
     "calculate_similarity", "find_similar_molecules",
 ]
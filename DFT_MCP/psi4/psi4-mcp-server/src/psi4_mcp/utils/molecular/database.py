@@ -2,6 +2,12 @@
 Molecule Database for Psi4 MCP Server.
 
 Provides storage and retrieval of molecular structures.
+
+Every record is fingerprinted once when it is added; structural
+similarity lookups go through a FingerprintIndex, which can be kept on
+disk (index_path) so large libraries are not re-fingerprinted on load.
+Records are also kept in a GeometryIndex to find the same molecule given
+with reordered atoms, another orientation or small coordinate noise.
 """
 
 from dataclasses import dataclass, field
@@ -10,6 +16,10 @@ from typing import Any, Dict, List, Optional, Tuple
 import json
 from pathlib import Path
 
+from psi4_mcp.utils.caching.geometry_index import NEAR_DUPLICATE_RMSD, GeometryIndex
+from psi4_mcp.utils.molecular.fingerprints import calculate_fingerprint
+from psi4_mcp.utils.molecular.index import FingerprintIndex
+
 
 @dataclass
 class MoleculeRecord:
@@ -28,6 +38,10 @@ class MoleculeRecord:
     def n_atoms(self) -> int:
         return len(self.elements)
     
+    @property
+    def geometry(self) -> List[Tuple[str, float, float, float]]:
+        return [(elem, *xyz) for elem, xyz in zip(self.elements, self.coordinates)]
+    
     def to_xyz_string(self) -> str:
         lines = [str(self.n_atoms), self.name or ""]
         for elem, (x, y, z) in zip(self.elements, self.coordinates):
@@ -64,9 +78,11 @@ class MoleculeRecord:
 class MoleculeDatabase:
     """Database for storing and retrieving molecules."""
     
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(self, storage_path: Optional[Path] = None, index_path: Optional[Path] = None):
         self.storage_path = storage_path
         self._molecules: Dict[str, MoleculeRecord] = {}
+        self.index = FingerprintIndex(index_path)
+        self.geometry_index = GeometryIndex()
         self._load_common_molecules()
     
     def _load_common_molecules(self) -> None:
@@ -82,10 +98,30 @@ class MoleculeDatabase:
         }
         for name, (elements, coords) in common.items():
             self._molecules[name] = MoleculeRecord(name=name, elements=elements, coordinates=coords)
+        # A persistent index may hold records that load() has not read yet
+        self._sync_index(prune=False)
+    
+    def _sync_index(self, prune: bool = True) -> None:
+        """Index all records (geometries, missing fingerprints); optionally drop stale fingerprints."""
+        if prune:
+            for key in self.index.keys():
+                if key not in self._molecules:
+                    self.index.remove(key)
+        for key, mol in self._molecules.items():
+            self.geometry_index.add(key, mol.geometry, mol.charge, mol.multiplicity)
+        missing = [key for key in self._molecules if key not in self.index]
+        self.index.add_many(missing, (
+            calculate_fingerprint(self._molecules[key].elements, self._molecules[key].coordinates,
+                                  n_bits=self.index.n_bits)
+            for key in missing
+        ))
     
     def add(self, molecule: MoleculeRecord) -> str:
         key = molecule.name or f"mol_{len(self._molecules)}"
         self._molecules[key] = molecule
+        self.geometry_index.add(key, molecule.geometry, molecule.charge, molecule.multiplicity)
+        self.index.add(key, calculate_fingerprint(molecule.elements, molecule.coordinates,
+                                                  n_bits=self.index.n_bits))
         return key
     
     def get(self, name: str) -> Optional[MoleculeRecord]:
@@ -94,6 +130,8 @@ class MoleculeDatabase:
     def remove(self, name: str) -> bool:
         if name in self._molecules:
             del self._molecules[name]
+            self.index.remove(name)
+            self.geometry_index.remove(name)
             return True
         return False
     
@@ -108,6 +146,32 @@ class MoleculeDatabase:
                 results.append(mol)
         return results
     
+    def find_geometry(
+        self,
+        elements: List[str],
+        coordinates: List[Tuple[float, float, float]],
+        charge: int = 0,
+        multiplicity: int = 1,
+        tolerance: float = NEAR_DUPLICATE_RMSD,
+    ) -> Optional[MoleculeRecord]:
+        """Stored record of the same molecule (any atom order and orientation, RMSD within tolerance)."""
+        geometry = [(elem, *xyz) for elem, xyz in zip(elements, coordinates)]
+        key = self.geometry_index.find(geometry, charge, multiplicity, tolerance)
+        return self._molecules.get(key) if key else None
+    
+    def find_similar(
+        self,
+        elements: List[str],
+        coordinates: List[Tuple[float, float, float]],
+        top_k: int = 10,
+        threshold: float = 0.0,
+        metric: str = "tanimoto",
+    ) -> List[Tuple[MoleculeRecord, float]]:
+        """Most similar stored molecules by fingerprint similarity."""
+        query = calculate_fingerprint(elements, coordinates, n_bits=self.index.n_bits)
+        matches = self.index.search(query, top_k=top_k, threshold=threshold, metric=metric)
+        return [(self._molecules[key], sim) for key, sim in matches if key in self._molecules]
+    
     def save(self, filepath: Optional[Path] = None) -> None:
         path = filepath or self.storage_path
         if path is None:
@@ -115,6 +179,7 @@ class MoleculeDatabase:
         data = {name: mol.to_dict() for name, mol in self._molecules.items()}
         with open(path, "w") as f:
             json.dump(data, f, indent=2, default=str)
+        self.index.flush()
     
     def load(self, filepath: Optional[Path] = None) -> None:
         path = filepath or self.storage_path
@@ -124,6 +189,7 @@ class MoleculeDatabase:
             data = json.load(f)
         for name, mol_data in data.items():
             self._molecules[name] = MoleculeRecord.from_dict(mol_data)
+        self._sync_index()
 
 
 _database: Optional[MoleculeDatabase] = None
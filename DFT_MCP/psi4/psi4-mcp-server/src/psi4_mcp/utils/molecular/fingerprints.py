@@ -2,10 +2,27 @@
 Molecular Fingerprints for Psi4 MCP Server.
 
 Generates fingerprints for molecular comparison.
+
+Bit positions come from a stable hash of the atom environments, so
+fingerprints are reproducible across processes and can be stored
+(packed into uint64 words) in a persistent FingerprintIndex.
 """
 
 from dataclasses import dataclass, field
 from typing import Any, Dict, List, Set, Tuple
+import zlib
+
+import numpy as np
+
+
+def _stable_hash(text: str) -> int:
+    """Process-independent string hash (the builtin hash is salted per process)."""
+    return zlib.crc32(text.encode("utf-8"))
+
+
+def packed_words(n_bits: int) -> int:
+    """Number of uint64 words holding n_bits."""
+    return (n_bits + 63) // 64
 
 
 @dataclass
@@ -14,6 +31,20 @@ class MolecularFingerprint:
     bits: Set[int] = field(default_factory=set)
     n_bits: int = 1024
     
+    def to_packed(self) -> np.ndarray:
+        """Bits packed into uint64 words (bit i is bit i % 64 of word i // 64)."""
+        words = np.zeros(packed_words(self.n_bits), dtype=np.uint64)
+        if self.bits:
+            positions = np.fromiter(self.bits, dtype=np.int64)
+            masks = np.left_shift(np.uint64(1), (positions & 63).astype(np.uint64))
+            np.bitwise_or.at(words, positions >> 6, masks)
+        return words
+    
+    @classmethod
+    def from_packed(cls, words: np.ndarray, n_bits: int) -> "MolecularFingerprint":
+        unpacked = np.unpackbits(np.asarray(words, dtype="<u8").view(np.uint8), bitorder="little")
+        return cls(bits=set(np.flatnonzero(unpacked[:n_bits]).tolist()), n_bits=n_bits)
+    
     def to_binary_string(self) -> str:
         return "".join("1" if i in self.bits else "0" for i in range(self.n_bits))
     
@@ -44,7 +75,7 @@ def calculate_fingerprint(
     # Element-based bits
     element_hash = {"H": 0, "C": 1, "N": 2, "O": 3, "F": 4, "S": 5, "P": 6, "Cl": 7}
     for elem in elements:
-        bit = element_hash.get(elem, hash(elem)) % n_bits
+        bit = element_hash.get(elem, _stable_hash(elem)) % n_bits
         bits.add(bit)
     
     # Count-based bits
@@ -53,7 +84,7 @@ def calculate_fingerprint(
         element_counts[elem] = element_counts.get(elem, 0) + 1
     
     for elem, count in element_counts.items():
-        bit = (hash(f"{elem}_{count}") % n_bits + n_bits) % n_bits
+        bit = _stable_hash(f"{elem}_{count}") % n_bits
         bits.add(bit)
     
     # Distance-based bits
@@ -71,7 +102,7 @@ def calculate_fingerprint(
         
         # Hash atom environment
         env_str = f"{elements[i]}:" + ",".join(sorted(n[0] for n in neighbors))
-        bit = (hash(env_str) % n_bits + n_bits) % n_bits
+        bit = _stable_hash(env_str) % n_bits
         bits.add(bit)
     
     # Bond-based bits (approximate)
@@ -86,7 +117,7 @@ def calculate_fingerprint(
             dist = (dx*dx + dy*dy + dz*dz) ** 0.5
             if dist < (ri + rj) * 1.3:  # Bonded
                 bond_str = "-".join(sorted([elements[i], elements[j]]))
-                bit = (hash(bond_str) % n_bits + n_bits) % n_bits
+                bit = _stable_hash(bond_str) % n_bits
                 bits.add(bit)
     
     return MolecularFingerprint(bits=bits, n_bits=n_bits)
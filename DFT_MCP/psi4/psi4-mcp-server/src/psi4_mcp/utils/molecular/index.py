@@ -0,0 +1,307 @@
+"""
+Fingerprint Similarity Index for Psi4 MCP Server.
+
+Stores the fingerprints of many molecules as rows of packed uint64 words
+and searches them with vectorized popcounts:
+
+- Similarities follow from the bit counts of the rows (kept alongside the
+  matrix) and of their intersection with the query, evaluated for large
+  blocks of rows at once.
+- With a threshold, rows whose bit count alone rules out a match are
+  skipped; when few rows remain, only those are gathered and compared.
+- The best top_k rows are selected with a partial sort.
+
+A persistent index is a directory holding the fingerprint matrix and the
+bit counts as memory-mapped .npy files and the keys as JSON. Additions
+and removals update the matrix in place; rows of removed entries are
+reused.
+"""
+
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple, Union
+import json
+import logging
+import os
+
+import numpy as np
+
+from psi4_mcp.utils.molecular.fingerprints import MolecularFingerprint, packed_words
+
+
+logger = logging.getLogger(__name__)
+
+SIMILARITY_METRICS = ("tanimoto", "dice", "cosine")
+
+# Rows per vectorized search block
+SEARCH_BLOCK_ROWS = 1 << 16
+
+
+@lru_cache(maxsize=1)
+def _popcount_table() -> np.ndarray:
+    table = np.zeros(1 << 16, dtype=np.uint8)
+    for bit in range(16):
+        table += ((np.arange(1 << 16) >> bit) & 1).astype(np.uint8)
+    return table
+
+
+def popcount_rows(words: np.ndarray) -> np.ndarray:
+    """Number of set bits in each row of a (n, n_words) uint64 array."""
+    words = np.ascontiguousarray(words, dtype=np.uint64)
+    if hasattr(np, "bitwise_count"):
+        counts = np.bitwise_count(words)
+    else:
+        counts = _popcount_table()[words.view(np.uint16)]
+    # Row sums stay below 2^16 for fingerprints up to 65535 bits
+    return counts.sum(axis=-1, dtype=np.uint16 if words.shape[-1] * 64 < 1 << 16 else np.int64)
+
+
+def similarity_scores(common: np.ndarray, counts: np.ndarray, query_count: int, metric: str) -> np.ndarray:
+    """Similarities from intersection and fingerprint bit counts."""
+    common = common.astype(float)
+    counts = counts.astype(float)
+    if metric == "tanimoto":
+        denominator = counts + query_count - common
+    elif metric == "dice":
+        common = 2 * common
+        denominator = counts + query_count
+    elif metric == "cosine":
+        denominator = np.sqrt(counts * query_count)
+    else:
+        raise ValueError(f"Unknown similarity metric '{metric}'. Use: {', '.join(SIMILARITY_METRICS)}")
+    return np.divide(common, denominator, out=np.zeros_like(common), where=denominator > 0)
+
+
+def count_bounds(query_count: int, threshold: float, metric: str) -> Tuple[float, float]:
+    """Range of fingerprint bit counts that can reach threshold against the query."""
+    if threshold <= 0 or query_count == 0:
+        return 0.0, np.inf
+    if metric == "tanimoto":
+        return threshold * query_count, query_count / threshold
+    if metric == "dice":
+        return threshold * query_count / (2 - threshold), query_count * (2 - threshold) / threshold
+    return threshold ** 2 * query_count, query_count / threshold ** 2
+
+
+class FingerprintIndex:
+    """
+    Packed fingerprint matrix with top-k similarity search.
+
+    Args:
+        path: Directory of a persistent index (opened if it exists)
+        n_bits: Fingerprint length (taken from the files for existing indexes)
+        capacity: Initial number of rows
+    """
+
+    MATRIX_FILE = "fingerprints.npy"
+    COUNTS_FILE = "counts.npy"
+    KEYS_FILE = "keys.json"
+
+    def __init__(self, path: Optional[Union[str, Path]] = None, n_bits: int = 1024, capacity: int = 1024):
+        self.path = Path(path) if path is not None else None
+        self.n_bits = n_bits
+        self._keys: List[Optional[str]] = []
+        self._rows: Dict[str, int] = {}
+        self._free: List[int] = []
+        if self.path is not None and (self.path / self.KEYS_FILE).exists():
+            self._open()
+        else:
+            self._matrix, self._counts = self._allocate(max(capacity, 1))
+
+    @property
+    def n_words(self) -> int:
+        return packed_words(self.n_bits)
+
+    @property
+    def capacity(self) -> int:
+        return len(self._counts)
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self._rows
+
+    def keys(self) -> List[str]:
+        return list(self._rows)
+
+    # ----- storage -----
+
+    def _allocate(self, capacity: int, suffix: str = "") -> Tuple[np.ndarray, np.ndarray]:
+        if self.path is None:
+            return np.zeros((capacity, self.n_words), dtype=np.uint64), np.full(capacity, -1, dtype=np.int32)
+        self.path.mkdir(parents=True, exist_ok=True)
+        matrix = np.lib.format.open_memmap(
+            self.path / (self.MATRIX_FILE + suffix), mode="w+", dtype=np.uint64, shape=(capacity, self.n_words)
+        )
+        counts = np.lib.format.open_memmap(
+            self.path / (self.COUNTS_FILE + suffix), mode="w+", dtype=np.int32, shape=(capacity,)
+        )
+        counts[:] = -1
+        return matrix, counts
+
+    def _open(self) -> None:
+        with open(self.path / self.KEYS_FILE, "r") as f:
+            meta = json.load(f)
+        self.n_bits = meta["n_bits"]
+        self._keys = meta["keys"]
+        self._matrix = np.load(self.path / self.MATRIX_FILE, mmap_mode="r+")
+        self._counts = np.load(self.path / self.COUNTS_FILE, mmap_mode="r+")
+        for row, key in enumerate(self._keys):
+            if key is None:
+                self._free.append(row)
+            else:
+                self._rows[key] = row
+        logger.debug(f"Opened fingerprint index {self.path} ({len(self._rows)} entries)")
+
+    def _grow(self, capacity: int) -> None:
+        size = len(self._keys)
+        matrix, counts = self._allocate(capacity, ".tmp" if self.path is not None else "")
+        matrix[:size] = self._matrix[:size]
+        counts[:size] = self._counts[:size]
+        if self.path is not None:
+            matrix.flush()
+            counts.flush()
+            del self._matrix, self._counts, matrix, counts
+            for name in (self.MATRIX_FILE, self.COUNTS_FILE):
+                os.replace(self.path / (name + ".tmp"), self.path / name)
+            self._matrix = np.load(self.path / self.MATRIX_FILE, mmap_mode="r+")
+            self._counts = np.load(self.path / self.COUNTS_FILE, mmap_mode="r+")
+        else:
+            self._matrix, self._counts = matrix, counts
+
+    def _assign_rows(self, keys: List[str]) -> np.ndarray:
+        """Rows for keys: existing rows are overwritten, then free rows, then new ones."""
+        rows = np.empty(len(keys), dtype=np.int64)
+        new = []
+        for i, key in enumerate(keys):
+            if key in self._rows:
+                rows[i] = self._rows[key]
+            elif self._free:
+                rows[i] = self._free.pop()
+            else:
+                new.append(i)
+        start = len(self._keys)
+        if start + len(new) > self.capacity:
+            self._grow(max(2 * self.capacity, start + len(new)))
+        self._keys.extend([None] * len(new))
+        rows[new] = np.arange(start, start + len(new))
+        for key, row in zip(keys, rows.tolist()):
+            self._keys[row] = key
+            self._rows[key] = row
+        return rows
+
+    def flush(self) -> None:
+        """Write a persistent index to disk."""
+        if self.path is None:
+            return
+        self._matrix.flush()
+        self._counts.flush()
+        tmp = self.path / (self.KEYS_FILE + ".tmp")
+        with open(tmp, "w") as f:
+            json.dump({"n_bits": self.n_bits, "keys": self._keys}, f)
+        os.replace(tmp, self.path / self.KEYS_FILE)
+
+    # ----- entries -----
+
+    def add(self, key: str, fingerprint: MolecularFingerprint) -> None:
+        """Add or replace one fingerprint."""
+        self.add_many([key], [fingerprint])
+
+    def add_many(self, keys: Iterable[str], fingerprints: Iterable[MolecularFingerprint]) -> None:
+        """Add or replace fingerprints (later duplicates of a key win)."""
+        latest: Dict[str, MolecularFingerprint] = {}
+        for key, fingerprint in zip(keys, fingerprints):
+            if fingerprint.n_bits != self.n_bits:
+                raise ValueError(f"Fingerprint has {fingerprint.n_bits} bits, index uses {self.n_bits}")
+            latest[key] = fingerprint
+        if not latest:
+            return
+        packed = np.stack([fp.to_packed() for fp in latest.values()])
+        rows = self._assign_rows(list(latest))
+        self._matrix[rows] = packed
+        self._counts[rows] = popcount_rows(packed)
+
+    def remove(self, key: str) -> bool:
+        row = self._rows.pop(key, None)
+        if row is None:
+            return False
+        self._keys[row] = None
+        self._matrix[row] = 0
+        self._counts[row] = -1
+        self._free.append(row)
+        return True
+
+    def get(self, key: str) -> Optional[MolecularFingerprint]:
+        row = self._rows.get(key)
+        if row is None:
+            return None
+        return MolecularFingerprint.from_packed(self._matrix[row], self.n_bits)
+
+    # ----- search -----
+
+    def search(
+        self,
+        fingerprint: MolecularFingerprint,
+        top_k: Optional[int] = 10,
+        threshold: float = 0.0,
+        metric: str = "tanimoto",
+    ) -> List[Tuple[str, float]]:
+        """
+        Most similar entries.
+
+        Args:
+            fingerprint: Query fingerprint
+            top_k: Number of results (None for all above threshold)
+            threshold: Minimum similarity
+            metric: One of SIMILARITY_METRICS
+
+        Returns:
+            (key, similarity) pairs, most similar first
+        """
+        if metric not in SIMILARITY_METRICS:
+            raise ValueError(f"Unknown similarity metric '{metric}'. Use: {', '.join(SIMILARITY_METRICS)}")
+        if fingerprint.n_bits != self.n_bits:
+            raise ValueError(f"Fingerprint has {fingerprint.n_bits} bits, index uses {self.n_bits}")
+        if top_k is not None and top_k <= 0:
+            return []
+
+        query = fingerprint.to_packed()
+        query_count = int(popcount_rows(query[None, :])[0])
+        size = len(self._keys)
+        counts = np.asarray(self._counts[:size])
+        low, high = count_bounds(query_count, threshold, metric)
+        eligible = (counts >= 0) & (counts >= low - 1e-9) & (counts <= high + 1e-9)
+        candidates = np.flatnonzero(eligible)
+        # Scanning contiguous blocks beats gathering unless most rows are ruled out
+        gather = len(candidates) < size // 4
+        n_rows = len(candidates) if gather else size
+        buffer = np.empty((min(SEARCH_BLOCK_ROWS, max(n_rows, 1)), self.n_words), dtype=np.uint64)
+
+        found_rows: List[np.ndarray] = []
+        found_scores: List[np.ndarray] = []
+        for start in range(0, n_rows, SEARCH_BLOCK_ROWS):
+            if gather:
+                rows = candidates[start:start + SEARCH_BLOCK_ROWS]
+                block = self._matrix[rows]
+            else:
+                stop = min(start + SEARCH_BLOCK_ROWS, size)
+                rows = np.arange(start, stop)
+                block = self._matrix[start:stop]
+            intersection = np.bitwise_and(block, query, out=buffer[:len(rows)])
+            common = popcount_rows(intersection)
+            scores = similarity_scores(common, counts[rows], query_count, metric)
+            keep = (scores >= threshold) & eligible[rows]
+            rows, scores = rows[keep], scores[keep]
+            if top_k is not None and len(scores) > top_k:
+                best = np.argpartition(-scores, top_k - 1)[:top_k]
+                rows, scores = rows[best], scores[best]
+            found_rows.append(rows)
+            found_scores.append(scores)
+        if not found_rows:
+            return []
+
+        rows = np.concatenate(found_rows)
+        scores = np.concatenate(found_scores)
+        order = np.lexsort((rows, -scores))[:top_k]
+        return [(self._keys[row], float(score)) for row, score in zip(rows[order].tolist(), scores[order])]
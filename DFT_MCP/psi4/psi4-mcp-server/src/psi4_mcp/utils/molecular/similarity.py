@@ -4,8 +4,9 @@ Molecular Similarity for Psi4 MCP Server.
 Calculates similarity between molecules.
 """
 
-from typing import List, Tuple
+from typing import List, Tuple, Union
 from psi4_mcp.utils.molecular.fingerprints import MolecularFingerprint, calculate_fingerprint
+from psi4_mcp.utils.molecular.index import FingerprintIndex
 
 
 def tanimoto_similarity(fp1: MolecularFingerprint, fp2: MolecularFingerprint) -> float:
@@ -53,19 +54,27 @@ def calculate_similarity(
 def find_similar_molecules(
     query_elements: List[str],
     query_coords: List[Tuple[float, float, float]],
-    database: List[Tuple[str, List[str], List[Tuple[float, float, float]]]],
+    database: Union[FingerprintIndex, List[Tuple[str, List[str], List[Tuple[float, float, float]]]]],
     threshold: float = 0.7,
     top_k: int = 10,
+    method: str = "tanimoto",
 ) -> List[Tuple[str, float]]:
-    """Find similar molecules in database."""
-    query_fp = calculate_fingerprint(query_elements, query_coords)
+    """
+    Find similar molecules in database.
     
-    similarities = []
-    for name, elements, coords in database:
-        fp = calculate_fingerprint(elements, coords)
-        sim = tanimoto_similarity(query_fp, fp)
-        if sim >= threshold:
-            similarities.append((name, sim))
+    The database is either a FingerprintIndex (fingerprints computed once,
+    searched in place) or a list of (name, elements, coordinates), which is
+    fingerprinted and searched as a temporary index.
+    """
+    if isinstance(database, FingerprintIndex):
+        query_fp = calculate_fingerprint(query_elements, query_coords, n_bits=database.n_bits)
+        return database.search(query_fp, top_k=top_k, threshold=threshold, metric=method)
     
-    similarities.sort(key=lambda x: x[1], reverse=True)
-    return similarities[:top_k]
+    query_fp = calculate_fingerprint(query_elements, query_coords)
+    index = FingerprintIndex(n_bits=query_fp.n_bits, capacity=len(database))
+    index.add_many(
+        (str(i) for i in range(len(database))),
+        (calculate_fingerprint(elements, coords) for _, elements, coords in database),
+    )
+    matches = index.search(query_fp, top_k=top_k, threshold=threshold, metric=method)
+    return [(database[int(i)][0], sim) for i, sim in matches]
@@ -7,9 +7,20 @@ Provides utilities for parallel execution.
 from psi4_mcp.utils.parallel.thread_manager import ThreadManager, get_thread_manager, configure_threads
 from psi4_mcp.utils.parallel.task_queue import TaskQueue, Task, TaskStatus
 from psi4_mcp.utils.parallel.mpi_interface import MPIInterface, is_mpi_available, get_mpi_info
+from psi4_mcp.utils.parallel.scheduler import (
+    ResourceScheduler, ResourceRequest, ResourceGrant, AdmissionError,
+    get_scheduler, configure_scheduler,
+)
+from psi4_mcp.utils.parallel.workers import (
+    worker_resources, share_resources, spawn_pool, run_in_worker, submit_task, run_worker_tasks,
+)
 
 __all__ = [
     "ThreadManager", "get_thread_manager", "configure_threads",
     "TaskQueue", "Task", "TaskStatus",
     "MPIInterface", "is_mpi_available", "get_mpi_info",
+    "ResourceScheduler", "ResourceRequest", "ResourceGrant", "AdmissionError",
+    "get_scheduler", "configure_scheduler",
+    "worker_resources", "share_resources", "spawn_pool", "run_in_worker", "submit_task",
+    "run_worker_tasks",
 ]
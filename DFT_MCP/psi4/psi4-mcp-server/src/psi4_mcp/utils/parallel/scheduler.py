@@ -0,0 +1,686 @@
+"""
+Resource-Aware Admission Scheduler for Psi4 MCP Server.
+
+Admits calculations onto the node only when their predicted memory and
+thread footprint fits next to the jobs already running:
+
+- Footprints are estimated from molecule, basis and method with
+  MemoryEstimator, corrected by measured peak RSS of earlier jobs.
+- Granted memory and threads are tracked with MemoryManager and
+  ThreadManager; jobs that would oversubscribe are down-sized to their
+  estimated need or queued until resources are released.
+- Estimates are advisory: a grant never exceeds the memory the caller
+  asked for, and an estimate beyond the node is clamped to its capacity.
+- Smaller jobs may start ahead of a queued large job (backfill) unless
+  that job has waited longer than ``starvation_seconds``.
+- With a ledger directory, leases are shared between all server processes
+  on the node through lock-protected lease files.
+"""
+
+import json
+import logging
+import os
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+from dataclasses import dataclass, field, replace
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+from psi4_mcp.utils.helpers.constants import get_atomic_number
+from psi4_mcp.utils.helpers.string_utils import parse_geometry_string
+from psi4_mcp.utils.memory.estimator import CalculationType, MemoryEstimate, MemoryEstimator
+from psi4_mcp.utils.memory.manager import MemoryAllocation, MemoryManager, get_system_memory_mb
+from psi4_mcp.utils.parallel.thread_manager import ThreadManager
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+
+logger = logging.getLogger(__name__)
+
+
+# =============================================================================
+# FOOTPRINT ESTIMATION
+# =============================================================================
+
+# Contracted basis functions per atom for (H-He, Li-Ne, Na and heavier)
+BASIS_FUNCTIONS_PER_ATOM: Dict[str, tuple] = {
+    "sto-3g": (1, 5, 9),
+    "3-21g": (2, 9, 13),
+    "6-31g": (2, 9, 13),
+    "6-31g*": (2, 15, 19),
+    "6-31g(d)": (2, 15, 19),
+    "6-31g**": (5, 15, 19),
+    "6-31g(d,p)": (5, 15, 19),
+    "6-31+g*": (2, 19, 23),
+    "6-31+g**": (5, 19, 23),
+    "6-311g": (3, 13, 17),
+    "6-311g**": (6, 18, 22),
+    "6-311+g**": (6, 22, 26),
+    "6-311++g**": (7, 22, 26),
+    "cc-pvdz": (5, 14, 18),
+    "cc-pvtz": (14, 30, 34),
+    "cc-pvqz": (30, 55, 59),
+    "cc-pv5z": (55, 91, 95),
+    "aug-cc-pvdz": (9, 23, 27),
+    "aug-cc-pvtz": (23, 46, 50),
+    "aug-cc-pvqz": (46, 80, 84),
+    "def2-svp": (5, 14, 18),
+    "def2-svpd": (7, 18, 22),
+    "def2-tzvp": (6, 31, 37),
+    "def2-tzvpp": (14, 31, 37),
+    "def2-tzvpd": (9, 36, 42),
+    "def2-qzvp": (30, 57, 63),
+    "def2-qzvpp": (30, 57, 63),
+}
+DEFAULT_BASIS_FUNCTIONS = BASIS_FUNCTIONS_PER_ATOM["cc-pvdz"]
+
+# Correction factors are clamped so a single odd measurement cannot
+# make the scheduler reject or over-pack everything afterwards.
+CORRECTION_BOUNDS = (0.25, 8.0)
+CORRECTION_SMOOTHING = 0.3
+
+
+def count_basis_functions(symbols: List[str], basis: str) -> int:
+    """
+    Approximate the number of basis functions for a molecule.
+
+    Args:
+        symbols: Element symbols.
+        basis: Basis set name.
+
+    Returns:
+        Estimated number of contracted basis functions.
+    """
+    per_atom = BASIS_FUNCTIONS_PER_ATOM.get(basis.strip().lower(), DEFAULT_BASIS_FUNCTIONS)
+    n_basis = 0
+    for symbol in symbols:
+        z = get_atomic_number(symbol)
+        if z <= 2:
+            n_basis += per_atom[0]
+        elif z <= 10:
+            n_basis += per_atom[1]
+        else:
+            n_basis += per_atom[2]
+    return n_basis
+
+
+def classify_method(method: str, tool_name: str = "") -> CalculationType:
+    """
+    Map a method string (and tool name) to a memory-estimation type.
+
+    Args:
+        method: Method name, e.g. "ccsd(t)", "mp2", "b3lyp".
+        tool_name: Name of the tool running the calculation.
+
+    Returns:
+        CalculationType used by MemoryEstimator.
+    """
+    method = method.strip().lower()
+    tool_name = tool_name.lower()
+
+    if "ccsd(t)" in method or "ccsd_t" in method:
+        return CalculationType.CCSD_T
+    if method.startswith(("ccsd", "eom-cc", "cc2", "cc3", "bccd", "qcisd")):
+        return CalculationType.CCSD
+    if "mp2" in method or method.startswith(("mp3", "mp2.5", "omp")):
+        return CalculationType.MP2
+    if method.startswith("sapt"):
+        return CalculationType.MP2
+    if "tddft" in tool_name or "excited" in tool_name or method.startswith("td-"):
+        return CalculationType.TDDFT
+    if method in ("hf", "scf", "rhf", "uhf", "rohf"):
+        return CalculationType.SCF
+    return CalculationType.DFT
+
+
+# =============================================================================
+# REQUESTS AND GRANTS
+# =============================================================================
+
+@dataclass
+class ResourceRequest:
+    """Predicted resource footprint of one calculation."""
+    name: str
+    calc_type: CalculationType
+    need_mb: float
+    want_mb: float
+    n_threads: int
+    min_threads: int = 1
+    estimate: Optional[MemoryEstimate] = None
+    correction: float = 1.0
+
+
+@dataclass
+class ResourceGrant:
+    """Resources granted to an admitted calculation."""
+    job_id: str
+    request: ResourceRequest
+    memory_mb: float
+    n_threads: int
+    downsized: bool = False
+    queued_seconds: float = 0.0
+    started: float = field(default_factory=time.monotonic)
+    allocation: Optional[MemoryAllocation] = None
+
+
+class AdmissionError(Exception):
+    """Raised when a request times out in the admission queue."""
+
+    def __init__(self, message: str, resource_type: str, requested: float, available: float):
+        super().__init__(message)
+        self.resource_type = resource_type
+        self.requested = requested
+        self.available = available
+
+
+# =============================================================================
+# LEASE LEDGERS
+# =============================================================================
+
+class _LocalLedger:
+    """Leases held by this process only."""
+
+    def __init__(self):
+        self._leases: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        with self._lock:
+            yield
+
+    def active(self) -> List[Dict[str, Any]]:
+        return list(self._leases.values())
+
+    def add(self, job_id: str, lease: Dict[str, Any]) -> None:
+        self._leases[job_id] = lease
+
+    def remove(self, job_id: str) -> None:
+        self._leases.pop(job_id, None)
+
+    def load_corrections(self) -> Dict[str, float]:
+        return {}
+
+    def save_corrections(self, corrections: Dict[str, float]) -> None:
+        pass
+
+
+class _FileLedger(_LocalLedger):
+    """Leases shared by every process on the node via files in one directory."""
+
+    def __init__(self, directory: Path):
+        super().__init__()
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._lock_path = self.directory / ".lock"
+
+    @contextmanager
+    def locked(self) -> Iterator[None]:
+        with self._lock, open(self._lock_path, "a") as handle:
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(handle, fcntl.LOCK_UN)
+
+    def _lease_path(self, job_id: str) -> Path:
+        return self.directory / f"lease-{os.getpid()}-{job_id}.json"
+
+    def active(self) -> List[Dict[str, Any]]:
+        leases = []
+        for path in self.directory.glob("lease-*.json"):
+            try:
+                lease = json.loads(path.read_text())
+            except (OSError, ValueError):
+                continue
+            if not _pid_alive(lease.get("pid", -1)):
+                # Crashed holder: reclaim its resources
+                path.unlink(missing_ok=True)
+                continue
+            leases.append(lease)
+        return leases
+
+    def add(self, job_id: str, lease: Dict[str, Any]) -> None:
+        path = self._lease_path(job_id)
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(lease))
+        os.replace(tmp_path, path)
+
+    def remove(self, job_id: str) -> None:
+        self._lease_path(job_id).unlink(missing_ok=True)
+
+    def load_corrections(self) -> Dict[str, float]:
+        try:
+            return json.loads((self.directory / "corrections.json").read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def save_corrections(self, corrections: Dict[str, float]) -> None:
+        path = self.directory / "corrections.json"
+        tmp_path = path.with_suffix(".tmp")
+        tmp_path.write_text(json.dumps(corrections, indent=2))
+        os.replace(tmp_path, path)
+
+
+def _pid_alive(pid: int) -> bool:
+    """Check whether a process id is still running."""
+    if pid <= 0:
+        return False
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+# =============================================================================
+# PEAK MEMORY SAMPLING
+# =============================================================================
+
+def _read_proc_status(field_name: str) -> Optional[int]:
+    """Integer value of a field of /proc/self/status (None if unknown)."""
+    try:
+        with open("/proc/self/status", "r") as f:
+            for line in f:
+                if line.startswith(field_name + ":"):
+                    return int(line.split()[1])
+    except (FileNotFoundError, PermissionError, ValueError):
+        pass
+    return None
+
+
+def get_process_rss_mb() -> float:
+    """Current resident set size of this process in MB (0.0 if unknown)."""
+    rss_kb = _read_proc_status("VmRSS")
+    return rss_kb / 1024 if rss_kb is not None else 0.0
+
+
+def get_process_threads() -> int:
+    """Current number of OS threads of this process."""
+    threads = _read_proc_status("Threads")
+    return threads if threads is not None else threading.active_count()
+
+
+class PeakRSSSampler:
+    """Background sampler for the peak RSS growth (and thread count) during a calculation."""
+
+    def __init__(self, interval: float = 0.2):
+        self.interval = interval
+        self.baseline_mb = 0.0
+        self.peak_mb = 0.0
+        self.peak_threads = 0
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self.baseline_mb = self.peak_mb = get_process_rss_mb()
+        self.peak_threads = get_process_threads()
+        self._thread = threading.Thread(target=self._run, name="rss-sampler", daemon=True)
+        self._thread.start()
+
+    def _sample(self) -> None:
+        self.peak_mb = max(self.peak_mb, get_process_rss_mb())
+        self.peak_threads = max(self.peak_threads, get_process_threads())
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def stop(self) -> float:
+        """Stop sampling and return the peak growth over the baseline in MB."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self._sample()
+        return max(0.0, self.peak_mb - self.baseline_mb)
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+class ResourceScheduler:
+    """
+    Node-level admission control for calculations.
+
+    Example:
+        scheduler = ResourceScheduler(max_memory_mb=64000, max_threads=32)
+        request = scheduler.estimate_request("energy", "ccsd", "cc-pvtz", geometry)
+        with scheduler.reserve(request) as grant:
+            run(memory=grant.memory_mb, n_threads=grant.n_threads)
+    """
+
+    def __init__(
+        self,
+        max_memory_mb: Optional[float] = None,
+        max_threads: Optional[int] = None,
+        reserve_mb: float = 512.0,
+        estimator: Optional[MemoryEstimator] = None,
+        ledger_dir: Optional[Path] = None,
+        allow_downsize: bool = True,
+        starvation_seconds: float = 300.0,
+        poll_interval: float = 0.5,
+    ):
+        self.max_memory_mb = max_memory_mb or get_system_memory_mb()
+        self.memory_manager = MemoryManager(max_memory_mb=self.max_memory_mb, reserve_mb=reserve_mb)
+        self.thread_manager = ThreadManager(max_threads=max_threads)
+        self.estimator = estimator or MemoryEstimator()
+        self.allow_downsize = allow_downsize
+        self.starvation_seconds = starvation_seconds
+        self.poll_interval = poll_interval
+
+        if ledger_dir is not None and fcntl is not None:
+            self._ledger: _LocalLedger = _FileLedger(ledger_dir)
+        else:
+            self._ledger = _LocalLedger()
+
+        self._condition = threading.Condition()
+        self._waiting: List[tuple] = []  # (ticket, enqueued_at)
+        self._active: Dict[str, ResourceGrant] = {}
+        self._corrections: Dict[str, float] = self._ledger.load_corrections()
+
+    # -------------------------------------------------------------------------
+    # Capacity
+    # -------------------------------------------------------------------------
+
+    @property
+    def capacity_mb(self) -> float:
+        return self.memory_manager.max_memory_mb - self.memory_manager.reserve_mb
+
+    @property
+    def capacity_threads(self) -> int:
+        return self.thread_manager.max_threads
+
+    def _free_resources(self) -> tuple:
+        """Free (memory_mb, threads) on the node; call with the ledger locked."""
+        leases = self._ledger.active()
+        used_mb = sum(lease["memory_mb"] for lease in leases)
+        used_threads = sum(lease["n_threads"] for lease in leases)
+        return self.capacity_mb - used_mb, self.capacity_threads - used_threads
+
+    # -------------------------------------------------------------------------
+    # Estimation
+    # -------------------------------------------------------------------------
+
+    def correction_for(self, calc_type: CalculationType) -> float:
+        """Measured/estimated memory ratio learned for a calculation type."""
+        return self._corrections.get(calc_type.value, 1.0)
+
+    def estimate_request(
+        self,
+        name: str,
+        method: str,
+        basis: str,
+        geometry: str,
+        charge: int = 0,
+        memory_mb: Optional[float] = None,
+        n_threads: Optional[int] = None,
+    ) -> ResourceRequest:
+        """
+        Predict the footprint of a calculation.
+
+        Args:
+            name: Job name (usually the tool name).
+            method: Method name.
+            basis: Basis set name.
+            geometry: Molecule geometry string.
+            charge: Molecular charge.
+            memory_mb: Memory requested by the caller, if any; never
+                exceeded by a grant.
+            n_threads: Threads requested by the caller, if any.
+
+        Returns:
+            ResourceRequest with the corrected memory need.
+        """
+        symbols = [atom[0] for atom in parse_geometry_string(geometry)]
+        n_basis = count_basis_functions(symbols, basis)
+        n_electrons = max(0, sum(max(get_atomic_number(s), 0) for s in symbols) - charge)
+
+        calc_type = classify_method(method, name)
+        estimate = self.estimator.estimate(calc_type, n_basis, n_electrons)
+        correction = self.correction_for(calc_type)
+        need_mb = estimate.total_mb * correction
+
+        if n_threads is None:
+            n_threads = self.thread_manager.optimal_threads_for_system(n_basis, len(symbols))
+
+        # The estimate is advisory: the caller's request caps the grant
+        if memory_mb and need_mb > memory_mb:
+            logger.warning(
+                f"{name}: estimated ~{need_mb:.0f} MB exceeds the {memory_mb:.0f} MB "
+                "requested; admitting at the requested memory"
+            )
+            need_mb = memory_mb
+
+        return ResourceRequest(
+            name=name,
+            calc_type=calc_type,
+            need_mb=need_mb,
+            want_mb=memory_mb or need_mb,
+            n_threads=max(1, min(n_threads, self.capacity_threads)),
+            estimate=estimate,
+            correction=correction,
+        )
+
+    # -------------------------------------------------------------------------
+    # Admission
+    # -------------------------------------------------------------------------
+
+    def _try_admit(self, request: ResourceRequest, may_backfill: bool) -> Optional[ResourceGrant]:
+        """Admit a request if it fits now; call with the condition held."""
+        if not may_backfill:
+            return None
+
+        with self._ledger.locked():
+            free_mb, free_threads = self._free_resources()
+
+            if request.want_mb <= free_mb and request.n_threads <= free_threads:
+                memory_mb, n_threads = request.want_mb, request.n_threads
+            elif (self.allow_downsize and request.need_mb <= free_mb
+                    and request.min_threads <= free_threads):
+                memory_mb = min(request.want_mb, free_mb)
+                n_threads = max(request.min_threads, min(request.n_threads, free_threads))
+            else:
+                return None
+
+            job_id = uuid.uuid4().hex[:12]
+            self._ledger.add(job_id, {
+                "job_id": job_id,
+                "pid": os.getpid(),
+                "name": request.name,
+                "memory_mb": memory_mb,
+                "n_threads": n_threads,
+                "calc_type": request.calc_type.value,
+            })
+
+        allocation = self.memory_manager.allocate(request.name, memory_mb, job_id=job_id)
+        self.thread_manager.reserve(n_threads)
+        return ResourceGrant(
+            job_id=job_id,
+            request=request,
+            memory_mb=memory_mb,
+            n_threads=n_threads,
+            downsized=memory_mb < request.want_mb or n_threads < request.n_threads,
+            allocation=allocation,
+        )
+
+    def _may_backfill(self, ticket: str, now: float) -> bool:
+        """Queue head always goes; others only while the head is not starving."""
+        if not self._waiting or self._waiting[0][0] == ticket:
+            return True
+        return now - self._waiting[0][1] < self.starvation_seconds
+
+    def acquire(self, request: ResourceRequest, timeout: Optional[float] = None) -> ResourceGrant:
+        """
+        Block until the request can be admitted.
+
+        Args:
+            request: Predicted footprint.
+            timeout: Maximum seconds to wait in the queue (None waits forever).
+
+        Returns:
+            ResourceGrant describing the admitted memory and threads.
+
+        A request larger than the node (the estimate is a heuristic) is
+        clamped to the node capacity and queued like any other.
+
+        Raises:
+            AdmissionError: If the timeout expires.
+        """
+        if request.want_mb > self.capacity_mb:
+            logger.warning(
+                f"{request.name}: ~{request.want_mb:.0f} MB exceeds the node capacity; "
+                f"clamping to {self.capacity_mb:.0f} MB"
+            )
+            request = replace(
+                request,
+                need_mb=min(request.need_mb, self.capacity_mb),
+                want_mb=self.capacity_mb,
+            )
+
+        ticket = uuid.uuid4().hex
+        enqueued = time.monotonic()
+        deadline = None if timeout is None else enqueued + timeout
+
+        with self._condition:
+            self._waiting.append((ticket, enqueued))
+            try:
+                while True:
+                    now = time.monotonic()
+                    grant = self._try_admit(request, self._may_backfill(ticket, now))
+                    if grant is not None:
+                        grant.queued_seconds = now - enqueued
+                        self._active[grant.job_id] = grant
+                        if grant.queued_seconds > self.poll_interval or grant.downsized:
+                            logger.info(
+                                f"Admitted {request.name} ({grant.memory_mb:.0f} MB, "
+                                f"{grant.n_threads} threads) after {grant.queued_seconds:.1f}s"
+                                f"{' [down-sized]' if grant.downsized else ''}"
+                            )
+                        return grant
+
+                    if deadline is not None and now >= deadline:
+                        free_mb, _ = self._free_resources_unlocked()
+                        raise AdmissionError(
+                            f"Timed out after {timeout:.0f}s waiting for "
+                            f"{request.need_mb:.0f} MB for {request.name}",
+                            "memory", request.need_mb, free_mb,
+                        )
+
+                    wait = self.poll_interval
+                    if deadline is not None:
+                        wait = min(wait, max(0.0, deadline - now))
+                    self._condition.wait(wait)
+            finally:
+                self._waiting = [entry for entry in self._waiting if entry[0] != ticket]
+                self._condition.notify_all()
+
+    def _free_resources_unlocked(self) -> tuple:
+        with self._ledger.locked():
+            return self._free_resources()
+
+    def release(self, grant: ResourceGrant, peak_rss_mb: Optional[float] = None) -> None:
+        """
+        Return a grant's resources and learn from its measured peak memory.
+
+        Args:
+            grant: Grant returned by acquire().
+            peak_rss_mb: Measured peak RSS growth of the calculation, if known.
+        """
+        with self._condition:
+            if self._active.pop(grant.job_id, None) is None:
+                return
+            with self._ledger.locked():
+                self._ledger.remove(grant.job_id)
+                if peak_rss_mb is not None:
+                    self._record_feedback(grant.request, peak_rss_mb)
+            if grant.allocation is not None:
+                self.memory_manager.release(grant.allocation)
+            self.thread_manager.release(grant.n_threads)
+            self._condition.notify_all()
+
+    def _record_feedback(self, request: ResourceRequest, peak_rss_mb: float) -> None:
+        """Blend the measured/raw-estimate ratio into the type's correction."""
+        if request.estimate is None or request.estimate.total_mb <= 0 or peak_rss_mb <= 0:
+            return
+
+        # Re-read so concurrent processes refine one shared set of factors
+        self._corrections.update(self._ledger.load_corrections())
+
+        ratio = peak_rss_mb / request.estimate.total_mb
+        key = request.calc_type.value
+        previous = self._corrections.get(key, 1.0)
+        blended = (1 - CORRECTION_SMOOTHING) * previous + CORRECTION_SMOOTHING * ratio
+        self._corrections[key] = min(max(blended, CORRECTION_BOUNDS[0]), CORRECTION_BOUNDS[1])
+        self._ledger.save_corrections(self._corrections)
+
+    @contextmanager
+    def reserve(self, request: ResourceRequest, timeout: Optional[float] = None,
+                measure: bool = True) -> Iterator[ResourceGrant]:
+        """
+        Context manager that acquires, measures and releases a grant.
+
+        Peak RSS is only fed back when the calculation ran alone in this
+        process, since in-process jobs cannot be told apart.
+        """
+        grant = self.acquire(request, timeout=timeout)
+        sampler = None
+        if measure and len(self._active) == 1:
+            sampler = PeakRSSSampler()
+            sampler.start()
+        try:
+            yield grant
+        finally:
+            peak = sampler.stop() if sampler is not None else None
+            if peak is not None and len(self._active) != 1:
+                peak = None
+            self.release(grant, peak_rss_mb=peak)
+
+    # -------------------------------------------------------------------------
+    # Reporting
+    # -------------------------------------------------------------------------
+
+    def get_statistics(self) -> Dict[str, Any]:
+        """Current node usage, queue length and learned corrections."""
+        with self._condition:
+            free_mb, free_threads = self._free_resources_unlocked()
+            return {
+                "capacity_mb": self.capacity_mb,
+                "capacity_threads": self.capacity_threads,
+                "free_mb": free_mb,
+                "free_threads": free_threads,
+                "active_jobs": len(self._active),
+                "queued_jobs": len(self._waiting),
+                "corrections": dict(self._corrections),
+            }
+
+
+_scheduler: Optional[ResourceScheduler] = None
+
+
+def get_scheduler() -> ResourceScheduler:
+    """Get the process-wide scheduler, configured from the server config."""
+    global _scheduler
+    if _scheduler is None:
+        from psi4_mcp.config import get_config
+        config = get_config()
+        _scheduler = ResourceScheduler(
+            max_memory_mb=min(config.max_memory, get_system_memory_mb()),
+            max_threads=min(config.max_threads, os.cpu_count() or config.max_threads),
+            ledger_dir=Path(config.scheduler_dir) if config.scheduler_dir else None,
+        )
+    return _scheduler
+
+
+def configure_scheduler(**kwargs: Any) -> ResourceScheduler:
+    """Replace the process-wide scheduler with one built from kwargs."""
+    global _scheduler
+    _scheduler = ResourceScheduler(**kwargs)
+    return _scheduler
@@ -0,0 +1,118 @@
+"""
+Worker Process Pools for Psi4 MCP Server.
+
+Runs independent Psi4 calculations (scan points, subsystems, conformers,
+workflow branches) in separate processes. Psi4 keeps global state, so
+each worker is a fresh "spawn" process, clears Psi4 per task and writes
+its own output file; the memory and thread budget of the calling tool is
+split over the workers.
+
+Runners are module-level functions taking a task dict and returning a
+result dict; they must not raise for calculation failures (a worker that
+dies is reported as {label_key: ..., "error": "Worker failed: ..."}).
+"""
+
+from concurrent.futures import Future, ProcessPoolExecutor, as_completed
+from typing import Any, Callable, Dict, List, Optional, Tuple
+import logging
+import multiprocessing
+import os
+
+from psi4_mcp.utils.parsing.streaming import calculation_output_path
+
+
+logger = logging.getLogger(__name__)
+
+WorkerTask = Dict[str, Any]
+Runner = Callable[[WorkerTask], Dict[str, Any]]
+
+# Smallest memory (MB) given to one worker
+MIN_WORKER_MEMORY = 256
+
+
+def worker_resources(memory: int, n_threads: int, workers: int) -> Tuple[int, int]:
+    """Memory (MB) and threads of each of workers sharing a budget."""
+    workers = max(1, workers)
+    return max(MIN_WORKER_MEMORY, memory // workers), max(1, n_threads // workers)
+
+
+def share_resources(
+    tasks: List[WorkerTask],
+    max_workers: int,
+    memory: int,
+    n_threads: int,
+    output: Optional[str] = None,
+) -> int:
+    """
+    Split memory and threads over the workers for tasks (in place).
+
+    Args:
+        tasks: WorkerTask dicts; "memory" and "n_threads" are set when several
+            workers run
+        max_workers: Requested worker processes
+        memory: Memory budget (MB) of the whole run
+        n_threads: Thread budget of the whole run
+        output: Output file name for the first task when running serially
+
+    Returns:
+        Number of workers to use
+    """
+    workers = max(1, min(max_workers, len(tasks)))
+    if workers > 1:
+        worker_memory, worker_threads = worker_resources(memory, n_threads, workers)
+        for task in tasks:
+            task.update(memory=worker_memory, n_threads=worker_threads)
+    elif tasks and output:
+        tasks[0]["output_file"] = calculation_output_path(output)
+    return workers
+
+
+def spawn_pool(max_workers: int) -> ProcessPoolExecutor:
+    """Process pool of fresh interpreters (Psi4 state is not fork-safe)."""
+    return ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context("spawn"))
+
+
+def run_in_worker(runner: Runner, task: WorkerTask, output_prefix: str) -> Dict[str, Any]:
+    """Run a task in a worker, with the worker's own Psi4 output file."""
+    task = dict(task, output_file=calculation_output_path(f"{output_prefix}_{os.getpid()}.out"))
+    return runner(task)
+
+
+def submit_task(pool: ProcessPoolExecutor, runner: Runner, task: WorkerTask, output_prefix: str) -> Future:
+    """Submit a task to a pool from spawn_pool."""
+    return pool.submit(run_in_worker, runner, task, output_prefix)
+
+
+def run_worker_tasks(
+    runner: Runner,
+    tasks: List[WorkerTask],
+    max_workers: int,
+    output_prefix: str,
+    label_key: str = "label",
+) -> List[Dict[str, Any]]:
+    """
+    Run tasks, in parallel workers if requested.
+
+    Args:
+        runner: Module-level function computing one task
+        tasks: WorkerTask dicts
+        max_workers: Worker processes (1 = serial, in this process)
+        output_prefix: Prefix of the per-worker Psi4 output files
+        label_key: WorkerTask key copied into the result of a failed worker
+
+    Returns:
+        Results in completion order (task order when serial)
+    """
+    if max_workers <= 1 or len(tasks) <= 1:
+        return [runner(task) for task in tasks]
+
+    results = []
+    with spawn_pool(max_workers) as pool:
+        futures = {submit_task(pool, runner, task, output_prefix): task for task in tasks}
+        for future in as_completed(futures):
+            try:
+                results.append(future.result())
+            except Exception as e:
+                logger.warning(f"Worker failed on {futures[future].get(label_key)}: {e}")
+                results.append({label_key: futures[future].get(label_key), "error": f"Worker failed: {e}"})
+    return results
@@ -1,7 +1,8 @@
 """
 Output Parsing Utilities for Psi4 MCP Server.
 
-Provides parsers for Psi4 calculation outputs.
+Provides parsers for Psi4 calculation outputs, including a streaming
+parser that follows output while a calculation runs.
 """
 
 from psi4_mcp.utils.parsing.generic import GenericParser, parse_output_section
@@ -9,8 +10,13 @@ from psi4_mcp.utils.parsing.energy import EnergyParser, parse_energy_output
 from psi4_mcp.utils.parsing.optimization import OptimizationParser, parse_optimization_trajectory
 from psi4_mcp.utils.parsing.frequencies import FrequencyParser, parse_frequency_output
 from psi4_mcp.utils.parsing.properties import PropertyParser, parse_property_output
-from psi4_mcp.utils.parsing.orbitals import OrbitalParser, parse_orbital_energies
+from psi4_mcp.utils.parsing.orbitals import OrbitalParser, parse_orbital_energies, build_orbital_output
 from psi4_mcp.utils.parsing.wavefunction import WavefunctionParser, parse_wavefunction
+from psi4_mcp.utils.parsing.streaming import (
+    StreamingOutputParser, ProgressEvent, AbortPolicy, CalculationAborted,
+    stream_calculation, calculation_output_path, add_progress_listener,
+    remove_progress_listener, get_active_streams, prune_output_files,
+)
 
 __all__ = [
     "GenericParser", "parse_output_section",
@@ -18,6 +24,9 @@ __all__ = [
     "OptimizationParser", "parse_optimization_trajectory",
     "FrequencyParser", "parse_frequency_output",
     "PropertyParser", "parse_property_output",
-    "OrbitalParser", "parse_orbital_energies",
+    "OrbitalParser", "parse_orbital_energies", "build_orbital_output",
     "WavefunctionParser", "parse_wavefunction",
+    "StreamingOutputParser", "ProgressEvent", "AbortPolicy", "CalculationAborted",
+    "stream_calculation", "calculation_output_path", "add_progress_listener",
+    "remove_progress_listener", "get_active_streams", "prune_output_files",
 ]
@@ -81,3 +81,42 @@ def parse_orbital_energies(wfn: Any) -> List[float]:
     parser = OrbitalParser()
     result = parser.parse_from_wavefunction(wfn)
     return [orb.energy for orb in result.alpha_orbitals]
+
+
+def build_orbital_output(wfn: Any, include_coefficients: bool = True) -> Any:
+    """
+    Build an array-backed OrbitalOutput from a Psi4 wavefunction.
+    
+    Orbitals are taken in energy order over all irreps (C1 AO basis);
+    the arrays go into the models through the trusted path, without
+    per-orbital validation.
+    """
+    import numpy as np
+    from psi4_mcp.models.outputs.orbitals import OrbitalOutput, OrbitalSet
+    
+    n_alpha, n_beta = wfn.nalpha(), wfn.nbeta()
+    restricted = wfn.same_a_b_orbs()
+    
+    def orbital_set(spin: str, n_occ: int) -> OrbitalSet:
+        suffix = "a" if spin != "beta" else "b"
+        energies = np.asarray(getattr(wfn, f"epsilon_{suffix}_subset")("AO", "ALL").np)
+        occupations = np.zeros(len(energies))
+        occupations[:n_occ] = 2.0 if restricted else 1.0
+        coefficients = None
+        if include_coefficients:
+            coefficients = np.asarray(getattr(wfn, f"C{suffix}_subset")("AO", "ALL").np)
+        return OrbitalSet.from_arrays(
+            energies, occupations, coefficients=coefficients,
+            n_basis=wfn.basisset().nbf(), spin=spin,
+        )
+    
+    alpha = orbital_set("restricted" if restricted else "alpha", n_alpha)
+    beta = None if restricted else orbital_set("beta", n_beta)
+    return OrbitalOutput.from_trusted(
+        alpha=alpha,
+        beta=beta,
+        is_restricted=restricted,
+        n_electrons=n_alpha + n_beta,
+        n_alpha=n_alpha,
+        n_beta=n_beta,
+    )
@@ -0,0 +1,550 @@
+"""
+Streaming Output Parser for Psi4 MCP Server.
+
+Follows a calculation's output file while Psi4 is still writing it:
+
+- One precompiled alternation regex is run over each new chunk of
+  complete lines; a small state machine attributes table rows (e.g. the
+  optking convergence table) to the right section.
+- SCF iterations, final and total energies, optimization steps and error
+  markers are published as ProgressEvents to listeners.
+- An AbortPolicy stops hopeless runs (NaN energies, diverging SCF, fatal
+  runtime errors) by raising CalculationAborted in the calculation's thread.
+
+Each tool run gets its own output file (see calculation_output_path), so
+concurrent calculations never share one output; prune_output_files keeps
+the output directory bounded.
+"""
+
+import codecs
+import ctypes
+import itertools
+import logging
+import math
+import os
+import re
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+
+logger = logging.getLogger(__name__)
+
+_NUMBER = r"[-+]?(?:\d+\.\d*(?:[eEdD][-+]?\d+)?|nan|inf)"
+_EXP_NUMBER = r"[-+]?(?:\d+\.\d+[eE][-+]?\d+|nan|inf)"
+
+# One alternation for everything the stream cares about; the name of the
+# outer group tells which kind of line matched.
+STREAM_PATTERN = re.compile(
+    "|".join([
+        rf"(?P<scf_iter>^[ \t]*@(?P<scf_label>[\w-]+) iter[ \t]+(?P<scf_n>SAD|\d+):[ \t]+"
+        rf"(?P<scf_e>{_NUMBER})[ \t]+(?P<scf_de>{_EXP_NUMBER})[ \t]+(?P<scf_drms>{_EXP_NUMBER}))",
+        rf"(?P<scf_final>^[ \t]*@(?P<final_label>[\w-]+) Final Energy:[ \t]+(?P<final_e>{_NUMBER}))",
+        r"(?P<scf_converged>^[ \t]*Energy and wave function converged)",
+        rf"(?P<total>^[ \t]*(?P<total_label>(?:[\w()*.+-]+[ \t])*?)total energy(?:[ \t]\(a\.u\.\))?"
+        rf"[ \t]*[=:][ \t]*(?P<total_e>{_NUMBER}))",
+        r"(?P<opt_cycle>^[ \t]*Convergence Check Cycle[ \t]+(?P<cycle_n>\d+):)",
+        rf"(?P<opt_row>^[ \t]*(?P<row_n>\d+)[ \t]+(?P<row_e>-\d+\.\d+)[ \t]+(?P<row_de>{_EXP_NUMBER}))",
+        rf"(?P<opt_step>^[ \t]*Step[ \t]+(?P<step_n>\d+)[ \t]+Energy[ \t]+(?P<step_e>{_NUMBER}))",
+        r"(?P<opt_done>Optimization is complete)",
+        r"(?P<error>Could not converge (?:SCF iterations|geometry optimization) in \d+ iterations"
+        r"|PsiException[^\n]*|Fatal Error[^\n]*|(?:insufficient|not enough) memory[^\n]*)",
+        r"(?P<fatal>PSIO_ERROR[^\n]*|std::bad_alloc|Segmentation fault)",
+    ]),
+    re.IGNORECASE | re.MULTILINE,
+)
+
+
+class StreamState(str, Enum):
+    """Section of the output currently being read."""
+    IDLE = "idle"
+    SCF = "scf"
+    OPT_TABLE = "opt_table"
+
+
+@dataclass
+class ProgressEvent:
+    """One piece of progress extracted from a running calculation."""
+    kind: str
+    data: Dict[str, Any] = field(default_factory=dict)
+    source: str = ""
+    timestamp: float = field(default_factory=time.time)
+
+
+@dataclass
+class AbortPolicy:
+    """
+    When to give up on a running calculation.
+
+    Attributes:
+        abort_on_nan: Abort when an SCF energy becomes NaN/inf.
+        abort_on_fatal: Abort on fatal runtime markers (I/O errors, bad_alloc).
+        divergence_min_iterations: SCF iterations before divergence checks start.
+        divergence_window: Consecutive iterations inspected for divergence.
+        divergence_threshold: |dE| (Eh) every iteration in the window must exceed.
+    """
+    abort_on_nan: bool = True
+    abort_on_fatal: bool = True
+    divergence_min_iterations: int = 30
+    divergence_window: int = 8
+    divergence_threshold: float = 1e-3
+
+
+def _to_float(value: str) -> float:
+    return float(value.replace("D", "E").replace("d", "e"))
+
+
+class StreamingOutputParser:
+    """
+    Incremental parser fed with arbitrary chunks of Psi4 output.
+
+    Example:
+        parser = StreamingOutputParser()
+        parser.add_listener(lambda event: print(event.kind, event.data))
+        for chunk in chunks:
+            parser.feed(chunk)
+        parser.close()
+    """
+
+    def __init__(self, source: str = "", abort_policy: Optional[AbortPolicy] = None):
+        self.source = source
+        self.abort_policy = abort_policy or AbortPolicy()
+        self._listeners: List[Callable[[ProgressEvent], None]] = []
+        self._tail = ""
+        self.reset()
+
+    def reset(self) -> None:
+        """Forget all state (e.g. when the output file is rewritten)."""
+        self._tail = ""
+        self.state = StreamState.IDLE
+        self.scf_history: List[tuple] = []
+        self.total_scf_iterations = 0
+        self.n_scf_runs = 0
+        self.energies: Dict[str, float] = {}
+        self.optimization_steps: List[Dict[str, float]] = []
+        self.optimization_converged = False
+        self.errors: List[str] = []
+        self.abort_reason: Optional[str] = None
+
+    def add_listener(self, callback: Callable[[ProgressEvent], None]) -> None:
+        """Register a callback receiving every ProgressEvent."""
+        self._listeners.append(callback)
+
+    def _emit(self, kind: str, **data: Any) -> None:
+        event = ProgressEvent(kind=kind, data=data, source=self.source)
+        for callback in self._listeners:
+            try:
+                callback(event)
+            except Exception as e:
+                logger.debug(f"Progress listener failed: {e}")
+
+    # -------------------------------------------------------------------------
+    # Feeding
+    # -------------------------------------------------------------------------
+
+    def feed(self, chunk: str) -> None:
+        """Parse the complete lines in chunk; a trailing partial line is kept."""
+        text = self._tail + chunk
+        cut = text.rfind("\n") + 1
+        self._tail = text[cut:]
+        if cut:
+            self._scan(text[:cut])
+
+    def close(self) -> None:
+        """Parse whatever partial line is left."""
+        if self._tail:
+            text, self._tail = self._tail, ""
+            self._scan(text + "\n")
+
+    def _scan(self, text: str) -> None:
+        for match in STREAM_PATTERN.finditer(text):
+            handler = getattr(self, f"_on_{match.lastgroup}")
+            handler(match)
+
+    # -------------------------------------------------------------------------
+    # Handlers (one per outer group of STREAM_PATTERN)
+    # -------------------------------------------------------------------------
+
+    def _on_scf_iter(self, match: re.Match) -> None:
+        label = match.group("scf_n")
+        iteration = int(label) if label.isdigit() else 0
+        # A new SCF starts with the SAD guess or when the counter goes back
+        if (self.state != StreamState.SCF or not self.scf_history
+                or iteration == 0 or iteration <= self.scf_history[-1][0]):
+            self.scf_history = []
+            self.n_scf_runs += 1
+        self.state = StreamState.SCF
+
+        energy = _to_float(match.group("scf_e"))
+        delta_e = _to_float(match.group("scf_de"))
+        d_rms = _to_float(match.group("scf_drms"))
+        self.scf_history.append((iteration, energy, delta_e, d_rms))
+        if label.isdigit():
+            self.total_scf_iterations += 1
+
+        self._emit(
+            "scf_iteration", method=match.group("scf_label"), iteration=iteration,
+            energy=energy, delta_e=delta_e, d_rms=d_rms,
+        )
+        self._check_scf_abort(iteration, energy)
+
+    def _on_scf_final(self, match: re.Match) -> None:
+        energy = _to_float(match.group("final_e"))
+        self.energies["scf"] = energy
+        self.state = StreamState.IDLE
+        self._emit("scf_energy", method=match.group("final_label"), energy=energy,
+                   iterations=len(self.scf_history))
+
+    def _on_scf_converged(self, match: re.Match) -> None:
+        self._emit("scf_converged", iterations=len(self.scf_history))
+
+    def _on_total(self, match: re.Match) -> None:
+        label = (match.group("total_label").strip() or "total").lower()
+        energy = _to_float(match.group("total_e"))
+        self.energies[label] = energy
+        self._emit("energy", label=label, energy=energy)
+
+    def _on_opt_cycle(self, match: re.Match) -> None:
+        self.state = StreamState.OPT_TABLE
+
+    def _on_opt_row(self, match: re.Match) -> None:
+        # Numeric rows only count inside the optking convergence table
+        if self.state != StreamState.OPT_TABLE:
+            return
+        self.state = StreamState.IDLE
+        self._record_opt_step(int(match.group("row_n")), _to_float(match.group("row_e")),
+                              _to_float(match.group("row_de")))
+
+    def _on_opt_step(self, match: re.Match) -> None:
+        self._record_opt_step(int(match.group("step_n")), _to_float(match.group("step_e")), None)
+
+    def _record_opt_step(self, step: int, energy: float, delta_e: Optional[float]) -> None:
+        self.optimization_steps.append({"step": step, "energy": energy, "delta_e": delta_e})
+        self._emit("optimization_step", step=step, energy=energy, delta_e=delta_e)
+
+    def _on_opt_done(self, match: re.Match) -> None:
+        self.optimization_converged = True
+        self._emit("optimization_converged", steps=len(self.optimization_steps))
+
+    def _on_error(self, match: re.Match) -> None:
+        message = match.group("error").strip()
+        self.errors.append(message)
+        self._emit("error", message=message)
+
+    def _on_fatal(self, match: re.Match) -> None:
+        message = match.group("fatal").strip()
+        self.errors.append(message)
+        self._emit("error", message=message, fatal=True)
+        if self.abort_policy.abort_on_fatal:
+            self._abort(f"fatal error in output: {message}")
+
+    # -------------------------------------------------------------------------
+    # Abort rules
+    # -------------------------------------------------------------------------
+
+    def _check_scf_abort(self, iteration: int, energy: float) -> None:
+        policy = self.abort_policy
+        if policy.abort_on_nan and not math.isfinite(energy):
+            self._abort(f"SCF not converging (energy {energy} at iteration {iteration})")
+            return
+
+        window = self.scf_history[-policy.divergence_window:]
+        if (iteration >= policy.divergence_min_iterations
+                and len(window) == policy.divergence_window
+                and all(abs(step[2]) > policy.divergence_threshold for step in window)
+                and window[-1][3] >= window[0][3]):
+            self._abort(
+                f"SCF not converging (|dE| above {policy.divergence_threshold:.0e} "
+                f"for {policy.divergence_window} iterations at iteration {iteration})"
+            )
+
+    def _abort(self, reason: str) -> None:
+        if self.abort_reason is None:
+            self.abort_reason = reason
+            self._emit("abort", reason=reason)
+
+    # -------------------------------------------------------------------------
+    # Summary
+    # -------------------------------------------------------------------------
+
+    def progress(self) -> Dict[str, Any]:
+        """Snapshot of what has been parsed so far."""
+        last = self.scf_history[-1] if self.scf_history else None
+        return {
+            "state": self.state.value,
+            "scf_runs": self.n_scf_runs,
+            "scf_iteration": last[0] if last else 0,
+            "scf_energy": last[1] if last else None,
+            "total_scf_iterations": self.total_scf_iterations,
+            "energies": dict(self.energies),
+            "optimization_steps": len(self.optimization_steps),
+            "optimization_converged": self.optimization_converged,
+            "errors": list(self.errors),
+            "aborted": self.abort_reason,
+        }
+
+
+# =============================================================================
+# FILE TAILING
+# =============================================================================
+
+class OutputTail:
+    """Background thread feeding a growing file to a StreamingOutputParser."""
+
+    def __init__(self, path: Path, parser: StreamingOutputParser,
+                 poll_interval: float = 0.5, chunk_size: int = 1 << 16):
+        self.path = Path(path)
+        self.parser = parser
+        self.poll_interval = poll_interval
+        self.chunk_size = chunk_size
+        self._offset = 0
+        self._decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name=f"tail-{self.path.name}", daemon=True)
+        self._thread.start()
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.poll_interval):
+            self.poll()
+
+    def poll(self) -> None:
+        """Read and parse everything appended since the last poll."""
+        try:
+            size = self.path.stat().st_size
+        except OSError:
+            return
+        if size < self._offset:
+            # Output was truncated (a retry reopened it): start over
+            self._offset = 0
+            self._decoder.reset()
+            self.parser.reset()
+        if size == self._offset:
+            return
+
+        with open(self.path, "rb") as f:
+            f.seek(self._offset)
+            while True:
+                data = f.read(self.chunk_size)
+                if not data:
+                    break
+                self._offset += len(data)
+                self.parser.feed(self._decoder.decode(data))
+
+    def stop(self) -> None:
+        """Stop the thread after a final read."""
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        self.poll()
+        self.parser.close()
+
+
+# =============================================================================
+# CALCULATION STREAMS
+# =============================================================================
+
+class CalculationAborted(Exception):
+    """Raised inside a calculation stopped early by its AbortPolicy."""
+
+
+@dataclass
+class CalculationStream:
+    """A running calculation with its own output file and live parser."""
+    name: str
+    path: Path
+    parser: StreamingOutputParser
+    thread_id: int
+    started: float = field(default_factory=time.time)
+    tail: Optional[OutputTail] = None
+    active: bool = True
+
+    def progress(self) -> Dict[str, Any]:
+        return {"name": self.name, "output_file": str(self.path),
+                "elapsed": time.time() - self.started, **self.parser.progress()}
+
+
+_local = threading.local()
+_streams: Dict[int, CalculationStream] = {}
+_streams_lock = threading.Lock()
+_global_listeners: List[Callable[[ProgressEvent], None]] = []
+_counter = itertools.count(1)
+
+
+def add_progress_listener(callback: Callable[[ProgressEvent], None]) -> None:
+    """Receive ProgressEvents from every calculation stream."""
+    _global_listeners.append(callback)
+
+
+def remove_progress_listener(callback: Callable[[ProgressEvent], None]) -> None:
+    """Stop receiving ProgressEvents."""
+    if callback in _global_listeners:
+        _global_listeners.remove(callback)
+
+
+def get_active_streams() -> List[Dict[str, Any]]:
+    """Progress snapshots of all running calculations."""
+    with _streams_lock:
+        streams = list(_streams.values())
+    return [stream.progress() for stream in streams]
+
+
+def _output_dir() -> Path:
+    from psi4_mcp.config import get_config
+    return Path(get_config().output_dir)
+
+
+def prune_output_files(
+    keep: Optional[int] = None,
+    max_age_hours: Optional[float] = None,
+) -> int:
+    """
+    Apply the retention policy to the .out files in the output directory.
+
+    Files of running streams are never removed; of the rest, only the
+    newest `keep` files younger than `max_age_hours` survive.
+
+    Args:
+        keep: Newest files to keep (default: config.output_keep_files, 0 = no limit)
+        max_age_hours: Maximum file age (default: config.output_max_age_hours, 0 = no limit)
+
+    Returns:
+        Number of files removed
+    """
+    from psi4_mcp.config import get_config
+    config = get_config()
+    keep = config.output_keep_files if keep is None else keep
+    max_age_hours = config.output_max_age_hours if max_age_hours is None else max_age_hours
+    if not keep and not max_age_hours:
+        return 0
+
+    with _streams_lock:
+        running = {stream.path for stream in _streams.values()}
+    files = []
+    try:
+        with os.scandir(_output_dir()) as entries:
+            for entry in entries:
+                if entry.name.endswith(".out") and entry.is_file() and Path(entry.path) not in running:
+                    files.append((entry.stat().st_mtime, entry.path))
+    except OSError:
+        return 0
+
+    files.sort(reverse=True)
+    cutoff = time.time() - max_age_hours * 3600 if max_age_hours else None
+    removed = 0
+    for rank, (mtime, path) in enumerate(files):
+        if (keep and rank >= keep) or (cutoff is not None and mtime < cutoff):
+            try:
+                os.remove(path)
+                removed += 1
+            except OSError as e:
+                logger.debug(f"Could not remove old output {path}: {e}")
+    return removed
+
+
+def calculation_output_path(default_name: str = "psi4.out") -> str:
+    """
+    Output file for the calculation running in this thread.
+
+    Inside stream_calculation() this is the stream's file; otherwise a
+    unique file named after default_name in the output directory (old
+    outputs are pruned first, see prune_output_files).
+
+    Args:
+        default_name: Name the tool used to write to (e.g. "psi4_batch.out")
+
+    Returns:
+        Path string for psi4.core.set_output_file
+    """
+    stream = getattr(_local, "stream", None)
+    if stream is not None:
+        return str(stream.path)
+    prune_output_files()
+    stem = Path(default_name).stem
+    return str(_output_dir() / f"{stem}-{os.getpid()}-{next(_counter)}.out")
+
+
+def active_output_file() -> Optional[str]:
+    """Output file of the calculation stream running in this thread, if any."""
+    stream = getattr(_local, "stream", None)
+    return str(stream.path) if stream is not None else None
+
+
+def _raise_in_thread(thread_id: int, reason: str) -> None:
+    """Asynchronously raise CalculationAborted(reason) in another thread."""
+    exc_type = type("CalculationAborted", (CalculationAborted,), {
+        "__init__": lambda self, *args: CalculationAborted.__init__(self, f"Calculation aborted early: {reason}"),
+    })
+    ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(thread_id), ctypes.py_object(exc_type))
+
+
+@contextmanager
+def stream_calculation(
+    name: str,
+    abort_policy: Optional[AbortPolicy] = None,
+    poll_interval: float = 0.5,
+) -> Iterator[CalculationStream]:
+    """
+    Give the calculation in this block its own, live-parsed output file.
+
+    Psi4's output is pointed at the file (tools calling
+    psi4.core.set_output_file(calculation_output_path(...)) get the same
+    path), a tail thread parses it while the block runs, and the block is
+    interrupted with CalculationAborted if the abort policy fires.
+
+    Args:
+        name: Calculation name (usually the tool name)
+        abort_policy: Early-abort rules (default: AbortPolicy())
+        poll_interval: Seconds between reads of the output file
+
+    Yields:
+        CalculationStream with the parser and output path
+    """
+    path = _output_dir() / f"{name}-{time.strftime('%Y%m%d-%H%M%S')}-{os.getpid()}-{next(_counter)}.out"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    parser = StreamingOutputParser(source=name, abort_policy=abort_policy)
+    stream = CalculationStream(name=name, path=path, parser=parser, thread_id=threading.get_ident())
+
+    def forward(event: ProgressEvent) -> None:
+        for callback in list(_global_listeners):
+            try:
+                callback(event)
+            except Exception as e:
+                logger.debug(f"Progress listener failed: {e}")
+        if event.kind == "abort" and stream.active:
+            logger.warning(f"Aborting {name}: {event.data['reason']}")
+            _raise_in_thread(stream.thread_id, event.data["reason"])
+
+    parser.add_listener(forward)
+
+    try:
+        import psi4
+        psi4.core.set_output_file(str(path), False)
+    except ImportError:
+        psi4 = None
+
+    previous = getattr(_local, "stream", None)
+    _local.stream = stream
+    with _streams_lock:
+        _streams[id(stream)] = stream
+    stream.tail = OutputTail(path, parser, poll_interval=poll_interval)
+    stream.tail.start()
+    try:
+        yield stream
+    finally:
+        stream.active = False
+        # Drop an abort that was raised but not yet delivered
+        ctypes.pythonapi.PyThreadState_SetAsyncExc(ctypes.c_ulong(stream.thread_id), None)
+        stream.tail.stop()
+        with _streams_lock:
+            _streams.pop(id(stream), None)
+        _local.stream = previous
+        if psi4 is not None:
+            psi4.core.set_output_file(str(previous.path) if previous else os.devnull, True)
+        prune_output_files()
@@ -0,0 +1,22 @@
+"""
+Profiling and Metrics Utilities for Psi4 MCP Server.
+
+Provides per-call phase timing, resource tracking and metric
+aggregation (JSON and Prometheus text format).
+"""
+
+from psi4_mcp.utils.profiling.metrics import (
+    MetricsRegistry, Counter, Gauge, Histogram, get_metrics_registry,
+)
+from psi4_mcp.utils.profiling.instrumentation import (
+    CallProfile, ProfilerCapture, PHASES,
+    profile_call, profile_phase, current_profile,
+    install_psi4_hooks, get_metrics_summary,
+)
+
+__all__ = [
+    "MetricsRegistry", "Counter", "Gauge", "Histogram", "get_metrics_registry",
+    "CallProfile", "ProfilerCapture", "PHASES",
+    "profile_call", "profile_phase", "current_profile",
+    "install_psi4_hooks", "get_metrics_summary",
+]
@@ -0,0 +1,386 @@
+"""
+Per-Call Instrumentation for Psi4 MCP Server.
+
+Splits every tool call into phases and aggregates them into the metrics
+registry:
+
+- validation, admission (scheduler queue wait)
+- psi4_init: psi4.core.clean/clean_options, set_options, set_memory, ...
+- molecule_build: psi4.geometry
+- scf / post_scf: time inside psi4.energy/optimize/frequency/..., split
+  at the SCF boundaries reported by the streaming output parser
+- post_processing: the rest of the tool's own code
+- serialization: building the tool output
+
+Psi4 entry points are wrapped once; the wrappers only measure while a
+call profile is active in the calling thread. Peak RSS, OS thread count
+and cache hits are recorded per call, and a cProfile (or pyinstrument)
+capture can be enabled per tool.
+"""
+
+import cProfile
+import functools
+import logging
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+from psi4_mcp.utils.profiling.metrics import (
+    MEMORY_BUCKETS_MB,
+    THREAD_BUCKETS,
+    MetricsRegistry,
+    get_metrics_registry,
+)
+
+
+logger = logging.getLogger(__name__)
+
+PHASES = (
+    "validation", "admission", "psi4_init", "molecule_build",
+    "scf", "post_scf", "post_processing", "serialization",
+)
+
+# Psi4 functions attributed to phases: (submodule of psi4 or "", attribute)
+PSI4_INIT_CALLS = [
+    ("core", "clean"), ("core", "clean_options"), ("core", "clean_variables"),
+    ("", "set_options"), ("", "set_memory"), ("", "set_num_threads"),
+    ("core", "set_output_file"), ("core", "be_quiet"),
+]
+MOLECULE_CALLS = [("", "geometry")]
+COMPUTE_CALLS = [
+    ("", "energy"), ("", "gradient"), ("", "optimize"), ("", "opt"),
+    ("", "frequency"), ("", "frequencies"), ("", "freq"), ("", "hessian"),
+    ("", "properties"), ("", "prop"),
+]
+
+_local = threading.local()
+_hooks_installed = False
+_hooks_lock = threading.Lock()
+
+
+@dataclass
+class CallProfile:
+    """Timing and resource usage of one tool call."""
+    tool: str
+    started: float = field(default_factory=time.perf_counter)
+    phases: Dict[str, float] = field(default_factory=dict)
+    success: Optional[bool] = None
+    peak_rss_mb: float = 0.0
+    peak_threads: int = 0
+    cache_hits: int = 0
+    cache_misses: int = 0
+    total: float = 0.0
+    _depth: int = 0
+    _compute: List[Dict[str, float]] = field(default_factory=list)
+    _scf_marks: List[tuple] = field(default_factory=list)
+
+    def add(self, phase: str, seconds: float) -> None:
+        self.phases[phase] = self.phases.get(phase, 0.0) + seconds
+
+    @contextmanager
+    def phase(self, name: str) -> Iterator[None]:
+        """Attribute the block to a phase (nested blocks count once, outermost)."""
+        if self._depth:
+            yield
+            return
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._depth -= 1
+            if name == "compute":
+                self._compute.append({"start": start, "end": start + elapsed})
+            else:
+                self.add(name, elapsed)
+
+    def on_progress(self, event: Any) -> None:
+        """Streaming parser listener: remember SCF start/end times."""
+        if event.kind == "scf_iteration" and event.data.get("iteration", 0) <= 1:
+            self._scf_marks.append(("start", time.perf_counter()))
+        elif event.kind == "scf_energy":
+            self._scf_marks.append(("end", time.perf_counter()))
+
+    def _split_compute(self) -> None:
+        """Split time in psi4 compute calls into SCF and post-SCF."""
+        for span in self._compute:
+            total = span["end"] - span["start"]
+            marks = [(kind, at) for kind, at in self._scf_marks if span["start"] <= at <= span["end"]]
+            if not marks:
+                # Nothing streamed during the call to split on
+                self.add("scf", total)
+                continue
+            scf = 0.0
+            scf_start = None
+            for kind, at in marks:
+                if kind == "start" and scf_start is None:
+                    scf_start = at
+                elif kind == "end":
+                    scf += at - (scf_start if scf_start is not None else span["start"])
+                    scf_start = None
+            if scf_start is not None:
+                scf += span["end"] - scf_start
+            self.add("scf", min(scf, total))
+            self.add("post_scf", max(0.0, total - scf))
+
+    def finish(self) -> None:
+        self.total = time.perf_counter() - self.started
+        self._split_compute()
+        measured = sum(self.phases.values())
+        self.add("post_processing", max(0.0, self.total - measured))
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "tool": self.tool,
+            "success": self.success,
+            "total_seconds": round(self.total, 6),
+            "phases": {k: round(v, 6) for k, v in self.phases.items()},
+            "peak_rss_mb": round(self.peak_rss_mb, 1),
+            "peak_threads": self.peak_threads,
+            "cache_hits": self.cache_hits,
+            "cache_misses": self.cache_misses,
+        }
+
+
+def current_profile() -> Optional[CallProfile]:
+    """Call profile active in this thread, if any."""
+    return getattr(_local, "profile", None)
+
+
+@contextmanager
+def profile_phase(name: str) -> Iterator[None]:
+    """Attribute a block to a phase of the active call profile (no-op otherwise)."""
+    profile = current_profile()
+    if profile is None:
+        yield
+        return
+    with profile.phase(name):
+        yield
+
+
+# =============================================================================
+# PSI4 HOOKS
+# =============================================================================
+
+def _wrap(func: Callable, phase: str) -> Callable:
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        profile = current_profile()
+        if profile is None:
+            return func(*args, **kwargs)
+        with profile.phase(phase):
+            return func(*args, **kwargs)
+    wrapper._psi4_mcp_phase = phase
+    return wrapper
+
+
+def install_psi4_hooks() -> bool:
+    """Wrap Psi4 entry points so calls are attributed to phases."""
+    global _hooks_installed
+    with _hooks_lock:
+        if _hooks_installed:
+            return True
+        try:
+            import psi4
+        except ImportError:
+            return False
+
+        for calls, phase in (
+            (PSI4_INIT_CALLS, "psi4_init"),
+            (MOLECULE_CALLS, "molecule_build"),
+            (COMPUTE_CALLS, "compute"),
+        ):
+            for module_name, attr in calls:
+                module = getattr(psi4, module_name) if module_name else psi4
+                func = getattr(module, attr, None)
+                if func is None or hasattr(func, "_psi4_mcp_phase"):
+                    continue
+                try:
+                    setattr(module, attr, _wrap(func, phase))
+                except (AttributeError, TypeError) as e:
+                    logger.debug(f"Could not instrument psi4.{attr}: {e}")
+        _hooks_installed = True
+        return True
+
+
+# =============================================================================
+# PROFILER CAPTURE
+# =============================================================================
+
+class ProfilerCapture:
+    """cProfile or pyinstrument capture of one call, written to a file."""
+
+    def __init__(self, tool: str, directory: Path, mode: str = "cprofile"):
+        self.tool = tool
+        self.directory = Path(directory)
+        self.mode = mode
+        self.path: Optional[Path] = None
+        self._profiler: Any = None
+
+    def start(self) -> None:
+        if self.mode == "pyinstrument":
+            try:
+                from pyinstrument import Profiler
+                self._profiler = Profiler()
+                self._profiler.start()
+                return
+            except ImportError:
+                logger.warning("pyinstrument not installed; using cProfile")
+                self.mode = "cprofile"
+        self._profiler = cProfile.Profile()
+        self._profiler.enable()
+
+    def stop(self) -> Optional[Path]:
+        if self._profiler is None:
+            return None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        stamp = time.strftime("%Y%m%d-%H%M%S")
+        if self.mode == "pyinstrument":
+            self._profiler.stop()
+            self.path = self.directory / f"{self.tool}-{stamp}.html"
+            self.path.write_text(self._profiler.output_html())
+        else:
+            self._profiler.disable()
+            self.path = self.directory / f"{self.tool}-{stamp}.prof"
+            self._profiler.dump_stats(str(self.path))
+        return self.path
+
+
+def _should_capture(tool: str, selection: str) -> bool:
+    names = {name.strip() for name in selection.split(",") if name.strip()}
+    return "*" in names or tool in names
+
+
+# =============================================================================
+# CALL PROFILING
+# =============================================================================
+
+def _record(registry: MetricsRegistry, profile: CallProfile) -> None:
+    status = "success" if profile.success else "failure"
+    registry.counter("tool_calls_total", "Tool calls by outcome").inc(tool=profile.tool, status=status)
+    registry.histogram("tool_duration_seconds", "Wall time of tool calls").observe(
+        profile.total, tool=profile.tool)
+    phases = registry.histogram("tool_phase_seconds", "Wall time of tool calls by phase")
+    for phase, seconds in profile.phases.items():
+        phases.observe(seconds, tool=profile.tool, phase=phase)
+    registry.histogram("tool_peak_rss_mb", "Peak RSS growth during tool calls (MB)",
+                       buckets=MEMORY_BUCKETS_MB).observe(profile.peak_rss_mb, tool=profile.tool)
+    registry.histogram("tool_peak_threads", "Peak OS threads during tool calls",
+                       buckets=THREAD_BUCKETS).observe(profile.peak_threads, tool=profile.tool)
+    registry.counter("cache_hits_total", "Cache hits during tool calls").inc(
+        profile.cache_hits, tool=profile.tool)
+    registry.counter("cache_misses_total", "Cache misses during tool calls").inc(
+        profile.cache_misses, tool=profile.tool)
+
+
+def _cache_counts() -> tuple:
+    try:
+        from psi4_mcp.utils.caching.cache_manager import get_cache
+        stats = get_cache().get_stats()
+        return stats.hits, stats.misses
+    except Exception:
+        return 0, 0
+
+
+@contextmanager
+def profile_call(
+    tool: str,
+    registry: Optional[MetricsRegistry] = None,
+    capture: str = "",
+    capture_mode: str = "cprofile",
+    capture_dir: Optional[Path] = None,
+) -> Iterator[CallProfile]:
+    """
+    Profile one tool call and record it in the metrics registry.
+
+    Args:
+        tool: Tool name (metric label)
+        registry: Metrics registry (default: global)
+        capture: Comma-separated tool names (or "*") to capture a profile for
+        capture_mode: "cprofile" or "pyinstrument"
+        capture_dir: Where captured profiles are written
+
+    Yields:
+        CallProfile; set .success before leaving the block
+    """
+    from psi4_mcp.utils.parallel.scheduler import PeakRSSSampler
+
+    install_psi4_hooks()
+    registry = registry or get_metrics_registry()
+    profile = CallProfile(tool=tool)
+    sampler = PeakRSSSampler()
+    sampler.start()
+    hits, misses = _cache_counts()
+
+    capturer = None
+    if capture and capture_dir is not None and _should_capture(tool, capture):
+        capturer = ProfilerCapture(tool, capture_dir, capture_mode)
+        capturer.start()
+
+    previous = current_profile()
+    _local.profile = profile
+    active = registry.gauge("tool_calls_in_progress", "Tool calls currently running")
+    active.inc(1, tool=tool)
+    try:
+        yield profile
+    finally:
+        _local.profile = previous
+        active.inc(-1, tool=tool)
+        if capturer is not None:
+            path = capturer.stop()
+            logger.info(f"Profile of {tool} written to {path}")
+        profile.peak_rss_mb = sampler.stop()
+        profile.peak_threads = sampler.peak_threads
+        end_hits, end_misses = _cache_counts()
+        profile.cache_hits = max(0, end_hits - hits)
+        profile.cache_misses = max(0, end_misses - misses)
+        profile.finish()
+        _record(registry, profile)
+
+
+def get_metrics_summary(registry: Optional[MetricsRegistry] = None) -> Dict[str, Any]:
+    """
+    Per-tool summary of the recorded metrics.
+
+    Returns:
+        {tool: {"calls", "failures", "duration", "phases", "peak_rss_mb",
+        "peak_threads", "cache_hits", "cache_misses"}}
+    """
+    registry = registry or get_metrics_registry()
+    summary: Dict[str, Dict[str, Any]] = {}
+
+    def entry(tool: str) -> Dict[str, Any]:
+        return summary.setdefault(tool, {"calls": 0, "failures": 0, "phases": {}})
+
+    calls = registry.get("tool_calls_total")
+    if calls is not None:
+        for labels, value in calls.series().items():
+            labels = dict(labels)
+            entry(labels["tool"])["calls"] += int(value)
+            if labels.get("status") == "failure":
+                entry(labels["tool"])["failures"] += int(value)
+
+    for name, key in (("tool_duration_seconds", "duration"), ("tool_peak_rss_mb", "peak_rss_mb"),
+                      ("tool_peak_threads", "peak_threads")):
+        metric = registry.get(name)
+        if metric is not None:
+            for labels, series in metric.series().items():
+                entry(dict(labels)["tool"])[key] = series.summary()
+
+    phases = registry.get("tool_phase_seconds")
+    if phases is not None:
+        for labels, series in phases.series().items():
+            labels = dict(labels)
+            entry(labels["tool"])["phases"][labels["phase"]] = series.summary()
+
+    for name, key in (("cache_hits_total", "cache_hits"), ("cache_misses_total", "cache_misses")):
+        metric = registry.get(name)
+        if metric is not None:
+            for labels, value in metric.series().items():
+                entry(dict(labels)["tool"])[key] = int(value)
+
+    return dict(sorted(summary.items()))
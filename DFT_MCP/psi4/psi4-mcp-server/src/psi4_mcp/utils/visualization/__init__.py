@@ -7,11 +7,21 @@ Provides utilities for generating visualization data.
 from psi4_mcp.utils.visualization.molecular import MoleculeVisualizer, generate_xyz_viewer_data
 from psi4_mcp.utils.visualization.orbitals import OrbitalVisualizer, generate_orbital_data
 from psi4_mcp.utils.visualization.spectra import SpectrumVisualizer, generate_spectrum_plot_data
-from psi4_mcp.utils.visualization.surfaces import SurfaceVisualizer, generate_isosurface_data
+from psi4_mcp.utils.visualization.surfaces import (
+    IsosurfaceData,
+    SurfaceVisualizer,
+    marching_cubes,
+    weld_vertices,
+    decimate,
+    extract_isosurface,
+    decode_array,
+    generate_isosurface_data,
+)
 
 __all__ = [
     "MoleculeVisualizer", "generate_xyz_viewer_data",
     "OrbitalVisualizer", "generate_orbital_data",
     "SpectrumVisualizer", "generate_spectrum_plot_data",
-    "SurfaceVisualizer", "generate_isosurface_data",
+    "IsosurfaceData", "SurfaceVisualizer", "marching_cubes", "weld_vertices", "decimate",
+    "extract_isosurface", "decode_array", "generate_isosurface_data",
 ]
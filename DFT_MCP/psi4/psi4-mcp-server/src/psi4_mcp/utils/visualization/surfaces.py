@@ -2,10 +2,48 @@
 Surface Visualization for Psi4 MCP Server.
 
 Generates visualization data for molecular surfaces and isosurfaces.
+
+Isosurfaces are extracted with a vectorized marching cubes over volume
+data (cube engine volumes, sampled orbitals, or a promolecular density):
+
+- The triangulation table is derived from the cube topology with one
+  face rule (each inside corner of an ambiguous face is cut off on its
+  own), so neighbouring cells always agree and the surface is closed.
+- Vertices are created once per crossed grid edge, which welds them
+  between cells; normals come from the field gradient.
+- Vertex clustering decimates the mesh to a triangle budget.
+- Surfaces are serialized as base64 typed arrays (float32 vertices,
+  int8 normals, uint16/uint32 faces) for compact MCP payloads.
 """
 
+import base64
 from dataclasses import dataclass, field
-from typing import Any, Dict, List, Optional, Tuple
+from functools import lru_cache
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from psi4_mcp.utils.helpers.constants import ANGSTROM_TO_BOHR, get_vdw_radius
+
+
+# Cube corners and edges (edge k joins corners EDGE_CORNERS[k])
+CUBE_CORNERS = np.array([
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+])
+EDGE_CORNERS = np.array([
+    [0, 1], [1, 2], [2, 3], [3, 0],
+    [4, 5], [5, 6], [6, 7], [7, 4],
+    [0, 4], [1, 5], [2, 6], [3, 7],
+])
+# Grid direction of each edge and offset of its lower corner within the cell
+EDGE_AXIS = np.argmax(np.abs(CUBE_CORNERS[EDGE_CORNERS[:, 1]] - CUBE_CORNERS[EDGE_CORNERS[:, 0]]), axis=1)
+EDGE_ORIGIN = np.minimum(CUBE_CORNERS[EDGE_CORNERS[:, 0]], CUBE_CORNERS[EDGE_CORNERS[:, 1]])
+
+# Decay (1/bohr) of the atomic densities of the promolecular model
+PROMOLECULE_DECAY = 2.0
+
+ORBITAL_COLORS = ("#FF0D0D", "#3050F8")
 
 
 @dataclass
@@ -19,12 +57,21 @@ class GridPoint:
 
 @dataclass
 class IsosurfaceData:
-    """Data for rendering an isosurface."""
-    vertices: List[Tuple[float, float, float]]
-    faces: List[Tuple[int, int, int]]
-    normals: List[Tuple[float, float, float]]
+    """Data for rendering an isosurface (vertices (n, 3), faces (m, 3), normals (n, 3))."""
+    vertices: np.ndarray
+    faces: np.ndarray
+    normals: np.ndarray
     isovalue: float
     color: str = "#3050F8"
+    units: str = "angstrom"
+    
+    @property
+    def n_vertices(self) -> int:
+        return len(self.vertices)
+    
+    @property
+    def n_triangles(self) -> int:
+        return len(self.faces)
 
 
 @dataclass
@@ -33,16 +80,316 @@ class VolumeData:
     origin: Tuple[float, float, float]
     dimensions: Tuple[int, int, int]
     spacing: Tuple[float, float, float]
-    values: List[float]
+    values: Any
     min_value: float = 0.0
     max_value: float = 0.0
+    
+    def array(self) -> np.ndarray:
+        """Values as an array of shape dimensions (z fastest)."""
+        return np.asarray(self.values, dtype=float).reshape(self.dimensions)
+    
+    def points(self) -> np.ndarray:
+        """Coordinates of all grid points, shape (n, 3)."""
+        axes = [self.origin[i] + self.spacing[i] * np.arange(self.dimensions[i]) for i in range(3)]
+        mesh = np.meshgrid(*axes, indexing="ij")
+        return np.stack([m.ravel() for m in mesh], axis=1)
+
+
+# =============================================================================
+# MARCHING CUBES
+# =============================================================================
+
+def _cube_faces() -> List[List[int]]:
+    """Corners of the six cube faces, counterclockwise seen from outside."""
+    faces = []
+    for axis in range(3):
+        u, v = (axis + 1) % 3, (axis + 2) % 3
+        for side in (0, 1):
+            corners = [c for c in range(8) if CUBE_CORNERS[c, axis] == side]
+            angles = [np.arctan2(CUBE_CORNERS[c, v] - 0.5, CUBE_CORNERS[c, u] - 0.5) for c in corners]
+            ordered = [c for _, c in sorted(zip(angles, corners))]
+            # u x v is +axis: increasing angle is counterclockwise seen from the + side
+            faces.append(ordered if side == 1 else ordered[::-1])
+    return faces
+
+
+@lru_cache(maxsize=None)
+def triangle_table() -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Marching cubes triangulation for all 256 corner configurations.
+    
+    On every face, each crossing where the boundary (counterclockwise from
+    outside) enters the inside is joined to the next crossing where it
+    leaves; these segments chain into closed loops that are fanned into
+    triangles. Since the rule only depends on the face, adjacent cells
+    cut their shared face identically.
+    
+    Returns:
+        (table of shape (256, max_triangles, 3) with edge indices, -1 padded;
+        triangle count per configuration)
+    """
+    edge_index = {frozenset(map(int, e)): k for k, e in enumerate(EDGE_CORNERS)}
+    faces = _cube_faces()
+    triangles: List[List[Tuple[int, int, int]]] = []
+    for case in range(256):
+        inside = [(case >> c) & 1 == 1 for c in range(8)]
+        successor: Dict[int, int] = {}
+        for corners in faces:
+            crossings = []
+            for k in range(4):
+                a, b = corners[k], corners[(k + 1) % 4]
+                if inside[a] != inside[b]:
+                    crossings.append((edge_index[frozenset((a, b))], inside[b]))
+            for i, (edge, entering) in enumerate(crossings):
+                if entering:
+                    for j in range(1, len(crossings)):
+                        other, other_entering = crossings[(i + j) % len(crossings)]
+                        if not other_entering:
+                            successor[edge] = other
+                            break
+        case_triangles = []
+        remaining = set(successor)
+        while remaining:
+            start = min(remaining)
+            loop = [start]
+            remaining.discard(start)
+            while successor[loop[-1]] != start:
+                loop.append(successor[loop[-1]])
+                remaining.discard(loop[-1])
+            case_triangles.extend((loop[0], loop[i], loop[i + 1]) for i in range(1, len(loop) - 1))
+        triangles.append(case_triangles)
+    
+    # Wind triangles counterclockwise seen from outside (low values)
+    midpoints = CUBE_CORNERS[EDGE_CORNERS].mean(axis=1)
+    a, b, c = (midpoints[e] for e in triangles[1][0])
+    flip = np.dot(np.cross(b - a, c - a), midpoints[triangles[1][0][0]]) < 0
+    
+    max_triangles = max(len(t) for t in triangles)
+    table = -np.ones((256, max_triangles, 3), dtype=np.int64)
+    counts = np.zeros(256, dtype=np.int64)
+    for case, case_triangles in enumerate(triangles):
+        counts[case] = len(case_triangles)
+        for i, (p, q, r) in enumerate(case_triangles):
+            table[case, i] = (p, r, q) if flip else (p, q, r)
+    return table, counts
+
+
+def _gradient_at(field_values: np.ndarray, index: np.ndarray, spacing: np.ndarray) -> np.ndarray:
+    """Finite-difference gradient at grid points index (n, 3)."""
+    shape = np.array(field_values.shape)
+    gradient = np.empty(index.shape, dtype=float)
+    for axis in range(3):
+        up = index.copy()
+        down = index.copy()
+        up[:, axis] = np.minimum(index[:, axis] + 1, shape[axis] - 1)
+        down[:, axis] = np.maximum(index[:, axis] - 1, 0)
+        step = (up[:, axis] - down[:, axis]) * spacing[axis]
+        difference = field_values[tuple(up.T)] - field_values[tuple(down.T)]
+        gradient[:, axis] = difference / np.where(step > 0, step, 1.0)
+    return gradient
+
+
+def marching_cubes(
+    values: np.ndarray,
+    isovalue: float,
+    origin: Sequence[float] = (0.0, 0.0, 0.0),
+    spacing: Sequence[float] = (1.0, 1.0, 1.0),
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Extract the isosurface values == isovalue.
+    
+    Args:
+        values: Volume of shape (nx, ny, nz)
+        isovalue: Surface level; for negative levels the region below the
+            level counts as inside (negative orbital lobes)
+        origin: Coordinates of values[0, 0, 0]
+        spacing: Grid spacing along x, y, z
+    
+    Returns:
+        (vertices (n, 3), faces (m, 3), unit normals (n, 3) pointing out of
+        the enclosed region)
+    """
+    field_values = np.asarray(values, dtype=float)
+    level = isovalue
+    if isovalue < 0:
+        field_values, level = -field_values, -isovalue
+    origin = np.asarray(origin, dtype=float)
+    spacing = np.asarray(spacing, dtype=float)
+    nx, ny, nz = field_values.shape
+    empty = (np.zeros((0, 3), np.float32), np.zeros((0, 3), np.int64), np.zeros((0, 3), np.float32))
+    if min(nx, ny, nz) < 2:
+        return empty
+    
+    inside = field_values > level
+    cells = (nx - 1, ny - 1, nz - 1)
+    case = np.zeros(cells, dtype=np.uint8)
+    for bit, (dx, dy, dz) in enumerate(CUBE_CORNERS):
+        case |= inside[dx:dx + cells[0], dy:dy + cells[1], dz:dz + cells[2]].astype(np.uint8) << bit
+    
+    table, counts = triangle_table()
+    case = case.ravel()
+    n_triangles = counts[case]
+    active = np.flatnonzero(n_triangles)
+    if active.size == 0:
+        return empty
+    
+    # One row per triangle: its cell and its slot in the table
+    per_cell = n_triangles[active]
+    triangle_cell = np.repeat(active, per_cell)
+    slot = np.arange(per_cell.sum()) - np.repeat(np.cumsum(per_cell) - per_cell, per_cell)
+    edges = table[case[triangle_cell], slot]
+    
+    # Crossed grid edges, identified by axis and lower grid point; shared
+    # edges of neighbouring cells map to the same vertex
+    cell_index = np.stack(np.unravel_index(triangle_cell, cells), axis=1)
+    lower = cell_index[:, None, :] + EDGE_ORIGIN[edges]
+    axis = EDGE_AXIS[edges]
+    key = ((axis * nx + lower[..., 0]) * ny + lower[..., 1]) * nz + lower[..., 2]
+    unique_keys, faces = np.unique(key.ravel(), return_inverse=True)
+    faces = faces.reshape(-1, 3)
+    
+    vertex_axis = unique_keys // (nx * ny * nz)
+    p0 = np.stack(np.unravel_index(unique_keys % (nx * ny * nz), (nx, ny, nz)), axis=1)
+    p1 = p0.copy()
+    p1[np.arange(len(p1)), vertex_axis] += 1
+    f0 = field_values[tuple(p0.T)]
+    f1 = field_values[tuple(p1.T)]
+    t = np.clip((level - f0) / (f1 - f0), 0.0, 1.0)
+    vertices = origin + spacing * (p0 + (p1 - p0) * t[:, None])
+    
+    gradient = _gradient_at(field_values, p0, spacing) * (1 - t)[:, None] \
+        + _gradient_at(field_values, p1, spacing) * t[:, None]
+    normals = -gradient / np.maximum(np.linalg.norm(gradient, axis=1), 1e-30)[:, None]
+    return vertices, faces, normals
+
+
+# =============================================================================
+# MESH PROCESSING
+# =============================================================================
+
+def _merge_vertices(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    normals: np.ndarray,
+    cluster: np.ndarray,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge vertices with the same cluster id; drop collapsed and coincident triangles."""
+    _, inverse = np.unique(cluster, return_inverse=True)
+    n_clusters = inverse.max() + 1 if inverse.size else 0
+    weight = np.bincount(inverse, minlength=n_clusters).astype(float)
+    merged = np.stack([np.bincount(inverse, vertices[:, i], n_clusters) for i in range(3)], axis=1)
+    merged /= weight[:, None]
+    merged_normals = np.stack([np.bincount(inverse, normals[:, i], n_clusters) for i in range(3)], axis=1)
+    merged_normals /= np.maximum(np.linalg.norm(merged_normals, axis=1), 1e-30)[:, None]
+    
+    faces = inverse[faces]
+    keep = (faces[:, 0] != faces[:, 1]) & (faces[:, 1] != faces[:, 2]) & (faces[:, 0] != faces[:, 2])
+    faces = faces[keep]
+    # Coincident triangles are folds (opposite windings); remove both sheets
+    _, inverse_faces, repeats = np.unique(np.sort(faces, axis=1), axis=0, return_inverse=True, return_counts=True)
+    faces = faces[repeats[inverse_faces.ravel()] == 1]
+    
+    # Drop vertices no triangle uses any more
+    used = np.zeros(n_clusters, dtype=bool)
+    used[faces.ravel()] = True
+    remap = np.cumsum(used) - 1
+    return merged[used], remap[faces], merged_normals[used]
+
+
+def weld_vertices(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    normals: np.ndarray,
+    tolerance: float = 1e-6,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Merge vertices closer than tolerance (e.g. where the surface passes through grid points)."""
+    if len(vertices) == 0:
+        return vertices, faces, normals
+    quantized = np.round((vertices - vertices.min(axis=0)) / tolerance).astype(np.int64)
+    _, cluster = np.unique(quantized, axis=0, return_inverse=True)
+    return _merge_vertices(vertices, faces, normals, cluster.ravel())
+
+
+def decimate(
+    vertices: np.ndarray,
+    faces: np.ndarray,
+    normals: np.ndarray,
+    max_triangles: int,
+    max_iterations: int = 12,
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Reduce a mesh to at most max_triangles by vertex clustering.
+    
+    Vertices are merged per cell of a uniform grid whose cell size is
+    grown until the triangle budget is met; the triangle count scales
+    roughly with the inverse square of the cell size.
+    """
+    if len(faces) <= max_triangles or len(vertices) == 0:
+        return vertices, faces, normals
+    low = vertices.min(axis=0)
+    edge = np.linalg.norm(vertices[faces[:, 1]] - vertices[faces[:, 0]], axis=1).mean()
+    cell = max(edge, 1e-12) * np.sqrt(len(faces) / max_triangles)
+    result = (vertices, faces, normals)
+    for _ in range(max_iterations):
+        cells = np.floor((vertices - low) / cell).astype(np.int64)
+        dims = cells.max(axis=0) + 1
+        cluster = (cells[:, 0] * dims[1] + cells[:, 1]) * dims[2] + cells[:, 2]
+        result = _merge_vertices(vertices, faces, normals, cluster)
+        if len(result[1]) <= max_triangles:
+            break
+        cell *= max(1.1, np.sqrt(len(result[1]) / max_triangles))
+    return result
+
+
+def extract_isosurface(
+    values: np.ndarray,
+    isovalue: float,
+    origin: Sequence[float],
+    spacing: Sequence[float],
+    max_triangles: Optional[int] = None,
+    color: str = "#3050F8",
+    units: str = "angstrom",
+) -> IsosurfaceData:
+    """Marching cubes, welding and optional decimation."""
+    vertices, faces, normals = marching_cubes(values, isovalue, origin, spacing)
+    vertices, faces, normals = weld_vertices(vertices, faces, normals, 1e-6 * float(np.min(spacing)))
+    if max_triangles:
+        vertices, faces, normals = decimate(vertices, faces, normals, max_triangles)
+    return IsosurfaceData(
+        vertices=vertices.astype(np.float32),
+        faces=faces.astype(np.uint32),
+        normals=normals.astype(np.float32),
+        isovalue=isovalue,
+        color=color,
+        units=units,
+    )
+
+
+# =============================================================================
+# SERIALIZATION
+# =============================================================================
+
+def encode_array(array: np.ndarray, dtype: str) -> Dict[str, Any]:
+    """Little-endian typed array as base64."""
+    data = np.ascontiguousarray(array, dtype=np.dtype(dtype).newbyteorder("<"))
+    return {
+        "dtype": dtype,
+        "shape": list(data.shape),
+        "data": base64.b64encode(data.tobytes()).decode("ascii"),
+    }
+
+
+def decode_array(encoded: Dict[str, Any]) -> np.ndarray:
+    """Inverse of encode_array."""
+    data = np.frombuffer(base64.b64decode(encoded["data"]), dtype=np.dtype(encoded["dtype"]).newbyteorder("<"))
+    return data.reshape(encoded["shape"])
 
 
 class SurfaceVisualizer:
     """Generates surface visualization data."""
     
-    def __init__(self):
-        pass
+    def __init__(self, max_triangles: Optional[int] = 20000):
+        self.max_triangles = max_triangles
     
     def generate_cube_grid(
         self,
@@ -52,15 +399,14 @@ class SurfaceVisualizer:
     ) -> VolumeData:
         """Generate an empty cubic grid."""
         origin = (center[0] - extent, center[1] - extent, center[2] - extent)
-        spacing = (2 * extent / n_points, 2 * extent / n_points, 2 * extent / n_points)
+        spacing = (2 * extent / (n_points - 1),) * 3
         dimensions = (n_points, n_points, n_points)
-        values = [0.0] * (n_points ** 3)
         
         return VolumeData(
             origin=origin,
             dimensions=dimensions,
             spacing=spacing,
-            values=values,
+            values=np.zeros(dimensions),
         )
     
     def sample_orbital_on_grid(
@@ -69,67 +415,124 @@ class SurfaceVisualizer:
         orbital_coefficients: List[float],
         basis_functions: List[Dict[str, Any]],
     ) -> VolumeData:
-        """Sample orbital on grid (placeholder for actual implementation)."""
-        # This would require actual basis function evaluation
-        # For now, return empty grid
-        return grid
+        """
+        Sample an orbital on the grid.
+        
+        Each basis function is a contracted Cartesian Gaussian
+        {"center": (x, y, z), "exponents": [...], "coefficients": [...],
+        "powers": (l, m, n)} in the grid's length unit; primitives are
+        normalized here.
+        """
+        points = grid.points()
+        values = np.zeros(len(points))
+        for c, function in zip(orbital_coefficients, basis_functions):
+            if c == 0.0:
+                continue
+            l, m, n = function.get("powers", (0, 0, 0))
+            d = points - np.asarray(function["center"], dtype=float)
+            r2 = np.einsum("ij,ij->i", d, d)
+            angular = d[:, 0] ** l * d[:, 1] ** m * d[:, 2] ** n
+            radial = np.zeros(len(points))
+            for alpha, coefficient in zip(function["exponents"], function["coefficients"]):
+                radial += coefficient * _cartesian_norm(alpha, l, m, n) * np.exp(-alpha * r2)
+            values += c * angular * radial
+        values = values.reshape(grid.dimensions)
+        
+        return VolumeData(
+            origin=grid.origin,
+            dimensions=grid.dimensions,
+            spacing=grid.spacing,
+            values=values,
+            min_value=float(values.min()),
+            max_value=float(values.max()),
+        )
+    
+    def surface_from_volume(
+        self,
+        volume: Any,
+        isovalue: float,
+        color: str = "#3050F8",
+    ) -> IsosurfaceData:
+        """Isosurface of a VolumeData or a cube engine Volume (bohr)."""
+        if isinstance(volume, VolumeData):
+            return extract_isosurface(volume.array(), isovalue, volume.origin, volume.spacing,
+                                      self.max_triangles, color)
+        return extract_isosurface(volume.values, isovalue, volume.grid.origin, volume.grid.spacing,
+                                  self.max_triangles, color, units="bohr")
+    
+    def orbital_surfaces(self, volume: Any, isovalue: float = 0.05) -> List[IsosurfaceData]:
+        """Positive and negative lobes of an orbital."""
+        return [
+            self.surface_from_volume(volume, abs(isovalue), ORBITAL_COLORS[0]),
+            self.surface_from_volume(volume, -abs(isovalue), ORBITAL_COLORS[1]),
+        ]
     
     def generate_density_surface(
         self,
         elements: List[str],
         coordinates: List[Tuple[float, float, float]],
         isovalue: float = 0.002,
+        spacing: float = 0.2,
     ) -> IsosurfaceData:
-        """Generate electron density isosurface (simplified)."""
-        # Simplified: just return bounding box vertices
-        if not coordinates:
-            return IsosurfaceData(vertices=[], faces=[], normals=[], isovalue=isovalue)
+        """
+        Electron density isosurface of a promolecular density model.
         
-        # Calculate bounding box
-        xs = [c[0] for c in coordinates]
-        ys = [c[1] for c in coordinates]
-        zs = [c[2] for c in coordinates]
-        
-        pad = 3.0  # Angstrom padding
-        x_min, x_max = min(xs) - pad, max(xs) + pad
-        y_min, y_max = min(ys) - pad, max(ys) + pad
-        z_min, z_max = min(zs) - pad, max(zs) + pad
-        
-        # Cube vertices
-        vertices = [
-            (x_min, y_min, z_min), (x_max, y_min, z_min),
-            (x_max, y_max, z_min), (x_min, y_max, z_min),
-            (x_min, y_min, z_max), (x_max, y_min, z_max),
-            (x_max, y_max, z_max), (x_min, y_max, z_max),
-        ]
+        Each atom contributes isovalue * exp(-k (r - R_vdW)), so isolated
+        atoms reach the default isovalue at their van der Waals radius.
+        Coordinates and spacing in Angstrom.
+        """
+        if not coordinates:
+            return IsosurfaceData(
+                vertices=np.zeros((0, 3), np.float32), faces=np.zeros((0, 3), np.uint32),
+                normals=np.zeros((0, 3), np.float32), isovalue=isovalue,
+            )
         
-        # Cube faces (triangles)
-        faces = [
-            (0, 1, 2), (0, 2, 3),  # bottom
-            (4, 6, 5), (4, 7, 6),  # top
-            (0, 4, 5), (0, 5, 1),  # front
-            (2, 6, 7), (2, 7, 3),  # back
-            (0, 3, 7), (0, 7, 4),  # left
-            (1, 5, 6), (1, 6, 2),  # right
-        ]
+        xyz = np.asarray(coordinates, dtype=float)
+        radii = np.array([get_vdw_radius(e) or 2.0 for e in elements])
+        pad = radii.max() + 1.5
+        low = xyz.min(axis=0) - pad
+        dimensions = tuple(int(n) for n in np.ceil((xyz.max(axis=0) + pad - low) / spacing) + 1)
+        grid = VolumeData(tuple(low), dimensions, (spacing,) * 3, None)
         
-        # Simple normals
-        normals = [(0, 0, -1)] * 2 + [(0, 0, 1)] * 2 + [(0, -1, 0)] * 2 + \
-                  [(0, 1, 0)] * 2 + [(-1, 0, 0)] * 2 + [(1, 0, 0)] * 2
+        points = grid.points()
+        density = np.zeros(len(points))
+        decay = PROMOLECULE_DECAY * ANGSTROM_TO_BOHR
+        for center, radius in zip(xyz, radii):
+            r = np.linalg.norm(points - center, axis=1)
+            density += 0.002 * np.exp(-decay * (r - radius))
+        grid.values = density.reshape(dimensions)
         
-        return IsosurfaceData(
-            vertices=vertices,
-            faces=faces,
-            normals=normals,
-            isovalue=isovalue,
-        )
+        return self.surface_from_volume(grid, isovalue)
     
     def to_json(self, surface: IsosurfaceData) -> Dict[str, Any]:
-        """Convert surface data to JSON."""
+        """Convert surface data to JSON (nested lists)."""
         return {
-            "vertices": [list(v) for v in surface.vertices],
-            "faces": [list(f) for f in surface.faces],
-            "normals": [list(n) for n in surface.normals],
+            "vertices": np.asarray(surface.vertices).tolist(),
+            "faces": np.asarray(surface.faces).tolist(),
+            "normals": np.asarray(surface.normals).tolist(),
+            "isovalue": surface.isovalue,
+            "color": surface.color,
+        }
+    
+    def to_compact(self, surface: IsosurfaceData) -> Dict[str, Any]:
+        """
+        Convert surface data to base64 typed arrays: float32 vertices,
+        int8 normals (scaled by 127), uint16 or uint32 faces.
+        """
+        index_type = "uint16" if surface.n_vertices <= 65536 else "uint32"
+        normals = np.round(np.asarray(surface.normals) * 127).astype(np.int8)
+        vertices = np.asarray(surface.vertices)
+        return {
+            "format": "typed-arrays",
+            "encoding": "base64",
+            "byte_order": "little",
+            "units": surface.units,
+            "n_vertices": surface.n_vertices,
+            "n_triangles": surface.n_triangles,
+            "bounds": [vertices.min(axis=0).tolist(), vertices.max(axis=0).tolist()] if len(vertices) else None,
+            "vertices": encode_array(vertices, "float32"),
+            "normals": {**encode_array(normals, "int8"), "scale": 1 / 127},
+            "faces": encode_array(surface.faces, index_type),
             "isovalue": surface.isovalue,
             "color": surface.color,
         }
@@ -140,24 +543,49 @@ class SurfaceVisualizer:
             "origin": list(volume.origin),
             "dimensions": list(volume.dimensions),
             "spacing": list(volume.spacing),
-            "values": volume.values,
+            "values": np.asarray(volume.values).ravel().tolist(),
             "min_value": volume.min_value,
             "max_value": volume.max_value,
         }
 
 
+def _cartesian_norm(alpha: float, l: int, m: int, n: int) -> float:
+    """Normalization of the primitive x^l y^m z^n exp(-alpha r^2)."""
+    def double_factorial(k: int) -> float:
+        return float(np.prod(np.arange(k, 0, -2))) if k > 0 else 1.0
+    L = l + m + n
+    return float(
+        (2 * alpha / np.pi) ** 0.75 * (4 * alpha) ** (L / 2)
+        / np.sqrt(double_factorial(2 * l - 1) * double_factorial(2 * m - 1) * double_factorial(2 * n - 1))
+    )
+
+
 def generate_isosurface_data(
     elements: List[str],
     coordinates: List[Tuple[float, float, float]],
     surface_type: str = "density",
     isovalue: float = 0.002,
+    volume: Any = None,
+    max_triangles: Optional[int] = 20000,
+    compact: bool = True,
 ) -> Dict[str, Any]:
-    """Generate isosurface visualization data."""
-    visualizer = SurfaceVisualizer()
+    """
+    Generate isosurface visualization data.
+    
+    With a volume (VolumeData or cube engine Volume) its isosurface is
+    extracted - both lobes for surface_type "orbital"; without one, the
+    promolecular density surface of the molecule.
+    """
+    visualizer = SurfaceVisualizer(max_triangles)
     
-    if surface_type.lower() == "density":
-        surface = visualizer.generate_density_surface(elements, coordinates, isovalue)
+    if volume is not None and surface_type.lower() == "orbital":
+        surfaces = visualizer.orbital_surfaces(volume, isovalue)
+    elif volume is not None:
+        surfaces = [visualizer.surface_from_volume(volume, isovalue)]
     else:
-        surface = visualizer.generate_density_surface(elements, coordinates, isovalue)
+        surfaces = [visualizer.generate_density_surface(elements, coordinates, isovalue)]
     
-    return visualizer.to_json(surface)
+    serialize = visualizer.to_compact if compact else visualizer.to_json
+    if len(surfaces) == 1:
+        return serialize(surfaces[0])
+    return {"surfaces": [serialize(surface) for surface in surfaces]}
@@ -1,9 +1,44 @@
 """
-Psi4 MCP Server - Placeholder Module
+Shared helpers for the performance tests.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Benchmark cases are slow and need Psi4, so they only run when
+PSI4_MCP_BENCHMARKS is set (PSI4_MCP_BENCHMARKS=quick restricts them to
+the quick ladder). Each case is compared with the stored baseline and
+fails on a regression beyond the tolerance; cases without a baseline
+entry are only checked for success.
 """
 
-# TODO: Add implementation
-pass
+import importlib.util
+import os
+from typing import List
+
+import pytest
+
+from benchmarks.performance import BenchmarkCase, load_baseline, run_case
+from benchmarks.performance.results import compare_case
+
+
+BENCHMARKS_ENV = os.environ.get("PSI4_MCP_BENCHMARKS", "")
+QUICK = BENCHMARKS_ENV.lower() == "quick"
+
+requires_benchmarks = pytest.mark.skipif(
+    not BENCHMARKS_ENV or importlib.util.find_spec("psi4") is None,
+    reason="set PSI4_MCP_BENCHMARKS (and install psi4) to run performance benchmarks",
+)
+
+
+def case_params(cases: List[BenchmarkCase]) -> List:
+    """pytest parameters with the case ids as test ids."""
+    return [pytest.param(case, id=case.case_id) for case in cases]
+
+
+def check_case(case: BenchmarkCase) -> None:
+    """Run a case and fail on error or regression against the baseline."""
+    result = run_case(case)
+    assert result.success, f"{case.case_id} failed: {result.error}"
+
+    baseline = (load_baseline() or {}).get("results", {}).get(case.case_id)
+    if baseline is None:
+        return
+    regressions = compare_case(result.to_dict(), baseline)
+    assert not regressions, "; ".join(str(r) for r in regressions)
@@ -1,9 +1,15 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Peak memory benchmarks.
 """
 
-# TODO: Add implementation
-pass
+import pytest
+
+from benchmarks.performance import memory_usage
+
+from tests.performance.benchmark_suite import QUICK, case_params, check_case, requires_benchmarks
+
+
+@requires_benchmarks
+@pytest.mark.parametrize("case", case_params(memory_usage.get_cases(QUICK)))
+def test_peak_memory(case):
+    check_case(case)
@@ -1,9 +1,67 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Execution time benchmarks and regression gating.
 """
 
-# TODO: Add implementation
-pass
+import pytest
+
+from benchmarks.performance import execution_time, parallel_scaling
+from benchmarks.performance.harness import CaseResult
+from benchmarks.performance.results import compare_to_baseline
+
+from tests.performance.benchmark_suite import QUICK, case_params, check_case, requires_benchmarks
+
+
+def _run(*results: CaseResult) -> dict:
+    return {"results": {r.case_id: r.to_dict() for r in results}}
+
+
+class TestRegressionGate:
+    """Baseline comparison (no Psi4 needed)."""
+
+    def test_slowdown_beyond_tolerance(self):
+        baseline = _run(CaseResult("energy/water", "core", True, wall_time=2.0, peak_rss_mb=200))
+        current = _run(CaseResult("energy/water", "core", True, wall_time=2.6, peak_rss_mb=200))
+        regressions = compare_to_baseline(current, baseline, time_tolerance=0.2)
+        assert [r.metric for r in regressions] == ["wall_time"]
+        assert regressions[0].ratio == pytest.approx(1.3)
+
+    def test_within_tolerance(self):
+        baseline = _run(CaseResult("energy/water", "core", True, wall_time=2.0, peak_rss_mb=200))
+        current = _run(CaseResult("energy/water", "core", True, wall_time=2.3, peak_rss_mb=220))
+        assert compare_to_baseline(current, baseline, time_tolerance=0.2) == []
+
+    def test_small_absolute_change_ignored(self):
+        baseline = _run(CaseResult("energy/water", "core", True, wall_time=0.01, peak_rss_mb=100))
+        current = _run(CaseResult("energy/water", "core", True, wall_time=0.03, peak_rss_mb=140))
+        assert compare_to_baseline(current, baseline) == []
+
+    def test_memory_growth(self):
+        baseline = _run(CaseResult("energy/water", "core", True, wall_time=1.0, peak_rss_mb=500))
+        current = _run(CaseResult("energy/water", "core", True, wall_time=1.0, peak_rss_mb=800))
+        assert [r.metric for r in compare_to_baseline(current, baseline)] == ["peak_rss_mb"]
+
+    def test_missing_baseline(self):
+        current = _run(CaseResult("energy/water", "core", True, wall_time=5.0))
+        assert compare_to_baseline(current, None) == []
+        assert compare_to_baseline(current, _run()) == []
+
+    def test_scaling_curve(self):
+        results = [
+            CaseResult(f"scaling/threads/{n}", "scaling", True, wall_time=t, metadata={"threads": n})
+            for n, t in ((1, 8.0), (2, 4.0), (4, 4.0))
+        ]
+        curve = parallel_scaling.scaling_curve(results, "threads")
+        assert [p["speedup"] for p in curve] == [1.0, 2.0, 2.0]
+        assert [p["efficiency"] for p in curve] == [1.0, 1.0, 0.5]
+
+
+@requires_benchmarks
+@pytest.mark.parametrize("case", case_params(execution_time.get_cases(QUICK)))
+def test_execution_time(case):
+    check_case(case)
+
+
+@requires_benchmarks
+@pytest.mark.parametrize("case", case_params(parallel_scaling.thread_cases(QUICK)))
+def test_thread_scaling(case):
+    check_case(case)
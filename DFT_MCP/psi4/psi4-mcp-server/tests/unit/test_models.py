@@ -1,9 +1,65 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the array-backed output models.
 """
 
-# TODO: Add implementation
-pass
+import numpy as np
+import pytest
+
+orbitals = pytest.importorskip("psi4_mcp.models.outputs.orbitals")
+
+MolecularOrbital = orbitals.MolecularOrbital
+OrbitalOutput = orbitals.OrbitalOutput
+OrbitalSet = orbitals.OrbitalSet
+
+ENERGIES = [-20.55, -1.34, -0.70, -0.57, -0.49, 0.18, 0.26]
+OCCUPATIONS = [2.0, 2.0, 2.0, 2.0, 2.0, 0.0, 0.0]
+COEFFICIENTS = np.arange(49, dtype=float).reshape(7, 7) / 49.0
+
+
+def _orbital_set(**overrides) -> "OrbitalSet":
+    data = dict(energies=ENERGIES, occupations=OCCUPATIONS, coefficients=COEFFICIENTS)
+    data.update(overrides)
+    return OrbitalSet.from_arrays(**data)
+
+
+class TestArrayBackedEquality:
+    """Models with NumPy array fields compare by value."""
+
+    def test_equal_orbital_sets(self):
+        assert _orbital_set() == _orbital_set(coefficients=COEFFICIENTS.copy())
+
+    def test_different_arrays(self):
+        changed = COEFFICIENTS.copy()
+        changed[3, 4] += 1e-3
+        assert _orbital_set() != _orbital_set(coefficients=changed)
+        assert _orbital_set() != _orbital_set(coefficients=None)
+
+    def test_nested_models(self):
+        def output(alpha: "OrbitalSet") -> "OrbitalOutput":
+            return OrbitalOutput.from_trusted(alpha=alpha, n_electrons=10, n_alpha=5, n_beta=5)
+
+        assert output(_orbital_set()) == output(_orbital_set())
+        assert output(_orbital_set()) != output(_orbital_set(energies=np.array(ENERGIES) + 0.1))
+
+    def test_trusted_matches_validated(self):
+        trusted = _orbital_set()
+        validated = OrbitalSet.model_validate(trusted.model_dump())
+        assert validated == trusted
+        assert isinstance(validated.energies, np.ndarray)
+
+
+class TestMolecularOrbital:
+    """Per-orbital models built from an array-backed set."""
+
+    def test_coefficients_are_a_list(self):
+        orbital = _orbital_set().get_orbital(4)
+        assert isinstance(orbital.coefficients, list)
+        assert orbital.coefficients == COEFFICIENTS[:, 4].tolist()
+
+    def test_matches_validated_model(self):
+        orbital = _orbital_set().get_orbital(5)
+        expected = MolecularOrbital(
+            index=5, energy=0.18, occupation=0.0, coefficients=COEFFICIENTS[:, 5].tolist(),
+        )
+        assert orbital == expected
+        assert not orbital.is_occupied
@@ -1,9 +1,112 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the streaming output parser: output retention and progress.
 """
 
-# TODO: Add implementation
-pass
+import json
+import os
+import time
+
+import pytest
+
+config = pytest.importorskip("psi4_mcp.config")
+streaming = pytest.importorskip("psi4_mcp.utils.parsing.streaming")
+progress = pytest.importorskip("psi4_mcp.resources.progress")
+
+SCF_ITERATION = "   @DF-RHF iter   1:   -75.98765432   -7.59876543e+01   1.23456789e-02 DIIS\n"
+
+
+@pytest.fixture
+def output_dir(tmp_path, monkeypatch):
+    monkeypatch.setattr(config, "_config", config.ServerConfig(
+        output_dir=str(tmp_path / "output"), scratch_dir=str(tmp_path / "scratch"),
+        output_keep_files=3, output_max_age_hours=1.0,
+    ))
+    return tmp_path / "output"
+
+
+def _outputs(directory, count, age=0.0):
+    """count .out files, the first one oldest, all at least `age` seconds old."""
+    now = time.time()
+    paths = []
+    for i in range(count):
+        path = directory / f"psi4-{i}.out"
+        path.write_text("output\n")
+        mtime = now - age - (count - i)
+        os.utime(path, (mtime, mtime))
+        paths.append(path)
+    return paths
+
+
+class TestOutputRetention:
+    """Old calculation outputs are pruned from the output directory."""
+
+    def test_keep_newest(self, output_dir):
+        paths = _outputs(output_dir, 5)
+        assert streaming.prune_output_files() == 2
+        assert [path.exists() for path in paths] == [False, False, True, True, True]
+
+    def test_max_age(self, output_dir):
+        old = _outputs(output_dir, 1, age=7200)
+        assert streaming.prune_output_files() == 1
+        assert not old[0].exists()
+
+    def test_disabled(self, output_dir):
+        paths = _outputs(output_dir, 5, age=7200)
+        assert streaming.prune_output_files(keep=0, max_age_hours=0) == 0
+        assert all(path.exists() for path in paths)
+
+    def test_other_files_untouched(self, output_dir):
+        _outputs(output_dir, 5)
+        other = output_dir / "notes.txt"
+        other.write_text("keep me\n")
+        streaming.prune_output_files(keep=1)
+        assert other.exists()
+        assert len(list(output_dir.glob("*.out"))) == 1
+
+    def test_new_output_path_prunes(self, output_dir):
+        _outputs(output_dir, 5)
+        streaming.calculation_output_path("psi4_batch.out")
+        assert len(list(output_dir.glob("*.out"))) == 3
+
+    def test_running_stream_kept(self, output_dir):
+        with streaming.stream_calculation("energy", poll_interval=0.01) as stream:
+            stream.path.write_text("running\n")
+            os.utime(stream.path, (0, 0))
+            _outputs(output_dir, 5)
+            streaming.prune_output_files()
+            assert stream.path.exists()
+        assert len(list(output_dir.glob("*.out"))) == 3
+
+
+class TestProgressResource:
+    """psi4://progress exposes the events of streamed calculations."""
+
+    @pytest.fixture
+    def resource(self):
+        resource = progress.ProgressResource(max_events=10)
+        yield resource
+        streaming.remove_progress_listener(resource.record)
+
+    def test_records_stream_events(self, output_dir, resource):
+        with streaming.stream_calculation("energy", poll_interval=0.01) as stream:
+            stream.parser.feed(SCF_ITERATION)
+            running = json.loads(resource.get())["running"]
+            assert [calc["name"] for calc in running] == ["energy"]
+
+        data = json.loads(resource.get("energy"))
+        assert data["running"] == []
+        event = data["events"][0]
+        assert event["kind"] == "scf_iteration"
+        assert event["iteration"] == 1
+        assert event["energy"] == pytest.approx(-75.98765432)
+
+    def test_unknown_source(self, resource):
+        resource.record(streaming.ProgressEvent(kind="scf_iteration", source="energy"))
+        data = json.loads(resource.get("optimize"))
+        assert data["available"] == ["energy"]
+
+    def test_bounded(self, resource):
+        for i in range(25):
+            resource.record(streaming.ProgressEvent(kind="opt_step", data={"step": i}, source="optimize"))
+        events = json.loads(resource.get())["events"]
+        assert [event["step"] for event in events] == list(range(15, 25))
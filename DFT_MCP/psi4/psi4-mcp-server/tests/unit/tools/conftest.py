@@ -0,0 +1,123 @@
+"""
+Shared fixtures for the tool tests.
+
+fake_wavefunction stands in for a Psi4 SCF wavefunction of a water-like
+molecule (O with one s and one p shell, two H with one s shell each) with
+a random but valid overlap matrix and idempotent densities.
+"""
+
+import sys
+import types
+
+import numpy as np
+import pytest
+
+# (atom, angular momentum) per shell
+SHELLS = [(0, 0), (0, 1), (1, 0), (2, 0)]
+NUCLEAR_CHARGES = [8.0, 1.0, 1.0]
+LABELS = ["O", "H", "H"]
+
+
+class FakeShell:
+    def __init__(self, am):
+        self.am = am
+        self.nfunction = 2 * am + 1
+
+
+class FakeBasisSet:
+    def __init__(self):
+        self._shells = [FakeShell(am) for _, am in SHELLS]
+
+    def nshell(self):
+        return len(SHELLS)
+
+    def shell(self, index):
+        return self._shells[index]
+
+    def shell_to_center(self, index):
+        return SHELLS[index][0]
+
+    def nbf(self):
+        return sum(shell.nfunction for shell in self._shells)
+
+    def name(self):
+        return "FAKE-BASIS"
+
+
+class FakeMolecule:
+    def __init__(self, multiplicity):
+        self._multiplicity = multiplicity
+
+    def natom(self):
+        return len(LABELS)
+
+    def Z(self, index):
+        return NUCLEAR_CHARGES[index]
+
+    def label(self, index):
+        return LABELS[index].upper()
+
+    def multiplicity(self):
+        return self._multiplicity
+
+
+class FakeWavefunction:
+    def __init__(self, n_alpha, n_beta, seed=7):
+        rng = np.random.default_rng(seed)
+        self.basis = FakeBasisSet()
+        nbf = self.basis.nbf()
+        a = rng.normal(size=(nbf, nbf))
+        self.S = np.eye(nbf) + 0.1 * (a + a.T) / 2
+        values, vectors = np.linalg.eigh(self.S)
+        s_half_inv = vectors @ np.diag(values ** -0.5) @ vectors.T
+        # S-orthonormal orbitals
+        self.C = s_half_inv @ np.linalg.qr(rng.normal(size=(nbf, nbf)))[0]
+        self.n_alpha = n_alpha
+        self.n_beta = n_beta
+
+    def molecule(self):
+        return FakeMolecule(self.n_alpha - self.n_beta + 1)
+
+    def basisset(self):
+        return self.basis
+
+    def bf_to_atom(self):
+        """Atom index of every basis function."""
+        return [atom for atom, am in SHELLS for _ in range(2 * am + 1)]
+
+    def Da(self):
+        return self.C[:, :self.n_alpha] @ self.C[:, :self.n_alpha].T
+
+    def Db(self):
+        return self.C[:, :self.n_beta] @ self.C[:, :self.n_beta].T
+
+    def same_a_b_dens(self):
+        return self.n_alpha == self.n_beta
+
+    def Ca(self):
+        return self.C
+
+    def epsilon_a(self):
+        return np.linspace(-20.0, 1.0, self.basis.nbf())
+
+    def nalpha(self):
+        return self.n_alpha
+
+    def name(self):
+        return "SCF"
+
+
+@pytest.fixture
+def fake_wavefunction(monkeypatch):
+    """Factory for fake wavefunctions; psi4.core.MintsHelper returns their overlap."""
+    psi4 = types.ModuleType("psi4")
+    psi4.core = types.SimpleNamespace(MintsHelper=None)
+    monkeypatch.setitem(sys.modules, "psi4", psi4)
+
+    def make(n_alpha=3, n_beta=3):
+        wfn = FakeWavefunction(n_alpha, n_beta)
+        psi4.core.MintsHelper = lambda basis: types.SimpleNamespace(ao_overlap=lambda: wfn.S)
+        return wfn
+
+    return make
+
@@ -1,9 +1,241 @@
 """
-Psi4 MCP Server - Placeholder Module
+Tests for the cube-grid engine and volumes.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+The engine runs against a fake psi4 whose basis functions are normalized
+s-type Gaussians, so densities and orbitals integrate to known values.
 """
 
-# TODO: Add implementation
-pass
+import sys
+import types
+
+import numpy as np
+import pytest
+
+volume = pytest.importorskip("psi4_mcp.utils.cube.volume")
+engine = pytest.importorskip("psi4_mcp.utils.cube.engine")
+
+# H2 (bohr) with two s functions per atom
+COORDINATES = np.array([[0.0, 0.0, -0.7], [0.0, 0.0, 0.7]])
+CENTERS = np.repeat(COORDINATES, 2, axis=0)
+EXPONENTS = np.array([1.2, 0.3, 1.2, 0.3])
+
+
+def _gaussians(points, local):
+    r2 = ((points[:, None, :] - CENTERS[None, local, :]) ** 2).sum(axis=-1)
+    a = EXPONENTS[local]
+    return (2 * a / np.pi) ** 0.75 * np.exp(-a * r2)
+
+
+def _overlap():
+    a, b = EXPONENTS[:, None], EXPONENTS[None, :]
+    r2 = ((CENTERS[:, None, :] - CENTERS[None, :, :]) ** 2).sum(axis=-1)
+    return (2 * np.sqrt(a * b) / (a + b)) ** 1.5 * np.exp(-a * b / (a + b) * r2)
+
+
+class FakeBlock:
+    def __init__(self, x, y, z, w, tolerance):
+        self.points = np.stack([x, y, z], axis=1)
+        # Functions above the tolerance somewhere in the block
+        r2 = ((self.points[:, None, :] - CENTERS[None, :, :]) ** 2).sum(axis=-1).min(axis=0)
+        self.local = np.flatnonzero(np.exp(-EXPONENTS * r2) > tolerance)
+
+    def functions_local_to_global(self):
+        return self.local.tolist()
+
+
+class FakeBasisFunctions:
+    def __init__(self, basis, max_points, nbf):
+        self.phi = np.zeros((max_points, nbf))
+
+    def compute_functions(self, block):
+        self.phi[:] = 0.0
+        self.phi[:len(block.points), :block.local.size] = _gaussians(block.points, block.local)
+
+    def basis_values(self):
+        return {"PHI": types.SimpleNamespace(np=self.phi)}
+
+
+class FakeWavefunction:
+    def __init__(self, n_alpha, n_beta):
+        values, vectors = np.linalg.eigh(_overlap())
+        s_half_inv = vectors @ np.diag(values ** -0.5) @ vectors.T
+        self.C = s_half_inv @ np.linalg.qr(np.random.default_rng(1).normal(size=(4, 4)))[0]
+        self.n_alpha = n_alpha
+        self.n_beta = n_beta
+
+    def molecule(self):
+        return types.SimpleNamespace(
+            geometry=lambda: types.SimpleNamespace(np=COORDINATES),
+            Z=lambda i: 1.0,
+            natom=lambda: 2,
+            units=lambda: "Bohr",
+        )
+
+    def basisset(self):
+        return types.SimpleNamespace(nbf=lambda: 4)
+
+    def same_a_b_dens(self):
+        return self.n_alpha == self.n_beta
+
+    def nalpha(self):
+        return self.n_alpha
+
+    def nbeta(self):
+        return self.n_beta
+
+    def Ca_subset(self, basis, subset):
+        return types.SimpleNamespace(np=self.C)
+
+    Cb_subset = Ca_subset
+
+    def Da_subset(self, basis):
+        return types.SimpleNamespace(np=self.C[:, :self.n_alpha] @ self.C[:, :self.n_alpha].T)
+
+    def Db_subset(self, basis):
+        return types.SimpleNamespace(np=self.C[:, :self.n_beta] @ self.C[:, :self.n_beta].T)
+
+
+@pytest.fixture
+def fake_psi4(monkeypatch):
+    psi4 = types.ModuleType("psi4")
+    psi4.core = types.SimpleNamespace(
+        BasisFunctions=FakeBasisFunctions,
+        BasisExtents=lambda basis, tolerance: tolerance,
+        BlockOPoints=FakeBlock,
+        Vector=types.SimpleNamespace(from_array=np.asarray),
+    )
+    monkeypatch.setitem(sys.modules, "psi4", psi4)
+
+
+def _engine(n_alpha=1, n_beta=1, block_size=16):
+    grid = volume.CubeGrid.around(COORDINATES, spacing=0.25, padding=6.0)
+    return engine.VolumeEngine(FakeWavefunction(n_alpha, n_beta), grid, block_size=block_size)
+
+
+def _volume(values, grid=None, label="v"):
+    values = np.asarray(values, dtype=float)
+    grid = grid or volume.CubeGrid((0.0, 0.0, 0.0), (0.5, 0.5, 0.5), values.shape)
+    return volume.Volume(grid, values, label, [1, 8], np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.8]]))
+
+
+class TestCubeGrid:
+    """Grid placement and bricks."""
+
+    def test_around_centers_molecule(self):
+        grid = volume.CubeGrid.around(COORDINATES, spacing=0.3, padding=4.0)
+        low = np.array(grid.origin)
+        high = low + (np.array(grid.shape) - 1) * 0.3
+        assert np.all(low <= COORDINATES.min(axis=0) - 4.0 + 1e-12)
+        assert np.all(high >= COORDINATES.max(axis=0) + 4.0 - 1e-12)
+        assert (low + high) / 2 == pytest.approx(COORDINATES.mean(axis=0))
+
+    def test_blocks_cover_grid_once(self):
+        grid = volume.CubeGrid((1.0, 2.0, 3.0), (0.5, 0.25, 1.0), (7, 5, 9))
+        count = np.zeros(grid.shape, dtype=int)
+        points = np.zeros(grid.shape + (3,))
+        for index, block_points in grid.iter_blocks(block_size=3):
+            count[index] += 1
+            points[index] = block_points.reshape(count[index].shape + (3,))
+        assert np.all(count == 1)
+        assert points.reshape(-1, 3) == pytest.approx(grid.points())
+
+
+class TestVolume:
+    """Statistics, arithmetic and storage."""
+
+    def test_statistics(self):
+        values = np.arange(-4.0, 4.0).reshape(2, 2, 2)
+        stats = _volume(values).statistics
+        assert (stats.min_value, stats.max_value, stats.n_points) == (-4.0, 3.0, 8)
+        assert stats.mean == pytest.approx(-0.5)
+        assert stats.std == pytest.approx(values.std())
+        assert stats.integral == pytest.approx(-4.0 * 0.125)
+        assert stats.positive_integral == pytest.approx(6.0 * 0.125)
+        assert stats.negative_integral == pytest.approx(-10.0 * 0.125)
+
+    def test_chunked_statistics(self):
+        values = np.random.default_rng(0).normal(size=(6, 5, 4))
+        full = volume.volume_statistics(values, 0.1)
+        chunked = volume.volume_statistics(values, 0.1, chunk=7)
+        assert chunked.to_dict() == pytest.approx(full.to_dict())
+
+    def test_arithmetic(self):
+        a = _volume(np.ones((2, 2, 2)), label="a")
+        b = _volume(np.full((2, 2, 2), 3.0), label="b")
+        assert np.all((a - b).values == -2.0)
+        assert np.all((2 * a + b).values == 5.0)
+        assert np.all(b.squared().values == 9.0)
+        combined = volume.combine_volumes([a, b], [1.0, -0.5])
+        assert np.all(combined.values == -0.5)
+        other_grid = volume.CubeGrid((0.0, 0.0, 0.0), (0.4, 0.5, 0.5), (2, 2, 2))
+        with pytest.raises(ValueError):
+            a + _volume(np.ones((2, 2, 2)), other_grid)
+
+    @pytest.mark.parametrize("compress", [True, False])
+    def test_save_and_load(self, tmp_path, compress):
+        original = _volume(np.random.default_rng(2).normal(size=(3, 4, 5)), label="density")
+        path = original.save(tmp_path / "density", compress=compress)
+        assert path.suffix == volume.VOLUME_EXTENSION
+
+        header, offset = volume.read_volume_header(path)
+        assert header["label"] == "density"
+        assert header["statistics"]["integral"] == pytest.approx(original.statistics.integral)
+        if not compress:
+            assert offset % volume.VOLUME_ALIGNMENT == 0
+
+        loaded = volume.Volume.load(path)
+        assert isinstance(loaded.values, np.memmap) != compress
+        assert loaded.values == pytest.approx(original.values.astype(np.float32))
+        assert loaded.grid == original.grid
+        assert loaded.atomic_numbers == [1, 8]
+        assert loaded.coordinates == pytest.approx(original.coordinates)
+
+    def test_not_a_volume_file(self, tmp_path):
+        path = tmp_path / "bad.vol"
+        path.write_bytes(b"not a volume")
+        with pytest.raises(ValueError):
+            volume.read_volume_header(path)
+
+    def test_cube_round_trip(self, tmp_path):
+        # nz = 8 splits the z rows over two lines
+        original = _volume(np.random.default_rng(3).normal(size=(2, 3, 8)), label="orbital")
+        loaded = volume.Volume.read_cube(original.write_cube(tmp_path / "orbital.cube"))
+        assert loaded.label == "orbital"
+        assert loaded.grid.compatible(original.grid)
+        assert loaded.values == pytest.approx(original.values, rel=1e-4)
+        assert loaded.atomic_numbers == [1, 8]
+        assert loaded.coordinates == pytest.approx(original.coordinates)
+
+
+class TestVolumeEngine:
+    """Densities and orbitals evaluated on the grid."""
+
+    def test_restricted_density(self, fake_psi4):
+        volumes = _engine().compute(["density", "spin_density"])
+        assert volumes["density"].statistics.integral == pytest.approx(2.0, abs=1e-6)
+        assert np.all(volumes["spin_density"].values == 0.0)
+
+    def test_unrestricted_densities(self, fake_psi4):
+        volumes = _engine(2, 1).compute(["density", "alpha_density", "beta_density", "spin_density"])
+        integrals = {label: v.statistics.integral for label, v in volumes.items()}
+        assert integrals == pytest.approx(
+            {"density": 3.0, "alpha_density": 2.0, "beta_density": 1.0, "spin_density": 1.0}, abs=1e-6
+        )
+
+    def test_orbitals(self, fake_psi4):
+        volumes = _engine(2, 1).compute(["homo", "lumo", "orbital"], orbital_indices=[0])
+        assert set(volumes) == {"homo", "lumo", "orbital_0", "homo_beta", "lumo_beta", "orbital_0_beta"}
+        for orbital in volumes.values():
+            assert orbital.squared().statistics.integral == pytest.approx(1.0, abs=1e-6)
+        assert not np.array_equal(volumes["lumo"].values, volumes["orbital_0"].values)
+        assert np.array_equal(volumes["homo_beta"].values, volumes["orbital_0"].values)
+
+    def test_block_size_independent(self, fake_psi4):
+        small = _engine(block_size=7).compute(["density", "homo"])
+        large = _engine(block_size=32).compute(["density", "homo"])
+        for label in ("density", "homo"):
+            assert small[label].values == pytest.approx(large[label].values, abs=1e-12)
+
+    def test_orbital_index_out_of_range(self, fake_psi4):
+        with pytest.raises(ValueError):
+            _engine().compute(["orbital"], orbital_indices=[4])
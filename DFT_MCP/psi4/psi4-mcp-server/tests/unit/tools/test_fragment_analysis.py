@@ -1,9 +1,76 @@
 """
-Psi4 MCP Server - Placeholder Module
+Tests for the fragment analysis (many-body expansion) tool.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+The Psi4 subsystem runner is replaced by a model in which every atom
+carries a charge of +0.01 (x < 1.5 Angstrom) or -0.01, so the first
+water below transfers 0.03 e to the second.
 """
 
-# TODO: Add implementation
-pass
+import pytest
+
+fragment_analysis = pytest.importorskip("psi4_mcp.tools.analysis.fragment_analysis")
+molecular = pytest.importorskip("psi4_mcp.utils.caching.molecular")
+results = pytest.importorskip("psi4_mcp.utils.caching.results")
+
+WATER_A = "O 0.0 0.0 0.117\nH 0.0 0.757 -0.467\nH 0.0 -0.757 -0.467"
+WATER_B = "O 3.0 0.0 0.117\nH 3.0 0.757 -0.467\nH 3.0 -0.757 -0.467"
+
+
+@pytest.fixture
+def computed(monkeypatch):
+    """Labels of the subsystems sent to the (fake) workers, per call."""
+    monkeypatch.setattr(molecular, "_molecular_cache", None)
+    monkeypatch.setattr(results, "_results_cache", None)
+    calls = []
+
+    def run_worker_tasks(runner, tasks, max_workers, output_prefix):
+        calls.append(sorted(task["label"] for task in tasks))
+        outcomes = []
+        for task in tasks:
+            atoms = [line.split() for line in task["molecule"].split("\n")[1:]]
+            outcomes.append({
+                "label": task["label"],
+                "energy": -76.0 * len(atoms) / 3,
+                "charges": [0.01 if float(a[1]) < 1.5 else -0.01 for a in atoms] if task["charges"] else None,
+            })
+        return outcomes
+
+    monkeypatch.setattr(fragment_analysis, "run_worker_tasks", run_worker_tasks)
+    return calls
+
+
+def _analyze(fragments, **options):
+    return fragment_analysis.run_fragment_analysis(
+        fragment_analysis.FragmentAnalysisInput(fragments=fragments, **options)
+    )
+
+
+class TestChargeTransferCache:
+    """Cached per-atom charges are only reused for the same atom order."""
+
+    def test_charge_transfer(self, computed):
+        result = _analyze([WATER_A, WATER_B])
+        assert result.charge_transfer == pytest.approx([0.03, -0.03])
+
+    def test_swapped_fragments(self, computed):
+        _analyze([WATER_A, WATER_B])
+        result = _analyze([WATER_B, WATER_A])
+        assert result.charge_transfer == pytest.approx([-0.03, 0.03])
+        # Monomer energies come from the cache, the dimer charges do not
+        assert computed[1] == ["(0,1)"]
+
+    def test_same_order_fully_cached(self, computed):
+        _analyze([WATER_A, WATER_B])
+        result = _analyze([WATER_A, WATER_B])
+        assert result.n_cached == result.n_subsystems
+        assert result.charge_transfer == pytest.approx([0.03, -0.03])
+
+
+class TestSupersystem:
+    """The full complex is computed once."""
+
+    def test_dimer_supersystem_not_duplicated(self, computed):
+        result = _analyze([WATER_A, WATER_B], compute_supersystem=True)
+        assert computed[0] == ["(0)", "(0,1)", "(1)"]
+        assert result.n_subsystems == 3
+        assert result.supersystem_energy == pytest.approx(-152.0)
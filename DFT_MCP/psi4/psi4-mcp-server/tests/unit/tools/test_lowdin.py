@@ -1,9 +1,35 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for Löwdin population analysis on a fake wavefunction.
 """
 
-# TODO: Add implementation
-pass
+import numpy as np
+import pytest
+
+lowdin = pytest.importorskip("psi4_mcp.tools.properties.charges.lowdin")
+
+ELEMENTS = ["O", "H", "H"]
+
+
+class TestLowdinCharges:
+    """Array-backed Löwdin charges."""
+
+    @pytest.mark.parametrize("n_alpha,n_beta", [(3, 3), (3, 2)])
+    def test_matches_reference(self, fake_wavefunction, n_alpha, n_beta):
+        wfn = fake_wavefunction(n_alpha, n_beta)
+        result = lowdin.compute_lowdin_charges_from_wfn(wfn, ELEMENTS)
+
+        values, vectors = np.linalg.eigh(wfn.S)
+        s_half = vectors @ np.diag(np.sqrt(values)) @ vectors.T
+        density = np.diag(s_half @ (wfn.Da() + wfn.Db()) @ s_half)
+        expected = np.array([8.0, 1.0, 1.0])
+        for mu, atom in enumerate(wfn.bf_to_atom()):
+            expected[atom] -= density[mu]
+
+        assert [entry["charge"] for entry in result.to_dict()["atomic_charges"]] == pytest.approx(expected)
+        assert result.total_charge == pytest.approx(10 - n_alpha - n_beta)
+        assert result.total_spin == pytest.approx(n_alpha - n_beta)
+
+    def test_population_analysis(self, fake_wavefunction):
+        result = lowdin.compute_lowdin_charges_from_wfn(fake_wavefunction(), ELEMENTS)
+        charges = [charge.lowdin for charge in result.population.get_atomic_charges()]
+        assert charges == pytest.approx(result.population.atomic_charges.tolist())
@@ -1,9 +1,46 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for Mayer bond orders on a fake wavefunction.
 """
 
-# TODO: Add implementation
-pass
+import numpy as np
+import pytest
+
+mayer = pytest.importorskip("psi4_mcp.tools.properties.bonds.mayer")
+
+ELEMENTS = ["O", "H", "H"]
+
+
+class TestMayerBondOrders:
+    """Array-backed Mayer analysis."""
+
+    def test_valences_match_reference(self, fake_wavefunction):
+        wfn = fake_wavefunction(3, 2)
+        result = mayer.compute_mayer_bond_orders(wfn, ELEMENTS, bond_threshold=0.0)
+
+        ds_total = (wfn.Da() + wfn.Db()) @ wfn.S
+        bf_to_atom = wfn.bf_to_atom()
+        gross = np.zeros(3)
+        same_atom = np.zeros(3)
+        for mu, atom_mu in enumerate(bf_to_atom):
+            gross[atom_mu] += ds_total[mu, mu]
+            for nu, atom_nu in enumerate(bf_to_atom):
+                if atom_mu == atom_nu:
+                    same_atom[atom_mu] += ds_total[mu, nu] * ds_total[nu, mu]
+
+        valences = result.to_dict()["atomic_valences"]
+        assert [v["gross_population"] for v in valences] == pytest.approx(gross)
+        assert [v["total_valence"] for v in valences] == pytest.approx(2 * gross - same_atom)
+        matrix = np.array(result.bond_order_matrix)
+        assert [v["bonded_valence"] for v in valences] == pytest.approx(matrix.sum(axis=1))
+        assert result.is_open_shell
+
+    def test_components(self, fake_wavefunction):
+        result = mayer.compute_mayer_bond_orders(fake_wavefunction(), ELEMENTS, bond_threshold=0.0)
+        for bond in result.bond_orders:
+            assert bond.covalent_component + bond.ionic_component == pytest.approx(bond.bond_order)
+
+        plain = mayer.compute_mayer_bond_orders(
+            fake_wavefunction(), ELEMENTS, bond_threshold=0.0, compute_components=False,
+        )
+        assert all(b.covalent_component == b.ionic_component == 0.0 for b in plain.bond_orders)
+        assert plain.bond_order_matrix == result.bond_order_matrix
@@ -1,9 +1,47 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for Mulliken population analysis on a fake wavefunction.
 """
 
-# TODO: Add implementation
-pass
+import numpy as np
+import pytest
+
+mulliken = pytest.importorskip("psi4_mcp.tools.properties.charges.mulliken")
+
+ELEMENTS = ["O", "H", "H"]
+
+
+def _reference_populations(wfn):
+    """Gross populations summed one basis function at a time."""
+    ps_alpha = wfn.Da() @ wfn.S
+    ps_beta = wfn.Db() @ wfn.S
+    alpha = np.zeros(3)
+    beta = np.zeros(3)
+    for mu, atom in enumerate(wfn.bf_to_atom()):
+        alpha[atom] += ps_alpha[mu, mu]
+        beta[atom] += ps_beta[mu, mu]
+    return alpha, beta
+
+
+class TestMullikenCharges:
+    """Array-backed Mulliken charges."""
+
+    @pytest.mark.parametrize("n_alpha,n_beta", [(3, 3), (3, 2)])
+    def test_matches_reference(self, fake_wavefunction, n_alpha, n_beta):
+        wfn = fake_wavefunction(n_alpha, n_beta)
+        result = mulliken.compute_mulliken_charges_from_wfn(wfn, ELEMENTS)
+        alpha, beta = _reference_populations(wfn)
+
+        entries = result.to_dict()["atomic_charges"]
+        assert [entry["element"] for entry in entries] == ELEMENTS
+        assert [entry["charge"] for entry in entries] == pytest.approx([8, 1, 1] - alpha - beta)
+        assert [entry["spin_population"] for entry in entries] == pytest.approx(alpha - beta)
+        assert result.total_charge == pytest.approx(10 - n_alpha - n_beta)
+        assert result.total_spin == pytest.approx(n_alpha - n_beta)
+
+    def test_population_analysis(self, fake_wavefunction):
+        result = mulliken.compute_mulliken_charges_from_wfn(fake_wavefunction(), ELEMENTS)
+        population = result.population
+        assert isinstance(population.atomic_charges, np.ndarray)
+        charges = [charge.mulliken for charge in population.get_atomic_charges()]
+        assert charges == pytest.approx(population.atomic_charges.tolist())
+        assert result.atomic_charges[1].charge == pytest.approx(charges[1])
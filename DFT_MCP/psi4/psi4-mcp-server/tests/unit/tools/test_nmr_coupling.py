@@ -1,9 +1,68 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the NMR coupling pair selection.
 """
 
-# TODO: Add implementation
-pass
+import itertools
+
+import numpy as np
+import pytest
+
+pairs = pytest.importorskip("psi4_mcp.tools.spectroscopy.nmr.pairs")
+
+# Chloromethane (Angstrom)
+CH3CL = (
+    ["C", "Cl", "H", "H", "H"],
+    np.array([
+        [0.000, 0.000, 0.000],
+        [0.000, 0.000, 1.781],
+        [1.027, 0.000, -0.363],
+        [-0.513, 0.889, -0.363],
+        [-0.513, -0.889, -0.363],
+    ]),
+)
+
+
+class TestBondGraph:
+    """Bonds from covalent radii."""
+
+    def test_chloromethane(self):
+        adjacency = pairs.bond_graph(*CH3CL)
+        assert sorted(adjacency[0]) == [1, 2, 3, 4]
+        assert adjacency[1] == [0]
+        assert all(adjacency[h] == [0] for h in (2, 3, 4))
+
+    def test_bond_paths(self):
+        paths = pairs.bond_paths(pairs.bond_graph(*CH3CL), max_bonds=2)
+        assert paths[(0, 1)] == (0, 1)
+        assert paths[(1, 2)] == (1, 0, 2)
+        assert paths[(2, 3)] == (2, 0, 3)
+        assert len(paths) == 10
+
+
+class TestCouplingPairs:
+    """Pair selection by bond count and distance."""
+
+    def test_all_pairs(self):
+        found = pairs.coupling_pairs(*CH3CL)
+        assert [(p["i"], p["j"]) for p in found] == list(itertools.combinations(range(5), 2))
+        assert all(p["n_bonds"] is None for p in found)
+
+    def test_max_bonds(self):
+        found = pairs.coupling_pairs(*CH3CL, max_bonds=1)
+        assert [(p["i"], p["j"]) for p in found] == [(0, 1), (0, 2), (0, 3), (0, 4)]
+        assert found[0]["distance"] == pytest.approx(1.781)
+
+    def test_max_distance_matches_brute_force(self):
+        elements, coords = CH3CL
+        found = pairs.coupling_pairs(elements, coords, max_distance=2.0, path_depth=3)
+        expected = [
+            (i, j) for i, j in itertools.combinations(range(5), 2)
+            if np.linalg.norm(coords[i] - coords[j]) <= 2.0
+        ]
+        assert [(p["i"], p["j"]) for p in found] == expected
+        assert {(p["i"], p["j"]): p["n_bonds"] for p in found}[(2, 3)] == 2
+
+    def test_elements_filter(self):
+        found = pairs.coupling_pairs(*CH3CL, max_bonds=2, elements_filter=["H", "Cl"])
+        assert [(p["i"], p["j"]) for p in found] == [(1, 2), (1, 3), (1, 4), (2, 3), (2, 4), (3, 4)]
+        assert all(p["n_bonds"] == 2 for p in found)
@@ -1,9 +1,56 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the SAPT scan result.
 """
 
-# TODO: Add implementation
-pass
+import numpy as np
+import pytest
+
+scan = pytest.importorskip("psi4_mcp.tools.sapt.scan")
+
+
+def _result(distances, angles=None, shape=None):
+    """Scan whose total energy is 2 (r - 3.6)^2 - 1.5 kcal/mol."""
+    distances = np.asarray(distances, dtype=float)
+    angles = np.zeros_like(distances) if angles is None else np.asarray(angles, dtype=float)
+    return scan.SAPTScanResult(
+        method="sapt0", basis="jun-cc-pvdz",
+        distances=distances, angles=angles,
+        shape=shape or (1, len(distances)),
+        components={"total": 2.0 * (distances - 3.6) ** 2 - 1.5},
+    )
+
+
+class TestScanMinimum:
+    """Parabolic refinement of the scan minimum."""
+
+    def test_sorted_distances(self):
+        minimum = _result([3.0, 3.5, 4.0, 4.5]).minimum()
+        assert minimum["distance_angstrom"] == 3.5
+        assert minimum["equilibrium_distance_angstrom"] == pytest.approx(3.6)
+        assert minimum["equilibrium_total_kcal"] == pytest.approx(-1.5)
+
+    def test_unsorted_distances(self):
+        def anharmonic(distances):
+            result = _result(distances)
+            result.components["total"] += (result.distances - 3.6) ** 3
+            return result.minimum()
+
+        expected = anharmonic([3.0, 3.5, 4.0, 4.5])
+        minimum = anharmonic([4.5, 3.5, 3.0, 4.0])
+        assert minimum["index"] == 1
+        assert minimum["equilibrium_distance_angstrom"] == pytest.approx(expected["equilibrium_distance_angstrom"])
+        assert minimum["equilibrium_total_kcal"] == pytest.approx(expected["equilibrium_total_kcal"])
+
+    def test_edge_minimum_not_refined(self):
+        minimum = _result([4.0, 3.7, 4.5]).minimum()
+        assert minimum["distance_angstrom"] == 3.7
+        assert "equilibrium_distance_angstrom" not in minimum
+
+    def test_fits_within_angle(self):
+        distances = [4.0, 3.0, 3.5] * 2
+        angles = [0.0] * 3 + [90.0] * 3
+        result = _result(distances, angles, shape=(2, 3))
+        result.components["total"][3:] += 1.0
+        minimum = result.minimum()
+        assert minimum["angle_degrees"] == 0.0
+        assert minimum["equilibrium_distance_angstrom"] == pytest.approx(3.6)
@@ -1,9 +1,223 @@
 """
-Psi4 MCP Server - Placeholder Module
+Tests for the shared excited-state store.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+The SCF and the response solvers are replaced by fakes that record their
+calls, so the tests check which requests reuse, extend or recompute.
 """
 
-# TODO: Add implementation
-pass
+import sys
+import types
+
+import numpy as np
+import pytest
+
+store = pytest.importorskip("psi4_mcp.tools.excited_states.store")
+
+WATER = """
+O  0.000  0.000  0.117
+H  0.000  0.757 -0.467
+H  0.000 -0.757 -0.467
+"""
+
+
+def _roots(n):
+    """TDSCF result dicts with energies 0.1, 0.2, ... Hartree."""
+    return [
+        {
+            "EXCITATION ENERGY": 0.1 * (i + 1),
+            "OSCILLATOR STRENGTH (LEN)": 0.01 * i,
+            "ELECTRIC DIPOLE TRANSITION MOMENT (LEN)": np.array([0.0, 0.0, 0.1 * i]),
+            "RIGHT EIGENVECTOR ALPHA": np.full(4, i, dtype=float),
+            "LEFT EIGENVECTOR ALPHA": np.full(4, -i, dtype=float),
+        }
+        for i in range(n)
+    ]
+
+
+class FakeWavefunction:
+    def __init__(self, nso=10, jk=None):
+        self._nso = nso
+        self._jk = jk
+
+    def same_a_b_orbs(self):
+        return True
+
+    def nso(self):
+        return self._nso
+
+    def jk(self):
+        return self._jk
+
+
+def _record(key, nso=10, jk=None):
+    record = store.ExcitedStateRecord(
+        key=key, method="b3lyp", basis="cc-pvdz", tda=False, triplets=False,
+        ground_state_energy=-76.4, convergence=1e-4, wavefunction=FakeWavefunction(nso, jk),
+        **{name: np.zeros(0) for name in (
+            "excitation_energies", "oscillator_length", "oscillator_velocity",
+            "rotatory_length", "rotatory_velocity",
+        )},
+        **{name: np.zeros((0, 3)) for name in ("dipole_length", "dipole_velocity", "magnetic_dipole")},
+    )
+    store._apply_roots(record, _roots(3))
+    return record
+
+
+@pytest.fixture
+def calls(monkeypatch):
+    """Fake psi4 and solvers; returns the list of (call, n_states) made."""
+    made = []
+    psi4 = types.ModuleType("psi4")
+    psi4.set_memory = psi4.set_num_threads = psi4.set_options = lambda *args, **kwargs: None
+    psi4.core = types.SimpleNamespace(clean=lambda: None, set_output_file=lambda *args: None)
+    psi4.geometry = lambda text: text
+
+    def energy(name, return_wfn, molecule):
+        made.append(("scf", None))
+        return -76.4, FakeWavefunction()
+
+    def solve_fresh(wfn, n_states, *args):
+        made.append(("fresh", n_states))
+        return _roots(n_states)
+
+    def solve_restarted(wfn, guess, n_states, *args):
+        made.append(("restarted", n_states))
+        assert [v[0] for v in guess] == list(range(len(guess)))
+        return _roots(n_states)
+
+    psi4.energy = energy
+    monkeypatch.setitem(sys.modules, "psi4", psi4)
+    monkeypatch.setattr(store, "solve_fresh", solve_fresh)
+    monkeypatch.setattr(store, "solve_restarted", solve_restarted)
+    monkeypatch.setattr(store, "calculation_output_path", lambda name: name)
+    monkeypatch.setattr(store, "_excited_state_store", None)
+    return made
+
+
+class TestExcitedStateKey:
+    """Records are shared across formatting but not across response types."""
+
+    def test_formatting_ignored(self):
+        key = store.excited_state_key(WATER, 0, 1, "B3LYP", "cc-pVDZ", False, False)
+        reformatted = "\n".join("  " + line.lower() for line in WATER.splitlines())
+        assert store.excited_state_key(reformatted, 0, 1, "b3lyp", "CC-PVDZ", False, False) == key
+
+    @pytest.mark.parametrize("change", [
+        dict(charge=1), dict(method="pbe0"), dict(basis="aug-cc-pvdz"), dict(tda=True), dict(triplets=True),
+    ])
+    def test_response_type_distinguished(self, change):
+        args = dict(geometry=WATER, charge=0, multiplicity=1, method="b3lyp", basis="cc-pvdz",
+                    tda=False, triplets=False)
+        assert store.excited_state_key(**{**args, **change}) != store.excited_state_key(**args)
+
+
+class TestExcitedStateRecord:
+    """Per-state data and size estimates."""
+
+    def test_excitations(self):
+        states = _record("a").excitations(2)
+        assert [s["state"] for s in states] == [1, 2]
+        assert states[1]["energy_ev"] == pytest.approx(0.2 * store.HARTREE_TO_EV)
+        assert states[1]["wavelength_nm"] == pytest.approx(store.HARTREE_TO_NM / 0.2)
+        assert states[1]["transition_dipole"] == pytest.approx([0.0, 0.0, 0.1])
+        assert len(_record("a").excitations(10)) == 3
+
+    def test_estimated_bytes(self):
+        vectors = 2 * 3 * 4 * 8
+        scf = 8 * store.WAVEFUNCTION_MATRICES * 10 ** 2
+        assert _record("a").estimated_bytes() == vectors + scf
+        jk = types.SimpleNamespace(memory_estimate=lambda: 1000)
+        assert _record("a", jk=jk).estimated_bytes() == vectors + scf + 8000
+        # JK objects without an estimate fall back to a density-fitting guess
+        jk = types.SimpleNamespace(memory_estimate=None)
+        assert _record("a", jk=jk).estimated_bytes() == vectors + scf + 8 * store.DF_AUX_RATIO * 10 ** 3
+
+
+class TestExcitedStateStore:
+    """LRU eviction by count and by estimated size."""
+
+    def test_evicts_least_recently_used(self):
+        records = store.ExcitedStateStore(max_entries=2)
+        records.put(_record("a"))
+        records.put(_record("b"))
+        assert records.get("a") is not None
+        records.put(_record("c"))
+        assert "b" not in records
+        assert [r["key"] for r in records.records()] == ["a", "c"]
+
+    def test_evicts_by_size(self):
+        large = _record("large", nso=400)
+        records = store.ExcitedStateStore(max_mb=1.5 * large.estimated_bytes() / 1024 ** 2)
+        records.put(_record("small"))
+        records.put(large)
+        assert len(records) == 2
+        records.put(_record("large2", nso=400))
+        assert [r["key"] for r in records.records()] == ["large2"]
+        assert records.size_mb <= records.max_mb
+
+    def test_newest_record_kept(self):
+        records = store.ExcitedStateStore(max_mb=1e-6)
+        records.put(_record("a"))
+        records.put(_record("b"))
+        assert [r["key"] for r in records.records()] == ["b"]
+
+    def test_remove_and_clear(self):
+        records = store.ExcitedStateStore()
+        records.put(_record("a"))
+        records.put(_record("b"))
+        assert records.remove("a") and not records.remove("a")
+        records.clear()
+        assert len(records) == 0 and records.size_mb == 0
+
+
+class TestGetExcitedStates:
+    """Requests are served, extended or computed."""
+
+    def test_computed_then_stored(self, calls):
+        record = store.get_excited_states(WATER, n_states=5)
+        assert (record.source, record.n_roots) == ("computed", 5)
+        again = store.get_excited_states(WATER, n_states=3)
+        assert again is record and again.source == "stored"
+        assert calls == [("scf", None), ("fresh", 5)]
+
+    def test_expanded_from_stored_vectors(self, calls):
+        record = store.get_excited_states(WATER, n_states=3)
+        expanded = store.get_excited_states(WATER, n_states=6)
+        assert expanded is record
+        assert (expanded.source, expanded.n_roots, expanded.n_solves) == ("expanded", 6, 2)
+        assert expanded.excitation_energies == pytest.approx(0.1 * np.arange(1, 7))
+        assert calls == [("scf", None), ("fresh", 3), ("restarted", 6)]
+
+    def test_tighter_convergence_keeps_roots(self, calls):
+        store.get_excited_states(WATER, n_states=4, convergence=1e-4)
+        record = store.get_excited_states(WATER, n_states=2, convergence=1e-6)
+        assert (record.n_roots, record.convergence) == (4, 1e-6)
+        assert calls[-1] == ("restarted", 4)
+
+    def test_restart_unavailable_reuses_scf(self, calls, monkeypatch):
+        store.get_excited_states(WATER, n_states=2)
+
+        def unavailable(*args):
+            raise ImportError("no restart")
+
+        monkeypatch.setattr(store, "solve_restarted", unavailable)
+        record = store.get_excited_states(WATER, n_states=4)
+        assert (record.source, record.n_roots) == ("expanded", 4)
+        assert calls == [("scf", None), ("fresh", 2), ("fresh", 4)]
+
+    def test_unusable_record_recomputed(self, calls, monkeypatch):
+        first = store.get_excited_states(WATER, n_states=2)
+
+        def broken(*args):
+            raise RuntimeError("stale wavefunction")
+
+        monkeypatch.setattr(store, "solve_restarted", broken)
+        record = store.get_excited_states(WATER, n_states=4)
+        assert record is not first and record.source == "computed"
+        assert calls == [("scf", None), ("fresh", 2), ("scf", None), ("fresh", 4)]
+
+    def test_response_types_stored_separately(self, calls):
+        singlets = store.get_excited_states(WATER, n_states=2)
+        triplets = store.get_excited_states(WATER, n_states=2, triplets=True)
+        assert singlets is not triplets
+        assert len(store.get_excited_state_store()) == 2
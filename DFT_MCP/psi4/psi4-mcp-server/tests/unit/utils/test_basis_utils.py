@@ -1,9 +1,167 @@
 """
-Psi4 MCP Server - Placeholder Module
+Tests for the basis set optimizer.
 
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+The objective is the hydrogen-atom energy in a basis of s-type Gaussians,
+which has closed-form integrals and known optimal exponents.
 """
 
-# TODO: Add implementation
-pass
+import math
+
+import numpy as np
+import pytest
+
+generator = pytest.importorskip("psi4_mcp.utils.basis.generator")
+optimizer = pytest.importorskip("psi4_mcp.utils.basis.optimizer")
+
+BasisOptimizer = optimizer.BasisOptimizer
+
+
+def _s_function(exponents, coefficients=None):
+    func = generator.ContractedFunction(shell_type=generator.ShellType.S, element="H")
+    for exponent, coefficient in zip(exponents, coefficients or [1.0] * len(exponents)):
+        func.add_primitive(exponent, coefficient)
+    return func
+
+
+def _integrals(exponents):
+    a = np.asarray(exponents, dtype=float)
+    s = a[:, None] + a[None, :]
+    overlap = (np.pi / s) ** 1.5
+    hamiltonian = 3 * a[:, None] * a[None, :] / s * overlap - 2 * np.pi / s
+    return overlap, hamiltonian
+
+
+def uncontracted_energy(func) -> float:
+    """Lowest eigenvalue in the span of the primitives."""
+    overlap, hamiltonian = _integrals(func.exponents)
+    inverse = np.linalg.inv(np.linalg.cholesky(overlap))
+    return float(np.linalg.eigvalsh(inverse @ hamiltonian @ inverse.T)[0])
+
+
+def contracted_energy(func) -> float:
+    """Energy expectation value of the contracted function."""
+    overlap, hamiltonian = _integrals(func.exponents)
+    c = np.asarray(func.coefficients, dtype=float)
+    return float(c @ hamiltonian @ c / (c @ overlap @ c))
+
+
+class TestExponentOptimization:
+    """Variational exponents of the hydrogen atom."""
+
+    def test_single_gaussian(self):
+        result = BasisOptimizer().optimize_exponents(_s_function([1.0]), uncontracted_energy)
+        assert result.converged
+        # Analytic optimum: alpha = 8 / (9 pi), E = -4 / (3 pi)
+        assert result.optimized_function.exponents[0] == pytest.approx(8 / (9 * math.pi), rel=1e-4)
+        assert result.final_value == pytest.approx(-4 / (3 * math.pi), abs=1e-8)
+
+    @pytest.mark.parametrize("start,energy", [
+        ([2.0, 0.3], -0.485813),
+        ([5.0, 1.0, 0.2], -0.496979),
+    ])
+    def test_several_gaussians(self, start, energy):
+        result = BasisOptimizer().optimize_exponents(_s_function(start), uncontracted_energy)
+        assert result.converged
+        assert result.final_value == pytest.approx(energy, abs=1e-6)
+
+    @pytest.mark.parametrize("tolerance", [1e-6, 1e-9])
+    def test_converged_gradient(self, tolerance):
+        result = BasisOptimizer(tolerance=tolerance).optimize_exponents(
+            _s_function([5.0, 1.0, 0.2]), uncontracted_energy,
+        )
+        assert result.converged
+        x = np.log(result.optimized_function.exponents)
+        h = 1e-5
+        for i in range(len(x)):
+            shift = np.eye(len(x))[i] * h
+            plus = uncontracted_energy(_s_function(np.exp(x + shift).tolist()))
+            minus = uncontracted_energy(_s_function(np.exp(x - shift).tolist()))
+            assert abs(plus - minus) / (2 * h) < max(10 * tolerance, 1e-8)
+
+    def test_unreachable_tolerance_not_converged(self):
+        # Finite-difference noise keeps the gradient above 1e-14
+        result = BasisOptimizer(tolerance=1e-14).optimize_exponents(
+            _s_function([5.0, 1.0, 0.2]), uncontracted_energy,
+        )
+        assert not result.converged
+        assert result.final_value == pytest.approx(-0.496979, abs=1e-6)
+        assert result.n_evaluations < 500
+
+
+class TestCoefficientOptimization:
+    """Contraction coefficients at fixed exponents."""
+
+    def test_matches_uncontracted_energy(self):
+        func = _s_function([5.0, 1.0, 0.2], [0.1, 0.4, 0.6])
+        result = BasisOptimizer().optimize_coefficients(func, contracted_energy)
+        assert result.converged
+        assert result.final_value == pytest.approx(uncontracted_energy(func), abs=1e-8)
+
+    def test_maximize(self):
+        func = _s_function([5.0, 1.0, 0.2], [0.1, 0.4, 0.6])
+        result = BasisOptimizer().optimize_coefficients(
+            func, lambda f: -contracted_energy(f), minimize=False,
+        )
+        assert result.converged
+        assert result.final_value == pytest.approx(-uncontracted_energy(func), abs=1e-8)
+
+
+class TestObjectiveEvaluation:
+    """Worker processes, batch objectives and the objective cache."""
+
+    START = [5.0, 1.0, 0.2]
+
+    def test_workers_match_serial(self, caplog):
+        serial = BasisOptimizer(line_search_batch=2).optimize_exponents(
+            _s_function(self.START), uncontracted_energy,
+        )
+        parallel = BasisOptimizer(max_workers=2).optimize_exponents(
+            _s_function(self.START), uncontracted_energy,
+        )
+        assert "evaluating serially" not in caplog.text
+        assert "failed" not in caplog.text
+        assert parallel.converged
+        assert parallel.final_value == serial.final_value
+        assert parallel.optimized_function.exponents == serial.optimized_function.exponents
+        assert parallel.n_evaluations == serial.n_evaluations
+
+    def test_batch_objective(self):
+        batches = []
+
+        def batch_energy(functions):
+            batches.append(len(functions))
+            return [uncontracted_energy(func) for func in functions]
+
+        def never_called(func):
+            raise AssertionError("single objective used despite a batch objective")
+
+        result = BasisOptimizer().optimize_exponents(
+            _s_function(self.START), never_called, batch_objective_func=batch_energy,
+        )
+        assert result.converged
+        assert result.final_value == pytest.approx(-0.496979, abs=1e-6)
+        assert sum(batches) == result.n_evaluations
+        # The central-difference gradient is one batch of 2n points
+        assert 2 * len(self.START) in batches
+
+    def test_cache_reused_across_runs(self):
+        cache = {}
+        first = BasisOptimizer(objective_cache=cache).optimize_exponents(
+            _s_function(self.START), uncontracted_energy,
+        )
+        assert first.n_evaluations == len(cache) > 0
+
+        calls = []
+
+        def counted_energy(func):
+            calls.append(func)
+            return uncontracted_energy(func)
+
+        second = BasisOptimizer(objective_cache=cache).optimize_exponents(
+            _s_function(self.START), counted_energy,
+        )
+        assert second.n_evaluations == 0
+        assert calls == []
+        assert second.n_cached > 0
+        assert second.final_value == first.final_value
+        assert second.optimized_function.exponents == first.optimized_function.exponents
@@ -1,9 +1,130 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the molecular and results caches.
 """
 
-# TODO: Add implementation
-pass
+import numpy as np
+import pytest
+
+geometry_index = pytest.importorskip("psi4_mcp.utils.caching.geometry_index")
+molecular = pytest.importorskip("psi4_mcp.utils.caching.molecular")
+results = pytest.importorskip("psi4_mcp.utils.caching.results")
+
+WATER = [
+    ("O", 0.0, 0.0, 0.117),
+    ("H", 0.0, 0.757, -0.467),
+    ("H", 0.0, -0.757, -0.467),
+]
+WATER_REORDERED = [WATER[1], WATER[2], WATER[0]]
+
+# Tetrahedral, so all principal moments are degenerate
+METHANE = [
+    ("C", 0.0, 0.0, 0.0),
+    ("H", 0.629, 0.629, 0.629),
+    ("H", -0.629, -0.629, 0.629),
+    ("H", -0.629, 0.629, -0.629),
+    ("H", 0.629, -0.629, -0.629),
+]
+
+KEY = dict(
+    calculation_type=results.CalculationType.PROPERTIES, charge=0, multiplicity=1,
+    method="nmr/b3lyp", basis="pcseg-1", reference="rks",
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches(monkeypatch):
+    monkeypatch.setattr(molecular, "_molecular_cache", None)
+    monkeypatch.setattr(results, "_results_cache", None)
+
+
+def _moved(geometry, seed=0, noise=0.0, order=None):
+    """Geometry rotated, translated, optionally reordered and perturbed."""
+    rng = np.random.default_rng(seed)
+    rotation = np.linalg.qr(rng.normal(size=(3, 3)))[0]
+    if np.linalg.det(rotation) < 0:
+        rotation[:, 0] = -rotation[:, 0]
+    xyz = np.array([atom[1:] for atom in geometry]) @ rotation.T + rng.normal(size=3)
+    xyz += rng.normal(scale=noise, size=xyz.shape)
+    order = range(len(geometry)) if order is None else order
+    return [(geometry[i][0].lower(), *xyz[i].tolist()) for i in order]
+
+
+class TestGeometryIndex:
+    """Near-duplicate lookup up to atom order, rigid motion and noise."""
+
+    @pytest.mark.parametrize("geometry", [WATER, METHANE], ids=["water", "methane"])
+    def test_finds_moved_and_reordered(self, geometry):
+        index = geometry_index.GeometryIndex()
+        index.add("mol", geometry)
+        order = list(reversed(range(len(geometry))))
+        for seed in range(5):
+            matches = index.query(_moved(geometry, seed, noise=1e-4, order=order))
+            assert [key for key, _ in matches] == ["mol"]
+            assert matches[0][1] < 5e-4
+
+    def test_rejects_distorted(self):
+        index = geometry_index.GeometryIndex()
+        index.add("water", WATER)
+        stretched = [WATER[0], WATER[1], ("H", 0.0, -0.857, -0.467)]
+        assert index.find(stretched) is None
+        assert index.find(stretched, tolerance=0.1) == "water"
+
+    def test_rejects_other_charge_state_and_formula(self):
+        index = geometry_index.GeometryIndex()
+        index.add("water", WATER)
+        assert index.find(WATER, charge=1, multiplicity=2) is None
+        assert index.find([("S", *WATER[0][1:])] + WATER[1:]) is None
+        assert index.find(WATER) == "water"
+
+    def test_matches_atoms_by_element(self):
+        # Swapping H and D is a C2 rotation; swapping O and D is a different molecule
+        hdo = [WATER[0], WATER[1], ("D", 0.0, -0.757, -0.467)]
+        odh = [WATER[0], ("D", 0.0, 0.757, -0.467), ("H", 0.0, -0.757, -0.467)]
+        index = geometry_index.GeometryIndex()
+        index.add("hdo", hdo)
+        assert index.find(_moved(odh, seed=1)) == "hdo"
+        assert index.find([("D", *WATER[0][1:]), WATER[1], ("O", 0.0, -0.757, -0.467)]) is None
+
+    def test_closest_first(self):
+        index = geometry_index.GeometryIndex(tolerance=0.05)
+        index.add("far", _moved(WATER, seed=1, noise=0.01))
+        index.add("near", _moved(WATER, seed=2, noise=0.001))
+        assert [key for key, _ in index.query(WATER)] == ["near", "far"]
+
+    def test_remove_and_replace(self):
+        index = geometry_index.GeometryIndex()
+        index.add("mol", WATER)
+        index.add("mol", METHANE)
+        assert len(index) == 1
+        assert index.find(WATER) is None
+        assert index.find(METHANE) == "mol"
+        assert index.remove("mol") and not index.remove("mol")
+        assert "mol" not in index and index.find(METHANE) is None
+
+
+class TestAtomOrder:
+    """The molecule hash ignores atom order; per-atom results must not."""
+
+    def test_molecule_hash_ignores_order(self):
+        assert molecular.compute_molecule_hash(WATER) == molecular.compute_molecule_hash(WATER_REORDERED)
+
+    def test_atom_order_hash(self):
+        assert molecular.atom_order_hash(WATER) != molecular.atom_order_hash(WATER_REORDERED)
+        assert molecular.atom_order_hash(WATER) == molecular.atom_order_hash(list(WATER))
+
+    def test_per_atom_result_not_shared_across_orders(self):
+        results.cache_calculation_result(
+            geometry=WATER, result={"shieldings": [330.0, 31.0, 32.0]}, per_atom=True, **KEY,
+        )
+        assert results.get_cached_result(geometry=WATER, per_atom=True, **KEY) == {
+            "shieldings": [330.0, 31.0, 32.0],
+        }
+        assert results.get_cached_result(geometry=WATER_REORDERED, per_atom=True, **KEY) is None
+        assert results.get_cached_result(
+            geometry=WATER_REORDERED, per_atom=True, near_duplicates=True, **KEY,
+        ) is None
+
+    def test_order_independent_result_shared(self):
+        results.cache_calculation_result(geometry=WATER, result={"energy": -76.4}, **KEY)
+        assert results.get_cached_result(geometry=WATER_REORDERED, **KEY) == {"energy": -76.4}
+        assert results.get_cached_result(geometry=WATER, per_atom=True, **KEY) is None
@@ -1,9 +1,60 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the cell-list neighbor search.
 """
 
-# TODO: Add implementation
-pass
+import itertools
+
+import numpy as np
+import pytest
+
+neighbors = pytest.importorskip("psi4_mcp.utils.geometry.neighbors")
+
+
+def _brute_force(coords, cutoff):
+    return [
+        (i, j, float(np.linalg.norm(coords[i] - coords[j])))
+        for i, j in itertools.combinations(range(len(coords)), 2)
+        if np.linalg.norm(coords[i] - coords[j]) <= cutoff
+    ]
+
+
+class TestNeighborPairs:
+    """Pairs within a cutoff from neighboring cells."""
+
+    @pytest.mark.parametrize("cutoff", [0.5, 1.5, 3.0, 50.0])
+    def test_matches_brute_force(self, cutoff):
+        # Negative coordinates and a spread over many cells
+        coords = np.random.default_rng(3).uniform(-6.0, 6.0, size=(120, 3))
+        i, j, d = neighbors.neighbor_pairs(coords, cutoff)
+        expected = _brute_force(coords, cutoff)
+        assert list(zip(i.tolist(), j.tolist())) == [(a, b) for a, b, _ in expected]
+        assert d == pytest.approx([dist for _, _, dist in expected])
+
+    def test_sorted_with_i_below_j(self):
+        coords = np.random.default_rng(5).uniform(0.0, 4.0, size=(40, 3))
+        i, j, _ = neighbors.neighbor_pairs(coords, 2.0)
+        assert np.all(i < j)
+        assert np.all(np.lexsort((j, i)) == np.arange(len(i)))
+
+    def test_cutoff_inclusive(self):
+        coords = np.array([[0.0, 0.0, 0.0], [0.0, 0.0, 1.0], [0.0, 0.0, 2.5]])
+        i, j, d = neighbors.neighbor_pairs(coords, 1.0)
+        assert i.tolist() == [0] and j.tolist() == [1]
+        assert d.tolist() == [1.0]
+
+    def test_coincident_atoms(self):
+        coords = np.zeros((3, 3))
+        i, j, d = neighbors.neighbor_pairs(coords, 1.0)
+        assert list(zip(i.tolist(), j.tolist())) == [(0, 1), (0, 2), (1, 2)]
+        assert d.tolist() == [0.0, 0.0, 0.0]
+
+    @pytest.mark.parametrize("coords, cutoff", [
+        (np.zeros((0, 3)), 1.0),
+        (np.zeros((1, 3)), 1.0),
+        (np.zeros((4, 3)), 0.0),
+        (np.eye(3) * 10.0, 1.0),
+    ])
+    def test_no_pairs(self, coords, cutoff):
+        i, j, d = neighbors.neighbor_pairs(coords, cutoff)
+        assert len(i) == len(j) == len(d) == 0
+        assert i.dtype.kind == j.dtype.kind == "i"
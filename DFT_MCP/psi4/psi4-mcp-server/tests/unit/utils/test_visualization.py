@@ -1,9 +1,115 @@
 """
-Psi4 MCP Server - Placeholder Module
-
-This file is part of the Psi4 MCP Server implementation.
-TODO: Implement according to psi4_mcp_comprehensive_plan.md
+Tests for the marching-cubes isosurfaces.
 """
 
-# TODO: Add implementation
-pass
+from collections import Counter
+
+import numpy as np
+import pytest
+
+surfaces = pytest.importorskip("psi4_mcp.utils.visualization.surfaces")
+
+RADIUS = 1.5
+SPACING = 0.1
+
+
+def _gaussian(sign=1.0):
+    """exp(-r^2) on [-2, 2]^3; the RADIUS sphere is the level exp(-RADIUS^2)."""
+    x = np.linspace(-2.0, 2.0, 41)
+    mesh = np.meshgrid(x, x, x, indexing="ij")
+    return sign * np.exp(-sum(m ** 2 for m in mesh))
+
+
+def _sphere(sign=1.0):
+    level = sign * np.exp(-RADIUS ** 2)
+    return surfaces.marching_cubes(_gaussian(sign), level, (-2.0, -2.0, -2.0), (SPACING,) * 3)
+
+
+def _is_closed(faces):
+    """Every directed edge is matched by exactly one opposite edge."""
+    directed = Counter(
+        (int(a), int(b)) for f in faces for a, b in ((f[0], f[1]), (f[1], f[2]), (f[2], f[0]))
+    )
+    return all(count == 1 and directed.get((b, a)) == 1 for (a, b), count in directed.items())
+
+
+def _enclosed_volume(vertices, faces):
+    a, b, c = (vertices[faces[:, k]] for k in range(3))
+    return float(np.einsum("ij,ij->i", a, np.cross(b, c)).sum() / 6)
+
+
+class TestMarchingCubes:
+    """Surface extraction from a volume."""
+
+    @pytest.mark.parametrize("case", range(256))
+    def test_every_configuration_is_closed(self, case):
+        values = np.zeros((4, 4, 4))
+        for bit, (dx, dy, dz) in enumerate(surfaces.CUBE_CORNERS):
+            if case >> bit & 1:
+                values[1 + dx, 1 + dy, 1 + dz] = 1.0
+        _, faces, _ = surfaces.marching_cubes(values, 0.5)
+        assert _is_closed(faces)
+        assert (len(faces) == 0) == (case == 0)
+
+    def test_sphere(self):
+        vertices, faces, normals = _sphere()
+        assert np.linalg.norm(vertices, axis=1) == pytest.approx(RADIUS, abs=5e-3)
+        assert _is_closed(faces)
+        edges = {tuple(sorted(e)) for f in faces.tolist() for e in ((f[0], f[1]), (f[1], f[2]), (f[2], f[0]))}
+        assert len(vertices) - len(edges) + len(faces) == 2
+        # Outward winding gives a positive volume
+        assert _enclosed_volume(vertices, faces) == pytest.approx(4 / 3 * np.pi * RADIUS ** 3, rel=1e-3)
+        assert np.linalg.norm(normals, axis=1) == pytest.approx(1.0)
+        assert np.all(np.einsum("ij,ij->i", normals, vertices) > 0)
+
+    def test_negative_isovalue(self):
+        positive = _sphere()
+        negative = _sphere(-1.0)
+        for a, b in zip(positive, negative):
+            assert np.array_equal(a, b)
+
+    def test_no_crossing(self):
+        vertices, faces, normals = surfaces.marching_cubes(_gaussian(), 2.0)
+        assert vertices.shape == faces.shape == normals.shape == (0, 3)
+        assert surfaces.marching_cubes(np.ones((1, 5, 5)), 0.5)[1].shape == (0, 3)
+
+
+class TestMeshProcessing:
+    """Welding, decimation and serialization."""
+
+    def test_weld_surface_through_grid_points(self):
+        # The level plane x + y + z = 3 meets each of its grid points on three edges
+        values = np.indices((4, 4, 4)).sum(axis=0).astype(float)
+        vertices, faces, normals = surfaces.marching_cubes(values, 3.0)
+        welded, welded_faces, _ = surfaces.weld_vertices(vertices, faces, normals)
+        assert len(welded) < len(vertices)
+        assert len(welded) == len(np.unique(np.round(welded, 9), axis=0))
+        assert np.allclose(welded.sum(axis=1), 3.0)
+        assert welded_faces.max() == len(welded) - 1
+
+    def test_decimate_to_budget(self):
+        vertices, faces, normals = _sphere()
+        reduced, reduced_faces, reduced_normals = surfaces.decimate(vertices, faces, normals, 500)
+        assert 0 < len(reduced_faces) <= 500
+        assert reduced_faces.max() == len(reduced) - 1
+        assert np.linalg.norm(reduced, axis=1) == pytest.approx(RADIUS, abs=0.1)
+        assert _enclosed_volume(reduced, reduced_faces) == pytest.approx(
+            4 / 3 * np.pi * RADIUS ** 3, rel=0.1
+        )
+        assert np.linalg.norm(reduced_normals, axis=1) == pytest.approx(1.0)
+
+    def test_decimate_within_budget_unchanged(self):
+        mesh = _sphere()
+        assert all(a is b for a, b in zip(surfaces.decimate(*mesh, len(mesh[1])), mesh))
+
+    def test_compact_round_trip(self):
+        surface = surfaces.extract_isosurface(
+            _gaussian(), np.exp(-RADIUS ** 2), (-2.0, -2.0, -2.0), (SPACING,) * 3,
+        )
+        compact = surfaces.SurfaceVisualizer().to_compact(surface)
+        assert compact["n_triangles"] == surface.n_triangles
+        assert compact["faces"]["dtype"] == "uint16"
+        assert np.array_equal(surfaces.decode_array(compact["faces"]), surface.faces)
+        assert np.array_equal(surfaces.decode_array(compact["vertices"]), surface.vertices)
+        normals = surfaces.decode_array(compact["normals"]) * compact["normals"]["scale"]
+        assert normals == pytest.approx(surface.normals, abs=1 / 127)
@@ -7,6 +7,7 @@ import json
 from pathlib import Path
 from datetime import datetime
 from comparison_utils import create_comparison_table, display_comparison_table
+from modules.basis_table import get_basis_stats_for_data
 
 # ==================== CONFIGURATION ====================
 st.set_page_config(
@@ -110,8 +111,6 @@ def get_basis_data(basis_name, element_z):
 
 def analyze_basis_intelligence(basis_data, basis_name):
     """Intelligent analysis of basis set characteristics"""
-    elem_data = list(basis_data['elements'].values())[0]
-    shells = elem_data['electron_shells']
     
     analysis = {
         'type': 'Unknown',
@@ -122,11 +121,9 @@ def analyze_basis_intelligence(basis_data, basis_name):
         'explanation': ''
     }
     
-    # Count shells by type
-    s_shells = sum(1 for s in shells if s['angular_momentum'][0] == 0)
-    p_shells = sum(1 for s in shells if s['angular_momentum'][0] == 1)
-    d_shells = sum(1 for s in shells if s['angular_momentum'][0] == 2)
-    f_shells = sum(1 for s in shells if s['angular_momentum'][0] == 3)
+    # Count shells by type (precomputed table, see modules.basis_table)
+    stats = get_basis_stats_for_data(basis_data, basis_name)
+    s_shells, p_shells, d_shells, f_shells = stats['n_s'], stats['n_p'], stats['n_d'], stats['n_f']
     
     # Detect zeta level
     if s_shells == 1:
@@ -149,8 +146,7 @@ def analyze_basis_intelligence(basis_data, basis_name):
         analysis['pol_level'] = 'f-polarization (very high)'
     
     # Detect diffuse (check for very small exponents)
-    min_exp = min(float(e) for s in shells for e in s['exponents'])
-    if min_exp < 0.1:
+    if stats['exp_min'] < 0.1:
         analysis['diffuse'] = True
     
     # Build explanation
@@ -206,7 +206,7 @@ def build_comprehensive_database():
             'cost': 'Medium'
         },
         'M06': {
-            'full_name': 'HYB_MGGA_XC_M06',
+            'full_name': 'HYB_MGGA_X_M06,MGGA_C_M06',
             'type': 'Hybrid meta-GGA',
             'description': 'Minnesota 06 hybrid',
             'year': 2008,
@@ -216,7 +216,7 @@ def build_comprehensive_database():
             'exact_exchange': 0.27
         },
         'M06-2X': {
-            'full_name': 'HYB_MGGA_XC_M06_2X',
+            'full_name': 'HYB_MGGA_X_M06_2X,MGGA_C_M06_2X',
             'type': 'Hybrid meta-GGA',
             'description': 'Minnesota 06 with 54% exact exchange',
             'year': 2008,
@@ -1,33 +1,21 @@
 """Utilities for creating professional comparison tables"""
 import streamlit as st
+from modules.basis_table import get_basis_stats_for_data
 
 def create_comparison_table(basis_data1, basis_data2, basis_name1, basis_name2, analysis1, analysis2):
     """Create a professional color-coded comparison table"""
     
-    elem_data1 = list(basis_data1['elements'].values())[0]
-    elem_data2 = list(basis_data2['elements'].values())[0]
+    # Extract metrics (precomputed table, see modules.basis_table)
+    stats1 = get_basis_stats_for_data(basis_data1, basis_name1)
+    stats2 = get_basis_stats_for_data(basis_data2, basis_name2)
     
-    # Extract metrics
-    shells1 = elem_data1['electron_shells']
-    shells2 = elem_data2['electron_shells']
+    s_shells_1, s_shells_2 = stats1['n_s'], stats2['n_s']
+    p_shells_1, p_shells_2 = stats1['n_p'], stats2['n_p']
+    d_shells_1, d_shells_2 = stats1['n_d'], stats2['n_d']
+    f_shells_1, f_shells_2 = stats1['n_f'], stats2['n_f']
     
-    s_shells_1 = sum(1 for s in shells1 if s['angular_momentum'][0] == 0)
-    s_shells_2 = sum(1 for s in shells2 if s['angular_momentum'][0] == 0)
-    
-    p_shells_1 = sum(1 for s in shells1 if s['angular_momentum'][0] == 1)
-    p_shells_2 = sum(1 for s in shells2 if s['angular_momentum'][0] == 1)
-    
-    d_shells_1 = sum(1 for s in shells1 if s['angular_momentum'][0] == 2)
-    d_shells_2 = sum(1 for s in shells2 if s['angular_momentum'][0] == 2)
-    
-    f_shells_1 = sum(1 for s in shells1 if s['angular_momentum'][0] == 3)
-    f_shells_2 = sum(1 for s in shells2 if s['angular_momentum'][0] == 3)
-    
-    total_prim_1 = sum(len(s['exponents']) for s in shells1)
-    total_prim_2 = sum(len(s['exponents']) for s in shells2)
-    
-    total_contr_1 = sum(len(s['coefficients']) for s in shells1)
-    total_contr_2 = sum(len(s['coefficients']) for s in shells2)
+    total_prim_1, total_prim_2 = stats1['n_primitives'], stats2['n_primitives']
+    total_contr_1, total_contr_2 = stats1['n_contracted'], stats2['n_contracted']
     
     # Create comparison data
     comparison_data = []
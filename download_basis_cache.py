@@ -1,118 +1,231 @@
 #!/usr/bin/env python3
 """
 Download and cache all basis set metadata locally for fast offline access
+
+The cache is built incrementally: every basis set records the BSE version it
+was built from plus a source and a content hash, so re-runs only rebuild the
+entries whose upstream data changed. Element availability is read from the
+BSE metadata (covering all 118 elements) instead of trial-loading each one.
 """
 
+import argparse
 import basis_set_exchange as bse
+import hashlib
 import json
 import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 from pathlib import Path
 import sys
 
 CACHE_DIR = Path(__file__).parent / "basis_cache"
 METADATA_FILE = CACHE_DIR / "metadata.json"
+CACHE_FORMAT_VERSION = 2
+
+
+def _hash_json(obj) -> str:
+    """Stable SHA-256 of a JSON-serialisable object"""
+    payload = json.dumps(obj, sort_keys=True, separators=(',', ':'))
+    return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+
+
+def _source_hash(meta: dict) -> str:
+    """Hash of the BSE metadata entry that describes a basis set"""
+    return _hash_json({'bse_version': bse.version(), 'metadata': meta})
+
+
+def _build_entry(meta: dict) -> dict:
+    """
+    Build the cache entry for one basis set (runs in a worker process).
+
+    Args:
+        meta: BSE metadata entry for the basis set
+
+    Returns:
+        Cache entry dictionary
+    """
+    name = meta['display_name']
+    version = meta['latest_version']
+    version_meta = meta['versions'][version]
+
+    # Availability comes straight from the metadata: no per-element loads
+    available_elements = sorted(int(z) for z in version_meta['elements'])
+
+    # One full load per basis gives the content hash for change tracking
+    basis_data = bse.get_basis(name, version=version)
+
+    return {
+        'name': basis_data.get('name', name),
+        'display_name': name,
+        'family': meta.get('family', 'Other'),
+        'description': meta.get('description') or 'No description available',
+        'role': meta.get('role', 'orbital'),
+        'available_elements': available_elements,
+        'tags': meta.get('tags', []),
+        'function_types': meta.get('function_types', []),
+        'version': version,
+        'revdate': version_meta.get('revdate'),
+        'source_hash': _source_hash(meta),
+        'content_hash': _hash_json(basis_data),
+    }
 
-def download_all_basis_sets():
-    """Download metadata for all basis sets"""
-    
+
+def load_existing_cache() -> dict:
+    """Load the current cache, or an empty one if missing or outdated"""
+    if not METADATA_FILE.exists():
+        return {}
+
+    try:
+        with open(METADATA_FILE, 'r') as f:
+            data = json.load(f)
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+    if data.get('cache_format') != CACHE_FORMAT_VERSION:
+        return {}
+    return data
+
+
+def write_cache_atomic(cache_data: dict, path: Path = None) -> None:
+    """
+    Write the cache via a temporary file and an atomic rename.
+
+    Readers (e.g. a running app) never observe a half-written file.
+    """
+    path = path or METADATA_FILE
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'w') as f:
+            json.dump(cache_data, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def download_all_basis_sets(force: bool = False, workers: int = None):
+    """
+    Build or refresh the metadata cache for all basis sets.
+
+    Args:
+        force: Rebuild every entry even if its source hash is unchanged
+        workers: Number of worker processes (default: CPU count)
+    """
     print("🚀 Starting basis set cache download...")
     print(f"📁 Cache directory: {CACHE_DIR}")
-    
-    # Create cache directory
+
     CACHE_DIR.mkdir(exist_ok=True)
-    
-    # Get all basis set names
-    all_names = bse.get_all_basis_names()
-    print(f"📊 Found {len(all_names)} basis sets")
-    
-    # Get families
+
+    all_metadata = bse.get_metadata()
+    print(f"📊 Found {len(all_metadata)} basis sets")
+
     families = bse.get_families()
     print(f"👨‍👩‍👧‍👦 Found {len(families)} families")
-    
+
+    # Previous entries are also the fallback for bases that fail to rebuild
+    previous_entries = load_existing_cache().get('basis_sets', {})
+    existing = {} if force else previous_entries
+
+    basis_sets = {}
+    pending = []
+    for meta in all_metadata.values():
+        name = meta['display_name']
+        previous = existing.get(name)
+        if previous is not None and previous.get('source_hash') == _source_hash(meta):
+            basis_sets[name] = previous
+        else:
+            pending.append(meta)
+
+    reused = len(basis_sets)
+    print(f"♻️  Up to date: {reused}, to rebuild: {len(pending)}")
+
+    successful = 0
+    failed = 0
+    kept = 0
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = {pool.submit(_build_entry, meta): meta['display_name'] for meta in pending}
+            for idx, future in enumerate(as_completed(futures), 1):
+                name = futures[future]
+                try:
+                    basis_sets[name] = future.result()
+                    successful += 1
+                except Exception as e:
+                    failed += 1
+                    if name in previous_entries:
+                        basis_sets[name] = previous_entries[name]
+                        kept += 1
+                        print(f"❌ Failed to process {name}: {e} (keeping previous entry)")
+                    else:
+                        print(f"❌ Failed to process {name}: {e}")
+
+                if idx % 25 == 0 or idx == len(pending):
+                    print(f"⏳ Progress: {idx}/{len(pending)} ({idx*100//len(pending)}%)")
+
     cache_data = {
+        'cache_format': CACHE_FORMAT_VERSION,
+        'bse_version': bse.version(),
         'download_date': datetime.now().isoformat(),
-        'total_basis_sets': len(all_names),
+        'total_basis_sets': len(basis_sets),
         'families': families,
-        'basis_sets': {}
+        'basis_sets': dict(sorted(basis_sets.items(), key=lambda kv: kv[0].lower())),
     }
-    
-    successful = 0
-    failed = 0
-    
-    for idx, name in enumerate(all_names, 1):
-        try:
-            # Progress indicator
-            if idx % 10 == 0:
-                print(f"⏳ Progress: {idx}/{len(all_names)} ({idx*100//len(all_names)}%)")
-            
-            # Get basis data for hydrogen (lightest element) to extract metadata
-            basis_data = bse.get_basis(name, elements='1')
-            
-            # Get available elements (try common ones)
-            available_elements = []
-            test_elements = [1, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 
-                           19, 20, 26, 29, 30, 35, 36, 47, 53, 54, 79, 80, 82, 86]
-            
-            for z in test_elements:
-                try:
-                    bse.get_basis(name, elements=str(z))
-                    available_elements.append(z)
-                except:
-                    pass
-            
-            # Store metadata
-            cache_data['basis_sets'][name] = {
-                'name': basis_data.get('name', name),
-                'display_name': basis_data.get('names', [name])[0] if basis_data.get('names') else name,
-                'family': basis_data.get('family', 'Other'),
-                'description': basis_data.get('description', 'No description available'),
-                'role': basis_data.get('role', 'orbital'),
-                'available_elements': available_elements,
-                'tags': basis_data.get('tags', [])
-            }
-            
-            successful += 1
-            
-        except Exception as e:
-            print(f"❌ Failed to process {name}: {e}")
-            failed += 1
-            continue
-    
-    # Save cache
+
     print(f"\n💾 Saving cache to {METADATA_FILE}...")
-    with open(METADATA_FILE, 'w') as f:
-        json.dump(cache_data, f, indent=2)
-    
+    write_cache_atomic(cache_data)
+
     print(f"\n✅ Cache download complete!")
-    print(f"   ✓ Successful: {successful}")
-    print(f"   ✗ Failed: {failed}")
+    print(f"   ♻️  Reused: {reused}")
+    print(f"   ✓ Rebuilt: {successful}")
+    print(f"   ✗ Failed: {failed} (previous entry kept for {kept})")
     print(f"   📦 Cache size: {METADATA_FILE.stat().st_size / 1024 / 1024:.2f} MB")
+
+    # Columnar per (basis, element) statistics; unchanged content hashes are reused
+    print("\n📐 Building basis analytics table...")
+    from modules.basis_table import BASIS_TABLE_FILE, build_basis_table
+    table = build_basis_table(workers=workers, force=force)
+    if table is not None:
+        print(f"   ✓ {len(table)} basis/element rows → {BASIS_TABLE_FILE.name}")
+
     print(f"\n🎉 You can now run the app with fast local access!")
 
+
 def check_cache_age():
     """Check if cache needs updating (older than 30 days)"""
     if not METADATA_FILE.exists():
         return None
-    
+
     with open(METADATA_FILE, 'r') as f:
         data = json.load(f)
-    
+
     download_date = datetime.fromisoformat(data['download_date'])
     age_days = (datetime.now() - download_date).days
-    
+
     return age_days
 
+
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build the local basis set metadata cache")
+    parser.add_argument("--force", action="store_true", help="Rebuild every entry from scratch")
+    parser.add_argument("--yes", "-y", action="store_true", help="Do not prompt; refresh changed entries")
+    parser.add_argument("--workers", type=int, default=None, help="Worker processes (default: CPU count)")
+    args = parser.parse_args()
+
     # Check if cache exists
-    if METADATA_FILE.exists():
+    if METADATA_FILE.exists() and not (args.yes or args.force):
         age = check_cache_age()
         print(f"📦 Existing cache found (age: {age} days)")
-        
+
         if age < 30:
-            response = input("Cache is recent. Re-download anyway? (y/N): ")
+            response = input("Cache is recent. Refresh anyway? (y/N): ")
             if response.lower() != 'y':
                 print("✅ Using existing cache")
                 sys.exit(0)
-    
-    download_all_basis_sets()
+
+    download_all_basis_sets(force=args.force, workers=args.workers)
@@ -0,0 +1,262 @@
+#!/usr/bin/env python3
+"""
+Prefetch whole PseudoDojo tables into the local pseudopotential cache
+
+Downloads every element x accuracy x functional UPF concurrently over one
+pooled HTTP session, verifies each file, and stores both the raw UPF and its
+parsed .npz arrays in data/pseudo_cache so the Pseudopotentials page never
+waits on the network.
+
+Verification:
+    - If the source provides a SHA256SUMS file (``<sha256>  <relpath>`` per
+      line, as written by --export-mirror), every download must match it.
+    - Every file must parse as UPF with a header for the expected element.
+    - The SHA-256 of each cached file is recorded in manifest.json and
+      re-checked on later runs, so truncated or corrupted files are refetched.
+
+Set PSEUDODOJO_MIRROR_URL (or pass --mirror) to an http(s):// or file://
+URL laid out like the upstream tree for air-gapped deployments and tests.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import tempfile
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from modules.pseudopotentials import (
+    CACHE_DIR,
+    HTTP_POOL_SIZE,
+    cache_pseudo_file,
+    fetch_url_bytes,
+    get_available_pseudos,
+    get_cache_path,
+    get_parsed_cache_path,
+    get_pseudo_base_url,
+    get_pseudo_relpath,
+    parse_upf_stream,
+    save_parsed_pseudo,
+)
+
+MANIFEST_FILE = CACHE_DIR / "manifest.json"
+CHECKSUM_FILENAME = "SHA256SUMS"
+FUNCTIONALS = ['PBE', 'LDA', 'PW']
+ACCURACIES = ['standard', 'stringent']
+
+
+def sha256_bytes(data: bytes) -> str:
+    """SHA-256 hex digest of a byte string"""
+    return hashlib.sha256(data).hexdigest()
+
+
+def load_manifest() -> dict:
+    """Load the local cache manifest ({cache filename: entry})"""
+    if not MANIFEST_FILE.exists():
+        return {}
+    try:
+        with open(MANIFEST_FILE, 'r') as f:
+            return json.load(f).get('files', {})
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def save_manifest(files: dict, base_url: str) -> None:
+    """Write the local cache manifest atomically"""
+    data = {
+        'updated': datetime.now().isoformat(),
+        'base_url': base_url,
+        'files': dict(sorted(files.items())),
+    }
+    fd, tmp_name = tempfile.mkstemp(dir=MANIFEST_FILE.parent, suffix=".tmp")
+    with os.fdopen(fd, 'w') as f:
+        json.dump(data, f, indent=2)
+    os.replace(tmp_name, MANIFEST_FILE)
+
+
+def fetch_remote_checksums(base_url: str) -> Dict[str, str]:
+    """
+    Fetch the SHA256SUMS file published alongside a mirror.
+
+    Returns:
+        {relpath: sha256}, empty if the source publishes no checksums
+    """
+    raw = fetch_url_bytes(f"{base_url}/{CHECKSUM_FILENAME}", timeout=30)
+    if raw is None:
+        return {}
+
+    checksums = {}
+    for line in raw.decode('utf-8', errors='replace').splitlines():
+        parts = line.split()
+        if len(parts) == 2:
+            checksums[parts[1].lstrip('*')] = parts[0].lower()
+    return checksums
+
+
+def is_cached_and_valid(element: str, accuracy: str, functional: str, manifest: dict) -> bool:
+    """Check that a cached UPF exists and still matches its recorded hash"""
+    path = get_cache_path(element, accuracy, functional)
+    entry = manifest.get(path.name)
+    if entry is None or not path.exists():
+        return False
+    return sha256_bytes(path.read_bytes()) == entry.get('sha256')
+
+
+def prefetch_one(element: str, accuracy: str, functional: str, base_url: str,
+                 checksums: Dict[str, str]) -> dict:
+    """
+    Download, verify and cache a single pseudopotential.
+
+    Returns:
+        Manifest entry dictionary with 'status' of 'ok', 'missing' or 'invalid'
+    """
+    relpath = get_pseudo_relpath(element, accuracy, functional)
+    result = {'element': element, 'accuracy': accuracy, 'functional': functional, 'relpath': relpath}
+
+    raw = fetch_url_bytes(f"{base_url}/{relpath}", timeout=60)
+    if raw is None:
+        return {**result, 'status': 'missing'}
+
+    digest = sha256_bytes(raw)
+    expected = checksums.get(relpath)
+    if expected is not None and expected != digest:
+        return {**result, 'status': 'invalid', 'reason': 'checksum mismatch'}
+
+    parsed = parse_upf_stream(raw)
+    if parsed is None:
+        return {**result, 'status': 'invalid', 'reason': 'not a parsable UPF file'}
+    if parsed['header'].get('element', element) != element:
+        return {**result, 'status': 'invalid', 'reason': f"header element {parsed['header'].get('element')!r}"}
+
+    try:
+        text = raw.decode('utf-8')
+    except UnicodeDecodeError as e:
+        return {**result, 'status': 'invalid', 'reason': f"not UTF-8 text ({e.reason} at byte {e.start})"}
+
+    if not cache_pseudo_file(element, accuracy, functional, text):
+        return {**result, 'status': 'invalid', 'reason': 'could not write cache file'}
+    save_parsed_pseudo(get_parsed_cache_path(element, accuracy, functional), parsed)
+
+    return {**result, 'status': 'ok', 'sha256': digest, 'verified': expected is not None}
+
+
+def prefetch_pseudo_tables(functionals: Optional[List[str]] = None,
+                           accuracies: Optional[List[str]] = None,
+                           elements: Optional[List[str]] = None,
+                           base_url: Optional[str] = None,
+                           workers: int = HTTP_POOL_SIZE,
+                           force: bool = False) -> dict:
+    """
+    Prefetch complete PseudoDojo tables into the local cache.
+
+    Args:
+        functionals: Functionals to fetch (default: PBE, LDA, PW)
+        accuracies: Accuracies to fetch (default: standard, stringent)
+        elements: Element symbols (default: all available)
+        base_url: Source URL (default: mirror from environment or upstream)
+        workers: Concurrent downloads (matches the HTTP pool size by default)
+        force: Re-download files already present and valid
+
+    Returns:
+        Summary dictionary with counts per status
+    """
+    base_url = (base_url or get_pseudo_base_url()).rstrip('/')
+    functionals = functionals or FUNCTIONALS
+    accuracies = accuracies or ACCURACIES
+    elements = elements or list(get_available_pseudos().keys())
+
+    print("🚀 Starting pseudopotential prefetch...")
+    print(f"🌐 Source: {base_url}")
+    print(f"📁 Cache directory: {CACHE_DIR}")
+
+    manifest = load_manifest()
+    checksums = fetch_remote_checksums(base_url)
+    print(f"🔐 Published checksums: {len(checksums) if checksums else 'none (structural verification only)'}")
+
+    jobs = [(el, acc, fn) for fn in functionals for acc in accuracies for el in elements]
+    if not force:
+        jobs = [job for job in jobs if not is_cached_and_valid(*job, manifest)]
+    print(f"📊 To download: {len(jobs)}")
+
+    counts = {'ok': 0, 'missing': 0, 'invalid': 0, 'cached': 0}
+    counts['cached'] = len(functionals) * len(accuracies) * len(elements) - len(jobs)
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(prefetch_one, *job, base_url, checksums) for job in jobs]
+        for idx, future in enumerate(as_completed(futures), 1):
+            entry = future.result()
+            counts[entry['status']] += 1
+            if entry['status'] == 'ok':
+                manifest[get_cache_path(entry['element'], entry['accuracy'], entry['functional']).name] = {
+                    key: entry[key] for key in ('relpath', 'sha256', 'verified')
+                }
+            elif entry['status'] == 'invalid':
+                print(f"❌ {entry['relpath']}: {entry['reason']}")
+
+            if idx % 50 == 0 or idx == len(jobs):
+                print(f"⏳ Progress: {idx}/{len(jobs)} ({idx*100//len(jobs)}%)")
+
+    save_manifest(manifest, base_url)
+
+    print("\n✅ Prefetch complete!")
+    print(f"   ✓ Downloaded: {counts['ok']}")
+    print(f"   ♻️  Already cached: {counts['cached']}")
+    print(f"   ∅ Not available upstream: {counts['missing']}")
+    print(f"   ✗ Failed verification: {counts['invalid']}")
+    return counts
+
+
+def export_mirror(target_dir: Path) -> int:
+    """
+    Lay out the local cache as a mirror tree with a SHA256SUMS file.
+
+    Serve the directory over HTTP (or point PSEUDODOJO_MIRROR_URL at it with
+    file://) to run without access to the upstream site.
+
+    Returns:
+        Number of exported files
+    """
+    manifest = load_manifest()
+    lines = []
+    for filename, entry in sorted(manifest.items()):
+        source = CACHE_DIR / filename
+        if not source.exists():
+            continue
+        destination = target_dir / entry['relpath']
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(source, destination)
+        lines.append(f"{entry['sha256']}  {entry['relpath']}")
+
+    target_dir.mkdir(parents=True, exist_ok=True)
+    (target_dir / CHECKSUM_FILENAME).write_text("\n".join(lines) + "\n")
+    print(f"📦 Exported {len(lines)} pseudopotentials to {target_dir}")
+    return len(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Prefetch PseudoDojo pseudopotentials into the local cache")
+    parser.add_argument("--mirror", default=None, help="Base URL of a mirror (http(s):// or file://)")
+    parser.add_argument("--functionals", nargs="+", choices=FUNCTIONALS, default=None)
+    parser.add_argument("--accuracies", nargs="+", choices=ACCURACIES, default=None)
+    parser.add_argument("--elements", nargs="+", default=None, help="Element symbols (default: all)")
+    parser.add_argument("--workers", type=int, default=HTTP_POOL_SIZE, help="Concurrent downloads")
+    parser.add_argument("--force", action="store_true", help="Re-download files already cached")
+    parser.add_argument("--export-mirror", type=Path, default=None, metavar="DIR",
+                        help="Write the cache as a mirror tree with SHA256SUMS and exit")
+    args = parser.parse_args()
+
+    if args.export_mirror is not None:
+        export_mirror(args.export_mirror)
+    else:
+        prefetch_pseudo_tables(
+            functionals=args.functionals,
+            accuracies=args.accuracies,
+            elements=args.elements,
+            base_url=args.mirror,
+            workers=args.workers,
+            force=args.force,
+        )
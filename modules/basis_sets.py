@@ -13,6 +13,7 @@ from typing import Dict, List, Tuple, Optional, Union
 
 from utils.validators import validate_element, validate_basis_set
 from utils.constants import ELEMENTS, ANGULAR_MOMENTUM
+from modules.basis_table import get_basis_stats_for_data
 
 
 # Cache directory
@@ -264,20 +265,13 @@ def analyze_basis_set(basis_data: dict, basis_name: str) -> dict:
             'has_diffuse': False
         }
     
-    elem_data = list(basis_data['elements'].values())[0]
-    shells = elem_data['electron_shells']
-    
-    # Count shells
-    shell_counts = count_shells_by_type(basis_data)
-    
-    # Determine zeta level
-    zeta = determine_zeta_level(basis_name, shell_counts)
-    
-    # Check for polarization functions
-    has_polarization = shell_counts.get('d', 0) > 0 or shell_counts.get('f', 0) > 0
+    # Precomputed statistics (see modules.basis_table)
+    stats = get_basis_stats_for_data(basis_data, basis_name)
     
-    # Check for diffuse functions (aug- prefix or diffuse in name)
-    has_diffuse = 'aug' in basis_name.lower() or 'diffuse' in basis_name.lower()
+    shell_counts = {key: stats['shell_counts'][key] for key in ('s', 'p', 'd', 'f', 'g')}
+    zeta = stats['zeta']
+    has_polarization = stats['has_polarization']
+    has_diffuse = stats['has_diffuse']
     
     # Generate explanation
     explanation = f"This is a **{zeta}** basis set"
@@ -313,7 +307,10 @@ def analyze_basis_set(basis_data: dict, basis_name: str) -> dict:
         'shell_counts': shell_counts,
         'has_polarization': has_polarization,
         'has_diffuse': has_diffuse,
-        'total_shells': len(shells)
+        'total_shells': stats['n_shells'],
+        'n_primitives': stats['n_primitives'],
+        'n_contracted': stats['n_contracted'],
+        'exponent_range': (stats['exp_min'], stats['exp_max'])
     }
 
 
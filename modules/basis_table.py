@@ -0,0 +1,381 @@
+"""
+Columnar basis set analytics table for DFT Flight Simulator.
+
+Precomputes per (basis set, element) statistics once - shells per angular
+momentum, primitive/contracted counts, exponent ranges, zeta level and
+diffuse/polarization flags - into a NumPy structured array stored at
+basis_cache/basis_table.npz. Sorting, filtering and side-by-side
+comparisons then become vectorized queries instead of walks over raw BSE
+dictionaries on every rerun.
+
+Build or refresh it with ``python3 download_basis_cache.py``.
+All query functions return None (or an empty table) on failure.
+"""
+
+import numpy as np
+import basis_set_exchange as bse
+import json
+import os
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Union
+
+from utils.constants import ANGULAR_MOMENTUM
+
+
+BASIS_CACHE_DIR = Path(__file__).resolve().parent.parent / "basis_cache"
+BASIS_TABLE_FILE = BASIS_CACHE_DIR / "basis_table.npz"
+BASIS_METADATA_FILE = BASIS_CACHE_DIR / "metadata.json"
+
+# Highest angular momentum tracked per shell-count column (s..i)
+MAX_L = 6
+SHELL_COLUMNS = [f"n_{ANGULAR_MOMENTUM.get(l, 'i')}" for l in range(MAX_L + 1)]
+
+BASIS_TABLE_DTYPE = np.dtype(
+    [
+        ('basis', 'U64'),
+        ('element', 'i2'),
+        ('family', 'U32'),
+        ('role', 'U16'),
+    ]
+    + [(column, 'i2') for column in SHELL_COLUMNS]
+    + [
+        ('n_shells', 'i2'),
+        ('n_primitives', 'i4'),
+        ('n_contracted', 'i4'),
+        ('exp_min', 'f8'),
+        ('exp_max', 'f8'),
+        ('zeta', 'U48'),
+        ('has_polarization', '?'),
+        ('has_diffuse', '?'),
+        ('has_ecp', '?'),
+    ]
+)
+
+_TABLE = None
+
+
+# ==================== BUILD ====================
+
+def _element_row(basis_name: str, z: int, elem_data: dict, family: str = '', role: str = '') -> tuple:
+    """
+    Compute one table row from a BSE element entry.
+
+    Statistics follow modules.basis_sets.analyze_basis_set: a shell counts
+    towards its first angular momentum, contractions are coefficient sets,
+    and diffuse means an 'aug'/'diffuse' basis name.
+    """
+    from modules.basis_sets import determine_zeta_level
+
+    shells = elem_data.get('electron_shells', [])
+
+    counts = [0] * (MAX_L + 1)
+    exponents = []
+    n_contracted = 0
+    for shell in shells:
+        counts[min(shell['angular_momentum'][0], MAX_L)] += 1
+        exponents.extend(float(e) for e in shell['exponents'])
+        n_contracted += len(shell['coefficients'])
+
+    name_lower = basis_name.lower()
+    shell_counts = {ANGULAR_MOMENTUM[l]: counts[l] for l in range(4)}
+
+    return (
+        basis_name,
+        z,
+        family,
+        role,
+        *counts,
+        len(shells),
+        len(exponents),
+        n_contracted,
+        min(exponents) if exponents else np.nan,
+        max(exponents) if exponents else np.nan,
+        determine_zeta_level(basis_name, shell_counts),
+        any(counts[2:]),
+        'aug' in name_lower or 'diffuse' in name_lower,
+        bool(elem_data.get('ecp_potentials')),
+    )
+
+
+def compute_basis_rows(basis_name: str, family: str = '', role: str = '') -> List[tuple]:
+    """
+    Compute table rows for every element of one basis set.
+
+    Args:
+        basis_name: Basis set name
+        family: Basis family (stored as-is)
+        role: Basis role (stored as-is)
+
+    Returns:
+        List of row tuples matching BASIS_TABLE_DTYPE
+    """
+    basis_data = bse.get_basis(basis_name)
+    return [
+        _element_row(basis_name, int(z_str), elem_data, family, role)
+        for z_str, elem_data in basis_data.get('elements', {}).items()
+    ]
+
+
+def _compute_rows_safe(args: tuple) -> List[tuple]:
+    """Worker wrapper: a failing basis yields no rows instead of aborting the build."""
+    try:
+        return compute_basis_rows(*args)
+    except Exception:
+        return []
+
+
+def build_basis_table(workers: Optional[int] = None, force: bool = False) -> Optional[np.ndarray]:
+    """
+    Build (or incrementally refresh) the analytics table for all basis sets.
+
+    Basis sets whose content hash in basis_cache/metadata.json matches the
+    hash recorded in the existing table are copied over; the rest are
+    recomputed in a process pool.
+
+    Args:
+        workers: Worker processes (default: CPU count)
+        force: Recompute every basis set
+
+    Returns:
+        The structured array that was written, or None if no metadata cache exists
+    """
+    if not BASIS_METADATA_FILE.exists():
+        return None
+
+    with open(BASIS_METADATA_FILE, 'r') as f:
+        metadata = json.load(f).get('basis_sets', {})
+
+    hashes = {name: meta.get('content_hash', '') for name, meta in metadata.items()}
+
+    previous_rows = {}
+    previous_hashes = {}
+    if not force and BASIS_TABLE_FILE.exists():
+        old_table, previous_hashes = _read_table_file(BASIS_TABLE_FILE)
+        if old_table is not None:
+            order = np.argsort(old_table['basis'], kind='stable')
+            names, starts = np.unique(old_table['basis'][order], return_index=True)
+            for name, rows in zip(names, np.split(old_table[order], starts[1:])):
+                previous_rows[str(name)] = rows
+
+    chunks = []
+    pending = []
+    for name, meta in metadata.items():
+        content_hash = hashes[name]
+        if content_hash and previous_hashes.get(name) == content_hash and name in previous_rows:
+            chunks.append(previous_rows[name])
+        else:
+            pending.append((name, meta.get('family', ''), meta.get('role', '')))
+
+    if pending:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            for rows in pool.map(_compute_rows_safe, pending, chunksize=8):
+                if rows:
+                    chunks.append(np.array(rows, dtype=BASIS_TABLE_DTYPE))
+
+    table = np.concatenate(chunks) if chunks else np.zeros(0, dtype=BASIS_TABLE_DTYPE)
+    table = table[np.lexsort((table['element'], np.char.lower(table['basis'])))]
+
+    _write_table_file(BASIS_TABLE_FILE, table, hashes)
+    global _TABLE
+    _TABLE = table
+    return table
+
+
+def _write_table_file(path: Path, table: np.ndarray, hashes: Dict[str, str]) -> None:
+    """Write table and per-basis content hashes atomically."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix=".tmp")
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez_compressed(
+                f,
+                table=table,
+                hash_names=np.array(list(hashes.keys()), dtype=str),
+                hash_values=np.array(list(hashes.values()), dtype=str),
+                bse_version=np.array(bse.version()),
+            )
+        os.replace(tmp_name, path)
+    except BaseException:
+        if os.path.exists(tmp_name):
+            os.unlink(tmp_name)
+        raise
+
+
+def _read_table_file(path: Path):
+    """Read (table, {basis: content_hash}) from disk, or (None, {})."""
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            table = data['table']
+            hashes = dict(zip(data['hash_names'].tolist(), data['hash_values'].tolist()))
+    except (OSError, ValueError, KeyError):
+        return None, {}
+
+    if table.dtype != BASIS_TABLE_DTYPE:
+        return None, {}
+    return table, hashes
+
+
+# ==================== QUERIES ====================
+
+def load_basis_table(reload: bool = False) -> Optional[np.ndarray]:
+    """
+    Load the analytics table (memoized per process).
+
+    Args:
+        reload: Re-read the file even if already loaded
+
+    Returns:
+        Structured array with BASIS_TABLE_DTYPE, or None if not built
+    """
+    global _TABLE
+    if _TABLE is None or reload:
+        if not BASIS_TABLE_FILE.exists():
+            return None
+        _TABLE = _read_table_file(BASIS_TABLE_FILE)[0]
+    return _TABLE
+
+
+def query_basis_table(
+    element: Optional[int] = None,
+    basis: Optional[Union[str, Sequence[str]]] = None,
+    family: Optional[str] = None,
+    role: Optional[str] = None,
+    min_s_shells: Optional[int] = None,
+    polarization: Optional[bool] = None,
+    diffuse: Optional[bool] = None,
+    max_primitives: Optional[int] = None,
+    sort_by: Optional[Union[str, Sequence[str]]] = None,
+    descending: bool = False
+) -> Optional[np.ndarray]:
+    """
+    Filter and sort the analytics table with vectorized masks.
+
+    Args:
+        element: Atomic number
+        basis: Basis set name or list of names (case-insensitive)
+        family: Basis family
+        role: Basis role (e.g. 'orbital')
+        min_s_shells: Minimum number of s shells
+        polarization: Require (True) or exclude (False) polarization functions
+        diffuse: Require (True) or exclude (False) diffuse functions
+        max_primitives: Maximum number of primitives
+        sort_by: Column name(s) to sort by (first name is the primary key)
+        descending: Reverse the sort order
+
+    Returns:
+        Matching rows, or None if the table has not been built
+    """
+    table = load_basis_table()
+    if table is None:
+        return None
+
+    mask = np.ones(len(table), dtype=bool)
+    if element is not None:
+        mask &= table['element'] == element
+    if basis is not None:
+        names = [basis] if isinstance(basis, str) else list(basis)
+        mask &= np.isin(np.char.lower(table['basis']), [name.lower() for name in names])
+    if family is not None:
+        mask &= table['family'] == family
+    if role is not None:
+        mask &= table['role'] == role
+    if min_s_shells is not None:
+        mask &= table['n_s'] >= min_s_shells
+    if polarization is not None:
+        mask &= table['has_polarization'] == polarization
+    if diffuse is not None:
+        mask &= table['has_diffuse'] == diffuse
+    if max_primitives is not None:
+        mask &= table['n_primitives'] <= max_primitives
+
+    rows = table[mask]
+    if sort_by:
+        keys = [sort_by] if isinstance(sort_by, str) else list(sort_by)
+        rows = rows[np.lexsort([rows[key] for key in reversed(keys)])]
+        if descending:
+            rows = rows[::-1]
+    return rows
+
+
+def get_basis_stats(basis_name: str, element: int) -> Optional[dict]:
+    """
+    Get precomputed statistics for one basis set and element.
+
+    Args:
+        basis_name: Basis set name
+        element: Atomic number
+
+    Returns:
+        Dictionary of column values (with 'shell_counts'), or None if not in the table
+    """
+    rows = query_basis_table(element=element, basis=basis_name)
+    if rows is None or len(rows) == 0:
+        return None
+
+    row = rows[0]
+    stats = {name: row[name].item() for name in BASIS_TABLE_DTYPE.names}
+    stats['shell_counts'] = {ANGULAR_MOMENTUM[l]: stats[SHELL_COLUMNS[l]] for l in range(5)}
+    return stats
+
+
+def get_basis_stats_for_data(basis_data: dict, basis_name: str) -> Optional[dict]:
+    """
+    Statistics for already-fetched single-element basis data.
+
+    Served from the precomputed table when available; otherwise the same
+    row is computed from basis_data, so callers have a single code path.
+
+    Args:
+        basis_data: BSE basis data for one element
+        basis_name: Basis set name
+
+    Returns:
+        Statistics dictionary (see get_basis_stats), or None
+    """
+    if basis_data is None or not basis_data.get('elements'):
+        return None
+
+    z_str, elem_data = next(iter(basis_data['elements'].items()))
+    stats = get_basis_stats(basis_name, int(z_str))
+    if stats is not None:
+        return stats
+
+    row = np.array([_element_row(basis_name, int(z_str), elem_data)], dtype=BASIS_TABLE_DTYPE)[0]
+    stats = {name: row[name].item() for name in BASIS_TABLE_DTYPE.names}
+    stats['shell_counts'] = {ANGULAR_MOMENTUM[l]: stats[SHELL_COLUMNS[l]] for l in range(5)}
+    return stats
+
+
+def compare_basis_sets(basis_names: Sequence[str], element: int) -> Optional[np.ndarray]:
+    """
+    Side-by-side rows for several basis sets on one element.
+
+    Args:
+        basis_names: Basis set names, in display order
+        element: Atomic number
+
+    Returns:
+        Rows in the order of basis_names (missing ones omitted), or None
+    """
+    rows = query_basis_table(element=element, basis=basis_names)
+    if rows is None:
+        return None
+
+    order = {name.lower(): idx for idx, name in enumerate(basis_names)}
+    ranks = np.array([order[str(name).lower()] for name in rows['basis']], dtype=int)
+    return rows[np.argsort(ranks, kind='stable')]
+
+
+# ==================== EXPORT ====================
+
+__all__ = [
+    'BASIS_TABLE_DTYPE',
+    'build_basis_table',
+    'load_basis_table',
+    'query_basis_table',
+    'get_basis_stats',
+    'get_basis_stats_for_data',
+    'compare_basis_sets',
+]
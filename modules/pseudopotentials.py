@@ -9,8 +9,11 @@ import numpy as np
 import requests
 import xml.etree.ElementTree as ET
 from pathlib import Path
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Tuple, Optional, Union
+import io
 import json
+import os
+import tempfile
 
 from utils.validators import (
     validate_element,
@@ -24,10 +27,74 @@ from utils.constants import ELEMENTS, ATOMIC_NUMBERS
 # PseudoDojo GitHub raw URL base
 PSEUDODOJO_BASE_URL = "https://raw.githubusercontent.com/pseudo-dojo/pseudo-dojo/master/pseudo_dojo/pseudos"
 
+# Optional mirror (http(s):// or file://) with the same layout as PSEUDODOJO_BASE_URL
+PSEUDODOJO_MIRROR_ENV = "PSEUDODOJO_MIRROR_URL"
+
 # Cache directory
 CACHE_DIR = Path("data/pseudo_cache")
 CACHE_DIR.mkdir(parents=True, exist_ok=True)
 
+# Shared HTTP session (connection pooling across downloads)
+_HTTP_SESSION = None
+HTTP_POOL_SIZE = 16
+
+
+def get_pseudo_base_url() -> str:
+    """
+    Get base URL for pseudopotential downloads.
+    
+    Returns:
+        Mirror URL from the PSEUDODOJO_MIRROR_URL environment variable,
+        or the upstream PseudoDojo URL
+    """
+    return os.environ.get(PSEUDODOJO_MIRROR_ENV, PSEUDODOJO_BASE_URL).rstrip('/')
+
+
+def get_http_session() -> requests.Session:
+    """
+    Get the shared, connection-pooled HTTP session.
+    
+    Returns:
+        requests.Session with a pooled adapter and retries on transient errors
+    """
+    global _HTTP_SESSION
+    if _HTTP_SESSION is None:
+        from requests.adapters import HTTPAdapter
+        from urllib3.util.retry import Retry
+        
+        retry = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=HTTP_POOL_SIZE, pool_maxsize=HTTP_POOL_SIZE, max_retries=retry)
+        session = requests.Session()
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _HTTP_SESSION = session
+    return _HTTP_SESSION
+
+
+def fetch_url_bytes(url: str, timeout: float = 30) -> Optional[bytes]:
+    """
+    Download raw bytes from an http(s):// or file:// URL.
+    
+    Args:
+        url: Source URL
+        timeout: Request timeout in seconds
+        
+    Returns:
+        Response body, or None if not found / failed
+    """
+    if url.startswith('file://'):
+        path = Path(url[len('file://'):])
+        return path.read_bytes() if path.is_file() else None
+    
+    try:
+        response = get_http_session().get(url, timeout=timeout)
+    except requests.RequestException:
+        return None
+    
+    if not validate_url_response(response.status_code):
+        return None
+    return response.content
+
 
 def get_available_pseudos() -> dict:
     """
@@ -63,9 +130,9 @@ def get_available_pseudos() -> dict:
     return available
 
 
-def construct_pseudo_url(element: str, accuracy: str, functional: str) -> Optional[str]:
+def get_pseudo_relpath(element: str, accuracy: str, functional: str) -> Optional[str]:
     """
-    Construct URL for pseudopotential file from PseudoDojo.
+    Get path of a pseudopotential file relative to the PseudoDojo base URL.
     
     Args:
         element: Element symbol (e.g., 'C', 'Si')
@@ -73,11 +140,7 @@ def construct_pseudo_url(element: str, accuracy: str, functional: str) -> Option
         functional: 'PBE', 'LDA', or 'PW'
         
     Returns:
-        URL string or None if invalid inputs
-        
-    Example URL format:
-        https://raw.githubusercontent.com/pseudo-dojo/pseudo-dojo/master/
-        pseudo_dojo/pseudos/ONCVPSP-PBE-PDv0.4/standard/C.upf
+        Relative path (e.g. 'ONCVPSP-PBE-PDv0.4/standard/C.upf') or None if invalid inputs
     """
     # Validate inputs
     z = validate_element(element)
@@ -95,12 +158,34 @@ def construct_pseudo_url(element: str, accuracy: str, functional: str) -> Option
     if functional not in ['PBE', 'LDA', 'PW']:
         return None
     
-    # Construct URL
     # Format: ONCVPSP-{FUNCTIONAL}-PDv0.4/{accuracy}/{element}.upf
     pseudo_set = f"ONCVPSP-{functional}-PDv0.4"
-    url = f"{PSEUDODOJO_BASE_URL}/{pseudo_set}/{acc}/{symbol}.upf"
+    return f"{pseudo_set}/{acc}/{symbol}.upf"
+
+
+def construct_pseudo_url(element: str, accuracy: str, functional: str, base_url: Optional[str] = None) -> Optional[str]:
+    """
+    Construct URL for pseudopotential file from PseudoDojo.
     
-    return url
+    Args:
+        element: Element symbol (e.g., 'C', 'Si')
+        accuracy: 'standard' or 'stringent'
+        functional: 'PBE', 'LDA', or 'PW'
+        base_url: Override for the base URL (default: get_pseudo_base_url())
+        
+    Returns:
+        URL string or None if invalid inputs
+        
+    Example URL format:
+        https://raw.githubusercontent.com/pseudo-dojo/pseudo-dojo/master/
+        pseudo_dojo/pseudos/ONCVPSP-PBE-PDv0.4/standard/C.upf
+    """
+    relpath = get_pseudo_relpath(element, accuracy, functional)
+    if relpath is None:
+        return None
+    
+    base = base_url.rstrip('/') if base_url else get_pseudo_base_url()
+    return f"{base}/{relpath}"
 
 
 def check_pseudo_exists(element: str, accuracy: str, functional: str) -> bool:
@@ -115,11 +200,21 @@ def check_pseudo_exists(element: str, accuracy: str, functional: str) -> bool:
     Returns:
         True if exists, False otherwise
     """
+    # A cached (e.g. prefetched) file answers without touching the network
+    if get_cache_path(element, accuracy, functional).exists():
+        return True
+    
     url = construct_pseudo_url(element, accuracy, functional)
     if url is None:
         return False
     
-    response = requests.head(url, timeout=10)
+    if url.startswith('file://'):
+        return Path(url[len('file://'):]).is_file()
+    
+    try:
+        response = get_http_session().head(url, timeout=10)
+    except requests.RequestException:
+        return False
     return validate_url_response(response.status_code)
 
 
@@ -179,7 +274,15 @@ def cache_pseudo_file(element: str, accuracy: str, functional: str, content: str
     
     cache_path = get_cache_path(element, accuracy, functional)
     
-    cache_path.write_text(validated_content)
+    # Write-then-rename so concurrent readers never see a partial file
+    fd, tmp_name = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w') as f:
+            f.write(validated_content)
+        os.replace(tmp_name, cache_path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
     return cache_path.exists()
 
 
@@ -207,14 +310,12 @@ def fetch_pseudo_file(element: str, accuracy: str, functional: str, use_cache: b
     if url is None:
         return None
     
-    # Fetch from web
-    response = requests.get(url, timeout=30)
-    
-    if not validate_url_response(response.status_code):
+    # Fetch from web (or mirror)
+    raw = fetch_url_bytes(url, timeout=30)
+    if raw is None:
         return None
     
-    content = response.text
-    validated = validate_file_content(content)
+    validated = validate_file_content(raw.decode('utf-8', errors='replace'))
     
     if validated is None:
         return None
@@ -225,42 +326,131 @@ def fetch_pseudo_file(element: str, accuracy: str, functional: str, use_cache: b
     return validated
 
 
-def parse_upf_header(upf_content: str) -> Optional[dict]:
+# UPF sections read by the streaming parser
+_UPF_ARRAY_TAGS = {'PP_R': 'r', 'PP_RAB': 'rab', 'PP_LOCAL': 'v_local', 'PP_RHOATOM': 'rho_atom', 'PP_DIJ': 'dij'}
+
+
+def _upf_values(text: Optional[str]) -> np.ndarray:
+    """Convert whitespace-separated UPF numbers to a float array."""
+    if not text:
+        return np.zeros(0)
+    return np.fromstring(text, sep=' ')
+
+
+def _pad_to_mesh(values: np.ndarray, mesh_size: int) -> np.ndarray:
+    """Zero-pad a radial function that UPF stores truncated at its cutoff."""
+    if len(values) >= mesh_size:
+        return values[:mesh_size]
+    padded = np.zeros(mesh_size)
+    padded[:len(values)] = values
+    return padded
+
+
+def parse_upf_stream(source: Union[str, Path, bytes]) -> Optional[dict]:
     """
-    Parse header information from UPF file.
+    Parse a UPF v2 file in a single streaming pass.
+    
+    Header, mesh, local potential, nonlocal projectors (PP_BETA), atomic
+    charge density (PP_RHOATOM) and pseudo-wavefunctions (PP_PSWFC) are all
+    extracted during one ``iterparse`` walk; each element is released as soon
+    as its data has been copied out, so memory stays bounded.
     
     Args:
-        upf_content: UPF XML content
+        source: Path to a UPF file, or raw UPF content (str or bytes)
         
     Returns:
-        Dictionary with header info, or None if parsing failed
-    """
-    content = validate_file_content(upf_content)
-    if content is None:
-        return None
+        Dictionary of header info and NumPy arrays, or None if parsing failed
+    """
+    if isinstance(source, Path):
+        if not source.exists():
+            return None
+        stream = source.open('rb')
+    else:
+        if isinstance(source, str):
+            if validate_file_content(source) is None:
+                return None
+            source = source.encode('utf-8')
+        stream = io.BytesIO(source)
     
-    root = ET.fromstring(content)
-    if root is None:
+    header = {}
+    arrays = {}
+    beta = []
+    pswfc = []
+    
+    try:
+        with stream:
+            for _, elem in ET.iterparse(stream, events=('end',)):
+                tag = elem.tag
+                
+                if tag == 'PP_INFO':
+                    header['info'] = elem.text.strip() if elem.text else ''
+                elif tag == 'PP_HEADER':
+                    header['element'] = elem.get('element', '').strip()
+                    header['pseudo_type'] = elem.get('pseudo_type', '')
+                    header['functional'] = elem.get('functional', '').strip()
+                    header['z_valence'] = float(elem.get('z_valence', 0))
+                    header['l_max'] = int(elem.get('l_max', 0))
+                    header['mesh_size'] = int(elem.get('mesh_size', 0))
+                    header['number_of_proj'] = int(elem.get('number_of_proj', 0))
+                    header['number_of_wfc'] = int(elem.get('number_of_wfc', 0))
+                elif tag in _UPF_ARRAY_TAGS:
+                    arrays[_UPF_ARRAY_TAGS[tag]] = _upf_values(elem.text)
+                elif tag.startswith('PP_BETA.'):
+                    beta.append({
+                        'l': int(elem.get('angular_momentum', 0)),
+                        'cutoff_radius_index': int(elem.get('cutoff_radius_index', 0)),
+                        'values': _upf_values(elem.text),
+                    })
+                elif tag.startswith('PP_CHI.'):
+                    pswfc.append({
+                        'label': elem.get('label', '').strip(),
+                        'l': int(elem.get('l', 0)),
+                        'occupation': float(elem.get('occupation', 0.0)),
+                        'values': _upf_values(elem.text),
+                    })
+                else:
+                    continue
+                
+                elem.clear()
+    except ET.ParseError:
         return None
     
-    header = {}
+    if not header or len(arrays.get('r', ())) == 0 or len(arrays.get('v_local', ())) == 0:
+        return None
     
-    # Extract PP_INFO
-    pp_info = root.find('.//PP_INFO')
-    if pp_info is not None:
-        header['info'] = pp_info.text.strip() if pp_info.text else ''
+    mesh_size = len(arrays['r'])
+    n_beta = len(beta)
+    dij = arrays.get('dij', np.zeros(0))
     
-    # Extract PP_HEADER
-    pp_header = root.find('.//PP_HEADER')
-    if pp_header is not None:
-        header['element'] = pp_header.get('element', '')
-        header['pseudo_type'] = pp_header.get('pseudo_type', '')
-        header['functional'] = pp_header.get('functional', '')
-        header['z_valence'] = float(pp_header.get('z_valence', 0))
-        header['l_max'] = int(pp_header.get('l_max', 0))
-        header['mesh_size'] = int(pp_header.get('mesh_size', 0))
+    return {
+        'header': header,
+        'r': arrays['r'],
+        'rab': arrays.get('rab', np.zeros(0)),
+        'v_local': arrays['v_local'],
+        'rho_atom': arrays.get('rho_atom', np.zeros(0)),
+        'beta': np.array([_pad_to_mesh(b['values'], mesh_size) for b in beta]).reshape(n_beta, mesh_size),
+        'beta_l': np.array([b['l'] for b in beta], dtype=int),
+        'beta_cutoff_index': np.array([b['cutoff_radius_index'] for b in beta], dtype=int),
+        'dij': dij.reshape(n_beta, n_beta) if dij.size == n_beta * n_beta else dij,
+        'pswfc': np.array([_pad_to_mesh(c['values'], mesh_size) for c in pswfc]).reshape(len(pswfc), mesh_size),
+        'pswfc_label': np.array([c['label'] for c in pswfc], dtype=str),
+        'pswfc_l': np.array([c['l'] for c in pswfc], dtype=int),
+        'pswfc_occupation': np.array([c['occupation'] for c in pswfc], dtype=float),
+    }
+
+
+def parse_upf_header(upf_content: str) -> Optional[dict]:
+    """
+    Parse header information from UPF file.
     
-    return header if header else None
+    Args:
+        upf_content: UPF XML content
+        
+    Returns:
+        Dictionary with header info, or None if parsing failed
+    """
+    parsed = parse_upf_stream(upf_content)
+    return parsed['header'] if parsed is not None else None
 
 
 def parse_upf_mesh(upf_content: str) -> Optional[np.ndarray]:
@@ -273,26 +463,8 @@ def parse_upf_mesh(upf_content: str) -> Optional[np.ndarray]:
     Returns:
         Numpy array of radial grid points, or None if parsing failed
     """
-    content = validate_file_content(upf_content)
-    if content is None:
-        return None
-    
-    root = ET.fromstring(content)
-    if root is None:
-        return None
-    
-    # Find PP_R (radial mesh)
-    pp_r = root.find('.//PP_R')
-    if pp_r is None or pp_r.text is None:
-        return None
-    
-    # Parse values
-    r_values = np.fromstring(pp_r.text, sep=' ')
-    
-    if len(r_values) == 0:
-        return None
-    
-    return r_values
+    parsed = parse_upf_stream(upf_content)
+    return parsed['r'] if parsed is not None else None
 
 
 def parse_upf_local_potential(upf_content: str) -> Optional[np.ndarray]:
@@ -305,26 +477,8 @@ def parse_upf_local_potential(upf_content: str) -> Optional[np.ndarray]:
     Returns:
         Numpy array of V_local values, or None if parsing failed
     """
-    content = validate_file_content(upf_content)
-    if content is None:
-        return None
-    
-    root = ET.fromstring(content)
-    if root is None:
-        return None
-    
-    # Find PP_LOCAL
-    pp_local = root.find('.//PP_LOCAL')
-    if pp_local is None or pp_local.text is None:
-        return None
-    
-    # Parse values
-    v_local = np.fromstring(pp_local.text, sep=' ')
-    
-    if len(v_local) == 0:
-        return None
-    
-    return v_local
+    parsed = parse_upf_stream(upf_content)
+    return parsed['v_local'] if parsed is not None else None
 
 
 def parse_upf_file(upf_content: str) -> Optional[dict]:
@@ -337,23 +491,108 @@ def parse_upf_file(upf_content: str) -> Optional[dict]:
     Returns:
         Dictionary with all parsed data, or None if parsing failed
     """
-    header = parse_upf_header(upf_content)
-    if header is None:
+    return parse_upf_stream(upf_content)
+
+
+# ==================== PARSED-ARRAY CACHE ====================
+
+def get_parsed_cache_path(element: str, accuracy: str, functional: str) -> Path:
+    """
+    Get path of the parsed-array (.npz) cache next to the raw UPF file.
+    
+    Args:
+        element: Element symbol
+        accuracy: 'standard' or 'stringent'
+        functional: 'PBE', 'LDA', or 'PW'
+        
+    Returns:
+        Path object for the .npz cache file
+    """
+    return get_cache_path(element, accuracy, functional).with_suffix('.npz')
+
+
+def save_parsed_pseudo(path: Path, parsed: dict) -> bool:
+    """
+    Save parsed UPF arrays to an .npz file (atomic rename).
+    
+    Args:
+        path: Destination .npz path
+        parsed: Output of parse_upf_stream
+        
+    Returns:
+        True if saved successfully, False otherwise
+    """
+    arrays = {key: value for key, value in parsed.items() if key != 'header'}
+    arrays['header_json'] = np.array(json.dumps(parsed['header']))
+    
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    return path.exists()
+
+
+def load_parsed_pseudo(path: Path) -> Optional[dict]:
+    """
+    Load parsed UPF arrays from an .npz cache file.
+    
+    Args:
+        path: .npz cache path
+        
+    Returns:
+        Parsed dictionary (same layout as parse_upf_stream), or None
+    """
+    if not path.exists():
         return None
     
-    r = parse_upf_mesh(upf_content)
-    if r is None:
+    try:
+        with np.load(path, allow_pickle=False) as data:
+            parsed = {key: data[key] for key in data.files if key != 'header_json'}
+            parsed['header'] = json.loads(str(data['header_json']))
+    except (OSError, ValueError, KeyError):
         return None
     
-    v_local = parse_upf_local_potential(upf_content)
-    if v_local is None:
+    return parsed
+
+
+def get_parsed_pseudo(element: str, accuracy: str, functional: str) -> Optional[dict]:
+    """
+    Get parsed pseudopotential arrays, using the .npz cache when fresh.
+    
+    The raw UPF is fetched (or read from cache) and stream-parsed only when
+    no .npz exists or the UPF file is newer than it.
+    
+    Args:
+        element: Element symbol
+        accuracy: 'standard' or 'stringent'
+        functional: 'PBE', 'LDA', or 'PW'
+        
+    Returns:
+        Parsed dictionary, or None if failed
+    """
+    upf_path = get_cache_path(element, accuracy, functional)
+    npz_path = get_parsed_cache_path(element, accuracy, functional)
+    
+    if npz_path.exists() and (not upf_path.exists() or npz_path.stat().st_mtime >= upf_path.stat().st_mtime):
+        parsed = load_parsed_pseudo(npz_path)
+        if parsed is not None:
+            return parsed
+    
+    if not upf_path.exists():
+        # Downloads and writes the raw UPF into the cache directory
+        if fetch_pseudo_file(element, accuracy, functional) is None:
+            return None
+    
+    parsed = parse_upf_stream(upf_path)
+    if parsed is None:
         return None
     
-    return {
-        'header': header,
-        'r': r,
-        'v_local': v_local
-    }
+    save_parsed_pseudo(npz_path, parsed)
+    return parsed
 
 
 def calculate_coulomb_potential(r: np.ndarray, Z: int) -> np.ndarray:
@@ -422,13 +661,8 @@ def get_pseudo_data(element: str, accuracy: str, functional: str) -> Optional[di
     Returns:
         Dictionary with all data, or None if failed
     """
-    # Fetch UPF file
-    upf_content = fetch_pseudo_file(element, accuracy, functional)
-    if upf_content is None:
-        return None
-    
-    # Parse UPF file
-    parsed = parse_upf_file(upf_content)
+    # Fetch and parse UPF file (served from the .npz cache when available)
+    parsed = get_parsed_pseudo(element, accuracy, functional)
     if parsed is None:
         return None
     
@@ -454,7 +688,13 @@ def get_pseudo_data(element: str, accuracy: str, functional: str) -> Optional[di
         'functional': functional,
         'header': parsed['header'],
         'r': parsed['r'],
+        'rab': parsed['rab'],
         'v_local': parsed['v_local'],
+        'beta': parsed['beta'],
+        'beta_l': parsed['beta_l'],
+        'rho_atom': parsed['rho_atom'],
+        'pswfc': parsed['pswfc'],
+        'pswfc_label': parsed['pswfc_label'],
         'v_coulomb': v_coulomb,
         'v_diff': v_diff,
         'r_core': r_core
@@ -506,10 +746,14 @@ def compare_pseudos(element: str, acc1: str, acc2: str, functional: str) -> Opti
 
 __all__ = [
     'get_available_pseudos',
+    'get_pseudo_base_url',
+    'get_pseudo_relpath',
     'construct_pseudo_url',
     'check_pseudo_exists',
     'fetch_pseudo_file',
+    'parse_upf_stream',
     'parse_upf_file',
+    'get_parsed_pseudo',
     'calculate_coulomb_potential',
     'get_pseudo_data',
     'compare_pseudos',
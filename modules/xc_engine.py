@@ -0,0 +1,410 @@
+"""
+Batch XC-functional evaluation engine for DFT Flight Simulator.
+
+Evaluates exchange/correlation enhancement factors, energy densities and
+potentials for many functionals at once on (rs, s, α) grids through Libxc.
+Each functional is split into its Libxc components; every distinct component
+is evaluated once per grid in a single vectorized call and memoized in memory
+and on disk (data/xc_cache), so functionals sharing a component (e.g. PBE and
+RPBE sharing GGA_C_PBE) reuse it.
+
+Backends (first available wins):
+    - pyscf.dft.libxc
+    - pylibxc
+
+All functions return None on failure (no exceptions).
+"""
+
+import numpy as np
+import hashlib
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence
+
+
+# Disk cache for evaluated components
+XC_CACHE_DIR = Path("data/xc_cache")
+
+# LDA exchange prefactor: ε_x^LDA = -C_x ρ^(1/3)
+C_X = (3.0 / 4.0) * (3.0 / np.pi)**(1.0 / 3.0)
+
+# Densities below this are treated as vacuum
+RHO_FLOOR = 1e-12
+
+_MEMORY_CACHE: Dict[str, dict] = {}
+
+
+# ==================== BACKENDS ====================
+
+def get_xc_backend() -> Optional[str]:
+    """
+    Detect the available Libxc backend.
+
+    Returns:
+        'pyscf', 'pylibxc', or None if neither is installed
+    """
+    try:
+        from pyscf.dft import libxc  # noqa: F401
+        return 'pyscf'
+    except ImportError:
+        pass
+
+    try:
+        import pylibxc  # noqa: F401
+        return 'pylibxc'
+    except ImportError:
+        return None
+
+
+def _libxc_version(backend: str) -> str:
+    """Libxc version string of a backend (part of the cache key)."""
+    if backend == 'pyscf':
+        from pyscf.dft import libxc
+        version = libxc.libxc_version
+        return version() if callable(version) else str(version)
+
+    import pylibxc
+    return getattr(pylibxc, '__version__', 'unknown')
+
+
+def _component_family(code: str) -> str:
+    """Rung of a Libxc component name ('LDA', 'GGA' or 'MGGA')."""
+    name = code.upper()
+    if 'MGGA' in name:
+        return 'MGGA'
+    if 'GGA' in name:
+        return 'GGA'
+    return 'LDA'
+
+
+def _component_kind(code: str) -> str:
+    """Whether a Libxc component is exchange ('x'), correlation ('c') or combined ('xc')."""
+    name = code.upper()
+    if '_XC_' in name or name.endswith('_XC'):
+        return 'xc'
+    if '_X_' in name or name.endswith('_X'):
+        return 'x'
+    if '_C_' in name or name.endswith('_C'):
+        return 'c'
+    return 'xc'
+
+
+def _eval_pyscf(code: str, kind: str, grid: dict) -> dict:
+    """Evaluate one component with pyscf.dft.libxc."""
+    from pyscf.dft import libxc
+
+    # pyscf reads "X,C": put the component on the matching side of the comma
+    xc_code = {'x': f"{code},", 'c': f",{code}"}.get(kind, code)
+    family = libxc.xc_type(xc_code)
+
+    n = grid['rho'].size
+    rho = np.zeros((6, n))
+    rho[0] = grid['rho']
+    rho[1] = np.sqrt(grid['sigma'])   # gradient along x only
+    rho[5] = grid['tau']
+
+    if family == 'LDA':
+        rho_in = rho[0]
+    elif family == 'GGA':
+        rho_in = rho[:4]
+    else:
+        rho_in = rho
+
+    exc, vxc = libxc.eval_xc(xc_code, rho_in, spin=0, deriv=1)[:2]
+    vrho, vsigma, _, vtau = (list(vxc) + [None] * 4)[:4]
+
+    return {
+        'eps': np.asarray(exc, dtype=float),
+        'vrho': np.asarray(vrho, dtype=float),
+        'vsigma': np.zeros(n) if vsigma is None else np.asarray(vsigma, dtype=float),
+        'vtau': np.zeros(n) if vtau is None else np.asarray(vtau, dtype=float),
+        'exact_exchange': float(libxc.hybrid_coeff(xc_code)),
+    }
+
+
+def _eval_pylibxc(code: str, kind: str, grid: dict) -> dict:
+    """Evaluate one component with pylibxc."""
+    import pylibxc
+
+    func = pylibxc.LibXCFunctional(code, "unpolarized")
+    inp = {'rho': grid['rho'], 'sigma': grid['sigma'], 'tau': grid['tau'], 'lapl': grid['lapl']}
+    out = func.compute(inp, do_exc=True, do_vxc=True)
+
+    n = grid['rho'].size
+
+    def column(key):
+        value = out.get(key)
+        return np.zeros(n) if value is None else np.asarray(value, dtype=float).reshape(n, -1)[:, 0]
+
+    try:
+        exact_exchange = float(func.get_hyb_exx_coef())
+    except (AttributeError, ValueError):
+        exact_exchange = 0.0
+
+    return {
+        'eps': column('zk'),
+        'vrho': column('vrho'),
+        'vsigma': column('vsigma'),
+        'vtau': column('vtau'),
+        'exact_exchange': exact_exchange,
+    }
+
+
+# ==================== GRIDS ====================
+
+def make_xc_grid(rs: Sequence[float], s: Sequence[float], alpha: Sequence[float] = (1.0,)) -> dict:
+    """
+    Build density inputs on an (rs, s, α) grid for an unpolarized system.
+
+    ρ = 3/(4π rs³), |∇ρ| = 2(3π²)^(1/3) ρ^(4/3) s and
+    τ = τ_W + α τ_unif with τ_W = |∇ρ|²/(8ρ), τ_unif = (3/10)(3π²)^(2/3) ρ^(5/3).
+    The Laplacian is set to zero.
+
+    Args:
+        rs: Wigner-Seitz radii (Bohr)
+        s: Reduced gradients
+        alpha: Iso-orbital indicators (meta-GGA)
+
+    Returns:
+        Dictionary of axes, grid shape and flattened rho/sigma/tau/lapl arrays
+    """
+    rs = np.atleast_1d(np.asarray(rs, dtype=float))
+    s = np.atleast_1d(np.asarray(s, dtype=float))
+    alpha = np.atleast_1d(np.asarray(alpha, dtype=float))
+
+    RS, S, A = np.meshgrid(rs, s, alpha, indexing='ij')
+
+    rho = np.maximum(3.0 / (4.0 * np.pi * RS**3), RHO_FLOOR)
+    grad = 2.0 * (3.0 * np.pi**2)**(1.0 / 3.0) * rho**(4.0 / 3.0) * S
+    sigma = grad**2
+    tau_w = sigma / (8.0 * rho)
+    tau_unif = 0.3 * (3.0 * np.pi**2)**(2.0 / 3.0) * rho**(5.0 / 3.0)
+    tau = tau_w + A * tau_unif
+
+    return {
+        'rs': rs,
+        's': s,
+        'alpha': alpha,
+        'shape': RS.shape,
+        'rho': rho.ravel(),
+        'sigma': sigma.ravel(),
+        'tau': tau.ravel(),
+        'lapl': np.zeros(rho.size),
+    }
+
+
+def _grid_key(grid: dict) -> str:
+    """Content hash of a grid's axes."""
+    digest = hashlib.sha256()
+    for axis in ('rs', 's', 'alpha'):
+        digest.update(np.ascontiguousarray(grid[axis], dtype=np.float64).tobytes())
+        digest.update(b'|')
+    return digest.hexdigest()
+
+
+# ==================== COMPONENT EVALUATION ====================
+
+def evaluate_xc_component(code: str, grid: dict, use_disk_cache: bool = True) -> Optional[dict]:
+    """
+    Evaluate a single Libxc component on a grid (memoized).
+
+    Args:
+        code: Libxc component name (e.g. 'GGA_X_PBE')
+        grid: Grid from make_xc_grid
+        use_disk_cache: Read/write .npz results under XC_CACHE_DIR
+
+    Returns:
+        Dictionary with flat 'eps', 'vrho', 'vsigma', 'vtau' arrays and
+        'exact_exchange', or None if the component cannot be evaluated
+    """
+    backend = get_xc_backend()
+    if backend is None:
+        return None
+
+    code = code.strip().upper()
+    kind = _component_kind(code)
+    key = hashlib.sha256(
+        f"{backend}|{_libxc_version(backend)}|{code}|{_grid_key(grid)}".encode('utf-8')
+    ).hexdigest()
+
+    if key in _MEMORY_CACHE:
+        return _MEMORY_CACHE[key]
+
+    cache_path = XC_CACHE_DIR / f"{key}.npz"
+    if use_disk_cache and cache_path.exists():
+        try:
+            with np.load(cache_path, allow_pickle=False) as data:
+                result = {name: data[name] for name in data.files}
+            result['exact_exchange'] = float(result['exact_exchange'])
+            _MEMORY_CACHE[key] = result
+            return result
+        except (OSError, ValueError, KeyError):
+            pass
+
+    try:
+        if backend == 'pyscf':
+            result = _eval_pyscf(code, kind, grid)
+        else:
+            result = _eval_pylibxc(code, kind, grid)
+    except (KeyError, ValueError, RuntimeError):
+        return None
+
+    if use_disk_cache:
+        XC_CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(cache_path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **result)
+        tmp_path.replace(cache_path)
+
+    _MEMORY_CACHE[key] = result
+    return result
+
+
+def clear_xc_cache(disk: bool = False) -> None:
+    """
+    Clear memoized component results.
+
+    Args:
+        disk: Also delete the .npz files under XC_CACHE_DIR
+    """
+    _MEMORY_CACHE.clear()
+    if disk and XC_CACHE_DIR.exists():
+        for path in XC_CACHE_DIR.glob("*.npz"):
+            path.unlink()
+
+
+# ==================== FUNCTIONAL EVALUATION ====================
+
+def resolve_libxc_components(functional: str, database: Optional[dict] = None) -> Optional[List[str]]:
+    """
+    Resolve a functional name to its Libxc component names.
+
+    Names from data/libxc_functionals.json use their 'full_name'; anything
+    else is treated as a comma-separated Libxc code (e.g. 'GGA_X_PBE,GGA_C_PBE').
+
+    Args:
+        functional: Functional name or Libxc code
+        database: Functional database (default: loaded from disk)
+
+    Returns:
+        List of component names, or None if empty
+    """
+    if database is None:
+        from modules.xc_functionals import load_functional_database
+        database = load_functional_database() or {}
+
+    entries = database.get('functionals', {})
+    lookup = {name.upper(): info for name, info in entries.items()}
+    info = lookup.get(functional.upper())
+    code = info['full_name'] if info else functional
+
+    components = [part.strip() for part in code.split(',') if part.strip()]
+    return components if components else None
+
+
+def evaluate_functionals(
+    functionals: List[str],
+    rs: Sequence[float] = (1.0,),
+    s: Optional[Sequence[float]] = None,
+    alpha: Sequence[float] = (1.0,),
+    use_disk_cache: bool = True
+) -> Optional[dict]:
+    """
+    Evaluate many functionals on a shared (rs, s, α) grid.
+
+    Args:
+        functionals: Functional names (database keys) or Libxc codes
+        rs: Wigner-Seitz radii (Bohr)
+        s: Reduced gradients (default: 200 points on [0, 4])
+        alpha: Iso-orbital indicators
+        use_disk_cache: Memoize component results on disk
+
+    Returns:
+        Dictionary with the grid axes and, per functional, arrays of shape
+        (n_rs, n_s, n_alpha):
+            F_x, F_c, F_xc: enhancement factors relative to LDA exchange
+                (F_x/F_c are None when the functional is a single combined
+                XC component and cannot be split)
+            eps_x, eps_c, eps_xc: energy per particle (Hartree)
+            e_xc: energy density ρ·ε_xc
+            v_rho, v_sigma, v_tau: XC potential derivatives
+            exact_exchange: global exact-exchange fraction
+        Returns None if no backend is available or nothing could be evaluated.
+    """
+    if not functionals or get_xc_backend() is None:
+        return None
+
+    if s is None:
+        s = np.linspace(0.0, 4.0, 200)
+
+    grid = make_xc_grid(rs, s, alpha)
+    shape = grid['shape']
+    rho = grid['rho']
+    eps_x_lda = -C_X * rho**(1.0 / 3.0)
+
+    from modules.xc_functionals import load_functional_database
+    database = load_functional_database() or {}
+
+    results = {}
+    for name in functionals:
+        components = resolve_libxc_components(name, database)
+        if components is None:
+            continue
+
+        evaluated = [(code, evaluate_xc_component(code, grid, use_disk_cache)) for code in components]
+        if any(data is None for _, data in evaluated):
+            continue
+
+        totals = {part: np.zeros(rho.size) for part in ('x', 'c', 'xc')}
+        potentials = {key: np.zeros(rho.size) for key in ('vrho', 'vsigma', 'vtau')}
+        exact_exchange = 0.0
+        for code, data in evaluated:
+            totals[_component_kind(code)] += data['eps']
+            for key in potentials:
+                potentials[key] += data[key]
+            exact_exchange += data['exact_exchange']
+
+        separable = not np.any(totals['xc'])
+        eps_x = totals['x'] if separable else None
+        eps_c = totals['c'] if separable else None
+        eps_xc = totals['x'] + totals['c'] + totals['xc']
+
+        def shaped(values):
+            return None if values is None else values.reshape(shape)
+
+        results[name] = {
+            'components': components,
+            'family': max((_component_family(code) for code in components), key=['LDA', 'GGA', 'MGGA'].index),
+            'F_x': shaped(None if eps_x is None else eps_x / eps_x_lda),
+            'F_c': shaped(None if eps_c is None else eps_c / eps_x_lda),
+            'F_xc': shaped(eps_xc / eps_x_lda),
+            'eps_x': shaped(eps_x),
+            'eps_c': shaped(eps_c),
+            'eps_xc': shaped(eps_xc),
+            'e_xc': shaped(rho * eps_xc),
+            'v_rho': shaped(potentials['vrho']),
+            'v_sigma': shaped(potentials['vsigma']),
+            'v_tau': shaped(potentials['vtau']),
+            'exact_exchange': exact_exchange,
+        }
+
+    if not results:
+        return None
+
+    return {
+        'rs': grid['rs'],
+        's': grid['s'],
+        'alpha': grid['alpha'],
+        'functionals': results,
+    }
+
+
+# ==================== EXPORT ====================
+
+__all__ = [
+    'get_xc_backend',
+    'make_xc_grid',
+    'evaluate_xc_component',
+    'clear_xc_cache',
+    'resolve_libxc_components',
+    'evaluate_functionals',
+]
@@ -12,6 +12,7 @@ from pathlib import Path
 
 from utils.validators import validate_element, validate_functional
 from utils.constants import ELEMENTS, FUNCTIONAL_INFO
+from modules.xc_engine import get_xc_backend, evaluate_functionals
 
 
 # Load functional database
@@ -193,13 +194,19 @@ def get_enhancement_comparison(
     """
     Calculate enhancement factors for multiple functionals.
     
+    All functionals are evaluated together through Libxc (see
+    modules.xc_engine) at rs = 1 Bohr and α = 1. The exchange enhancement
+    F_x is returned where the functional separates into exchange and
+    correlation; combined XC components (e.g. HYB_GGA_XC_B3LYP) return F_xc.
+    Without a Libxc backend the built-in analytic formulas are used.
+    
     Args:
         functionals: List of functional names
         s_range: (min, max) for reduced gradient
         n_points: Number of points
         
     Returns:
-        Dictionary with {functional: {'s': array, 'F': array}} or None
+        Dictionary with {functional: {'s': array, 'F': array, 'quantity': str}} or None
     """
     if not functionals:
         return None
@@ -207,6 +214,22 @@ def get_enhancement_comparison(
     # Create reduced gradient array
     s = np.linspace(s_range[0], s_range[1], n_points)
     
+    if get_xc_backend() is not None:
+        evaluated = evaluate_functionals(functionals, rs=[1.0], s=s, alpha=[1.0])
+        if evaluated is None:
+            return None
+        
+        result = {}
+        for func_name, data in evaluated['functionals'].items():
+            separable = data['F_x'] is not None
+            F = data['F_x'] if separable else data['F_xc']
+            result[func_name] = {
+                's': s,
+                'F': F[0, :, 0],
+                'quantity': 'F_x' if separable else 'F_xc'
+            }
+        return result if result else None
+    
     result = {}
     
     for func_name in functionals:
@@ -235,7 +258,8 @@ def get_enhancement_comparison(
         
         result[func_name] = {
             's': s,
-            'F': F
+            'F': F,
+            'quantity': 'F_x'
         }
     
     return result if result else None
@@ -327,7 +351,8 @@ def compare_functionals_simple(
         n_points: Number of points
         
     Returns:
-        Comparison dictionary or None
+        Comparison dictionary or None. When one functional gives F_x and
+        the other F_xc, 'diff', 'max_diff' and 'max_diff_location' are None.
     """
     data = get_enhancement_comparison([func1, func2], s_range, n_points)
     if data is None:
@@ -339,16 +364,19 @@ def compare_functionals_simple(
     s = data[func1]['s']
     F1 = data[func1]['F']
     F2 = data[func2]['F']
+    comparable = data[func1]['quantity'] == data[func2]['quantity']
     
     return {
         's': s,
         'F1': F1,
         'F2': F2,
-        'diff': F1 - F2,
+        'quantity1': data[func1]['quantity'],
+        'quantity2': data[func2]['quantity'],
+        'diff': F1 - F2 if comparable else None,
         'func1': func1,
         'func2': func2,
-        'max_diff': np.max(np.abs(F1 - F2)),
-        'max_diff_location': s[np.argmax(np.abs(F1 - F2))]
+        'max_diff': np.max(np.abs(F1 - F2)) if comparable else None,
+        'max_diff_location': s[np.argmax(np.abs(F1 - F2))] if comparable else None
     }
 
 
@@ -17,6 +17,7 @@ from modules.basis_sets import (
     calculate_orbital_wavefunction,
     count_shells_by_type
 )
+from modules.basis_table import get_basis_stats_for_data
 from utils.constants import ELEMENTS
 from utils.plotting import create_3d_orbital_plot, create_shell_visualization
 from utils.session import init_session_state, show_consistency_checker, show_current_selections
@@ -685,12 +686,11 @@ else:
     # Get shell counts
     elem_data1 = list(basis_data_1['elements'].values())[0]
     elem_data2 = list(basis_data_2['elements'].values())[0]
-    s_shells_1 = sum(1 for s in elem_data1['electron_shells'] if s['angular_momentum'][0] == 0)
-    s_shells_2 = sum(1 for s in elem_data2['electron_shells'] if s['angular_momentum'][0] == 0)
-    p_shells_1 = sum(1 for s in elem_data1['electron_shells'] if s['angular_momentum'][0] == 1)
-    p_shells_2 = sum(1 for s in elem_data2['electron_shells'] if s['angular_momentum'][0] == 1)
-    d_shells_1 = sum(1 for s in elem_data1['electron_shells'] if s['angular_momentum'][0] == 2)
-    d_shells_2 = sum(1 for s in elem_data2['electron_shells'] if s['angular_momentum'][0] == 2)
+    stats1 = get_basis_stats_for_data(basis_data_1, basis_name_1)
+    stats2 = get_basis_stats_for_data(basis_data_2, basis_name_2)
+    s_shells_1, s_shells_2 = stats1['n_s'], stats2['n_s']
+    p_shells_1, p_shells_2 = stats1['n_p'], stats2['n_p']
+    d_shells_1, d_shells_2 = stats1['n_d'], stats2['n_d']
     
     # Orbital count bar graph
     fig_orbital_count = go.Figure()
@@ -267,23 +267,34 @@ if view_mode == "Mathematical View":
     
     colors = ['#667eea', '#e74c3c', '#2ecc71', '#f39c12', '#9b59b6', '#1abc9c']
     
-    for i, func_name in enumerate(selected_functionals):
+    # Functionals the backend could not evaluate are left out
+    skipped = [f for f in selected_functionals if f not in enhancement_data]
+    if skipped:
+        st.warning(f"⚠️ Could not evaluate: {', '.join(skipped)}")
+    plotted = [f for f in selected_functionals if f in enhancement_data]
+    
+    # F_x for exchange/correlation-separable functionals, F_xc for combined ones
+    quantities = sorted({enhancement_data[f]['quantity'] for f in plotted})
+    quantity_label = " / ".join(f"{q}(s)" for q in quantities)
+    
+    for i, func_name in enumerate(plotted):
         data = enhancement_data[func_name]
         color = colors[i % len(colors)]
+        quantity = data['quantity']
         
         fig.add_trace(go.Scatter(
             x=data['s'],
             y=data['F'],
             mode='lines',
-            name=func_name,
+            name=func_name if len(quantities) == 1 else f"{func_name} ({quantity})",
             line=dict(color=color, width=3),
-            hovertemplate=f'{func_name}<br>s: %{{x:.3f}}<br>F_x: %{{y:.3f}}<extra></extra>'
+            hovertemplate=f'{func_name}<br>s: %{{x:.3f}}<br>{quantity}: %{{y:.3f}}<extra></extra>'
         ))
     
     fig.update_layout(
-        title="Exchange Enhancement Factor F_x(s)",
+        title=f"Enhancement Factor {quantity_label}",
         xaxis_title="Reduced Gradient s = |∇ρ|/(2k_F ρ)",
-        yaxis_title="Enhancement Factor F_x(s)",
+        yaxis_title=f"Enhancement Factor {quantity_label}",
         hovermode='x unified',
         height=600,
         template='plotly_white',
@@ -497,9 +508,9 @@ elif view_mode == "Comparison Mode":
         x=comparison['s'],
         y=comparison['F1'],
         mode='lines',
-        name=func1,
+        name=f"{func1} ({comparison['quantity1']})",
         line=dict(color='#667eea', width=3),
-        hovertemplate=f'{func1}<br>s: %{{x:.3f}}<br>F_x: %{{y:.3f}}<extra></extra>'
+        hovertemplate=f"{func1}<br>s: %{{x:.3f}}<br>{comparison['quantity1']}: %{{y:.3f}}<extra></extra>"
     ))
     
     # Second functional
@@ -507,15 +518,19 @@ elif view_mode == "Comparison Mode":
         x=comparison['s'],
         y=comparison['F2'],
         mode='lines',
-        name=func2,
+        name=f"{func2} ({comparison['quantity2']})",
         line=dict(color='#e74c3c', width=3),
-        hovertemplate=f'{func2}<br>s: %{{x:.3f}}<br>F_x: %{{y:.3f}}<extra></extra>'
+        hovertemplate=f"{func2}<br>s: %{{x:.3f}}<br>{comparison['quantity2']}: %{{y:.3f}}<extra></extra>"
     ))
     
     fig_comp.update_layout(
         title=f"Enhancement Factor: {func1} vs {func2}",
         xaxis_title="Reduced Gradient s",
-        yaxis_title="Enhancement Factor F_x(s)",
+        yaxis_title=(
+            f"Enhancement Factor {comparison['quantity1']}(s)"
+            if comparison['diff'] is not None
+            else f"Enhancement Factor {comparison['quantity1']}(s) / {comparison['quantity2']}(s)"
+        ),
         hovermode='x unified',
         height=500,
         template='plotly_white'
@@ -523,6 +538,15 @@ elif view_mode == "Comparison Mode":
     
     st.plotly_chart(fig_comp, use_container_width=True)
     
+    if comparison['diff'] is None:
+        st.info(
+            f"ℹ️ {func1} gives {comparison['quantity1']} and {func2} gives {comparison['quantity2']}: "
+            "exchange-only and combined exchange-correlation enhancement factors are not compared."
+        )
+        st.stop()
+    
+    quantity = comparison['quantity1']
+    
     # Difference plot
     st.markdown("### 📊 Difference Plot")
     
@@ -536,7 +560,7 @@ elif view_mode == "Comparison Mode":
         line=dict(color='#9b59b6', width=3),
         fill='tozeroy',
         fillcolor='rgba(155, 89, 182, 0.2)',
-        hovertemplate='s: %{x:.3f}<br>ΔF_x: %{y:.3f}<extra></extra>'
+        hovertemplate=f's: %{{x:.3f}}<br>Δ{quantity}: %{{y:.3f}}<extra></extra>'
     ))
     
     fig_diff.add_hline(y=0, line_dash="dash", line_color="gray", opacity=0.5)
@@ -544,7 +568,7 @@ elif view_mode == "Comparison Mode":
     fig_diff.update_layout(
         title=f"Difference: {func1} - {func2}",
         xaxis_title="Reduced Gradient s",
-        yaxis_title=f"ΔF_x = F_x({func1}) - F_x({func2})",
+        yaxis_title=f"Δ{quantity} = {quantity}({func1}) - {quantity}({func2})",
         height=400,
         template='plotly_white'
     )